@@ -1,13 +1,17 @@
 import config 
 
-from flask import Flask
+from flask import Flask, g
 from flask_cors import CORS
 # from flask.json import JSONEncoder
+from json_encoder import BigIntJSONEncoder
 
 from controller.account_controller  import account_app
 from controller.order_controller    import order_app
 from controller.product_controller  import product_app
 from controller.home_controller     import home_app
+from controller.statistics_controller import statistics_app
+from controller.job_controller      import job_app
+from connection import CONSISTENCY_TOKEN_HEADER
 
 """ Flask 객체 
 Returns: Flask 객체화를 통한 app 객체 생성 
@@ -17,17 +21,32 @@ Authors: 홍성은
 History:
     2020-10-24 : 초기 생성
     2020-10-26 : 각 app에 url_prefix blueprint 등록 
+    2026-10-19 : 매출 통계(statistics_app) 등록
+    2026-10-19 : 작업 큐(job_app) 등록
+    2026-10-19 : 쓰기 후 세션 일관성 토큰(X-Consistency-Token) 응답 헤더 추가
+    2026-10-19 : 2^53 보다 큰 id 를 JSON 응답에서 문자열로 보냄 (BigIntJSONEncoder)
 """
     
 def create_app():
     app = Flask(__name__) # Flask를 객체화, 인스턴스를 app변수에 저장 
     app.debug = True
     app.config.from_pyfile('config.py') # config 설정
-    CORS(app, resources={r'*' : {'origins':'*'}}) #CORS 설정
+    app.json_encoder = BigIntJSONEncoder # id_generator 의 id 가 자바스크립트에서 반올림되지 않도록 문자열로
+    CORS(app, resources={r'*' : {'origins':'*'}}, expose_headers=[CONSISTENCY_TOKEN_HEADER]) #CORS 설정
+
+    @app.after_request
+    def set_consistency_token(response):
+        # 이번 요청에서 커밋한 쓰기까지 반영한 레플리카에서 읽도록, 다음 조회 요청에 보낼 토큰
+        token = g.get('consistency_token')
+        if token:
+            response.headers[CONSISTENCY_TOKEN_HEADER] = token
+        return response
     
     app.register_blueprint(account_app, url_prefix='/account')
     app.register_blueprint(order_app,    url_prefix='/order')
     app.register_blueprint(product_app, url_prefix='/product')
     app.register_blueprint(home_app,    url_prefix='/home')
+    app.register_blueprint(statistics_app, url_prefix='/statistics')
+    app.register_blueprint(job_app,     url_prefix='/job')
 
     return app
\ No newline at end of file
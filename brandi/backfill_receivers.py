@@ -0,0 +1,105 @@
+import time
+import argparse
+
+import pymysql
+
+from sharding               import get_shard_indexes, get_job_connection
+from transaction            import run_in_transaction
+from service.order_service  import OrderService
+
+""" 수령인 중복 제거 백필
+receiver_hash 가 도입되기 전에 저장된 수령인들을 청크 단위로 해시하고,
+정규화한 정보가 같은 수령인들을 하나로 합친 뒤 orders, detail_orders 가 남은 수령인을 가리키도록 옮깁니다.
+청크마다 커밋하므로 중간에 멈춰도 다시 실행하면 이어서 처리합니다.
+샤딩중이면 샤드마다 차례로 처리합니다. (--shard 로 한 샤드만 실행)
+
+    python backfill_receivers.py --chunk-size 1000 --sleep 0.1
+    python backfill_receivers.py --chunk-size 1000 --sleep 0.1 --shard 0
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 작업 큐에서 실행할 때의 진행 보고(report) 추가
+    2026-10-19 : 샤드별 실행 (--shard)
+"""
+
+order_service = OrderService()
+
+# 청크를 처리하는 동안 같은 수령인으로 새 주문이 들어와 해시가 먼저 저장된 경우 다시 시도할 횟수
+MAX_CONFLICT_RETRIES = 3
+
+
+def backfill_receivers(chunk_size, sleep, report=None, shard=None):
+    """
+    샤드마다 더 이상 해시가 없는 수령인이 없을 때까지 청크 단위로 중복 제거를 진행합니다.
+    Args:
+        chunk_size : 한 트랜잭션에서 처리할 수령인 수
+        sleep      : 청크 사이에 쉬는 시간(초)
+        report     : 청크마다 누적 결과로 호출할 함수 (작업 큐의 진행 보고용, 선택)
+        shard      : 실행할 샤드 번호 (None 이면 모든 샤드)
+    Returns:
+        {'hashed' : 해시를 저장한 수령인 수, 'merged' : 삭제(병합)된 중복 수령인 수}
+    """
+    total = {'hashed': 0, 'merged': 0}
+
+    for index in get_shard_indexes(shard):
+        backfill_shard(chunk_size, sleep, total, report, index)
+
+    return total
+
+
+def backfill_shard(chunk_size, sleep, total, report=None, shard=None):
+    """
+    한 샤드의 수령인 중복 제거를 진행하며 결과를 total 에 더합니다.
+    Args:
+        chunk_size : 한 트랜잭션에서 처리할 수령인 수
+        sleep      : 청크 사이에 쉬는 시간(초)
+        total      : 누적 결과 {'hashed', 'merged'}
+        report     : 청크마다 누적 결과로 호출할 함수 (선택)
+        shard      : 샤드 번호 (None 이면 기본 커넥션)
+    """
+    db_connection = get_job_connection(shard)
+    last_id = 0
+
+    try:
+        while True:
+            for attempt in range(MAX_CONFLICT_RETRIES + 1):
+                try:
+                    result = run_in_transaction(
+                        'backfill_receivers',
+                        db_connection,
+                        lambda: order_service.dedupe_receivers(db_connection, last_id, chunk_size)
+                    )
+                    break
+
+                except pymysql.err.IntegrityError:
+                    if attempt == MAX_CONFLICT_RETRIES:
+                        raise
+
+            chunk = result['success']
+            if not chunk:
+                return
+
+            last_id = chunk['last_id']
+            total['hashed'] += chunk['hashed']
+            total['merged'] += chunk['merged']
+            print(f"shard={shard} last_id={last_id} hashed={total['hashed']} merged={total['merged']}")
+
+            if report:
+                report(total)
+
+            time.sleep(sleep)
+
+    finally:
+        db_connection.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='수령인 중복 제거 백필')
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--sleep', type=float, default=0.1)
+    parser.add_argument('--shard', type=int, default=None, help='샤드 번호 (없으면 모든 샤드)')
+    args = parser.parse_args()
+
+    print(backfill_receivers(args.chunk_size, args.sleep, shard=args.shard))
@@ -0,0 +1,143 @@
+import argparse
+import datetime
+
+from connection           import DB_UTC_OFFSET
+from seed_benchmark       import connect_benchmark, measure
+from model.order_dao      import OrderDao
+from service.order_service import OrderService
+
+""" 주문관리 목록 조회 시간 측정
+seed_benchmark.py 로 만든 벤치마크 DB 에서 주문관리 목록을 서비스와 같은 경로(OrderService.get_complete_order)로 조회하고
+경우별 중앙값/p95(ms)와 MySQL 이 고른 인덱스를 출력합니다. (SHARDS 없이 벤치마크 DB 하나를 읽음)
+셀러 범위 조회는 주문이 가장 많은 대형 셀러와, seed_benchmark.py 가 만든 소형 셀러(account_id 가 가장 큰 셀러)로 잽니다.
+
+    python seed_benchmark.py --database brandi_bench --rows 10000000
+    python benchmark_order_list.py --database brandi_bench --repeat 20
+    python benchmark_order_list.py --database brandi_bench_50m --repeat 20
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 셀러 범위 조회 추가
+"""
+
+order_dao     = OrderDao()
+order_service = OrderService()
+
+PAGE_SIZE = 50
+
+
+def get_cases(until, big_seller_id, small_seller_id):
+    """
+    측정할 경우들을 (이름, 필터) 리스트로 반환합니다.
+    """
+    until = datetime.date.fromisoformat(until)
+
+    def days_before(days):
+        return (until - datetime.timedelta(days)).isoformat()
+
+    return [
+        ('전체 탭, 기간 없음',               {}),
+        ('전체 탭, 최근 1주',                {'start_date': days_before(6)}),
+        ('전체 탭, 최근 1년, 20 페이지',     {'start_date': days_before(364), 'offset': PAGE_SIZE * 19}),
+        ('배송중 탭, 최근 1개월',            {'status_id': 4, 'start_date': days_before(29)}),
+        ('결제완료 탭, 1년 전 1주',          {'status_id': 1, 'start_date': days_before(371), 'end_date': days_before(365)}),
+        ('소형 셀러, 전체 탭',               {'seller_id': small_seller_id}),
+        ('소형 셀러, 구매확정 탭',           {'seller_id': small_seller_id, 'status_id': 6}),
+        ('소형 셀러, 최근 1년',              {'seller_id': small_seller_id, 'start_date': days_before(364)}),
+        ('대형 셀러, 전체 탭',               {'seller_id': big_seller_id}),
+        ('대형 셀러, 배송중 탭, 최근 1주',   {'seller_id': big_seller_id, 'status_id': 4, 'start_date': days_before(6)}),
+    ]
+
+
+def get_order_info(filters, until):
+    """
+    목록 조회 API 가 만드는 것과 같은 필터를 만듭니다.
+    """
+    order_info = {
+        'status_id'       : None,
+        'order_number'    : None,
+        'detail_order_id' : None,
+        'receiver_name'   : None,
+        'phone_number'    : None,
+        'product_name'    : None,
+        'seller_id'       : None,
+        'start_date'      : None,
+        'end_date'        : None,
+        'utc_offset'      : DB_UTC_OFFSET,
+        'limit'           : PAGE_SIZE,
+        'offset'          : 0
+    }
+    order_info.update(filters)
+
+    if order_info['start_date'] and not order_info['end_date']:
+        order_info['end_date'] = until
+
+    return order_info
+
+
+def explain(db_connection, order_info):
+    """
+    조회 쿼리의 EXPLAIN 에서 사용한 인덱스와 예상 행 수를 반환합니다.
+    """
+    query = order_dao.get_order_list_query(order_info) + """
+            LIMIT
+                %(limit)s
+            OFFSET
+                %(offset)s
+            """
+
+    with db_connection.cursor() as cursor:
+        cursor.execute('EXPLAIN ' + query, order_info)
+        plan = cursor.fetchone()
+
+    return plan['key'], plan['rows']
+
+
+def benchmark_order_list(database, until, repeat):
+    """
+    경우마다 목록 조회 시간을 재서 출력합니다.
+    """
+    db_connection = connect_benchmark(database)
+
+    try:
+        with db_connection.cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) AS count FROM order_list_view')
+            print(f"order_list_view rows={cursor.fetchone()['count']}")
+
+            cursor.execute("""
+                SELECT seller_id, COUNT(*) AS count
+                FROM order_list_view
+                WHERE seller_id IN ((SELECT MIN(seller_id) FROM order_list_view), (SELECT MAX(seller_id) FROM order_list_view))
+                GROUP BY seller_id
+                ORDER BY seller_id
+            """)
+            big_seller, small_seller = cursor.fetchall()
+            print(f"big seller={big_seller['seller_id']} rows={big_seller['count']}, "
+                  f"small seller={small_seller['seller_id']} rows={small_seller['count']}")
+
+        for name, filters in get_cases(until, big_seller['seller_id'], small_seller['seller_id']):
+            order_info = get_order_info(filters, until)
+            result = measure(lambda: order_service.get_complete_order(dict(order_info), db_connection)['success'], repeat)
+
+            # 서비스가 채운 결제일시 범위로 EXPLAIN
+            order_service.check_order_list_filter(order_info)
+            key, rows = explain(db_connection, order_info)
+
+            print(
+                f"{name}: median={result['median']:.1f}ms p95={result['p95']:.1f}ms "
+                f"max={result['max']:.1f}ms rows={result['rows']} key={key} examined~{rows}"
+            )
+    finally:
+        db_connection.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='주문관리 목록 조회 시간 측정')
+    parser.add_argument('--database', default='brandi_bench')
+    parser.add_argument('--until', default='2026-10-19', help='seed_benchmark.py 의 --until 과 같은 날짜')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    benchmark_order_list(args.database, args.until, args.repeat)
@@ -0,0 +1,67 @@
+import argparse
+import datetime
+
+from seed_benchmark            import connect_benchmark, measure
+from service.statistics_service import StatisticsService
+
+""" 매출 통계 조회 시간 측정
+seed_benchmark.py --daily-sales 로 만든 벤치마크 DB 에서 전체 셀러의 1년 매출 추이를
+서비스와 같은 경로(StatisticsService.get_sales_series, 'rollup')로 조회하고 집계 단위별 중앙값/p95(ms)를 출력합니다.
+목표는 주문 10M 건의 전체 셀러 1년 조회가 1초 미만인 것입니다. (SHARDS 없이 벤치마크 DB 하나를 읽음)
+
+    python seed_benchmark.py --database brandi_bench --rows 10000000 --daily-sales
+    python benchmark_sales.py --database brandi_bench --repeat 10
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+"""
+
+statistics_service = StatisticsService()
+
+# 전체 셀러 1년 조회가 이 시간(ms) 안에 끝나야 함
+TARGET_MS = 1000
+
+
+def benchmark_sales(database, until, repeat):
+    """
+    집계 단위마다 전체 셀러 1년 매출 추이 조회 시간을 재서 출력합니다.
+    """
+    db_connection = connect_benchmark(database)
+    end_date = datetime.date.fromisoformat(until)
+
+    try:
+        with db_connection.cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) AS count, SUM(order_count) AS orders FROM seller_daily_sales')
+            counts = cursor.fetchone()
+            print(f"seller_daily_sales rows={counts['count']} orders={counts['orders']}")
+
+        for interval in ('day', 'week', 'month'):
+            body = {
+                'start_date'   : (end_date - datetime.timedelta(364)).isoformat(),
+                'end_date'     : end_date.isoformat(),
+                'interval'     : interval,
+                'source'       : 'rollup',
+                'seller_id'    : None,
+                'attribute_id' : None
+            }
+            result = measure(lambda: statistics_service.get_sales_series(db_connection, dict(body))['success']['labels'], repeat)
+
+            print(
+                f"전체 셀러, 1년, {interval}: median={result['median']:.1f}ms p95={result['p95']:.1f}ms "
+                f"max={result['max']:.1f}ms buckets={result['rows']} "
+                f"{'OK' if result['p95'] < TARGET_MS else 'SLOW'}"
+            )
+    finally:
+        db_connection.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='매출 통계 조회 시간 측정')
+    parser.add_argument('--database', default='brandi_bench')
+    parser.add_argument('--until', default='2026-10-19', help='seed_benchmark.py 의 --until 과 같은 날짜')
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    benchmark_sales(args.database, args.until, args.repeat)
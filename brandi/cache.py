@@ -0,0 +1,349 @@
+import os
+import json
+import time
+import pickle
+import logging
+import threading
+import weakref
+
+from collections import OrderedDict
+
+import config
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+""" 캐시
+- LocalCache : 프로세스 내 LRU + TTL 캐시입니다. 키마다 세대(generation)를 두어, 값을 불러오는 도중에
+  무효화가 일어났다면 불러온 (오래된) 값을 저장하지 않습니다.
+
+    generation = cache.get_generation(key)
+    value = load()
+    cache.set(key, value, generation)
+
+- TwoLevelCache : 프로세스 내 LRU(1단계) 앞에 Redis(2단계)를 두고, 태그로 무효화하는 캐시입니다.
+  gunicorn 워커마다 1단계가 따로 있으므로, 무효화는 Redis 의 태그 버전을 올리고 pub/sub 으로 모든 워커에 알립니다.
+
+    value = cache.get_or_load(key, load, tags=['product:3'])
+    on_commit(db_connection, lambda: invalidate_tags(['product:3']))
+
+  태그
+    product:<상품 번호>  : 상품의 상태, 가격, 옵션, 재고
+    seller:<셀러 번호>   : 셀러 범위의 주문 집계, 상품 목록, 홈 통계
+    order-status         : 전체 셀러 범위의 주문 집계
+    products             : 전체 셀러 범위의 상품 목록
+  - 값은 저장할 때의 태그 버전과 함께 저장하고, 읽을 때 현재 버전과 다르면 버립니다.
+    버전은 불러오기 전에 읽으므로, 불러오는 도중에 무효화되면 저장된 값은 다음에 읽을 때 버려집니다.
+  - 무효화는 쓰기가 커밋된 뒤(transaction.on_commit) 호출합니다.
+  - Redis 는 config.REDIS_URL 로 설정합니다. (예: redis://localhost:6379/0, 로컬에서는 redis-server 실행)
+    설정이 없으면 1단계만 사용하며, 무효화는 그 프로세스에만 적용됩니다.
+  - Redis 장애중에는 REDIS_RETRY_SECONDS 동안 1단계만 사용합니다.
+    그 사이의 무효화는 다른 워커에 전달되지 않으므로, 오래된 값은 각 단계의 TTL 까지만 남습니다.
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : Redis 2단계 캐시와 태그 무효화 추가
+"""
+
+REDIS_URL = getattr(config, 'REDIS_URL', None)
+
+REDIS_TIMEOUT       = 0.05  # 초, 캐시 조회가 요청을 붙잡지 않도록 짧게
+REDIS_RETRY_SECONDS = 5     # 초, 장애 후 다시 시도하기까지 1단계만 사용
+
+INVALIDATION_CHANNEL = 'cache:invalidation'
+TAG_KEY              = 'cache:tag:{}'
+
+
+class LocalCache:
+    """LRU + TTL 캐시
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl     = ttl
+
+        self._lock        = threading.Lock()
+        self._data        = OrderedDict() # key : (만료시각, 값)
+        self._generations = {}            # key : 무효화된 횟수
+
+    def get(self, key):
+        """
+        캐시된 값을 반환합니다. 없거나 만료되었으면 None 을 반환합니다.
+        """
+        with self._lock:
+            item = self._data.get(key, None)
+
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def get_generation(self, key):
+        """
+        키의 현재 세대를 반환합니다. 값을 불러오기 전에 호출하여 set 에 넘겨줍니다.
+        """
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def set(self, key, value, generation=None, ttl=None):
+        """
+        값을 저장합니다. generation 이 주어졌고 그 사이 무효화가 있었다면 저장하지 않습니다.
+        Returns:
+            저장 여부
+        """
+        with self._lock:
+            if generation is not None and generation != self._generations.get(key, 0):
+                return False
+
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+            return True
+
+    def invalidate(self, key):
+        """
+        캐시된 값을 지우고 키의 세대를 올립니다.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self):
+        """
+        캐시된 값을 모두 지웁니다.
+        """
+        with self._lock:
+            self._data.clear()
+
+
+class TagVersions:
+    """프로세스의 태그 버전, Redis 연결, 무효화 구독
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def __init__(self, url):
+        self.url = url
+
+        self._lock       = threading.Lock()
+        self._versions   = {}                  # tag : 이 프로세스가 아는 최신 버전
+        self._caches     = weakref.WeakSet()   # 구독이 끊기면 1단계를 비울 캐시들
+        self._client     = None
+        self._pid        = None
+        self._down_until = 0
+
+    def register(self, cache):
+        self._caches.add(cache)
+
+    def get_client(self):
+        """
+        Redis 클라이언트를 반환합니다. 설정이 없거나 장애중이면 None 입니다.
+        프로세스마다(fork 이후 포함) 처음 사용할 때 무효화 구독 스레드를 시작합니다.
+        """
+        if not self.url or redis is None or time.monotonic() < self._down_until:
+            return None
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid    = os.getpid()
+                self._client = redis.Redis.from_url(
+                    self.url,
+                    socket_timeout=REDIS_TIMEOUT,
+                    socket_connect_timeout=REDIS_TIMEOUT
+                )
+                threading.Thread(target=self.subscribe, args=(self._pid,), daemon=True).start()
+
+            return self._client
+
+    def fail(self, error):
+        """
+        Redis 장애를 기록하고 REDIS_RETRY_SECONDS 동안 사용하지 않습니다.
+        """
+        logging.warning('cache redis unavailable: %s', error)
+        self._down_until = time.monotonic() + REDIS_RETRY_SECONDS
+
+    def get_versions(self, tags):
+        with self._lock:
+            return {tag: self._versions.get(tag, 0) for tag in tags}
+
+    def observe(self, versions):
+        """
+        Redis 에서 읽었거나 다른 워커가 알린 태그 버전을 반영합니다. (버전은 늘어나기만 함)
+        """
+        with self._lock:
+            for tag, version in versions.items():
+                if version > self._versions.get(tag, 0):
+                    self._versions[tag] = version
+
+    def clear_local(self):
+        for cache in list(self._caches):
+            cache.local.clear()
+
+    def invalidate(self, tags):
+        """
+        태그 버전을 올리고 모든 워커에 알립니다.
+        """
+        tags = list(tags)
+        client = self.get_client()
+
+        if client:
+            try:
+                pipe = client.pipeline(transaction=False)
+                for tag in tags:
+                    pipe.incr(TAG_KEY.format(tag))
+                versions = dict(zip(tags, pipe.execute()))
+
+                client.publish(INVALIDATION_CHANNEL, json.dumps(versions))
+                self.observe(versions)
+                return
+
+            except redis.RedisError as error:
+                # 다른 워커에는 알릴 수 없으므로 이 프로세스의 1단계만 비움
+                self.fail(error)
+                self.clear_local()
+                return
+
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def subscribe(self, pid):
+        """
+        다른 워커의 무효화를 받아 태그 버전에 반영합니다. (프로세스마다 하나의 데몬 스레드)
+        구독이 끊겼던 동안의 무효화는 알 수 없으므로, 구독할 때마다 1단계를 비웁니다.
+        """
+        while self._pid == pid:
+            try:
+                # 알림을 기다리는 연결이므로 읽기 시간 제한을 두지 않음
+                pubsub = redis.Redis.from_url(
+                    self.url,
+                    socket_connect_timeout=REDIS_TIMEOUT,
+                    socket_keepalive=True
+                ).pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                self.clear_local()
+
+                for message in pubsub.listen():
+                    self.observe(json.loads(message['data']))
+
+            except Exception as error:
+                logging.warning('cache invalidation subscriber failed: %s', error)
+                time.sleep(REDIS_RETRY_SECONDS)
+
+
+tag_versions = TagVersions(REDIS_URL)
+
+
+def invalidate_tags(tags):
+    """
+    태그가 붙은 값들을 모든 워커에서 무효화합니다. 쓰기가 커밋된 뒤(transaction.on_commit) 호출합니다.
+    Args:
+        tags : 태그들 (product:<상품 번호>, seller:<셀러 번호>, order-status)
+    """
+    tag_versions.invalidate(tags)
+
+
+class TwoLevelCache:
+    """프로세스 내 LRU(1단계) + Redis(2단계) 캐시, 태그로 무효화
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def __init__(self, name, maxsize=1024, ttl=60, shared_ttl=300):
+        """
+        Args:
+            name       : Redis 키의 접두어
+            maxsize    : 1단계 최대 개수
+            ttl        : 1단계 보관 시간(초)
+            shared_ttl : 2단계 보관 시간(초)
+        """
+        self.name       = name
+        self.shared_ttl = shared_ttl
+        self.local      = LocalCache(maxsize=maxsize, ttl=ttl) # key : (태그 버전, 값)
+
+        tag_versions.register(self)
+
+    def get_shared_key(self, key):
+        return f"cache:{self.name}:{':'.join(map(str, key)) if isinstance(key, tuple) else key}"
+
+    def get_or_load(self, key, load, tags=()):
+        """
+        캐시된 값을 반환합니다. 없거나 태그가 무효화되었으면 load() 로 불러와 저장합니다.
+        Args:
+            key  : 키 (튜플 또는 문자열)
+            load : 인자 없이 값을 불러오는 함수 (None 을 반환하면 저장하지 않음)
+            tags : 값이 의존하는 태그들
+        Returns:
+            값
+        """
+        tags = tuple(tags)
+
+        # 1단계
+        item = self.local.get(key)
+        if item is not None and item[0] == tag_versions.get_versions(tags):
+            return item[1]
+
+        # 2단계 - 값과 현재 태그 버전을 함께 읽음
+        client   = tag_versions.get_client()
+        versions = None
+
+        if client:
+            try:
+                pipe = client.pipeline(transaction=False)
+                pipe.get(self.get_shared_key(key))
+                if tags:
+                    pipe.mget([TAG_KEY.format(tag) for tag in tags])
+                results = pipe.execute()
+
+                versions = {tag: int(version or 0) for tag, version in zip(tags, results[1] if tags else [])}
+                tag_versions.observe(versions)
+
+                if results[0]:
+                    stored_versions, value = pickle.loads(results[0])
+                    if stored_versions == versions:
+                        self.local.set(key, (versions, value))
+                        return value
+
+            except redis.RedisError as error:
+                tag_versions.fail(error)
+                client = None
+
+        if versions is None:
+            versions = tag_versions.get_versions(tags)
+
+        # 불러오기 전에 읽은 버전으로 저장하므로, 불러오는 도중 무효화되면 다음에 읽을 때 버려짐
+        value = load()
+        if value is None:
+            return None
+
+        self.local.set(key, (versions, value))
+
+        if client:
+            try:
+                client.set(self.get_shared_key(key), pickle.dumps((versions, value)), ex=self.shared_ttl)
+            except redis.RedisError as error:
+                tag_versions.fail(error)
+
+        return value
+
+
+# 주문 페이지용 상품 스냅샷 (상품 상태, 가격, 옵션) - service.product_service 에서 사용, 태그 product:<상품 번호>
+product_snapshot_cache = TwoLevelCache('product_snapshot', maxsize=10000, ttl=60, shared_ttl=600)
+
+# 주문관리 탭별 건수 - service.order_service 에서 사용, 태그 seller:<셀러 번호> / order-status
+order_status_counts_cache = TwoLevelCache('order_status_counts', maxsize=10000, ttl=60, shared_ttl=300)
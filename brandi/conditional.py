@@ -0,0 +1,131 @@
+import datetime
+
+from flask import Response, request
+
+from model.version_dao import VersionDao
+from sharding import fan_out
+
+""" 조건부 GET (ETag / Last-Modified)
+목록, 셀러 상세, 옵션 조회 응답에 셀러별 데이터 버전(data_versions)으로 만든 ETag 와 Last-Modified 를 붙이고,
+클라이언트가 가진 것과 같으면 무거운 조회를 하기 전에 304 로 응답합니다.
+- 버전은 트리거가 행 잠금 안에서 올리므로, 커밋된 변경이 있으면 반드시 다른 ETag 가 됩니다.
+- ETag 는 응답 본문이 아닌 범위(셀러/전체)와 버전으로 만듭니다. 같은 URL 이라도 로그인한 사람에 따라
+  범위와 보이는 항목이 다르므로 범위와 마스터 여부를 ETag 에 넣고 Vary: Authorization 을 붙입니다.
+- 버전은 조회보다 먼저 읽으므로, 조회 도중의 변경은 다음 요청에서 새 버전으로 보입니다.
+- Last-Modified 는 초 단위라 같은 초 안의 변경을 구분하지 못하므로, 그 초가 지난 뒤에만 보냅니다.
+- 응답 형식이 바뀌면 ETAG_SCHEMA 를 올려 이전 ETag 를 무효로 만듭니다.
+- 샤딩중 전체 셀러 범위의 버전은 모든 샤드의 버전의 합입니다.
+
+    versions = get_data_versions(db_connection, ('orders', 'products'), seller_id)
+    if is_not_modified(versions):
+        return not_modified(versions)
+    ...
+    return set_validators(jsonify(result), versions), 200
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 전체 셀러 범위는 모든 샤드의 버전을 더함
+"""
+
+version_dao = VersionDao()
+
+ETAG_SCHEMA = 1
+
+
+def make_versions(db_connection, scope_key, rows):
+    """
+    버전 행들로 ETag 와 Last-Modified(UTC) 를 만듭니다.
+    """
+    clock = version_dao.get_clock(db_connection)
+    utc_shift = clock['utc_now'] - clock['now']
+
+    viewer = 'm' if getattr(request, 'is_master', False) else 'u'
+    etag = f'{ETAG_SCHEMA}-{viewer}-{scope_key}-' + '-'.join(
+        f"{row['scope']}.{row['version']}" for row in sorted(rows, key=lambda row: row['scope'])
+    )
+
+    last_modified = None
+    updated_at = max((row['updated_at'] for row in rows), default=None)
+
+    if updated_at:
+        # 초 단위로 올림, 그 초가 지나지 않았으면 같은 초에 또 바뀔 수 있으므로 보내지 않음
+        last_modified = (updated_at + utc_shift).replace(microsecond=0) + datetime.timedelta(seconds=1)
+        if last_modified > clock['utc_now']:
+            last_modified = None
+
+    return {'etag': etag, 'last_modified': last_modified}
+
+
+def get_data_versions(db_connection, scopes, seller_id=None):
+    """
+    Args:
+        db_connection : db_connection
+        scopes        : 응답이 의존하는 범위들 (products, orders, sellers)
+        seller_id     : 셀러 범위 (None 이면 전체 셀러)
+    Returns:
+        {etag, last_modified}
+    """
+    body = {'scopes': tuple(scopes), 'seller_id': seller_id}
+
+    if seller_id:
+        rows = version_dao.get_versions(db_connection, body)
+    else:
+        # 범위별로 샤드의 버전을 더하고 마지막 변경일시는 가장 늦은 것으로
+        merged = {}
+        for shard_rows in fan_out(lambda shard_connection: version_dao.get_versions(shard_connection, body), db_connection):
+            for row in shard_rows:
+                if row['scope'] in merged:
+                    merged[row['scope']]['version'] += row['version']
+                    merged[row['scope']]['updated_at'] = max(merged[row['scope']]['updated_at'], row['updated_at'])
+                else:
+                    merged[row['scope']] = dict(row)
+        rows = list(merged.values())
+
+    return make_versions(db_connection, f's{seller_id}' if seller_id else 'all', rows)
+
+
+def get_product_data_versions(db_connection, product_id):
+    """
+    상품을 등록한 셀러의 상품 버전으로 ETag 를 만듭니다. (옵션 조회용)
+    """
+    rows = version_dao.get_product_versions(db_connection, {'product_id': product_id})
+
+    return make_versions(db_connection, f'p{product_id}', rows)
+
+
+def is_not_modified(versions):
+    """
+    요청의 If-None-Match (없으면 If-Modified-Since) 가 현재 버전과 같은지 확인합니다.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(versions['etag'])
+
+    if request.if_modified_since and versions['last_modified']:
+        return versions['last_modified'] <= request.if_modified_since.replace(tzinfo=None)
+
+    return False
+
+
+def set_validators(response, versions):
+    """
+    응답에 ETag, Last-Modified 와 캐시 헤더를 붙입니다.
+    """
+    response.set_etag(versions['etag'], weak=True)
+
+    if versions['last_modified']:
+        response.last_modified = versions['last_modified']
+
+    # 캐시해 두되 쓸 때마다 확인하도록 함
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.vary.add('Authorization')
+
+    return response
+
+
+def not_modified(versions):
+    """
+    본문 없는 304 응답을 만듭니다.
+    """
+    return set_validators(Response(status=304), versions)
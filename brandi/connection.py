@@ -1,6 +1,15 @@
+import time
+import random
+import logging
+import threading
+
 import pymysql
 # import boto3
 
+import config
+
+from flask import g, request, has_request_context
+
 from config import DATABASES
 
 """ 데이터베이스 커넥션 생성
@@ -8,19 +17,146 @@ Args: import 될 때 마다 데이터베이스 커넥션 생성
 
 Returns: database connection 객체
 
+읽기/쓰기 분리
+- get_connection      : 프라이머리. 쓰기와, 쓴 뒤 바로 읽어야 하는 흐름에서 사용합니다.
+- get_read_connection : 읽기 전용 조회(GET API, 목록/통계/내보내기)에서 사용합니다.
+  config.REPLICAS 의 레플리카 중 하나를 고르고, 쓸 수 있는 레플리카가 없으면 프라이머리를 반환합니다.
+- 레플리카 지연(Seconds_Behind_Source)이 MAX_REPLICA_LAG 초를 넘거나 복제가 멈춘 레플리카는 사용하지 않습니다.
+  지연은 레플리카마다 LAG_CHECK_INTERVAL 초에 한 번 확인합니다. (REPLICATION CLIENT 권한 필요)
+- 세션 일관성: 쓰기 트랜잭션이 커밋되면 프라이머리의 GTID 집합을 응답 헤더(X-Consistency-Token)로 보내고,
+  클라이언트가 이후 요청에 같은 헤더를 보내면 그 GTID 를 이미 반영한 레플리카만 사용합니다.
+  (없으면 프라이머리) 그래서 자신이 쓴 내용은 바로 다음 조회에서 보입니다.
+- REPLICAS 가 없으면 모든 조회가 프라이머리로 갑니다.
+
+로컬에서 두 MySQL 인스턴스로 확인하기
+    프라이머리(3306), 레플리카(3307) 모두 gtid_mode=ON, enforce_gtid_consistency=ON 으로 실행하고
+    레플리카에서 CHANGE REPLICATION SOURCE TO SOURCE_HOST='127.0.0.1', SOURCE_PORT=3306, ..., SOURCE_AUTO_POSITION=1; START REPLICA;
+    config.py 에 REPLICAS = [{'host': '127.0.0.1', 'port': 3307}] (user, password, database 는 DATABASES 와 같으면 생략)
+    레플리카에서 STOP REPLICA SQL_THREAD 로 지연을 만들면, 쓰기 후 토큰을 보낸 조회는 프라이머리로 갑니다.
+
 Authors: 홍성은
 
 History:
     2020-10-26 : 초기 생성
+    2026-10-19 : 레플리카 읽기 분리, 세션 일관성 토큰 추가
 """
 
+REPLICAS = getattr(config, 'REPLICAS', [])
 
-def get_connection():
+MAX_REPLICA_LAG       = 5   # 초, 이보다 늦은 레플리카는 사용하지 않음
+LAG_CHECK_INTERVAL    = 1.0 # 초, 레플리카별 지연 확인 주기
+REPLICA_RETRY_SECONDS = 10  # 초, 연결에 실패한 레플리카를 다시 시도하기까지의 시간
+
+CONSISTENCY_TOKEN_HEADER = 'X-Consistency-Token'
+
+_lock = threading.Lock()
+
+# 레플리카별 상태 {checked_at : 지연 확인 시각, lag : 지연(초, 복제가 멈췄으면 None), down_until : 연결 실패시 제외 시각}
+_replica_states = [{'checked_at': 0, 'lag': None, 'down_until': 0} for _ in REPLICAS]
+
+
+def connect(database):
     return pymysql.connect(
-        user=DATABASES['user'],
-        password=DATABASES['password'],
-        host=DATABASES['host'],
-        port=DATABASES['port'],
-        database=DATABASES['database'],
+        user=database['user'],
+        password=database['password'],
+        host=database['host'],
+        port=database['port'],
+        database=database['database'],
         cursorclass=pymysql.cursors.DictCursor,
     )
+
+
+def get_connection():
+    return connect(DATABASES)
+
+
+def check_replica_lag(db_connection, index):
+    """
+    LAG_CHECK_INTERVAL 초가 지났으면 레플리카의 지연을 다시 확인합니다.
+    Returns:
+        지연(초), 복제가 멈췄으면 None
+    """
+    state = _replica_states[index]
+    now = time.monotonic()
+
+    if now - state['checked_at'] >= LAG_CHECK_INTERVAL:
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute("SHOW REPLICA STATUS")
+            status = cursor.fetchone() or {}
+
+        with _lock:
+            state['checked_at'] = now
+            state['lag'] = status.get('Seconds_Behind_Source', status.get('Seconds_Behind_Master'))
+
+    return state['lag']
+
+
+def has_applied(db_connection, token):
+    """
+    레플리카가 토큰(GTID 집합)의 트랜잭션을 모두 반영했는지 확인합니다.
+    """
+    with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        cursor.execute("SELECT GTID_SUBSET(%(token)s, @@GLOBAL.gtid_executed) AS applied", {'token': token})
+        return bool(cursor.fetchone()['applied'])
+
+
+def get_read_connection(token=None):
+    """
+    읽기 전용 조회에 사용할 커넥션을 반환합니다. 지연이 작고 토큰을 반영한 레플리카, 없으면 프라이머리입니다.
+    Args:
+        token : 세션 일관성 토큰 (없으면 요청의 X-Consistency-Token 헤더)
+    Returns:
+        database connection 객체
+    """
+    if not REPLICAS:
+        return get_connection()
+
+    if token is None and has_request_context():
+        token = request.headers.get(CONSISTENCY_TOKEN_HEADER)
+
+    indexes = list(range(len(REPLICAS)))
+    random.shuffle(indexes)
+
+    for index in indexes:
+        state = _replica_states[index]
+        now = time.monotonic()
+
+        # 연결 실패 후 기다리는 중이거나, 최근 확인에서 지연이 컸던 레플리카는 연결하지 않음
+        if now < state['down_until']:
+            continue
+        if now - state['checked_at'] < LAG_CHECK_INTERVAL and (state['lag'] is None or state['lag'] > MAX_REPLICA_LAG):
+            continue
+
+        try:
+            db_connection = connect(dict(DATABASES, **REPLICAS[index]))
+        except pymysql.MySQLError as error:
+            logging.warning('replica %s unavailable: %s', index, error)
+            state['down_until'] = now + REPLICA_RETRY_SECONDS
+            continue
+
+        try:
+            lag = check_replica_lag(db_connection, index)
+
+            if lag is not None and lag <= MAX_REPLICA_LAG and (not token or has_applied(db_connection, token)):
+                return db_connection
+
+        except pymysql.MySQLError as error:
+            # 잘못된 토큰이거나 레플리카 오류 - 프라이머리에서 읽음
+            logging.warning('replica %s check failed: %s', index, error)
+
+        db_connection.close()
+
+    return get_connection()
+
+
+def save_consistency_token(db_connection):
+    """
+    요청 중에 쓰기 트랜잭션이 커밋되면, 프라이머리의 GTID 집합을 응답 헤더로 보낼 세션 일관성 토큰으로 저장합니다.
+    (transaction.commit 에서 호출, 요청 밖이나 레플리카를 쓰지 않으면 아무것도 하지 않음)
+    """
+    if not REPLICAS or not has_request_context():
+        return
+
+    with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        cursor.execute("SELECT @@GLOBAL.gtid_executed AS gtid_executed")
+        g.consistency_token = cursor.fetchone()['gtid_executed'].replace('\n', '')
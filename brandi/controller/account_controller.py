@@ -1,7 +1,11 @@
 from service.account_service import AccountService
 from model.account_dao import AccountDao
 from utils import login_decorator, error_code, master_only, check_param
-from connection import get_connection
+from json_encoder import parse_id
+from connection import get_connection, get_read_connection
+from transaction import run_in_transaction
+from export import export_response, EXPORT_FORMATS
+from conditional import get_data_versions, is_not_modified, not_modified, set_validators
 from config import SECRET, ALGORITHM
 from flask_request_validator import validate_params, Param, GET, PATH, JSON, Pattern, MaxLength, FORM
 from flask import Blueprint, request, jsonify
@@ -19,6 +23,20 @@ re
 account_app = Blueprint('account_app', __name__)
 account_dao = AccountDao()
 
+# 셀러 리스트 내보내기 컬럼 (행의 키, 머리글)
+SELLER_EXPORT_COLUMNS = [
+    ('id', '번호'),
+    ('identification', '셀러아이디'),
+    ('english_name', '영문이름'),
+    ('korean_name', '한글이름'),
+    ('manager_name', '담당자이름'),
+    ('status_name', '셀러상태'),
+    ('contact', '담당자연락처'),
+    ('email', '담당자이메일'),
+    ('attribute', '셀러속성'),
+    ('created_at', '등록일시'),
+]
+
 
 class Account:
     """Account 뷰 
@@ -82,10 +100,13 @@ class Account:
             # DB 연결 후 account_service의 seller_info 로직 진행된 결과값 return
             if db_connection:
                 account_service = AccountService()
-                result = account_service.signup(
-                    seller_info, db_connection=db_connection)
-                # DB 입력
-                db_connection.commit()
+                # DB 입력 - 데드락 등 재시도 가능한 에러는 롤백 후 다시 실행
+                result = run_in_transaction(
+                    'signup',
+                    db_connection,
+                    lambda: account_service.signup(
+                        dict(seller_info), db_connection=db_connection)
+                )
                 return result
             return jsonify({'message': 'INVALID_CONNECTION'}), 500
 
@@ -143,8 +164,9 @@ class Account:
         History: 2020-10-27 : 초기 생성
                  2020-11-01 : 필터 생성 
                  2020-11-03 : 페이지네이션 생성 
+                 2026-10-19 : 셀러 정보 버전이 같으면 304 (If-None-Match, If-Modified-Since)
         """
-        db_connection = get_connection()
+        db_connection = get_read_connection()
 
         # validation 통과한 값 seller_list로 변수화
         seller_list = {
@@ -173,10 +195,15 @@ class Account:
         # DB 연결
         try:
             if db_connection:
+                # 셀러 정보가 바뀌지 않았으면 목록을 조회하지 않음
+                versions = get_data_versions(db_connection, ('sellers',))
+                if is_not_modified(versions):
+                    return not_modified(versions)
+
                 account_service = AccountService()
                 result = account_service.get_seller_list(
                     seller_list, db_connection=db_connection)
-                return jsonify(result)
+                return set_validators(jsonify(result), versions)
 
         except Exception as error:
             return error_code({'error': 'A1043'})
@@ -187,6 +214,57 @@ class Account:
             except Exception as exception:
                 return error_code({'error': 'C0003', 'programming_error': exception})
 
+    @account_app.route('/seller/export', methods=['GET'])
+    @master_only
+    @validate_params(
+        Param('id', GET, str, required=False, default=None),
+        Param('identification', GET, str, required=False, default=None),
+        Param('english_name', GET, str, required=False, default=None),
+        Param('korean_name', GET, str, required=False, default=None),
+        Param('manager_name', GET, str, required=False, default=None),
+        Param('status_name', GET, str, required=False, default=None),
+        Param('contact', GET, str, required=False, default=None),
+        Param('email', GET, str, required=False, default=None),
+        Param('attribute', GET, str, required=False, default=None),
+        Param('start_date', GET, str, required=False),
+        Param('end_date', GET, str, required=False),
+        Param('format', GET, str, required=False, default='csv')
+    )
+    def export_seller_list(*args):
+        """셀러 리스트 API 와 같은 필터로 조회한 셀러 전체를 CSV / XLSX 파일로 내려받는 API 입니다.
+        Args:
+            format : csv / xlsx (기본 csv)
+            그 외  : 셀러 리스트 API 의 필터 (offset, limit 제외)
+        Returns: 파일 스트리밍 응답, 200
+        Authors: 홍성은
+
+        History: 2026-10-19 : 초기 생성
+        """
+        if args[11] not in EXPORT_FORMATS:
+            return error_code({'error': 'C0008'})
+
+        seller_list = {
+            'id': args[0],
+            'identification': args[1],
+            'english_name': args[2],
+            'korean_name': args[3],
+            'manager_name': args[4],
+            'status_name': args[5],
+            'contact': args[6],
+            'email': args[7],
+            'attribute': args[8],
+            'start_date': args[9],
+            'end_date': args[10],
+        }
+
+        return export_response(
+            'sellers',
+            args[11],
+            SELLER_EXPORT_COLUMNS,
+            lambda db_connection: account_dao.stream_seller_list(db_connection, seller_list),
+            sharded=False
+        )
+
     @account_app.route("/signin", methods=['POST'])
     def sign_in():
         """
@@ -284,7 +362,12 @@ class Account:
 
         # DB 연결
         try:
-            db_connection = get_connection()
+            db_connection = get_read_connection()
+
+            # 셀러 정보가 바뀌지 않았으면 조회하지 않음
+            versions = get_data_versions(db_connection, ('sellers',), seller_id)
+            if is_not_modified(versions):
+                return not_modified(versions)
 
             account_service = AccountService()
             result = account_service.get_seller_info(
@@ -292,7 +375,7 @@ class Account:
 
             # 성공
             if 'success' in result:
-                return jsonify(result), 200
+                return set_validators(jsonify(result), versions), 200
 
             # 실패
             else:
@@ -328,6 +411,8 @@ class Account:
         # parameter 확인
         try:
             body = request.json
+            # 2^53 보다 큰 번호는 응답에서 문자열로 보내므로 정수로 바꿈 (json_encoder)
+            body['seller_id'] = parse_id(body['seller_id'])
             essens_params = [
                 (int, body['seller_id']),
                 (int, body['action_id'])
@@ -349,17 +434,19 @@ class Account:
             db_connection = get_connection()
 
             account_service = AccountService()
-            print(request.account_id)
-            result = account_service.change_seller_status(db_connection, body)
+            # 데드락 등 재시도 가능한 에러는 롤백 후 다시 실행 (성공시 커밋, 실패시 롤백)
+            result = run_in_transaction(
+                'change_seller_status',
+                db_connection,
+                lambda: account_service.change_seller_status(db_connection, body)
+            )
 
             # 성공
             if 'success' in result:
-                db_connection.commit()
                 return jsonify(result), 200
 
             # 실패
             else:
-                db_connection.rollback()
                 return error_code(result)
 
         # DB 연결 실패
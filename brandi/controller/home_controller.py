@@ -4,7 +4,7 @@ import pymysql
 import requests
 from flask import Blueprint,request,jsonify
 
-from connection import get_connection
+from sharding import get_shard_connection
 from utils import login_decorator, error_code, master_only, check_param
 from model.account_dao import AccountDao
 from service.account_service import AccountService 
@@ -26,7 +26,7 @@ class Home:
         """
         #DB 연결
         try:
-            db_connection = get_connection()
+            db_connection = get_shard_connection(request.account_id, read=True)
 
             account_service = AccountService()
             is_master = request.is_master
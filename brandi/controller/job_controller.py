@@ -0,0 +1,168 @@
+from flask import Blueprint, request, jsonify
+
+from connection import get_connection
+from sharding import get_located_connection
+from transaction import run_in_transaction
+from utils import login_decorator, error_code, master_only
+
+from model.job_dao import JobDao
+from service.job_service import JobService
+
+job_app = Blueprint('job_app', __name__)
+job_service = JobService()
+job_dao = JobDao()
+
+
+def get_job_connection(job_id):
+    """
+    작업이 있는 DB 의 커넥션. 상품/주문 대량 변경 작업은 그 셀러의 샤드, 나머지는 프라이머리에 있습니다.
+    """
+    return get_located_connection(
+        lambda shard_connection: job_dao.get_job(shard_connection, {'job_id': job_id}),
+        ('job', job_id)
+    )
+
+
+class Job:
+    @job_app.route("/<int:job_id>", methods=['GET'])
+    @login_decorator
+    def get_job(job_id):
+        """
+        작업의 상태(queued / running / succeeded / failed / cancelled), 진행 상황, 결과를 조회하는 API
+        셀러는 자신이 요청한 작업만 조회할 수 있습니다.
+        작성자: 홍성은
+        Args:
+            job_id : 작업 id
+        Returns:
+            {'success': {id, job_type, status, progress, total, result, error, ...}}, 200
+        """
+        body = {
+            'job_id'     : job_id,
+            'account_id' : request.account_id,
+            'is_master'  : request.is_master
+        }
+
+        # DB 연결
+        try:
+            db_connection = get_job_connection(job_id)
+            result = job_service.get_job(db_connection, body)
+
+            # 성공
+            if 'success' in result:
+                return jsonify(result), 200
+
+            # 실패
+            else:
+                return error_code(result)
+
+        # DB 연결 실패
+        except Exception as exception:
+            return error_code({"error": "C0002", 'programming_error': exception})
+
+        # DB Close
+        finally:
+            try:
+                if db_connection:
+                    db_connection.close()
+            except Exception as exception:
+                return error_code({"error": "C0003", 'programming_error': exception})
+
+    @job_app.route("/<int:job_id>/cancel", methods=['POST'])
+    @login_decorator
+    def cancel_job(job_id):
+        """
+        작업을 취소하는 API. 실행중인 작업은 처리중인 청크까지 마치고 멈추며, 이미 처리된 청크는 되돌리지 않습니다.
+        작성자: 홍성은
+        Args:
+            job_id : 작업 id
+        Returns:
+            {'success': {job_id, status}}, 200
+        """
+        body = {
+            'job_id'     : job_id,
+            'account_id' : request.account_id,
+            'is_master'  : request.is_master
+        }
+
+        # DB 연결
+        try:
+            db_connection = get_job_connection(job_id)
+            result = run_in_transaction(
+                'cancel_job',
+                db_connection,
+                lambda: job_service.cancel_job(db_connection, body)
+            )
+
+            # 성공
+            if 'success' in result:
+                return jsonify(result), 200
+
+            # 실패
+            else:
+                return error_code(result)
+
+        # DB 연결 실패
+        except Exception as exception:
+            return error_code({"error": "C0002", 'programming_error': exception})
+
+        # DB Close
+        finally:
+            try:
+                if db_connection:
+                    db_connection.close()
+            except Exception as exception:
+                return error_code({"error": "C0003", 'programming_error': exception})
+
+    @job_app.route("", methods=['POST'])
+    @master_only
+    def enqueue_job():
+        """
+        마스터가 백필/대사 작업을 등록하는 API
+        작성자: 홍성은
+        Args:
+            job_type : backfill_receivers / reconcile_rollups
+            payload  : 작업 입력 (예: {"days": 2})
+        Returns:
+            {'success': {job_id}}, 202
+        """
+        try:
+            body = {
+                'job_type'   : request.json['job_type'],
+                'payload'    : request.json.get('payload', {}),
+                'account_id' : request.account_id
+            }
+
+        except TypeError as exception:
+            return error_code({'error': 'C0006', 'programming_error': exception})
+
+        except Exception as exception:
+            return error_code({'error': 'C0001', 'programming_error': exception})
+
+        # DB 연결
+        try:
+            db_connection = get_connection()
+            result = run_in_transaction(
+                'enqueue_job',
+                db_connection,
+                lambda: job_service.enqueue_maintenance_job(db_connection, dict(body))
+            )
+
+            # 성공
+            if 'success' in result:
+                return jsonify(result), 202
+
+            # 실패
+            else:
+                return error_code(result)
+
+        # DB 연결 실패
+        except Exception as exception:
+            return error_code({"error": "C0002", 'programming_error': exception})
+
+        # DB Close
+        finally:
+            try:
+                if db_connection:
+                    db_connection.close()
+            except Exception as exception:
+                return error_code({"error": "C0003", 'programming_error': exception})
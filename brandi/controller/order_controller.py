@@ -1,25 +1,56 @@
 import os
 import sys
 import re
+import copy
+import json
+import time
 import pymysql
 import requests
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 
-from connection import get_connection
+from sharding import get_shard_connection, get_located_connection, is_cross_shard, CrossShardError
+from transaction import run_in_transaction
+from export import export_response, EXPORT_FORMATS
+from event_bus import event_bus
+from conditional import get_data_versions, get_product_data_versions, is_not_modified, not_modified, set_validators
 from utils import login_decorator, error_code, master_only, check_param, send_slack
+from json_encoder import BigIntJSONEncoder, parse_id
 from flask_request_validator import GET, PATH, Param, JSON, validate_params
 
 from model.product_dao import ProductDao
 from model.account_dao import AccountDao
 from model.order_dao import OrderDao
 
-from service.order_service import OrderService
+from service.order_service import OrderService, ORDER_STATUS_TABS, DB_UTC_OFFSET
 from service.product_service import ProductService
+from service.job_service import BULK_JOB_THRESHOLD
+from service.sync_service import SyncService
 
 order_app = Blueprint('order_app', __name__)
 order_service = OrderService()
 product_service = ProductService()
+order_dao = OrderDao()
+product_dao = ProductDao()
+sync_service = SyncService()
+
+# 주문 이벤트 스트림
+EVENT_HEARTBEAT_SECONDS = 15      # 이벤트가 없을 때 연결 유지용 주석을 보내는 간격
+EVENT_STREAM_SECONDS    = 5 * 60  # 한 연결을 유지하는 최대 시간 (클라이언트는 Last-Event-ID 로 다시 연결)
+EVENT_RETRY_MILLISECONDS = 3000   # 연결이 끊겼을 때 클라이언트가 다시 연결하기까지의 시간
+
+# 주문 관리 목록 내보내기 컬럼 (행의 키, 머리글)
+ORDER_EXPORT_COLUMNS = [
+    ('a_paied_at', '결제일자'),
+    ('b_oreder_id', '주문번호'),
+    ('c_detail_order_id', '주문상세번호'),
+    ('d_products_name', '상품명'),
+    ('e_option_id', '옵션정보'),
+    ('f_quantity', '수량'),
+    ('g_reciever', '주문자명'),
+    ('h_reciever_contact', '핸드폰번호'),
+    ('i_detail_order_statuses_name', '주문상태'),
+]
 
 
 class Order:
@@ -49,16 +80,24 @@ class Order:
         except Exception as exception:
             return error_code({'error': 'C0001', 'programming_error': exception})
 
-        # DB 연결
+        # DB 연결 (상품이 있는 샤드)
         try:
+            db_connection = get_located_connection(
+                lambda shard_connection: product_dao.get_products_by_ids(shard_connection, {'product_ids': (product_id,)}),
+                ('product', product_id)
+            )
+
+            # 상품의 셀러 상품 버전이 같으면 옵션을 조회하지 않음
+            versions = get_product_data_versions(db_connection, product_id)
+            if is_not_modified(versions):
+                return not_modified(versions)
 
-            db_connection = get_connection()
             result = product_service.get_options_service(
                 db_connection, product_id)
 
             # 성공
             if 'success' in result:
-                return jsonify(result), 200
+                return set_validators(jsonify(result), versions), 200
 
             # 실패
             else:
@@ -92,11 +131,16 @@ class Order:
             zip_code   : 수령지 우편번호
             street_address : 수령지 주소
             detail_address : 수령지 상세주소
+            Idempotency-Key : 재시도시 중복 주문을 막기 위한 멱등키 (header, 선택)
         Returns:
         """
         # parameter 확인
         try:
             body = request.json
+            idempotency_key = request.headers.get('Idempotency-Key', None)
+            if idempotency_key and len(idempotency_key) > 100:
+                return error_code({'error': 'O3022'})
+
             essens_params = [
                 (int, product_id),
                 (int, body['color_id']),
@@ -120,26 +164,31 @@ class Order:
         except Exception as exception:
             return error_code({'error': 'C0001', 'programming_error': exception})
 
-        # DB 연결
+        # DB 연결 (상품이 있는 샤드에 주문을 저장)
         try:
-            db_connection = get_connection()
-
-            result = order_service.make_order_service(
-                db_connection, product_id, body)
+            db_connection = get_located_connection(
+                lambda shard_connection: product_dao.get_products_by_ids(shard_connection, {'product_ids': (product_id,)}),
+                ('product', product_id)
+            )
+
+            # 데드락 등 재시도 가능한 에러는 롤백 후 다시 실행 (성공시 커밋, 실패시 롤백)
+            result = run_in_transaction(
+                'make_order',
+                db_connection,
+                lambda: order_service.make_order_service(
+                    db_connection, product_id, copy.deepcopy(body), idempotency_key)
+            )
 
             # 성공
             if 'success' in result:
-                db_connection.commit()
                 return jsonify(result), 200
 
             # 실패
             else:
-                db_connection.rollback()
                 return error_code(result)
 
         # DB 연결 실패
         except Exception as exception:
-            db_connection.rollback()
             return error_code({"error": "C0002", 'programming_error': exception})
 
         # DB Close
@@ -158,14 +207,21 @@ class Order:
         작성자: 김수정
         Args:
             body   : 딕셔너리
-                {detail_order_ids : 배송상태 변경할 주문들의 번호(list)}
+                {detail_order_ids : 배송상태 변경할 주문들의 번호(list, 응답에서 받은 문자열 그대로 보내도 됨)}
                 {status_before:
                 status_after}
+            Idempotency-Key : 재시도시 중복 처리를 막기 위한 멱등키 (header, 선택)
         Returns:
+            {'success': "변경 완료"}, 200
+            {'success': {'job_id'}}, 202 : 주문이 BULK_JOB_THRESHOLD 개보다 많으면 작업 큐에서 처리 (GET /job/<job_id> 로 확인)
         """
         # parameter 확인
         try:
             body = request.json
+            idempotency_key = request.headers.get('Idempotency-Key', None)
+            if idempotency_key and len(idempotency_key) > 100:
+                return error_code({'error': 'O3022'})
+
             essens_params = [
                 (list, body['id']),
                 (int, body['status_id']),
@@ -175,31 +231,226 @@ class Order:
             if check_check:
                 return error_code(check_check)
 
+            # 2^53 보다 큰 번호는 응답에서 문자열로 보내므로 정수로 바꿈 (json_encoder)
+            body['id'] = [parse_id(order_id) for order_id in body['id']]
+
         except TypeError as exception:
             return error_code({'error': 'C0006', 'programming_error': exception})
 
         except Exception as exception:
             return error_code({'error': 'C0001', 'programming_error': exception})
 
+        # 주문들이 있는 샤드 연결
+        try:
+            db_connection = get_located_connection(
+                lambda shard_connection: order_dao.get_order_sellers(shard_connection, {'order_ids': tuple(body['id'])})
+            )
+        except CrossShardError:
+            return error_code({'error': 'C0009'})
+        except Exception as exception:
+            return error_code({"error": "C0002", 'programming_error': exception})
+
+        try:
+            # 대량 변경은 작업 큐에 넣고 바로 응답
+            if len(body['id']) > BULK_JOB_THRESHOLD:
+                result = run_in_transaction(
+                    'change_order_status',
+                    db_connection,
+                    lambda: order_service.enqueue_order_progress(
+                        db_connection, request.account_id, copy.deepcopy(body), idempotency_key)
+                )
+
+                if 'success' in result:
+                    return jsonify(result), 202
+                else:
+                    return error_code(result)
+
+            # 데드락 등 재시도 가능한 에러는 롤백 후 다시 실행 (성공시 커밋, 실패시 롤백)
+            result = run_in_transaction(
+                'change_order_status',
+                db_connection,
+                lambda: order_service.make_order_progress(
+                    db_connection, request.account_id, copy.deepcopy(body), idempotency_key)
+            )
+
+            # 성공
+            if 'success' in result:
+                return jsonify(result), 200
+
+            # 실패
+            else:
+                return error_code(result)
+
+        # DB 연결 실패
+        except Exception as exception:
+            return error_code({"error": "C0002", 'programming_error': exception})
+
+        # DB Close
+        finally:
+            try:
+                if db_connection:
+                    db_connection.close()
+            except Exception as exception:
+                return error_code({"error": "C0003", 'programming_error': exception})
+
+    @order_app.route("/events", methods=['GET'])
+    @login_decorator
+    @validate_params(
+        Param('seller_id', GET, int, required=False, default=None),
+        Param('last_event_id', GET, int, required=False, default=None),
+    )
+    def stream_order_events(*args):
+        """
+        주문 생성/상태 변경 이벤트를 Server-Sent Events 로 보냅니다.
+        셀러는 자신의 주문만, 마스터는 seller_id 를 주면 해당 셀러의 주문을, 없으면 전체 주문의 이벤트를 받습니다.
+        주문관리 화면은 목록을 주기적으로 다시 조회하는 대신, 이벤트로 받은 주문만 다시 불러오면 됩니다.
+        - order_created        : {detail_order_id, order_id, status_id}
+        - order_status_changed : {detail_order_ids, before_status_id, status_id}
+        - reset                : 놓친 이벤트가 있어 이어 받을 수 없음, 목록과 건수를 다시 조회해야 함
+        작성자: 홍성은
+        Args:
+            seller_id     : 특정 셀러만 받음 (선택, 마스터만 사용)
+            last_event_id : 마지막으로 받은 이벤트 id (선택, Last-Event-ID 헤더가 우선)
+        Returns:
+            text/event-stream, 200
+        """
+        seller_id = args[0] if request.is_master else request.account_id
+
+        try:
+            last_event_id = int(request.headers.get('Last-Event-ID') or args[1] or event_bus.get_last_id())
+        except ValueError as exception:
+            return error_code({'error': 'C0001', 'programming_error': exception})
+
+        def generate(last_event_id):
+            yield f'retry: {EVENT_RETRY_MILLISECONDS}\n\n'
+
+            stream_until = time.monotonic() + EVENT_STREAM_SECONDS
+            while time.monotonic() < stream_until:
+                events = event_bus.wait_for_events(last_event_id, EVENT_HEARTBEAT_SECONDS)
+
+                # 놓친 이벤트가 있으면 지금부터 다시 받도록 알림
+                if events is None:
+                    last_event_id = event_bus.get_last_id()
+                    yield f'id: {last_event_id}\nevent: reset\ndata: {{}}\n\n'
+                    continue
+
+                # 다른 셀러의 이벤트만 있었어도 id 는 넘겨 두어, 다시 연결할 때 건너뛴 이벤트를 다시 보지 않게 함
+                if not events:
+                    yield f'id: {last_event_id}\n: ping\n\n'
+                    continue
+
+                for event in events:
+                    if seller_id is None or event['seller_id'] == seller_id:
+                        yield f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'], cls=BigIntJSONEncoder)}\n\n"
+
+                last_event_id = events[-1]['id']
+
+        return Response(
+            stream_with_context(generate(last_event_id)),
+            content_type='text/event-stream; charset=utf-8',
+            headers={
+                'Cache-Control'     : 'no-cache',
+                # nginx 가 응답을 모아서 보내지 않도록 함
+                'X-Accel-Buffering' : 'no',
+            }
+        )
+
+    @order_app.route("/counts", methods=['GET'])
+    @login_decorator
+    @validate_params(
+        Param('seller_id', GET, int, required=False, default=None),
+    )
+    def get_order_status_counts(*args):
+        """
+        주문관리 화면의 탭별 상세주문 수를 조회합니다.
+        셀러는 자신의 주문만, 마스터는 seller_id 를 주면 해당 셀러의 주문을, 없으면 전체 주문을 조회합니다.
+        작성자: 홍성은
+        Args:
+            seller_id : 특정 셀러만 조회 (선택, 마스터만 사용)
+        Returns:
+            {'success': {allOrderList, prepareList, deliveryPrepareList, deliveryList,
+                         deliveryCompleteList, orderConfirmList}}, 200
+        """
+        body = {
+            'account_id' : args[0] if request.is_master else request.account_id
+        }
+
+        # DB 연결
+        try:
+            db_connection = get_shard_connection(body['account_id'], read=True)
+
+            # 주문이 바뀌지 않았으면 건수를 조회하지 않음
+            versions = get_data_versions(db_connection, ('orders',), body['account_id'])
+            if is_not_modified(versions):
+                return not_modified(versions)
+
+            result = order_service.get_order_status_counts(db_connection, body)
+
+            # 성공
+            if 'success' in result:
+                return set_validators(jsonify(result), versions), 200
+
+            # 실패
+            else:
+                return error_code(result)
+
+        # DB 연결 실패
+        except Exception as exception:
+            return error_code({"error": "C0002", 'programming_error': exception})
+
+        # DB Close
+        finally:
+            try:
+                if db_connection:
+                    db_connection.close()
+            except Exception as exception:
+                return error_code({"error": "C0003", 'programming_error': exception})
+
+    @order_app.route("/changes", methods=['GET'])
+    @login_decorator
+    @validate_params(
+        Param('token', GET, int, required=False, default=None),
+        Param('limit', GET, int, required=False, default=None),
+        Param('seller_id', GET, int, required=False, default=None),
+    )
+    def get_order_changes(*args):
+        """
+        토큰 이후에 생성되었거나 상태가 바뀐 상세주문만 보내는 API
+        셀러는 자신의 주문만, 마스터는 seller_id 를 주면 해당 셀러의 주문을, 없으면 전체 주문의 변경을 받습니다.
+        resync 가 true 이면 받은 토큰을 저장하고 주문 목록 전체를 다시 불러와야 합니다.
+        작성자: 홍성은
+        Args:
+            token     : 마지막으로 받은 토큰 (처음에는 생략)
+            limit     : 최대 변경 수
+            seller_id : 특정 셀러만 받음 (선택, 마스터만 사용)
+        Returns:
+            {'success': {resync, changes, deleted(상세주문 번호들), token, has_more}}, 200
+        """
+        body = {
+            'token'     : args[0],
+            'limit'     : args[1],
+            'seller_id' : args[2] if request.is_master else request.account_id
+        }
+
+        # 변경 기록 토큰은 샤드마다 따로이므로 샤딩중에는 셀러를 지정해야 함
+        if is_cross_shard(body['seller_id']):
+            return error_code({'error': 'C0009'})
+
         # DB 연결
         try:
-            db_connection = get_connection()
-            result = order_service.make_order_progress(
-                db_connection, request.account_id, body)
+            db_connection = get_shard_connection(body['seller_id'], read=True)
+            result = sync_service.get_order_changes(db_connection, body)
 
             # 성공
             if 'success' in result:
-                db_connection.commit()
                 return jsonify(result), 200
 
             # 실패
             else:
-                db_connection.rollback()
                 return error_code(result)
 
         # DB 연결 실패
         except Exception as exception:
-            db_connection.rollback()
             return error_code({"error": "C0002", 'programming_error': exception})
 
         # DB Close
@@ -211,10 +462,11 @@ class Order:
                 return error_code({"error": "C0003", 'programming_error': exception})
 
     @order_app.route("/<order_status_name>", methods=['GET'])
+    @login_decorator
     @validate_params(
         Param('order_status_name', PATH, str, required=True),
-        Param('start_date', GET, int, required=False),
-        Param('end_date', GET, int, required=False),
+        Param('start_date', GET, str, required=False),
+        Param('end_date', GET, str, required=False),
         Param('order_number', GET, int, required=False),
         Param('detail_order_id', GET, str, required=False),
         Param('product_name', GET, str, required=False),
@@ -222,16 +474,20 @@ class Order:
         Param('phone_number', GET, int, required=False),
         Param('offset', GET, int, required=False),
         Param('limit', GET, int, required=False),
+        Param('utc_offset', GET, int, required=False),
+        Param('seller_id', GET, int, required=False),
     )
-    # @login_decorator
     def get_order_list(*args):
-        print(args)
         """결제완료된 리스트를 표출합니다.
         Args: 
             order_info: 결제 리스트
             db_connection: 연결된 db
             offset: 각 페이지 시작 번호 
             limit : 페이지에 들어갈 리스트 수
+            start_date : 결제일 검색 시작일 (YYYY-MM-DD, 요청자 시간대)
+            end_date   : 결제일 검색 종료일 (YYYY-MM-DD, 포함)
+            utc_offset : 요청자 시간대의 UTC 와의 차이(분, 기본 540 - KST)
+            seller_id  : 특정 셀러만 조회 (선택, 마스터만 사용. 셀러는 항상 자신의 주문만 조회)
         Returns: 결제 완료 리스트 
             'order_info' : [{
                  paied_at             : 결제일자
@@ -250,18 +506,13 @@ class Order:
             홍성은 
         History:
             2020-11-03: 초기 생성 
+            2026-10-19: 결제일 기간 조회, 요청자 시간대 추가
+            2026-10-19: 로그인 필요, 셀러는 자신의 주문만 조회
+            2026-10-19: 주문/상품 버전이 같으면 304 (If-None-Match, If-Modified-Since)
+            2026-10-19: 셀러 샤드에서 조회
         """
         # PATH 파라미터로 order_status_name 사용 order_status_dict에 있는 키값 넣을 경우 해당 페이지로 넘어감.
-        order_status_dict = {
-            'allOrderList': None,
-            'prepareList': 2,
-            'deliveryPrepareList': 3,
-            'deliveryList': 4,
-            'deliveryCompleteList': 5,
-            'orderConfirmList': 6,
-        }
-        print(order_status_dict)
-        db_connection = get_connection()
+        order_status_dict = ORDER_STATUS_TABS
         # validation 확인 완료 후 request로 받은 데이터 변수화
 
         order_info = {
@@ -274,15 +525,28 @@ class Order:
             'receiver_name': args[6],  # 주문자명
             'phone_number': args[7],  # 핸드폰번호
             'offset': args[8] if args[8] else 0,
-            'limit': args[9] if args[9] else 10
+            'limit': args[9] if args[9] else 10,
+            'utc_offset': args[10] if args[10] is not None else DB_UTC_OFFSET,  # 요청자 시간대(분)
+            'seller_id': args[11] if request.is_master else request.account_id,  # 셀러 범위 (None 이면 전체)
         }
-        print(order_info)
+
+        # 셀러 범위는 셀러의 샤드, 전체 셀러는 서비스에서 모든 샤드를 조회
+        db_connection = get_shard_connection(order_info['seller_id'], read=True)
         try:
             # DB 연결 확인
             if db_connection:
+                # 주문이나 상품명이 바뀌지 않았으면 목록을 조회하지 않음
+                versions = get_data_versions(db_connection, ('orders', 'products'), order_info['seller_id'])
+                if is_not_modified(versions):
+                    return not_modified(versions)
+
                 result = order_service.get_complete_order(
                     order_info, db_connection=db_connection)
-                return jsonify({'success': result}), 200
+
+                if 'success' in result:
+                    return set_validators(jsonify(result), versions), 200
+                else:
+                    return error_code(result)
             else:
                 return error_code({'error': 'C0002'})
 
@@ -294,3 +558,61 @@ class Order:
                 db_connection.close()
             except Exception as error:
                 return error_code({'error': 'A1043'})
+
+    @order_app.route("/<order_status_name>/export", methods=['GET'])
+    @login_decorator
+    @validate_params(
+        Param('order_status_name', PATH, str, required=True),
+        Param('start_date', GET, str, required=False),
+        Param('end_date', GET, str, required=False),
+        Param('order_number', GET, int, required=False),
+        Param('detail_order_id', GET, str, required=False),
+        Param('product_name', GET, str, required=False),
+        Param('reciever_name', GET, str, required=False),
+        Param('phone_number', GET, int, required=False),
+        Param('utc_offset', GET, int, required=False),
+        Param('seller_id', GET, int, required=False),
+        Param('format', GET, str, required=False, default='csv'),
+    )
+    def export_order_list(*args):
+        """
+        주문 관리 목록 API 와 같은 필터로 조회한 주문 전체를 CSV / XLSX 파일로 내려받는 API
+        셀러는 자신의 주문만 내려받습니다.
+        작성자: 홍성은
+        Args:
+            order_status_name : 주문관리 탭 이름 (ORDER_STATUS_TABS)
+            format            : csv / xlsx (기본 csv)
+            그 외             : 주문 관리 목록 API 의 필터 (offset, limit 제외)
+        Returns:
+            파일 스트리밍 응답, 200
+        """
+        if args[0] not in ORDER_STATUS_TABS:
+            return error_code({'error': 'C0006'})
+
+        if args[10] not in EXPORT_FORMATS:
+            return error_code({'error': 'C0008'})
+
+        order_info = {
+            'status_id': ORDER_STATUS_TABS[args[0]],
+            'start_date': args[1],
+            'end_date': args[2],
+            'order_number': args[3],
+            'detail_order_id': args[4],
+            'product_name': args[5],
+            'receiver_name': args[6],
+            'phone_number': args[7],
+            'utc_offset': args[8] if args[8] is not None else DB_UTC_OFFSET,
+            'seller_id': args[9] if request.is_master else request.account_id,
+        }
+
+        error = order_service.check_order_list_filter(order_info)
+        if error:
+            return error_code(error)
+
+        return export_response(
+            f'orders_{args[0]}',
+            args[10],
+            ORDER_EXPORT_COLUMNS,
+            lambda db_connection: order_dao.stream_order_list(db_connection, order_info),
+            seller_id=order_info['seller_id']
+        )
@@ -1,17 +1,40 @@
+import copy
 import pymysql 
 import requests
 
 from flask import Blueprint,request,jsonify
 
-from connection import get_connection
+from sharding import get_shard_connection, get_located_connection, is_cross_shard, CrossShardError
+from transaction import run_in_transaction
+from export import export_response, EXPORT_FORMATS
+from conditional import get_data_versions, is_not_modified, not_modified, set_validators
 from utils import login_decorator, error_code, master_only, check_param
 
 from model.product_dao import ProductDao
 from service.product_service import ProductService 
+from service.job_service import BULK_JOB_THRESHOLD
+from service.sync_service import SyncService
 
 product_app = Blueprint('product_app',__name__)
 
 product_service = ProductService()
+product_dao = ProductDao()
+sync_service = SyncService()
+
+# 상품 목록 내보내기 컬럼 (행의 키, 머리글)
+PRODUCT_EXPORT_COLUMNS = [
+    ('created_at', '등록일'),
+    ('product_number', '상품번호'),
+    ('product_code', '상품코드'),
+    ('product_name', '상품명'),
+    ('seller_name', '셀러명'),
+    ('attribute', '셀러속성'),
+    ('price', '판매가'),
+    ('discount_rate', '할인율'),
+    ('is_on_sale', '판매여부'),
+    ('is_displayed', '진열여부'),
+    ('image_url', '이미지'),
+]
 
 class Product:
     @product_app.route("", methods=['GET'])
@@ -24,16 +47,25 @@ class Product:
             filter_dict : query 
         Returns:
         """
-        # DB 연결
+        # DB 연결 (셀러는 자신의 샤드, 마스터는 서비스에서 모든 샤드를 조회)
         try:
-            db_connection = get_connection()
+            db_connection = get_shard_connection(None if request.is_master else request.account_id, read=True)
+
+            # 셀러의 상품/셀러 정보가 바뀌지 않았으면 목록을 조회하지 않음
+            versions = get_data_versions(
+                db_connection,
+                ('products', 'sellers'),
+                None if request.is_master else request.account_id
+            )
+            if is_not_modified(versions):
+                return not_modified(versions)
 
             filter_dict = request.args
             result = product_service.get_product_list(db_connection, filter_dict)
 
             # 성공 
             if 'success' in result:
-                return jsonify(result), 200
+                return set_validators(jsonify(result), versions), 200
 
             # 실패 
             else:
@@ -51,6 +83,86 @@ class Product:
             except Exception as exception:
                 return error_code({"error":"C0003", 'programming_error':exception})
 
+    @product_app.route("/changes", methods=['GET'])
+    @login_decorator
+    def get_product_changes(*args):
+        """
+        토큰 이후에 등록/수정(판매, 진열, 가격, 재고)/삭제된 상품만 보내는 API
+        셀러는 자신의 상품만, 마스터는 seller_id 를 주면 해당 셀러의 상품을, 없으면 전체 상품의 변경을 받습니다.
+        resync 가 true 이면 받은 토큰을 저장하고 상품 목록 전체를 다시 불러와야 합니다.
+        작성자: 홍성은
+        Args:
+            token     : 마지막으로 받은 토큰 (처음에는 생략)
+            limit     : 최대 변경 수
+            seller_id : 특정 셀러만 받음 (선택, 마스터만 사용)
+        Returns:
+            {'success': {resync, changes, deleted(상품 번호들), token, has_more}}, 200
+        """
+        body = {
+            'token'     : request.args.get('token', None, type=int),
+            'limit'     : request.args.get('limit', None, type=int),
+            'seller_id' : request.args.get('seller_id', None, type=int) if request.is_master else request.account_id
+        }
+
+        # 변경 기록 토큰은 샤드마다 따로이므로 샤딩중에는 셀러를 지정해야 함
+        if is_cross_shard(body['seller_id']):
+            return error_code({'error': 'C0009'})
+
+        # DB 연결
+        try:
+            db_connection = get_shard_connection(body['seller_id'], read=True)
+            result = sync_service.get_product_changes(db_connection, body)
+
+            # 성공
+            if 'success' in result:
+                return jsonify(result), 200
+
+            # 실패
+            else:
+                return error_code(result)
+
+        # DB 연결 실패
+        except Exception as exception:
+            return error_code({"error": "C0002", 'programming_error': exception})
+
+        # DB Close
+        finally:
+            try:
+                if db_connection:
+                    db_connection.close()
+            except Exception as exception:
+                return error_code({"error": "C0003", 'programming_error': exception})
+
+    @product_app.route("/export", methods=['GET'])
+    @login_decorator
+    def export_product_list():
+        """
+        상품 목록 API 와 같은 필터로 조회한 상품 전체를 CSV / XLSX 파일로 내려받는 API
+        셀러는 자신의 상품만 내려받습니다.
+        작성자: 홍성은
+        Args:
+            format      : csv / xlsx (기본 csv)
+            filter_dict : 상품 목록 API 의 query (offset, limit 제외)
+        Returns:
+            파일 스트리밍 응답, 200
+        """
+        file_format = request.args.get('format', 'csv')
+        if file_format not in EXPORT_FORMATS:
+            return error_code({'error': 'C0008'})
+
+        # ImmutableMultiDict 를 dict 로 바꿔줌
+        filter_dict = request.args.to_dict()
+        if not request.is_master:
+            filter_dict['seller_id'] = request.account_id
+
+        return export_response(
+            'products',
+            file_format,
+            PRODUCT_EXPORT_COLUMNS,
+            lambda db_connection: product_dao.stream_product_list(db_connection, filter_dict),
+            seller_id=filter_dict.get('seller_id')
+        )
+
     @product_app.route('', methods=['POST'])
     @login_decorator
     def change_product_status():
@@ -62,6 +174,8 @@ class Product:
             sales     : 0 or 1 
             product_ids : [상품 번호들]
         Returns:
+            {'success': "변경 완료"}, 200
+            {'success': {'job_id'}}, 202 : 상품이 BULK_JOB_THRESHOLD 개보다 많으면 작업 큐에서 처리 (GET /job/<job_id> 로 확인)
         """
 
         body = request.json
@@ -89,10 +203,33 @@ class Product:
         except Exception as exception:
             return error_code({'error':'C0001', 'programming_error':exception})
 
-        # DB 연결
+        # 상품들이 있는 샤드 연결
+        try:
+            db_connection = get_located_connection(
+                lambda shard_connection: product_dao.get_products_by_ids(
+                    shard_connection, {'product_ids': tuple(body['product_ids'])})
+            )
+        except CrossShardError:
+            return error_code({'error': 'C0009'})
+        except Exception as exception:
+            return error_code({"error":"C0002", 'programming_error':exception})
+
         try:
-            db_connection = get_connection()
-            result = product_service.change_status(db_connection, body)
+            # 데드락 등 재시도 가능한 에러는 롤백 후 다시 실행 (성공시 커밋, 실패시 롤백)
+            # 대량 변경은 작업 큐에 넣고 바로 응답
+            if len(body['product_ids']) > BULK_JOB_THRESHOLD:
+                result = run_in_transaction(
+                    'change_product_status',
+                    db_connection,
+                    lambda: product_service.enqueue_change_status(db_connection, copy.deepcopy(body))
+                )
+                return jsonify(result), 202
+
+            result = run_in_transaction(
+                'change_product_status',
+                db_connection,
+                lambda: product_service.change_status(db_connection, copy.deepcopy(body))
+            )
 
             # 성공 
             if 'success' in result:
@@ -110,7 +247,6 @@ class Product:
         finally:
             try:
                 if db_connection:
-                    db_connection.commit()
                     db_connection.close()
             except Exception as exception:
                 return error_code({"error":"C0003", 'programming_error':exception})
\ No newline at end of file
@@ -0,0 +1,120 @@
+from flask import Blueprint, request, jsonify
+from flask_request_validator import GET, Param, validate_params
+
+from sharding import get_shard_connection
+from utils import error_code, master_only
+
+from service.statistics_service import StatisticsService
+
+statistics_app = Blueprint('statistics_app', __name__)
+statistics_service = StatisticsService()
+
+
+class Statistics:
+    @statistics_app.route("/sales", methods=['GET'])
+    @master_only
+    @validate_params(
+        Param('start_date', GET, str, required=True),
+        Param('end_date', GET, str, required=True),
+        Param('interval', GET, str, required=False, default='day'),
+        Param('source', GET, str, required=False, default='rollup'),
+        Param('seller_id', GET, int, required=False, default=None),
+        Param('attribute_id', GET, int, required=False, default=None),
+    )
+    def get_sales(*args):
+        """
+        마스터가 기간내 매출액, 판매 수량, 주문 건수를 일/주/월 단위로 조회하는 API
+        작성자: 홍성은
+        Args:
+            start_date   : 시작일 (YYYY-MM-DD)
+            end_date     : 종료일 (YYYY-MM-DD)
+            interval     : day / week / month (기본 day)
+            source       : rollup(일 매출 집계) / raw(상세주문) (기본 rollup)
+            seller_id    : 특정 셀러만 조회 (선택, 없으면 모든 샤드의 합계)
+            attribute_id : 셀러 속성으로 조회 (선택)
+        Returns:
+            {'success': {interval, labels, revenue, units, orders}}, 200
+        """
+        body = {
+            'start_date'   : args[0],
+            'end_date'     : args[1],
+            'interval'     : args[2],
+            'source'       : args[3],
+            'seller_id'    : args[4],
+            'attribute_id' : args[5],
+        }
+
+        # DB 연결
+        try:
+            db_connection = get_shard_connection(body['seller_id'], read=True)
+            result = statistics_service.get_sales_series(db_connection, body)
+
+            # 성공
+            if 'success' in result:
+                return jsonify(result), 200
+
+            # 실패
+            else:
+                return error_code(result)
+
+        # DB 연결 실패
+        except Exception as exception:
+            return error_code({"error": "C0002", 'programming_error': exception})
+
+        # DB Close
+        finally:
+            try:
+                if db_connection:
+                    db_connection.close()
+            except Exception as exception:
+                return error_code({"error": "C0003", 'programming_error': exception})
+
+    @statistics_app.route("/uniques", methods=['GET'])
+    @master_only
+    @validate_params(
+        Param('start_date', GET, str, required=True),
+        Param('end_date', GET, str, required=True),
+        Param('seller_id', GET, int, required=False, default=None),
+    )
+    def get_uniques(*args):
+        """
+        마스터가 기간내 서로 다른 구매자 수와 판매된 상품 수를 조회하는 API
+        HyperLogLog 근사치이며 상대 표준오차(standard_error)는 약 1.6% 입니다.
+        작성자: 홍성은
+        Args:
+            start_date : 시작일 (YYYY-MM-DD)
+            end_date   : 종료일 (YYYY-MM-DD)
+            seller_id  : 특정 셀러만 조회 (선택, 없으면 모든 샤드의 스케치를 합친 전체 셀러)
+        Returns:
+            {'success': {daily, buyers, products, standard_error}}, 200
+        """
+        body = {
+            'start_date' : args[0],
+            'end_date'   : args[1],
+            'account_id' : args[2],
+        }
+
+        # DB 연결
+        try:
+            db_connection = get_shard_connection(body['account_id'], read=True)
+            result = statistics_service.get_unique_series(db_connection, body)
+
+            # 성공
+            if 'success' in result:
+                return jsonify(result), 200
+
+            # 실패
+            else:
+                return error_code(result)
+
+        # DB 연결 실패
+        except Exception as exception:
+            return error_code({"error": "C0002", 'programming_error': exception})
+
+        # DB Close
+        finally:
+            try:
+                if db_connection:
+                    db_connection.close()
+            except Exception as exception:
+                return error_code({"error": "C0003", 'programming_error': exception})
@@ -0,0 +1,105 @@
+import threading
+
+from collections import deque
+
+from id_generator import id_generator, get_time_id
+
+""" 프로세스 내 이벤트 버스
+주문 생성, 주문 상태 변경 같은 이벤트를 최근 BUFFER_SIZE 개까지 보관하고, 기다리는 구독자(SSE 응답)들을 깨웁니다.
+- 이벤트 id 는 id_generator 의 id 이므로 프로세스가 다시 떠도 계속 커집니다.
+  구독자는 마지막으로 받은 id(Last-Event-ID) 이후의 이벤트부터 이어서 받습니다.
+- 마지막으로 받은 id 가 버퍼에 남은 이벤트보다 오래되었으면(버퍼에서 밀려났거나 프로세스가 다시 뜬 경우)
+  이어 받을 수 없으므로, 구독자는 목록을 다시 불러와야 합니다.
+- 같은 프로세스에서 발행한 이벤트만 전달합니다.
+  다른 프로세스(job_worker, schedule_cron, 다른 API 워커)의 변경은 받지 못하므로,
+  클라이언트는 다시 연결할 때 목록과 건수를 한 번 다시 불러와야 합니다.
+- 트랜잭션 안에서 발행하지 말고 on_commit 으로 커밋 후에 발행해야 롤백된 변경이 나가지 않습니다.
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 시작 시점 기준 id 는 워커 id 리스 없이 만듦 (get_time_id)
+"""
+
+BUFFER_SIZE = 10000
+
+
+class EventBus:
+    """최근 이벤트를 보관하는 링 버퍼와 구독자 알림
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def __init__(self, buffer_size=BUFFER_SIZE):
+        self._condition = threading.Condition()
+        self._events    = deque(maxlen=buffer_size)
+
+        # 이 id 이하의 이벤트는 이어 받을 수 없음 (버퍼에서 밀려났거나 프로세스가 뜨기 전)
+        self._oldest_id = get_time_id()
+
+    def publish(self, event_type, seller_id, data):
+        """
+        이벤트를 추가하고 기다리는 구독자들을 깨웁니다.
+        Args:
+            event_type : 이벤트 종류 (order_created, order_status_changed)
+            seller_id  : 이벤트를 받을 셀러 (마스터는 모든 이벤트를 받음)
+            data       : 클라이언트로 보낼 딕셔너리
+        Returns:
+            이벤트 id
+        """
+        with self._condition:
+            event = {
+                'id'        : id_generator.get_id(),
+                'type'      : event_type,
+                'seller_id' : seller_id,
+                'data'      : data
+            }
+
+            if len(self._events) == self._events.maxlen:
+                self._oldest_id = self._events[0]['id']
+
+            self._events.append(event)
+            self._condition.notify_all()
+
+            return event['id']
+
+    def get_last_id(self):
+        """
+        마지막 이벤트 id 를 반환합니다. 이벤트가 없으면 이어 받을 수 있는 가장 오래된 시점입니다.
+        """
+        with self._condition:
+            return self._events[-1]['id'] if self._events else self._oldest_id
+
+    def wait_for_events(self, last_id, timeout):
+        """
+        last_id 이후의 이벤트를 반환합니다. 없으면 새 이벤트가 발행되거나 timeout 초가 지날 때까지 기다립니다.
+        Args:
+            last_id : 마지막으로 받은 이벤트 id
+            timeout : 최대 대기 시간(초)
+        Returns:
+            [이벤트] : 없으면 빈 리스트
+            None     : last_id 이후의 이벤트 중 일부가 버퍼에서 밀려나 이어 받을 수 없음
+        """
+        with self._condition:
+            if last_id < self._oldest_id:
+                return None
+
+            if not self._events or self._events[-1]['id'] <= last_id:
+                self._condition.wait(timeout)
+
+                if last_id < self._oldest_id:
+                    return None
+
+            # 새 이벤트는 뒤에 있으므로 뒤에서부터 찾음
+            events = []
+            for event in reversed(self._events):
+                if event['id'] <= last_id:
+                    break
+                events.append(event)
+
+            events.reverse()
+            return events
+
+
+event_bus = EventBus()
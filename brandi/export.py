@@ -0,0 +1,129 @@
+import io
+import csv
+import tempfile
+import datetime
+import urllib.parse
+
+from flask import Response, stream_with_context
+from openpyxl import Workbook
+
+from sharding import stream_shards
+
+""" 목록 내보내기 (CSV / XLSX)
+목록 API 와 같은 필터로 조회한 전체 행을 파일로 내려받게 합니다.
+- 요청마다 자신의 커넥션을 열고, DAO 의 서버 사이드 커서(SSDictCursor) 제너레이터로 batch 단위로 읽습니다.
+- 응답은 제너레이터(stream_with_context)로 보내므로 Content-Length 없이 chunked 로 전송됩니다.
+- CSV 는 batch 마다 바로 보내므로, 받는 쪽에서 진행 상황을 볼 수 있습니다.
+- XLSX 는 openpyxl write_only 워크북이 행을 임시 파일에 쓰고, 저장이 끝나면 임시 파일을 조각으로 보냅니다.
+  (zip 형식이라 다 쓰기 전에는 보낼 수 없음)
+- 어느 쪽이든 메모리에는 한 batch 와 쓰기 버퍼만 올라가므로 행 수와 관계없이 사용량이 일정합니다.
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 셀러 샤드에서 읽기 (sharding.stream_shards)
+"""
+
+EXPORT_FORMATS = {
+    'csv'  : 'text/csv; charset=utf-8',
+    'xlsx' : 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+# XLSX 임시 파일을 보낼 때 한 번에 읽는 크기(byte)
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+def get_cell(value):
+    """
+    CSV 에 쓸 값으로 바꿉니다. 날짜는 ISO 형식, None 은 빈 칸입니다.
+    """
+    if value is None:
+        return ''
+
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat(sep=' ') if isinstance(value, datetime.datetime) else value.isoformat()
+
+    return value
+
+
+def stream_csv(columns, batches):
+    """
+    Args:
+        columns : [(행의 키, 머리글)]
+        batches : 딕셔너리 리스트를 batch 단위로 반환하는 제너레이터
+    Returns:
+        batch 마다 인코딩된 CSV 조각을 반환하는 제너레이터 (엑셀에서 한글이 깨지지 않도록 BOM 으로 시작)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow([header for _, header in columns])
+    yield ('\ufeff' + buffer.getvalue()).encode('utf-8')
+
+    for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+
+        writer.writerows([get_cell(row[key]) for key, _ in columns] for row in rows)
+        yield buffer.getvalue().encode('utf-8')
+
+
+def stream_xlsx(columns, batches):
+    """
+    Args:
+        columns : [(행의 키, 머리글)]
+        batches : 딕셔너리 리스트를 batch 단위로 반환하는 제너레이터
+    Returns:
+        완성된 XLSX 파일을 FILE_CHUNK_SIZE 조각으로 반환하는 제너레이터
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append([header for _, header in columns])
+
+    for rows in batches:
+        for row in rows:
+            sheet.append([row[key] for key, _ in columns])
+
+    with tempfile.TemporaryFile() as xlsx_file:
+        workbook.save(xlsx_file)
+        xlsx_file.seek(0)
+
+        while True:
+            chunk = xlsx_file.read(FILE_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def export_response(filename, file_format, columns, read_batches, seller_id=None, sharded=True):
+    """
+    목록을 파일로 보내는 스트리밍 응답을 만듭니다.
+    커넥션은 응답을 보내기 시작할 때 열고, 다 보내거나 클라이언트가 끊으면 닫습니다.
+    Args:
+        filename     : 확장자를 뺀 파일 이름
+        file_format  : 'csv' 또는 'xlsx' (EXPORT_FORMATS 에 있어야 함)
+        columns      : [(행의 키, 머리글)]
+        read_batches : db_connection 을 받아 batch 제너레이터를 반환하는 함수 (예: DAO 의 stream_* 메소드)
+        seller_id    : 셀러 범위 (None 이면 전체 셀러, 샤딩중이면 모든 샤드를 차례로 읽음)
+        sharded      : 셀러별로 나뉜 테이블을 읽는지 (셀러 목록처럼 기준 테이블이면 False)
+    Returns:
+        flask Response
+    """
+    write = stream_csv if file_format == 'csv' else stream_xlsx
+
+    def generate():
+        yield from write(columns, stream_shards(read_batches, seller_id, sharded))
+
+    quoted_filename = urllib.parse.quote(f'{filename}.{file_format}')
+
+    return Response(
+        stream_with_context(generate()),
+        content_type=EXPORT_FORMATS[file_format],
+        headers={
+            'Content-Disposition' : f"attachment; filename*=UTF-8''{quoted_filename}",
+            'Cache-Control'       : 'no-cache',
+            # nginx 가 응답을 모아서 보내지 않도록 함
+            'X-Accel-Buffering'   : 'no',
+        }
+    )
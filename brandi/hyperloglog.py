@@ -0,0 +1,102 @@
+import math
+import zlib
+import hashlib
+
+""" HyperLogLog
+서로 다른 값의 개수(구매자 수, 상품 수)를 고정된 크기(2^p 바이트)로 근사합니다.
+- 같은 p 의 스케치끼리는 레지스터별 최댓값으로 합칠 수 있어, 일별/셀러별 스케치를 합쳐 기간/전체 값을 구합니다.
+- 상대 표준오차는 1.04 / sqrt(2^p) 이며, p=12 (4096 레지스터)에서 약 1.6% 입니다.
+  (약 95% 의 경우 실제 값의 ±3.3% 안에 들어옵니다.)
+- 작은 값에서는 선형 카운팅으로 보정하므로 수십 건 이하에서도 거의 정확합니다.
+- 저장시에는 zlib 으로 압축하므로 값이 적은 날의 스케치는 수십 바이트 수준입니다.
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+"""
+
+DEFAULT_PRECISION = 12
+
+
+def get_standard_error(precision=DEFAULT_PRECISION):
+    """
+    precision 에 따른 상대 표준오차를 반환합니다.
+    """
+    return 1.04 / math.sqrt(1 << precision)
+
+
+class HyperLogLog:
+    """HyperLogLog 스케치
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def __init__(self, precision=DEFAULT_PRECISION, registers=None):
+        self.precision = precision
+        self.size      = 1 << precision
+
+        if registers is None:
+            registers = bytearray(self.size)
+
+        if len(registers) != self.size:
+            raise ValueError(f'expected {self.size} registers, got {len(registers)}')
+
+        self.registers = bytearray(registers)
+
+    def add(self, value):
+        """
+        값을 추가합니다.
+        Returns:
+            True : 스케치가 바뀐 경우 (저장이 필요함)
+        """
+        digest = hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest()
+        hashed = int.from_bytes(digest, 'big')
+
+        index     = hashed >> (64 - self.precision)
+        remaining = hashed & ((1 << (64 - self.precision)) - 1)
+        rank      = (64 - self.precision) - remaining.bit_length() + 1
+
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+            return True
+
+        return False
+
+    def merge(self, other):
+        """
+        다른 스케치를 합칩니다. (합집합)
+        """
+        if other.precision != self.precision:
+            raise ValueError('cannot merge sketches with different precision')
+
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self):
+        """
+        서로 다른 값의 개수의 추정치를 반환합니다.
+        """
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        estimate = alpha * self.size * self.size / sum(2.0 ** -register for register in self.registers)
+
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.size and zeros:
+            estimate = self.size * math.log(self.size / zeros)
+
+        return int(round(estimate))
+
+    def to_bytes(self):
+        """
+        저장용으로 압축한 레지스터를 반환합니다.
+        """
+        return zlib.compress(bytes(self.registers))
+
+    @classmethod
+    def from_bytes(cls, data, precision=DEFAULT_PRECISION):
+        """
+        to_bytes 로 저장한 값에서 스케치를 복원합니다. data 가 없으면 빈 스케치를 반환합니다.
+        """
+        if not data:
+            return cls(precision)
+
+        return cls(precision, zlib.decompress(data))
@@ -0,0 +1,278 @@
+import os
+import time
+import uuid
+import atexit
+import random
+import socket
+import logging
+import threading
+
+""" 64비트 id 생성기
+DB 의 AUTO_INCREMENT(lastrowid) 대신 애플리케이션에서 id 를 미리 만들어
+연관된 INSERT 들을 서로 기다리지 않고 실행할 수 있게 합니다.
+
+    | 0 | 41bit: EPOCH 이후 밀리초 | 10bit: 워커 id | 12bit: 밀리초 내 순번 |
+
+- 시간 순서로 증가하므로 InnoDB 클러스터드 인덱스에 순서대로 쌓입니다.
+- 워커 id 가 다르면 같은 밀리초에 만든 id 도 겹치지 않습니다.
+  워커 id 는 처음 id 를 만들 때 프라이머리의 job_leases 에서 worker_id:<n> 리스로 빌려,
+  모든 서버와 프로세스(gunicorn 워커, job_worker, schedule_cron 등)에서 겹치지 않게 합니다.
+  - 리스는 WORKER_ID_LEASE_RENEW 초마다 백그라운드 스레드가 연장합니다.
+  - 연장하지 못해 만료가 WORKER_ID_LEASE_MARGIN 초 남으면 그 워커 id 로는 id 를 만들지 않고 리스를 다시 얻습니다.
+    (리스를 잃은 뒤 다른 프로세스가 같은 워커 id 를 쓰더라도 겹치지 않음)
+  - 리스를 얻지 못하면(DB 장애, 워커 id 1024개 모두 사용중) id 를 만들지 않고 에러를 냅니다.
+  - BRANDI_WORKER_ID 환경변수(0~1023)로 고정할 수 있으나 그 프로세스에만 적용되며,
+    fork 된 자식 프로세스는 항상 리스를 새로 얻습니다. (환경변수는 자식에게 그대로 복사되므로)
+- 한 프로세스 안에서는 시계가 뒤로 가거나 워커 id 가 바뀌더라도 항상 이전 id 보다 큰 id 를 반환합니다.
+- id 는 2^53 보다 크므로 JSON 응답에서는 문자열로 보냅니다. (json_encoder.BigIntJSONEncoder)
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : pid 로 워커 id 를 정하던 것을 DB 리스로 변경
+"""
+
+EPOCH = 1577836800000 # 2020-01-01 00:00:00 UTC (ms)
+
+WORKER_ID_BITS = 10
+SEQUENCE_BITS  = 12
+
+MAX_WORKER_ID  = (1 << WORKER_ID_BITS) - 1
+MAX_SEQUENCE   = (1 << SEQUENCE_BITS) - 1
+
+WORKER_ID_SHIFT = SEQUENCE_BITS
+TIMESTAMP_SHIFT = SEQUENCE_BITS + WORKER_ID_BITS
+
+WORKER_ID_LEASE_TTL    = 60 # 초
+WORKER_ID_LEASE_RENEW  = 20 # 초, 리스 연장 주기
+WORKER_ID_LEASE_MARGIN = 10 # 초, 만료 이만큼 전부터는 그 워커 id 로 id 를 만들지 않음
+
+
+class DbWorkerIdLease:
+    """job_leases 의 worker_id:<n> 리스로 워커 id 를 빌려주는 저장소
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def acquire(self, owner, worker_id=None):
+        """
+        워커 id 의 리스를 얻거나 연장합니다.
+        Args:
+            owner     : 리스를 가질 프로세스
+            worker_id : 연장할 워커 id (None 이면 임의의 위치부터 비어있는 워커 id 를 찾음)
+        Returns:
+            리스를 얻은 워커 id, 얻지 못했으면 None
+        """
+        # id_generator 는 DAO 들이 import 하므로 순환 import 를 피해 여기서 불러옴
+        from connection import get_connection
+        from model.job_dao import JobDao
+
+        if worker_id is None:
+            start = random.randint(0, MAX_WORKER_ID)
+            candidates = [(start + offset) % (MAX_WORKER_ID + 1) for offset in range(MAX_WORKER_ID + 1)]
+        else:
+            candidates = [worker_id]
+
+        job_dao = JobDao()
+        db_connection = get_connection()
+
+        try:
+            for candidate in candidates:
+                acquired = job_dao.acquire_lease(db_connection, {
+                    'name'  : f'worker_id:{candidate}',
+                    'owner' : owner,
+                    'ttl'   : WORKER_ID_LEASE_TTL
+                })
+                db_connection.commit()
+
+                if acquired:
+                    return candidate
+
+            return None
+
+        finally:
+            db_connection.close()
+
+    def release(self, owner, worker_id):
+        """
+        워커 id 의 리스를 반납합니다.
+        """
+        from connection import get_connection
+        from model.job_dao import JobDao
+
+        db_connection = get_connection()
+
+        try:
+            JobDao().release_lease(db_connection, {'name': f'worker_id:{worker_id}', 'owner': owner})
+            db_connection.commit()
+        finally:
+            db_connection.close()
+
+
+class IdGenerator:
+    """시간 순서 64비트 id 생성기
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+        2026-10-19: 워커 id 를 DB 리스로 얻음
+    """
+    def __init__(self, worker_id=None, lease=None):
+        """
+        Args:
+            worker_id : 고정할 워커 id (None 이면 BRANDI_WORKER_ID, 없으면 리스)
+            lease     : 워커 id 리스 저장소 (기본 DbWorkerIdLease)
+        """
+        self._fixed_worker_id = worker_id
+        self._lease           = lease or DbWorkerIdLease()
+        self._reset()
+
+    def _reset(self, forked=False):
+        """
+        상태를 초기화합니다. fork 된 자식 프로세스는 부모의 워커 id 를 쓰지 않고 리스를 새로 얻습니다.
+        """
+        self._lock           = threading.Lock()
+        self._last_timestamp = -1
+        self._sequence       = 0
+        self._owner          = f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+        self._renewer        = None
+        self._valid_until    = 0
+
+        worker_id = None
+        if not forked:
+            worker_id = self._fixed_worker_id
+            if worker_id is None and os.environ.get('BRANDI_WORKER_ID', None) is not None:
+                worker_id = int(os.environ['BRANDI_WORKER_ID'])
+
+        if worker_id is not None:
+            if not 0 <= worker_id <= MAX_WORKER_ID:
+                raise ValueError(f'worker_id must be between 0 and {MAX_WORKER_ID}')
+
+            self._valid_until = float('inf')
+
+        self.worker_id = worker_id
+
+    def _acquire_worker_id(self):
+        """
+        워커 id 리스를 얻습니다. (self._lock 안에서 호출)
+        연장에 실패하여 다른 워커 id 를 얻으면, 이전 id 보다 커지도록 다음 밀리초부터 만듭니다.
+        """
+        previous = self.worker_id
+        started_at = time.monotonic()
+
+        worker_id = self._lease.acquire(self._owner, previous) if previous is not None else None
+        if worker_id is None:
+            worker_id = self._lease.acquire(self._owner)
+        if worker_id is None:
+            raise RuntimeError('no free worker id')
+
+        if previous is not None and worker_id != previous:
+            self._last_timestamp += 1
+            self._sequence = -1
+
+        self.worker_id    = worker_id
+        self._valid_until = started_at + WORKER_ID_LEASE_TTL - WORKER_ID_LEASE_MARGIN
+
+        if self._renewer is None:
+            self._renewer = threading.Thread(target=self._renew, args=(os.getpid(),), daemon=True)
+            self._renewer.start()
+            atexit.register(self._release, os.getpid())
+
+    def _renew(self, pid):
+        """
+        WORKER_ID_LEASE_RENEW 초마다 워커 id 리스를 연장합니다. 연장하지 못하면 get_id 에서 다시 얻습니다.
+        """
+        while os.getpid() == pid:
+            time.sleep(WORKER_ID_LEASE_RENEW)
+
+            worker_id = self.worker_id
+            started_at = time.monotonic()
+
+            try:
+                renewed = self._lease.acquire(self._owner, worker_id)
+            except Exception:
+                logging.exception('worker id lease renewal failed')
+                continue
+
+            with self._lock:
+                if renewed is not None and renewed == self.worker_id:
+                    self._valid_until = started_at + WORKER_ID_LEASE_TTL - WORKER_ID_LEASE_MARGIN
+                elif renewed is None and worker_id == self.worker_id:
+                    # 다른 프로세스가 가져갔으므로 바로 다른 워커 id 를 얻도록 함
+                    logging.warning('worker id lease lost (worker_id=%s)', worker_id)
+                    self._valid_until = 0
+
+    def _release(self, pid):
+        """
+        프로세스가 끝날 때 워커 id 리스를 반납합니다. (fork 된 자식은 부모의 리스를 반납하지 않음)
+        """
+        if os.getpid() != pid or self.worker_id is None:
+            return
+
+        try:
+            self._lease.release(self._owner, self.worker_id)
+        except Exception:
+            logging.exception('worker id lease release failed')
+
+    def get_id(self):
+        """
+        새 id 를 반환합니다.
+        같은 밀리초에 순번(4096개)을 다 쓰면 다음 밀리초의 id 를 미리 사용합니다.
+        Returns:
+            양의 64비트 정수
+        Raises:
+            RuntimeError : 워커 id 리스를 얻지 못한 경우
+        """
+        with self._lock:
+            if time.monotonic() >= self._valid_until:
+                self._acquire_worker_id()
+
+            timestamp = max(int(time.time() * 1000) - EPOCH, self._last_timestamp)
+
+            if timestamp == self._last_timestamp:
+                self._sequence += 1
+
+                if self._sequence > MAX_SEQUENCE:
+                    timestamp += 1
+                    self._sequence = 0
+            else:
+                self._sequence = 0
+
+            self._last_timestamp = timestamp
+
+            return (
+                (timestamp << TIMESTAMP_SHIFT)
+                | (self.worker_id << WORKER_ID_SHIFT)
+                | self._sequence
+            )
+
+    def get_ids(self, count):
+        """
+        count 개의 id 를 증가하는 순서로 반환합니다.
+        """
+        return [self.get_id() for _ in range(count)]
+
+
+def get_timestamp(generated_id):
+    """
+    id 가 만들어진 시각(유닉스 시간, 초)을 반환합니다.
+    """
+    return ((generated_id >> TIMESTAMP_SHIFT) + EPOCH) / 1000
+
+
+def get_time_id(timestamp=None):
+    """
+    시각(유닉스 시간, 초, 기본 지금)에 만들어질 수 있는 가장 작은 id 를 반환합니다.
+    워커 id 가 필요 없으므로, 그 시각 이후의 id 와 비교하는 기준값으로 씁니다.
+    """
+    if timestamp is None:
+        timestamp = time.time()
+
+    return (int(timestamp * 1000) - EPOCH) << TIMESTAMP_SHIFT
+
+
+id_generator = IdGenerator()
+
+# fork 된 자식 프로세스(gunicorn 워커 등)는 상태를 초기화하고 처음 id 를 만들 때 워커 id 리스를 새로 얻습니다.
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=lambda: id_generator._reset(forked=True))
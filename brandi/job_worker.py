@@ -0,0 +1,329 @@
+import os
+import time
+import signal
+import socket
+import logging
+import argparse
+import threading
+import traceback
+import multiprocessing
+
+from sharding                   import get_job_connection
+from transaction                import run_in_transaction
+from service.job_service        import JobService
+from service.order_service      import OrderService
+from service.product_service    import ProductService
+from backfill_receivers         import backfill_receivers
+from reconcile_rollups          import reconcile_rollups
+
+""" 백오피스 작업 워커
+jobs 테이블의 작업을 가져가 실행하는 상주 프로세스입니다.
+- --processes 개의 프로세스가 각자 자신의 커넥션으로 작업을 하나씩 가져갑니다.
+  가져갈 때 다른 워커가 잠근 작업은 건너뛰므로(SKIP LOCKED) 여러 서버에서 실행해도 겹치지 않습니다.
+- 우선순위가 높은 작업부터, 같으면 먼저 등록된 작업부터 실행합니다.
+- 작업은 청크 단위로 커밋하고, 청크마다 진행 상황을 저장하면서 실행 리스(LEASE 초)를 연장합니다.
+  워커가 죽어 리스가 만료되면 다른 워커가 처음부터 다시 실행합니다. (at-least-once)
+  그래서 모든 작업은 다시 실행해도 결과가 같아야 합니다. (주문 상태 변경은 청크마다 멱등키를 사용)
+- 실패하면 RETRY_DELAY * 2^(시도-1) 초 뒤에 다시 실행하고, max_attempts 번 실패하면 failed 로 끝냅니다.
+- 취소 요청은 다음 진행 보고 때 확인하며, 이미 커밋된 청크는 되돌리지 않습니다.
+- 자동 구매확정은 리더 리스로 조율되는 schedule_cron.py 가 계속 담당합니다.
+
+    python job_worker.py --processes 4
+    python job_worker.py --processes 2 --shard 0   (샤딩중 샤드의 상품/주문 대량 변경 작업은 샤드마다 실행)
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 샤드별 실행 (--shard)
+    2026-10-19 : 백필/대사 작업을 샤드마다 실행 (payload 의 shard)
+"""
+
+job_service     = JobService()
+order_service   = OrderService()
+product_service = ProductService()
+
+PROCESSES     = 2
+POLL_INTERVAL = 1.0     # 초, 실행할 작업이 없을 때 기다리는 시간
+LEASE         = 5 * 60  # 초, 진행 보고 없이 이 시간이 지나면 다른 워커가 가져감
+RETRY_DELAY   = 10      # 초
+
+ORDER_CHUNK_SIZE   = 100
+PRODUCT_CHUNK_SIZE = 100
+
+# 결과에 남길 실패 청크 수
+MAX_RECORDED_ERRORS = 20
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class JobLost(Exception):
+    pass
+
+
+def get_chunks(items, chunk_size):
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def change_order_status(db_connection, job, report):
+    """
+    주문들의 배송 상태를 청크 단위로 변경합니다. (POST /order/change 의 대량 요청)
+    청크마다 'job:<job id>:<청크 번호>' 멱등키를 사용하므로, 다시 실행해도 이미 커밋된 청크는 건너뜁니다.
+    payload : {id : detail_order 의 id 들, status_id : 현재 status 의 id, account_id : 요청자}
+    """
+    payload = job['payload']
+    chunks = get_chunks(payload['id'], ORDER_CHUNK_SIZE)
+    result = {'changed': 0, 'errors': []}
+
+    for index, order_ids in enumerate(chunks):
+        chunk_result = run_in_transaction(
+            'job_change_order_status',
+            db_connection,
+            lambda: order_service.make_order_progress(
+                db_connection,
+                payload['account_id'],
+                {'id': order_ids, 'status_id': payload['status_id']},
+                f"job:{job['id']}:{index}"
+            )
+        )
+
+        if 'success' in chunk_result:
+            result['changed'] += len(order_ids)
+        elif len(result['errors']) < MAX_RECORDED_ERRORS:
+            result['errors'].append({'id': order_ids, 'error': chunk_result['error']})
+
+        report((index + 1) * ORDER_CHUNK_SIZE if index + 1 < len(chunks) else len(payload['id']))
+
+    return result
+
+
+def change_product_status(db_connection, job, report):
+    """
+    상품들의 판매/진열 여부를 청크 단위로 변경합니다. (POST /product 의 대량 요청)
+    같은 값으로 덮어쓰므로 다시 실행해도 결과가 같습니다.
+    payload : {product_ids : 상품 번호들, sales, displayed, updater_id : 요청자}
+    """
+    payload = job['payload']
+    chunks = get_chunks(payload['product_ids'], PRODUCT_CHUNK_SIZE)
+    result = {'changed': 0, 'errors': []}
+
+    for index, product_ids in enumerate(chunks):
+        body = dict(payload, product_ids=product_ids)
+        chunk_result = run_in_transaction(
+            'job_change_product_status',
+            db_connection,
+            lambda: product_service.change_status(db_connection, dict(body))
+        )
+
+        if 'success' in chunk_result:
+            result['changed'] += len(product_ids)
+        elif len(result['errors']) < MAX_RECORDED_ERRORS:
+            result['errors'].append({'product_ids': product_ids, 'error': chunk_result['error']})
+
+        report((index + 1) * PRODUCT_CHUNK_SIZE if index + 1 < len(chunks) else len(payload['product_ids']))
+
+    return result
+
+
+def run_backfill_receivers(db_connection, job, report):
+    """
+    수령인 중복 제거 백필. payload : {chunk_size, sleep, shard (없으면 모든 샤드)}
+    """
+    payload = job['payload']
+    return backfill_receivers(
+        payload.get('chunk_size', 1000),
+        payload.get('sleep', 0.1),
+        report=lambda total: report(total['hashed'] + total['merged']),
+        shard=payload.get('shard')
+    )
+
+
+def run_reconcile_rollups(db_connection, job, report):
+    """
+    매출 집계 대사. payload : {days, shard (없으면 모든 샤드)}
+    """
+    return reconcile_rollups(job['payload'].get('days', 2), job['payload'].get('shard'))
+
+
+# 작업 종류별 실행 함수 : (db_connection, job, report) -> 결과 딕셔너리
+# report(progress, total=None) 은 진행 상황을 저장하며, 취소 요청이 있으면 JobCancelled 를 발생시킴
+JOB_HANDLERS = {
+    'change_order_status'   : change_order_status,
+    'change_product_status' : change_product_status,
+    'backfill_receivers'    : run_backfill_receivers,
+    'reconcile_rollups'     : run_reconcile_rollups,
+}
+
+
+class JobWorker:
+    """작업 하나씩 가져가 실행하는 워커
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def __init__(self, db_connection):
+        self.db_connection = db_connection
+        self.worker        = f'{socket.gethostname()}:{os.getpid()}'
+
+    def report(self, job, progress, total=None):
+        result = run_in_transaction(
+            'job_progress',
+            self.db_connection,
+            lambda: job_service.report_job_progress(self.db_connection, {
+                'job_id'   : job['id'],
+                'worker'   : self.worker,
+                'lease'    : LEASE,
+                'progress' : progress,
+                'total'    : total
+            })
+        )['success']
+
+        if result is None:
+            raise JobLost()
+
+        if result['cancel_requested']:
+            raise JobCancelled()
+
+    def finish(self, job, status, result=None, error=None):
+        run_in_transaction(
+            'job_finish',
+            self.db_connection,
+            lambda: job_service.finish_job(self.db_connection, {
+                'job_id' : job['id'],
+                'worker' : self.worker,
+                'status' : status,
+                'result' : result,
+                'error'  : error
+            })
+        )
+
+    def retry(self, job, error):
+        run_in_transaction(
+            'job_finish',
+            self.db_connection,
+            lambda: job_service.retry_job(self.db_connection, {
+                'job_id' : job['id'],
+                'worker' : self.worker,
+                'delay'  : RETRY_DELAY * 2 ** (job['attempts'] - 1),
+                'error'  : error
+            })
+        )
+
+    def run_once(self):
+        """
+        작업을 하나 가져가 실행합니다.
+        Returns:
+            실행한 작업 (없으면 None)
+        """
+        job = run_in_transaction(
+            'job_claim',
+            self.db_connection,
+            lambda: job_service.claim_job(self.db_connection, {'worker': self.worker, 'lease': LEASE})
+        )['success']
+
+        if not job:
+            return None
+
+        handler = JOB_HANDLERS.get(job['job_type'])
+        started_at = time.monotonic()
+
+        # 리스 만료로 다시 가져간 작업이 계속 워커를 죽이는 경우 (시도 횟수는 가져갈 때 늘어남)
+        if job['attempts'] > job['max_attempts']:
+            self.finish(job, 'failed', error='max attempts exceeded')
+
+        elif not handler:
+            self.finish(job, 'failed', error=f"unknown job type {job['job_type']}")
+
+        else:
+            try:
+                result = handler(self.db_connection, job, lambda progress, total=None: self.report(job, progress, total))
+                self.finish(job, 'succeeded', result=result)
+
+            except JobCancelled:
+                self.finish(job, 'cancelled')
+
+            except JobLost:
+                logging.warning('job %s lost its lease', job['id'])
+
+            except Exception:
+                error = traceback.format_exc(limit=5)[-1000:]
+                logging.exception('job %s failed (attempt %s)', job['id'], job['attempts'])
+
+                if job['attempts'] >= job['max_attempts']:
+                    self.finish(job, 'failed', error=error)
+                else:
+                    self.retry(job, error)
+
+        logging.info('job %s %s finished in %.3fs', job['id'], job['job_type'], time.monotonic() - started_at)
+        return job
+
+
+def get_stop_event():
+    """
+    SIGTERM/SIGINT 를 받으면 설정되는 이벤트를 반환합니다.
+    """
+    stop_event = threading.Event()
+
+    def stop(signum, frame):
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    return stop_event
+
+
+def run_worker(shard=None):
+    """
+    종료 요청을 받을 때까지 작업을 가져가 실행합니다. 실행중인 작업은 끝까지 마치고 종료합니다.
+    Args:
+        shard : 작업을 가져갈 샤드 번호 (None 이면 프라이머리)
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(process)d %(levelname)s %(message)s')
+    stop_event = get_stop_event()
+    db_connection = get_job_connection(shard)
+
+    try:
+        worker = JobWorker(db_connection)
+
+        while not stop_event.is_set():
+            try:
+                job = worker.run_once()
+            except Exception:
+                logging.exception('job worker loop failed')
+                job = None
+
+            if not job:
+                stop_event.wait(POLL_INTERVAL)
+
+    finally:
+        db_connection.close()
+
+
+def run_pool(processes, shard=None):
+    """
+    processes 개의 워커 프로세스를 띄우고, 종료 요청을 받으면 워커들에게 전달한 뒤 끝날 때까지 기다립니다.
+    """
+    workers = [multiprocessing.Process(target=run_worker, args=(shard,)) for _ in range(processes)]
+    for process in workers:
+        process.start()
+
+    stop_event = get_stop_event()
+    while not stop_event.is_set() and any(process.is_alive() for process in workers):
+        stop_event.wait(POLL_INTERVAL)
+
+    for process in workers:
+        process.terminate()
+    for process in workers:
+        process.join()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='백오피스 작업 워커')
+    parser.add_argument('--processes', type=int, default=PROCESSES)
+    parser.add_argument('--shard', type=int, default=None)
+    args = parser.parse_args()
+
+    run_pool(args.processes, args.shard)
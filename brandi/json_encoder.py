@@ -0,0 +1,64 @@
+from flask.json import JSONEncoder
+
+""" JSON 응답 인코더
+id_generator 의 id(계정, 주문, 상세주문, 작업 번호 등)는 2^53 보다 커서
+JSON 숫자로 보내면 자바스크립트(백오피스)에서 반올림되어 다른 행을 가리키게 됩니다.
+- JSON 응답에서는 자바스크립트가 정확히 표현할 수 없는 정수(MAX_SAFE_INTEGER 초과)를 문자열로 보냅니다.
+  그보다 작은 정수(AUTO_INCREMENT 번호, 건수, 금액 등)는 그대로 숫자입니다.
+- 요청으로 돌려받은 id 는 parse_id 로 정수로 바꾼 뒤 사용합니다.
+  (문자열 그대로 BIGINT 와 비교하면 MySQL 이 실수로 바꿔 비교하므로 다른 행과 같다고 볼 수 있음)
+- app.json_encoder 로 등록하여 jsonify 에 적용되며, SSE 처럼 json.dumps 를 직접 쓰는 곳은 cls 로 넘깁니다.
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+"""
+
+MAX_SAFE_INTEGER = (1 << 53) - 1
+
+
+def stringify_big_ints(value):
+    """
+    딕셔너리, 리스트 안의 MAX_SAFE_INTEGER 보다 큰 정수를 문자열로 바꾼 복사본을 반환합니다.
+    """
+    if isinstance(value, bool):
+        return value
+
+    if isinstance(value, int):
+        return str(value) if abs(value) > MAX_SAFE_INTEGER else value
+
+    if isinstance(value, dict):
+        return {key: stringify_big_ints(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [stringify_big_ints(item) for item in value]
+
+    return value
+
+
+def parse_id(value):
+    """
+    요청으로 받은 id(숫자 또는 숫자 문자열)를 정수로 바꿉니다.
+    Raises:
+        TypeError  : 숫자나 문자열이 아닌 경우
+        ValueError : 숫자로 된 문자열이 아닌 경우
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise TypeError(f'invalid id {value!r}')
+
+    if isinstance(value, str) and not value.isdigit():
+        raise ValueError(f'invalid id {value!r}')
+
+    return int(value)
+
+
+class BigIntJSONEncoder(JSONEncoder):
+    """큰 정수를 문자열로 보내는 JSON 인코더
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def iterencode(self, o, _one_shot=False):
+        # encode 도 iterencode 를 거치므로 여기서 한 번만 바꿈
+        return super().iterencode(stringify_big_ints(o), _one_shot)
@@ -1,6 +1,8 @@
 import pymysql
 from flask import jsonify
 
+from id_generator import id_generator
+
 
 class AccountDao:
     """계정 모델 
@@ -25,7 +27,6 @@ class AccountDao:
             '''
             cursor.execute(query, body)
             row = cursor.fetchone()
-            print(row)
             return row if row else None
 
     def is_seller_not_validated(self, db_connection, body):
@@ -336,14 +337,20 @@ class AccountDao:
             2020-10-27~28 : 오류, SQL 수정 
             2020-11-04 : insert_sellers,insert_managers 매소드 분리 했을 때 커밋에 문제가 생겨 
                          lastrowid를 사용하여 signup_account 메소드로 합침.
+            2026-10-19 : account id 를 id_generator 로 미리 생성하여 identification 서브쿼리 제거
         """
         with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            # 새로 생성할 account 의 id 를 미리 만들어 둠
+            seller_info['account_id'] = id_generator.get_id()
+
             insert_accounts_query = """
             INSERT INTO accounts(
+                id,
                 identification,
                 password,
                 account_type_id
             )VALUES(
+                %(account_id)s,
                 %(identification)s,
                 %(password)s,
                 2
@@ -353,10 +360,6 @@ class AccountDao:
             # account 정보 기입
             cursor.execute(insert_accounts_query, seller_info)
 
-            # 새롭게 생성된 id 값을 가져옴
-            account_number = cursor.lastrowid
-            seller_info['account_id'] = account_number
-
             insert_sellers_query = """
             INSERT INTO sellers(
                 contact,
@@ -375,7 +378,7 @@ class AccountDao:
                 %(korean_name)s,    
                 %(english_name)s,
                 %(cs_contact)s,
-                (SELECT accounts.id FROM accounts JOIN sellers AS s ON accounts.id = s.account_id WHERE identification=%(identification)s)
+                %(account_id)s
             )
             """
             # 셀러 정보 기입
@@ -395,7 +398,7 @@ class AccountDao:
                 %(contact)s,
                 %(seller_id)s,
                 1,
-                (SELECT id FROM accounts WHERE identification=%(identification)s)
+                %(account_id)s
             )
             """
             cursor.execute(insert_managers_query, seller_info)
@@ -453,6 +456,111 @@ class AccountDao:
             result = cursor.fetchone()
             return result
 
+    def get_seller_list_query(self, seller_list):
+        """셀러 리스트 조회의 SELECT 절과 조건(FROM ~ WHERE) 절을 만듭니다. 목록 조회와 내보내기가 같은 조건을 사용합니다.
+        Args:
+            seller_list : get_seller_list 의 필터 (등록기간은 시각을 붙인 값으로 바뀜)
+
+        Returns:
+            (query, join_query)
+
+        Authors:
+            홍성은
+
+        History:
+            2026-10-19 : get_seller_list 에서 분리
+        """
+        query = """
+        SELECT 
+            sel.id,
+            a.id as account_id,
+            a.identification,
+            sel.english_name,
+            sel.korean_name,
+            m.name as manager_name,
+            s.name as status_name,
+            m.contact,
+            m.email,
+            at.name as attribute,
+            DATE_FORMAT(sel.created_at,'%%Y-%%m-%%d %%H:%%m:%%s') AS created_at,
+            s.id as status_id
+        
+        """
+
+        join_query = """
+        FROM 
+            sellers AS sel
+        JOIN 
+            accounts AS a ON sel.account_id = a.id 
+        LEFT JOIN 
+            managers AS m ON sel.id = m.seller_id
+        JOIN 
+            seller_statuses AS s ON sel.status_id = s.id 
+        JOIN 
+            seller_attributes AS at ON sel.attribute_id = at.id
+        WHERE 
+            sel.id >= 1 AND s.id != 5
+        """
+
+        # 셀러 필터 기능, seller_list에 검색 키워드가 있는지 확인 후에 쿼리 추가.
+        if seller_list['id']:
+            join_query += """
+            AND sel.id = %(id)s
+            """
+
+        if seller_list['identification']:
+            join_query += """
+            AND a.identification = %(identification)s
+            """
+
+        if seller_list['english_name']:
+            join_query += """
+            AND sel.english_name = %(english_name)s
+            """
+
+        if seller_list['korean_name']:
+            join_query += """
+            AND sel.korean_name = %(korean_name)s
+            """
+
+        if seller_list['manager_name']:
+            join_query += """
+            AND m.name = %(manager_name)s
+            """
+        if seller_list['status_name']:
+            join_query += """
+            AND s.name = %(status_name)s
+            """
+
+        if seller_list['contact']:
+            join_query += """
+            AND m.contact = %(contact)s
+            """
+
+        if seller_list['email']:
+            join_query += """
+            AND m.email = %(email)s
+            """
+
+        if seller_list['attribute']:
+            join_query += """
+            AND at.name = %(attribute)s
+            """
+
+        start_date = seller_list['start_date']
+        end_date = seller_list['end_date']
+
+        if seller_list['start_date'] and seller_list['end_date']:
+            seller_list['start_date'] = start_date + ' 00:00:00'
+            seller_list['end_date'] = end_date + ' 23:59:59'
+            join_query += """
+            AND sel.created_at > %(start_date)s 
+            AND sel.created_at < %(end_date)s
+
+            """
+
+        return query, join_query
+
     def get_seller_list(self, seller_list, db_connection):
         """셀러 리스트
             GET 한 셀러 리스트 return , 검색 필터로 검색 
@@ -472,102 +580,16 @@ class AccountDao:
             2020-10-27 : 셀러리스트 초기 생성
             2020-10-29 : 유효성 검사 추가 
             2020-10-31 : 셀러 검색 기능 추가
+            2026-10-19 : 조건절 생성을 get_seller_list_query 로 분리
         """
-        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            query = """
-            SELECT 
-                sel.id,
-                a.id as account_id,
-                a.identification,
-                sel.english_name,
-                sel.korean_name,
-                m.name as manager_name,
-                s.name as status_name,
-                m.contact,
-                m.email,
-                at.name as attribute,
-                DATE_FORMAT(sel.created_at,'%%Y-%%m-%%d %%H:%%m:%%s') AS created_at,
-                s.id as status_id
-            
-            """
+        query, join_query = self.get_seller_list_query(seller_list)
 
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
             total_seller_count = """
             SELECT
                 count(*) as total_seller_count
             """
 
-            join_query = """
-            FROM 
-                sellers AS sel
-            JOIN 
-                accounts AS a ON sel.account_id = a.id 
-            LEFT JOIN 
-                managers AS m ON sel.id = m.seller_id
-            JOIN 
-                seller_statuses AS s ON sel.status_id = s.id 
-            JOIN 
-                seller_attributes AS at ON sel.attribute_id = at.id
-            WHERE 
-                sel.id >= 1 AND s.id != 5
-            """
-
-            # 셀러 필터 기능, seller_list에 검색 키워드가 있는지 확인 후에 쿼리 추가.
-            if seller_list['id']:
-                join_query += """
-                AND sel.id = %(id)s
-                """
-
-            if seller_list['identification']:
-                join_query += """
-                AND a.identification = %(identification)s
-                """
-
-            if seller_list['english_name']:
-                join_query += """
-                AND sel.english_name = %(english_name)s
-                """
-
-            if seller_list['korean_name']:
-                join_query += """
-                AND sel.korean_name = %(korean_name)s
-                """
-
-            if seller_list['manager_name']:
-                join_query += """
-                AND m.name = %(manager_name)s
-                """
-            if seller_list['status_name']:
-                join_query += """
-                AND s.name = %(status_name)s
-                """
-
-            if seller_list['contact']:
-                join_query += """
-                AND m.contact = %(contact)s
-                """
-
-            if seller_list['email']:
-                join_query += """
-                AND m.email = %(email)s
-                """
-
-            if seller_list['attribute']:
-                join_query += """
-                AND at.name = %(attribute)s
-                """
-
-            start_date = seller_list['start_date']
-            end_date = seller_list['end_date']
-
-            if seller_list['start_date'] and seller_list['end_date']:
-                seller_list['start_date'] = start_date + ' 00:00:00'
-                seller_list['end_date'] = end_date + ' 23:59:59'
-                join_query += """
-                AND sel.created_at > %(start_date)s 
-                AND sel.created_at < %(end_date)s
-
-                """
-
             pagination_query = """
             ORDER BY 
                 sel.id 
@@ -587,6 +609,35 @@ class AccountDao:
 
             return seller_list_info, total_seller
 
+    def stream_seller_list(self, db_connection, seller_list, batch_size=1000):
+        """셀러 리스트 전체를 서버 사이드 커서(SSDictCursor)로 batch_size 행씩 읽어 반환합니다. (내보내기용)
+            결과 전체를 메모리에 올리지 않으며, 제너레이터를 끝까지 읽기 전에는 같은 커넥션으로 다른 쿼리를 실행할 수 없습니다.
+
+        Args:
+            db_connection : 연결된 DB
+            seller_list   : get_seller_list 의 필터 (offset, limit 는 사용하지 않음)
+            batch_size    : 한 번에 읽을 행 수
+
+        Returns:
+            딕셔너리 리스트를 batch 단위로 반환하는 제너레이터
+
+        Authors:
+            홍성은
+
+        History:
+            2026-10-19 : 초기 생성
+        """
+        query, join_query = self.get_seller_list_query(seller_list)
+
+        with db_connection.cursor(pymysql.cursors.SSDictCursor) as cursor:
+            cursor.execute(query + join_query + " ORDER BY sel.id DESC", seller_list)
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield rows
+
     def get_seller_actions(self, db_connection):
         with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
             query = """
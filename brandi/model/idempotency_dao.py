@@ -0,0 +1,125 @@
+import pymysql
+
+
+class IdempotencyDao:
+    """멱등키 모델
+    재시도된 요청에 대해 저장된 응답을 돌려주기 위해 요청 지문과 응답을 저장합니다.
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def reserve_key(self, db_connection, body):
+        """
+        멱등키를 선점합니다. 만료된 같은 키가 있다면 먼저 지웁니다.
+        같은 키로 진행중인 트랜잭션이 있다면 해당 트랜잭션이 끝날 때까지 대기합니다.
+        Args:
+            db_connection   : db_connection
+            body            : 딕셔너리
+                idempotency_key : 클라이언트가 보낸 Idempotency-Key 헤더 값
+                endpoint        : 요청 종류 (make_order, change_order_status)
+                fingerprint     : 요청 내용의 해시값
+                ttl             : 보관 시간(초)
+        Returns:
+            True  : 새로 선점한 경우 (요청을 처리해야 함)
+            False : 이미 저장된 키가 있는 경우
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            delete_query = '''
+            DELETE FROM idempotency_keys
+            WHERE idempotency_key=%(idempotency_key)s
+                AND endpoint=%(endpoint)s
+                AND expires_at <= NOW()
+            '''
+            cursor.execute(delete_query, body)
+
+            insert_query = '''
+            INSERT IGNORE INTO idempotency_keys(
+                idempotency_key,
+                endpoint,
+                fingerprint,
+                expires_at
+            ) VALUES(
+                %(idempotency_key)s,
+                %(endpoint)s,
+                %(fingerprint)s,
+                DATE_ADD(NOW(), INTERVAL %(ttl)s SECOND)
+            )
+            '''
+            cursor.execute(insert_query, body)
+
+            return cursor.rowcount == 1
+
+    def get_key(self, db_connection, body):
+        """
+        저장된 멱등키의 요청 지문과 응답을 반환합니다.
+        Args:
+            db_connection   : db_connection
+            idempotency_key : 멱등키
+            endpoint        : 요청 종류
+        Returns:
+            fingerprint : 최초 요청의 해시값
+            response    : 최초 요청의 응답(JSON), 처리중이면 None
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            SELECT
+                fingerprint,
+                response
+            FROM idempotency_keys
+            WHERE idempotency_key=%(idempotency_key)s
+                AND endpoint=%(endpoint)s
+            '''
+            cursor.execute(query, body)
+            row = cursor.fetchone()
+
+            return row if row else None
+
+    def save_response(self, db_connection, body):
+        """
+        처리 완료된 요청의 응답을 멱등키에 저장합니다.
+        요청을 처리한 트랜잭션과 같은 트랜잭션에서 호출되어야 합니다.
+        Args:
+            db_connection   : db_connection
+            idempotency_key : 멱등키
+            endpoint        : 요청 종류
+            response        : 응답(JSON)
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            UPDATE idempotency_keys
+            SET response=%(response)s
+            WHERE idempotency_key=%(idempotency_key)s
+                AND endpoint=%(endpoint)s
+            '''
+            cursor.execute(query, body)
+
+    def delete_expired_keys(self, db_connection, body):
+        """
+        만료된 멱등키를 limit 개씩 삭제합니다.
+        Args:
+            db_connection : db_connection
+            limit         : 한번에 삭제할 최대 개수
+        Returns:
+            삭제된 행의 수
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            DELETE FROM idempotency_keys
+            WHERE expires_at <= NOW()
+            LIMIT %(limit)s
+            '''
+            cursor.execute(query, body)
+
+            return cursor.rowcount
@@ -0,0 +1,422 @@
+import pymysql
+
+
+class JobDao:
+    """배치 작업 모델
+    배치 작업이 중간에 멈춰도 이어서 진행할 수 있도록 마지막으로 처리한 위치(watermark)를 저장하고,
+    여러 서버에서 실행되는 작업 중 하나만 동작하도록 리스(lease)를 관리합니다.
+    백오피스 작업 큐(jobs)의 등록, 가져가기, 진행 보고, 종료를 처리합니다.
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+        2026-10-19: 리스 추가
+        2026-10-19: 작업 큐 추가
+    """
+    def get_watermark(self, db_connection, body):
+        """
+        작업의 마지막 처리 위치를 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_name : 작업 이름}
+        Returns:
+            watermark 문자열
+            None : 아직 처리한 적이 없는 경우
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            SELECT
+                watermark
+            FROM job_watermarks
+            WHERE job_name=%(job_name)s
+            '''
+            cursor.execute(query, body)
+            row = cursor.fetchone()
+
+            return row['watermark'] if row else None
+
+    def set_watermark(self, db_connection, body):
+        """
+        작업의 마지막 처리 위치를 저장합니다. 처리 결과와 같은 트랜잭션에서 호출해야 다시 실행해도 중복 처리되지 않습니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_name : 작업 이름,
+                watermark : 마지막 처리 위치}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            INSERT INTO job_watermarks(
+                job_name,
+                watermark
+            ) VALUES(
+                %(job_name)s,
+                %(watermark)s
+            )
+            ON DUPLICATE KEY UPDATE
+                watermark = VALUES(watermark)
+            '''
+            cursor.execute(query, body)
+
+    def acquire_lease(self, db_connection, body):
+        """
+        작업의 리스를 얻거나 연장합니다. 리스가 없거나, 만료되었거나, 이미 자신의 리스인 경우에만 성공합니다.
+        바로 커밋되어야 다른 서버에서 보이므로 단독 트랜잭션으로 호출합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {name   : 작업 이름,
+                owner   : 리스를 얻으려는 프로세스,
+                ttl     : 리스 유지 시간(초)}
+        Returns:
+            True  : 리스를 가짐 (작업을 실행해도 됨)
+            False : 다른 프로세스가 리스를 가짐
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            insert_query = '''
+            INSERT IGNORE INTO job_leases(
+                name,
+                owner,
+                expires_at
+            ) VALUES(
+                %(name)s,
+                %(owner)s,
+                DATE_ADD(NOW(3), INTERVAL %(ttl)s SECOND)
+            )
+            '''
+            cursor.execute(insert_query, body)
+
+            update_query = '''
+            UPDATE job_leases
+            SET
+                owner      = %(owner)s,
+                expires_at = DATE_ADD(NOW(3), INTERVAL %(ttl)s SECOND)
+            WHERE name=%(name)s
+                AND (owner=%(owner)s OR expires_at < NOW(3))
+            '''
+            cursor.execute(update_query, body)
+
+            select_query = '''
+            SELECT
+                owner
+            FROM job_leases
+            WHERE name=%(name)s
+            '''
+            cursor.execute(select_query, body)
+
+            return cursor.fetchone()['owner'] == body['owner']
+
+    def release_lease(self, db_connection, body):
+        """
+        자신의 리스를 반납하여 다른 프로세스가 바로 이어받을 수 있게 합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {name   : 작업 이름,
+                owner   : 리스를 가진 프로세스}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            DELETE FROM job_leases
+            WHERE name=%(name)s
+                AND owner=%(owner)s
+            '''
+            cursor.execute(query, body)
+
+    def enqueue_job(self, db_connection, body):
+        """
+        작업을 큐에 넣습니다. 요청을 처리하는 트랜잭션에서 호출하면 커밋되어야 워커에게 보입니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_id      : id_generator 로 미리 생성한 작업 id,
+                job_type     : 작업 종류,
+                payload      : 작업 입력 (JSON 문자열),
+                priority     : 우선순위 (클수록 먼저),
+                total        : 전체 양 (모르면 None),
+                max_attempts : 최대 실행 시도 횟수,
+                account_id   : 요청자 account_id}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            INSERT INTO jobs(
+                id,
+                job_type,
+                payload,
+                priority,
+                total,
+                max_attempts,
+                created_by
+            ) VALUES(
+                %(job_id)s,
+                %(job_type)s,
+                %(payload)s,
+                %(priority)s,
+                %(total)s,
+                %(max_attempts)s,
+                %(account_id)s
+            )
+            '''
+            cursor.execute(query, body)
+
+    def requeue_expired_jobs(self, db_connection):
+        """
+        실행 리스가 만료된(워커가 죽었거나 멈춘) 작업을 다시 대기 상태로 돌립니다.
+        Returns:
+            다시 대기 상태가 된 작업 수
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            UPDATE jobs
+            SET
+                status    = 'queued',
+                locked_by = NULL
+            WHERE status = 'running'
+                AND locked_until < NOW(3)
+            '''
+            cursor.execute(query)
+
+            return cursor.rowcount
+
+    def claim_job(self, db_connection, body):
+        """
+        실행할 차례인 작업 중 우선순위가 가장 높은 작업을 가져가고 실행 리스를 잡습니다.
+        다른 워커가 가져가는 중인 작업은 건너뛰므로(SKIP LOCKED) 여러 워커가 같은 작업을 가져가지 않습니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {worker    : 워커(호스트명:pid),
+                lease      : 실행 리스 시간(초)}
+        Returns:
+            {id, job_type, payload, attempts, max_attempts, created_by}
+            None : 실행할 작업이 없음
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            select_query = '''
+            SELECT
+                id,
+                job_type,
+                payload,
+                attempts,
+                max_attempts,
+                created_by
+            FROM jobs
+            WHERE status = 'queued'
+                AND run_after <= NOW(3)
+            ORDER BY priority DESC, run_after, id
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+            '''
+            cursor.execute(select_query)
+            job = cursor.fetchone()
+
+            if not job:
+                return None
+
+            update_query = '''
+            UPDATE jobs
+            SET
+                status       = 'running',
+                attempts     = attempts + 1,
+                locked_by    = %(worker)s,
+                locked_until = DATE_ADD(NOW(3), INTERVAL %(lease)s SECOND)
+            WHERE id = %(job_id)s
+            '''
+            cursor.execute(update_query, dict(body, job_id=job['id']))
+
+            job['attempts'] += 1
+            return job
+
+    def report_job_progress(self, db_connection, body):
+        """
+        작업의 진행 상황을 저장하고 실행 리스를 연장합니다. (하트비트)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_id    : 작업 id,
+                worker     : 워커(호스트명:pid),
+                lease      : 실행 리스 시간(초),
+                progress   : 처리한 양,
+                total      : 전체 양 (모르면 None, 이전 값 유지)}
+        Returns:
+            None   : 다른 워커가 작업을 가져감 (리스 만료) - 실행을 멈춰야 함
+            {cancel_requested}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            update_query = '''
+            UPDATE jobs
+            SET
+                progress     = %(progress)s,
+                total        = COALESCE(%(total)s, total),
+                locked_until = DATE_ADD(NOW(3), INTERVAL %(lease)s SECOND)
+            WHERE id = %(job_id)s
+                AND status = 'running'
+                AND locked_by = %(worker)s
+            '''
+            cursor.execute(update_query, body)
+
+            select_query = '''
+            SELECT
+                cancel_requested
+            FROM jobs
+            WHERE id = %(job_id)s
+                AND status = 'running'
+                AND locked_by = %(worker)s
+            '''
+            cursor.execute(select_query, body)
+
+            return cursor.fetchone()
+
+    def finish_job(self, db_connection, body):
+        """
+        작업을 끝난 상태(succeeded / failed / cancelled)로 바꿉니다. 자신이 실행중인 작업만 바꿉니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_id    : 작업 id,
+                worker     : 워커(호스트명:pid),
+                status     : 끝난 상태,
+                result     : 작업 결과 (JSON 문자열, 없으면 None),
+                error      : 실패 내용 (없으면 None)}
+        Returns:
+            바뀐 행 수 (0 이면 다른 워커가 가져간 작업)
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            UPDATE jobs
+            SET
+                status       = %(status)s,
+                result       = %(result)s,
+                error        = %(error)s,
+                locked_by    = NULL,
+                locked_until = NULL,
+                finished_at  = NOW()
+            WHERE id = %(job_id)s
+                AND status = 'running'
+                AND locked_by = %(worker)s
+            '''
+            cursor.execute(query, body)
+
+            return cursor.rowcount
+
+    def retry_job(self, db_connection, body):
+        """
+        실패한 작업을 delay 초 뒤에 다시 실행하도록 대기 상태로 돌립니다. 자신이 실행중인 작업만 바꿉니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_id    : 작업 id,
+                worker     : 워커(호스트명:pid),
+                delay      : 다시 실행할 때까지의 시간(초),
+                error      : 실패 내용}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            UPDATE jobs
+            SET
+                status       = 'queued',
+                error        = %(error)s,
+                run_after    = DATE_ADD(NOW(3), INTERVAL %(delay)s SECOND),
+                locked_by    = NULL,
+                locked_until = NULL
+            WHERE id = %(job_id)s
+                AND status = 'running'
+                AND locked_by = %(worker)s
+            '''
+            cursor.execute(query, body)
+
+    def get_job(self, db_connection, body):
+        """
+        작업의 상태와 진행 상황을 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_id : 작업 id}
+        Returns:
+            {id, job_type, status, priority, result, error, progress, total, attempts, cancel_requested,
+             created_by, created_at, finished_at}
+            None : 없는 작업
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            SELECT
+                id,
+                job_type,
+                status,
+                priority,
+                result,
+                error,
+                progress,
+                total,
+                attempts,
+                cancel_requested,
+                created_by,
+                created_at,
+                finished_at
+            FROM jobs
+            WHERE id = %(job_id)s
+            '''
+            cursor.execute(query, body)
+
+            return cursor.fetchone()
+
+    def cancel_job(self, db_connection, body):
+        """
+        작업을 취소합니다. 대기중인 작업은 바로 취소되고, 실행중인 작업은 취소를 요청하여 워커가 다음 진행 보고 때 멈춥니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_id : 작업 id}
+        Returns:
+            바뀐 행 수 (0 이면 이미 끝난 작업)
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            # SET 은 왼쪽부터 적용되므로 finished_at 은 바뀐 status 를 봄
+            query = '''
+            UPDATE jobs
+            SET
+                cancel_requested = 1,
+                status           = IF(status = 'queued', 'cancelled', status),
+                finished_at      = IF(status = 'cancelled', NOW(), finished_at)
+            WHERE id = %(job_id)s
+                AND status IN ('queued', 'running')
+            '''
+            cursor.execute(query, body)
+
+            return cursor.rowcount
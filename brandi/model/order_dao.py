@@ -1,6 +1,62 @@
 import pymysql
 from flask import jsonify
 
+# 주문 관리 목록 조회 컬럼 (order_list_view 에서 읽음)
+# 결제일자는 문자열 순서가 시간 순서와 같아 샤드별 목록을 합칠 때 정렬 키로 씀
+ORDER_LIST_COLUMNS = '''
+            DATE_FORMAT(paied_at,'%%Y-%%m-%%d %%H:%%i:%%s') AS a_paied_at,
+            order_id as b_oreder_id,
+            product_name as d_products_name,
+            detail_order_id as c_detail_order_id,
+            quantity as f_quantity,
+            option_id as e_option_id,
+            receiver_contact as h_reciever_contact,
+            receiver_name as g_reciever,
+            status_name as i_detail_order_statuses_name'''
+
+# 주문관리 목록(order_list_view) 한 행을 원본 테이블들로부터 만드는 SELECT
+ORDER_LIST_VIEW_COLUMNS = '''
+                detail_order_id,
+                order_id,
+                seller_id,
+                status_id,
+                status_name,
+                paied_at,
+                ordered_at,
+                product_id,
+                product_name,
+                option_id,
+                quantity,
+                receiver_name,
+                receiver_contact'''
+
+ORDER_LIST_VIEW_SELECT = '''
+            SELECT
+                d.id,
+                d.order_id,
+                d.seller_id,
+                d.status_id,
+                dos.name,
+                o.paied_at,
+                d.ordered_at,
+                d.product_id,
+                p.name,
+                d.option_id,
+                d.quantity,
+                r.name,
+                r.contact
+            FROM
+                detail_orders AS d
+            JOIN
+                orders AS o ON d.order_id = o.id
+            JOIN
+                products AS p ON d.product_id = p.id
+            JOIN
+                receivers AS r ON d.receiver_id = r.id
+            JOIN
+                detail_order_statuses AS dos ON dos.id = d.status_id
+'''
+
 
 class OrderDao:
     def save_receiver_info(self,
@@ -9,23 +65,31 @@ class OrderDao:
                            ):
         """
         구매자 정보를 저장하고 저장된 아이디 값을 반환합니다. 
+        정규화한 수령인 정보가 같은 행이 이미 있으면 새로 만들지 않고 기존 행의 id 를 반환합니다.
         Args:
             db_connection  : db_connection
             body           : 딕셔너리
+                receiver_id    : id_generator 로 미리 생성한 수령인 id
+                receiver_hash  : 정규화한 수령인 정보의 해시값 (utils.get_receiver_hash)
                 buyer_name     : 수령인 이름
                 contact        : 수령인 전화번호
                 zip_code       : 수령지 우편번호
                 street_address : 수령지 주소
                 detail_address : 수령지 상세주소}
         Return:
-            MAD(id) : 수령인의 id
+            receiver_id : 수령인의 id
         Author : 김수정
         History: 
             2020-10-31: 초기생성
+            2026-10-19: lastrowid 대신 미리 생성한 id 사용 (홍성은)
+            2026-10-19: receiver_hash 로 중복 수령인 재사용 (홍성은)
         """
         with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            # 같은 해시의 수령인이 있으면 LAST_INSERT_ID(id) 로 기존 id 를 돌려받음
             insert_query = '''
             INSERT INTO receivers(
+                id,
+                receiver_hash,
                 name, 
                 contact, 
                 zip_code, 
@@ -33,50 +97,165 @@ class OrderDao:
                 detail_address
                 )
             VALUES(
+                %(receiver_id)s,
+                %(receiver_hash)s,
                 %(buyer_name)s,
                 %(contact)s,
                 %(zip_code)s,
                 %(street_address)s,
                 %(detail_address)s
             )
+            ON DUPLICATE KEY UPDATE id=LAST_INSERT_ID(id)
             '''
             cursor.execute(insert_query, body)
-            row = cursor.lastrowid
 
-            return row if row else None
+            # 새로 저장된 경우 AUTO_INCREMENT 가 없으므로 lastrowid 는 0
+            existing_id = cursor.lastrowid
+
+            return existing_id if existing_id else body['receiver_id']
+
+    def get_receivers_to_hash(self, db_connection, body):
+        """
+        receiver_hash 가 없는(중복 제거 이전에 저장된) 수령인을 id 순으로 limit 개 반환합니다.
+        Args:
+            db_connection : db_connection
+            last_id       : 직전 청크의 마지막 id
+            limit         : 청크 크기
+        Returns:
+            id, name, contact, zip_code, street_address, detail_address
+        Author : 홍성은
+        History: 
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            SELECT
+                id,
+                name,
+                contact,
+                zip_code,
+                street_address,
+                detail_address
+            FROM receivers
+            WHERE id > %(last_id)s
+                AND receiver_hash IS NULL
+            ORDER BY id
+            LIMIT %(limit)s
+            '''
+            cursor.execute(query, body)
+            row = cursor.fetchall()
+
+            return row
+
+    def get_receivers_by_hash(self, db_connection, body):
+        """
+        해시값이 일치하는 수령인들의 id 를 반환합니다.
+        Args:
+            db_connection   : db_connection
+            receiver_hashes : 해시값 리스트
+        Returns:
+            id, receiver_hash
+        Author : 홍성은
+        History: 
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            SELECT
+                id,
+                receiver_hash
+            FROM receivers
+            WHERE receiver_hash IN %(receiver_hashes)s
+            '''
+            cursor.execute(query, body)
+            row = cursor.fetchall()
+
+            return row
+
+    def set_receiver_hashes(self, db_connection, hash_list):
+        """
+        수령인들의 receiver_hash 를 저장합니다.
+        Args:
+            db_connection : db_connection
+            hash_list     : [(receiver_hash, receiver_id)]
+        Author : 홍성은
+        History: 
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            UPDATE receivers
+            SET receiver_hash=%s
+            WHERE id=%s
+            '''
+            cursor.executemany(query, hash_list)
+
+    def merge_receivers(self, db_connection, merge_list):
+        """
+        중복 수령인을 참조하는 주문과 상세주문을 남길 수령인으로 옮기고 중복 수령인을 삭제합니다.
+        Args:
+            db_connection : db_connection
+            merge_list    : [(남길 receiver_id, 삭제할 receiver_id)]
+        Author : 홍성은
+        History: 
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            detail_orders_query = '''
+            UPDATE detail_orders
+            SET receiver_id=%s
+            WHERE receiver_id=%s
+            '''
+            cursor.executemany(detail_orders_query, merge_list)
+
+            orders_query = '''
+            UPDATE orders
+            SET receiver_id=%s
+            WHERE receiver_id=%s
+            '''
+            cursor.executemany(orders_query, merge_list)
+
+            delete_query = '''
+            DELETE FROM receivers
+            WHERE id IN %(receiver_ids)s
+            '''
+            cursor.execute(delete_query, {'receiver_ids':[duplicate_id for survivor_id, duplicate_id in merge_list]})
 
     def make_order_info(self, db_connection, body):
         """
         orders 테이블에 가격과 수령자 정보를 저장하고 생성된 주문 번호를 반환합니다.
         Args:
             db_connection : db_connection
+            order_id      : id_generator 로 미리 생성한 주문 id
             receiver_id   : 주문자 번호
             total_price   : 총 결제 금액
         Returns:
-            MAX(id) : 생성된 주문의 id
+            order_id : 생성된 주문의 id
         Author : 김수정
         History: 
             2020-10-31: 초기생성
+            2026-10-19: lastrowid 대신 미리 생성한 id 사용 (홍성은)
         """
         with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
             insert_query = '''
-            INSERT INTO orders(receiver_id, total_paied_price)
+            INSERT INTO orders(id, receiver_id, total_paied_price)
             VALUES(
+                %(order_id)s,
                 %(receiver_id)s,
                 %(total_price)s
             )
             '''
             cursor.execute(insert_query, body)
-            row = cursor.lastrowid
 
-            return row if row else None
+            return body['order_id']
 
     def make_detail_order_info(self, db_connection, body):
         """상세 주문정보를 저장합니다.
         Args:
             db_connection : db_connection
             body          : 딕셔너리
-                {order_id      : 직전에 생성된 주문번호
+                {detail_order_id : id_generator 로 미리 생성한 상세주문 id
+                order_id      : 직전에 생성된 주문번호
                 product_id    : 상품번호
                 seller_id     : 셀러 번호
                 receiver_id   : 주문자 번호
@@ -87,10 +266,12 @@ class OrderDao:
         Author : 김수정
         History: 
             2020-10-31: 초기생성
+            2026-10-19: 미리 생성한 id 사용 (홍성은)
         """
         with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
             query = '''
             INSERT INTO detail_orders(
+                id,
                 order_id,      
                 product_id,      
                 seller_id,       
@@ -101,6 +282,7 @@ class OrderDao:
                 quantity,
                 status_id)        
             VALUES(
+                %(detail_order_id)s,
                 %(order_id)s,
                 %(product_id)s,
                 %(seller_id)s,
@@ -119,23 +301,39 @@ class OrderDao:
     def make_change_to_stock(self, db_connection, body):
         """
         재고 수량을 업데이트 합니다.
+        재고가 구매수량보다 적으면 변경하지 않습니다.
         Args:
             db_connection : db_connection
             body          : 딕셔너리
                 {option_id     : 재고 수량 변경할 옵션 번호
                 quantity      : 재고 수량에서 제할 구매수량}
+        Returns:
+            변경 후 남은 재고 수량, 재고가 부족하면 None
         Author : 김수정
         History: 
             2020-10-31: 초기생성
+            2026-10-19: 재고 부족시 변경하지 않고 남은 재고 반환 (홍성은)
         """
         with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
             query = '''
-            UPDATE options SET stock_quantity -= %(quantity)s
+            UPDATE options SET stock_quantity = stock_quantity - %(quantity)s
+            WHERE id=%(option_id)s
+                AND stock_quantity >= %(quantity)s
+            '''
+            cursor.execute(query, body)
+
+            if cursor.rowcount != 1:
+                return None
+
+            query = '''
+            SELECT stock_quantity FROM options
             WHERE id=%(option_id)s
             '''
             cursor.execute(query, body)
             row = cursor.fetchone()
 
+            return row['stock_quantity']
+
     def get_one_month_orders(self, db_connection, body):
         """
         조회일시로부터 지난 한 달동안 생성된 주문정보를 반환합니다.
@@ -174,11 +372,14 @@ class OrderDao:
 
     def get_orders_to_confirm(self, db_connection, body):
         """
-        10분 이상 된 모든 배송완료 주문을 반환합니다. 
+        주문한 지 n분 이상 된 배송완료 주문을 id 순서로 limit 개 잠그고 반환합니다.
+        다른 워커가 잠근 주문은 건너뛰므로(SKIP LOCKED) 여러 워커가 겹치지 않게 나누어 처리할 수 있습니다.
         Args:
             db_connection : db_connection
-            ten_m_before  : 지금으로부터 10분 전
-            status_id     : 조회할 주문의 현 상태 id (배송 완료-6)
+            body          : 딕셔너리
+                {minutes    : n분,
+                status_id   : 조회할 주문의 현 상태 id (배송완료-5),
+                limit       : 청크 크기}
         Returns:
             id              : detail_order 의 id
             product_name    : 주문한 상품명
@@ -186,6 +387,8 @@ class OrderDao:
         Author : 김수정
         History: 
             2020-11-02: 초기생성
+            2026-10-19: 청크(last_id, limit), 워커별 분할, 잠금 추가 (홍성은)
+            2026-10-19: 워커별 분할 대신 SKIP LOCKED 로 변경 (홍성은)
         """
         with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
             query = """
@@ -194,16 +397,156 @@ class OrderDao:
                 products.name AS product_name,
                 receivers.name AS receiver_name
             FROM detail_orders
-            JOIN detail_order_statuses ON detail_orders.status_id=detail_order_statuses.id
             JOIN products ON detail_orders.product_id=products.id
             JOIN receivers ON detail_orders.receiver_id=receivers.id
-            WHERE detail_order_statuses.id=%(status_id)s
+            WHERE detail_orders.status_id=%(status_id)s
                 AND detail_orders.ordered_at <= DATE_ADD(NOW(), INTERVAL -%(minutes)s MINUTE)
+            ORDER BY detail_orders.id
+            LIMIT %(limit)s
+            FOR UPDATE OF detail_orders SKIP LOCKED
             """
             cursor.execute(query, body)
-            row = cursor.fetchall()
 
-            return row if row else None
+            return cursor.fetchall()
+
+    def get_oldest_order_to_confirm(self, db_connection, body):
+        """
+        구매확정 대상 중 가장 오래된 주문의 주문일시를 반환합니다. (자동 구매확정 지연 측정용)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {minutes    : n분,
+                status_id   : 조회할 주문의 현 상태 id (배송완료-5)}
+        Returns:
+            가장 오래된 주문일시
+            None : 대상이 없는 경우
+        Author : 홍성은
+        History: 
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            SELECT 
+                MIN(ordered_at) AS ordered_at
+            FROM detail_orders
+            WHERE status_id=%(status_id)s
+                AND ordered_at <= DATE_ADD(NOW(), INTERVAL -%(minutes)s MINUTE)
+            """
+            cursor.execute(query, body)
+
+            return cursor.fetchone()['ordered_at']
+
+    def get_scheduled_orders_to_confirm(self, db_connection, body):
+        """
+        예약된 주문들 중 아직 배송완료 상태인 주문을 잠그고 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids  : 만기가 된 detail_order 의 id 들,
+                status_id   : 조회할 주문의 현 상태 id (배송완료-5)}
+        Returns:
+            id              : detail_order 의 id
+            product_name    : 주문한 상품명
+            receiver_name   : 수령인 이름
+        Author : 홍성은
+        History: 
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            SELECT 
+                detail_orders.id,
+                products.name AS product_name,
+                receivers.name AS receiver_name
+            FROM detail_orders
+            JOIN products ON detail_orders.product_id=products.id
+            JOIN receivers ON detail_orders.receiver_id=receivers.id
+            WHERE detail_orders.id IN %(order_ids)s
+                AND detail_orders.status_id=%(status_id)s
+            ORDER BY detail_orders.id
+            FOR UPDATE OF detail_orders
+            """
+            cursor.execute(query, body)
+
+            return cursor.fetchall()
+
+    def schedule_order_confirm(self, db_connection, body):
+        """
+        배송완료된 주문들의 자동 구매확정을 예약합니다. 이미 예약된 주문은 예정일시를 다시 정합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {schedules : [{schedule_id, detail_order_id}],
+                minutes    : 지금부터 구매확정까지의 시간(분)}
+        Author : 홍성은
+        History: 
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            INSERT INTO order_confirm_schedules(
+                id,
+                detail_order_id,
+                due_at
+            ) VALUES(
+                %(schedule_id)s,
+                %(detail_order_id)s,
+                DATE_ADD(NOW(), INTERVAL %(minutes)s MINUTE)
+            )
+            ON DUPLICATE KEY UPDATE
+                id     = VALUES(id),
+                due_at = VALUES(due_at)
+            """
+            cursor.executemany(query, [
+                dict(schedule, minutes=body['minutes']) for schedule in body['schedules']
+            ])
+
+    def delete_order_confirm_schedules(self, db_connection, body):
+        """
+        주문들의 자동 구매확정 예약을 삭제합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids : detail_order 의 id 들}
+        Author : 홍성은
+        History: 
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            DELETE FROM order_confirm_schedules
+            WHERE detail_order_id IN %(order_ids)s
+            """
+            cursor.execute(query, body)
+
+    def get_new_order_confirm_schedules(self, db_connection, body):
+        """
+        last_id 이후에 생긴 자동 구매확정 예약을 id 순서로 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {last_id : 직전에 읽은 마지막 예약 id,
+                limit    : 최대 개수}
+        Returns:
+            id, detail_order_id, due_at
+        Author : 홍성은
+        History: 
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            SELECT
+                id,
+                detail_order_id,
+                due_at
+            FROM order_confirm_schedules
+            WHERE id > %(last_id)s
+            ORDER BY id
+            LIMIT %(limit)s
+            """
+            cursor.execute(query, body)
+
+            return cursor.fetchall()
 
     def confirm_order_delivery(self, db_connection, body):
         """
@@ -257,12 +600,14 @@ class OrderDao:
     def check_order_status(self, db_connection, body):
         """
         선택한 주문들의 현재 상태를 확인합니다.     
+        동시에 같은 주문의 상태를 바꾸는 요청이 매출 집계를 두 번 옮기지 않도록, 트랜잭션이 끝날 때까지 주문들을 잠급니다.
         Args:
             db_connection : db_connection
             body
         Author : 김수정
         History: 
         #     2020-11-02: 초기생성
+        #     2026-10-19: FOR UPDATE 로 잠금 (홍성은)
         """
         with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
             query = """
@@ -273,6 +618,7 @@ class OrderDao:
             WHERE
                 status_id=%(status_id)s
                 AND id IN %(id)s
+            FOR UPDATE
             """
 
             cursor.execute(query, body)
@@ -354,8 +700,110 @@ class OrderDao:
 
             return row
 
+    def get_order_sellers(self, db_connection, body):
+        """
+        상세주문들의 셀러를 반환합니다. (주문 이벤트를 셀러별로 보내기 위함)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids : detail_order 들의 id}
+        Returns:
+            [{id : detail_order 의 id, seller_id}]
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            SELECT
+                id,
+                seller_id
+            FROM
+                detail_orders
+            WHERE
+                id IN %(order_ids)s
+            """
+            cursor.execute(query, body)
+
+            return cursor.fetchall()
+
+    def get_order_list_query(self, order_info):
+        """
+        주문 관리 목록 조회 쿼리를 ORDER BY 절까지 만듭니다. 목록 조회와 내보내기가 같은 조건을 사용합니다.
+        Args:
+            order_info : get_complete_order_list 의 필터
+        Returns:
+            쿼리 문자열
+        Author : 홍성은
+        History:
+            2026-10-19: get_complete_order_list 에서 분리
+            2026-10-19: 조회 컬럼을 ORDER_LIST_COLUMNS 로 분리
+        """
+        query = f"""
+        SELECT{ORDER_LIST_COLUMNS}
+        FROM 
+            order_list_view
+        """
+        conditions = []
+
+        # 셀러 범위 - (seller_id, status_id, order_id) / (seller_id, status_id, paied_at, order_id) 인덱스
+        if order_info.get('seller_id'):
+            conditions.append("seller_id = %(seller_id)s")
+
+        # 주문관리 카테고리가 바뀌는 경우
+        if order_info['status_id']:
+            conditions.append("status_id = %(status_id)s")
+
+        # 주문번호에 따른 필터
+        if order_info['order_number']:
+            conditions.append("order_id = %(order_number)s")
+
+        # 상세주문번호에 따른 필터
+        if order_info['detail_order_id']:
+            conditions.append("detail_order_id = %(detail_order_id)s")
+
+        # 주문자명에 따른 필터
+        if order_info['receiver_name']:
+            conditions.append("receiver_name = %(receiver_name)s")
+
+        # 핸드폰 번호에 따른 필터
+        if order_info['phone_number']:
+            conditions.append("receiver_contact = %(phone_number)s")
+
+        # 상품명에 따른 필터
+        if order_info['product_name']:
+            conditions.append("product_name = %(product_name)s")
+
+        # 결제일시 기간 (서비스에서 DB 시간대로 바꾼 값, 컬럼을 가공하지 않아야 인덱스를 탐)
+        if order_info.get('paied_from'):
+            conditions.append("paied_at >= %(paied_from)s")
+
+        if order_info.get('paied_until'):
+            conditions.append("paied_at < %(paied_until)s")
+
+        if conditions:
+            query += """
+        WHERE """ + """
+            AND """.join(conditions)
+
+        # 기간 조회는 ([seller_id,] status_id, paied_at, order_id) 인덱스를 역순으로 읽어 정렬 없이 limit 만큼만 읽음
+        if order_info.get('paied_from') or order_info.get('paied_until'):
+            query += """
+        ORDER BY 
+            paied_at DESC,
+            order_id DESC"""
+        else:
+            query += """
+        ORDER BY 
+            order_id 
+        DESC"""
+
+        return query
+
     def get_complete_order_list(self, order_info, db_connection):
         """주문 관리 목록을 보내줍니다.
+        원본 테이블들을 조인하지 않고 주문관리 목록(order_list_view) 한 테이블에서 필터별 인덱스로 읽습니다.
+        셀러 범위 조회는 seller_id 로 시작하는 인덱스만 읽으므로, 테이블이 커져도 셀러의 주문 수에 비례합니다.
         Args:
             db_connection : db_connection
         Returns:
@@ -364,70 +812,15 @@ class OrderDao:
         History: 
             2020-11-03: 초기생성
             2020-11-04: 페이지네이션 추가 
+            2026-10-19: order_list_view 에서 읽도록 변경, 조건이 status 없이 시작할 때의 WHERE/AND 오류 수정
+            2026-10-19: 결제일시 기간 조건 추가
+            2026-10-19: 셀러 범위 조회 추가
+            2026-10-19: 쿼리 생성을 get_order_list_query 로 분리
         """
+        query = self.get_order_list_query(order_info)
 
         with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            query = """
-            SELECT
-                DATE_FORMAT(o.paied_at,'%%Y-%%m-%%d %%H:%%m:%%s') AS a_paied_at,
-                d.order_id as b_oreder_id,
-                p.name as d_products_name,
-                d.id as c_detail_order_id,
-                d.quantity as f_quantity,
-                d.option_id as e_option_id,
-                r.contact as h_reciever_contact,
-                r.name as g_reciever,
-                dos.name as i_detail_order_statuses_name
-            FROM 
-                detail_orders AS d
-            JOIN
-                orders AS o ON d.order_id = o.id
-            JOIN 
-                products AS p ON d.product_id = p.id
-            JOIN 
-                sellers AS s ON d.seller_id = s.id 
-            JOIN
-                receivers AS r ON d.receiver_id = r.id
-            JOIN
-                detail_order_statuses AS dos ON dos.id = d.status_id    
-            """
-            # 주문관리 카테고리가 바뀌는 경우
-            if order_info['status_id']:
-                query += """
-                WHERE d.status_id=%(status_id)s
-                """
-
-            # 주문번호에 따른 필터
-            if order_info['order_number']:
-                query += """
-                AND o.id = %(order_number)s
-                """
-            # 상세주문번호에 따른 필터
-            if order_info['detail_order_id']:
-                query += """
-                AND d.id = %(detail_order_id)s
-                """
-            # 주문자명에 따른 필터
-            if order_info['receiver_name']:
-                query += """
-                AND r.name = %(receiver_name)s
-                """
-            # 핸드폰 번호에 따른 필터
-            if order_info['phone_number']:
-                query += """
-                AND r.contact = %(phone_number)s
-                """
-
-            # 상품명에 따른 필터
-            if order_info['product_name']:
-                query += """
-                AND p.name = %(product_name)s
-                """
-
             query += """
-            ORDER BY 
-                order_id 
-            DESC 
             LIMIT 
                 %(limit)s
             OFFSET
@@ -437,3 +830,189 @@ class OrderDao:
             order = cursor.fetchall()
 
             return order
+
+    def stream_order_list(self, db_connection, order_info, batch_size=1000):
+        """
+        조건에 맞는 주문 관리 목록 전체를 서버 사이드 커서(SSDictCursor)로 batch_size 행씩 읽어 반환합니다. (내보내기용)
+        결과 전체를 메모리에 올리지 않으며, 제너레이터를 끝까지 읽기 전에는 같은 커넥션으로 다른 쿼리를 실행할 수 없습니다.
+        Args:
+            db_connection : db_connection
+            order_info    : get_complete_order_list 의 필터 (offset, limit 는 사용하지 않음)
+            batch_size    : 한 번에 읽을 행 수
+        Returns:
+            딕셔너리 리스트를 batch 단위로 반환하는 제너레이터
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        query = self.get_order_list_query(order_info)
+
+        with db_connection.cursor(pymysql.cursors.SSDictCursor) as cursor:
+            cursor.execute(query, order_info)
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield rows
+
+    def get_order_list_rows(self, db_connection, body):
+        """
+        주문 관리 목록과 같은 컬럼으로 상세주문들을 반환합니다. (변경분 동기화용)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids : detail_order 들의 id}
+        Returns:
+            주문 관리 목록의 컬럼 + status_id
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = f"""
+            SELECT{ORDER_LIST_COLUMNS},
+                status_id
+            FROM
+                order_list_view
+            WHERE
+                detail_order_id IN %(order_ids)s
+            """
+            cursor.execute(query, body)
+
+            return cursor.fetchall()
+
+    def add_orders_to_list_view(self, db_connection, body, table='order_list_view'):
+        """
+        상세주문들의 주문관리 목록 행을 원본 테이블들로부터 만들어 넣거나 덮어씁니다.
+        주문 생성과 같은 트랜잭션에서 호출하며, 목록을 다시 만들 때 변경분을 맞추는 데에도 사용합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids : 반영할 detail_order 들의 id}
+            table         : 반영할 테이블 (다시 만드는 중에는 order_list_view_new)
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = f'''
+            REPLACE INTO {table}(
+                {ORDER_LIST_VIEW_COLUMNS}
+            )
+            {ORDER_LIST_VIEW_SELECT}
+            WHERE d.id IN %(order_ids)s
+            '''
+            cursor.execute(query, body)
+
+    def move_order_list_status(self, db_connection, body):
+        """
+        상세주문들의 상태 변경을 주문관리 목록에 반영합니다.
+        상세주문의 status_id 를 바꾸는 것과 같은 트랜잭션에서 호출합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids : 상태가 바뀐 detail_order 들의 id,
+                status_id  : 변경 후 상태 id}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            UPDATE order_list_view AS v
+            JOIN detail_order_statuses AS dos ON dos.id = %(status_id)s
+            SET
+                v.status_id   = dos.id,
+                v.status_name = dos.name
+            WHERE v.detail_order_id IN %(order_ids)s
+            '''
+            cursor.execute(query, body)
+
+    def copy_orders_to_list_view(self, db_connection, body, table):
+        """
+        detail_orders 를 id 순서로 limit 개씩 주문관리 목록 테이블에 복사합니다. (목록 다시 만들기용)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {last_id : 직전 청크의 마지막 detail_order id,
+                limit    : 청크 크기}
+            table         : 복사할 테이블
+        Returns:
+            이번 청크의 마지막 detail_order id, 복사할 주문이 없으면 None
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute('''
+            SELECT
+                MAX(id) AS last_id
+            FROM (
+                SELECT id
+                FROM detail_orders
+                WHERE id > %(last_id)s
+                ORDER BY id
+                LIMIT %(limit)s
+            ) AS chunk
+            ''', body)
+            last_id = cursor.fetchone()['last_id']
+
+            if last_id is None:
+                return None
+
+            query = f'''
+            REPLACE INTO {table}(
+                {ORDER_LIST_VIEW_COLUMNS}
+            )
+            {ORDER_LIST_VIEW_SELECT}
+            WHERE d.id > %(last_id)s
+                AND d.id <= %(chunk_last_id)s
+            '''
+            cursor.execute(query, dict(body, chunk_last_id=last_id))
+
+            return last_id
+
+    def get_last_status_log_id(self, db_connection):
+        """
+        상세주문 상태 변경 기록의 마지막 id 를 반환합니다. 기록이 없으면 0 입니다.
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute('''
+            SELECT
+                COALESCE(MAX(id), 0) AS last_id
+            FROM detail_order_status_log
+            ''')
+
+            return cursor.fetchone()['last_id']
+
+    def get_changed_order_ids(self, db_connection, body):
+        """
+        주어진 시점 이후 상태가 바뀌었거나 새로 생성된 상세주문 id 들을 반환합니다. (목록 다시 만들기용)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {log_id    : 이 id 이후의 상태 변경 기록을 봄,
+                order_id   : 이 id 이후에 생성된 detail_order 를 봄}
+        Returns:
+            [detail_order_id]
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            SELECT detail_order_id AS id
+            FROM detail_order_status_log
+            WHERE id > %(log_id)s
+            UNION
+            SELECT id
+            FROM detail_orders
+            WHERE id > %(order_id)s
+            '''
+            cursor.execute(query, body)
+
+            return [row['id'] for row in cursor.fetchall()]
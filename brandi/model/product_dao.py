@@ -8,6 +8,100 @@ class ProductDao:
     History: 
         2020-10-20: 초기생성
     """
+    def get_product_list_query(self, filter_dict):
+        """
+        상품 목록 조회의 SELECT 절과 조건(FROM ~ WHERE) 절을 만듭니다. 목록 조회와 내보내기가 같은 조건을 사용합니다.
+        Args:
+            filter_dict : get_product_list 의 필터
+        Returns:
+            (list_column_query, join_query)
+        Author : 김수정
+        History:
+            2020-10-29: 초기생성
+            2026-10-19: get_product_list 에서 분리 (홍성은)
+        """
+        list_column_query = '''
+        SELECT
+            ps.id AS product_number,
+            ps.created_at, 
+            ps.name AS product_name, 
+            ps.price,
+            ps.discount_rate, 
+            ps.is_displayed, 
+            ps.is_on_sale, 
+            (SELECT image_url FROM product_images pi WHERE ps.id = pi.product_id order by ordering asc limit 1) as image_url,
+            sellers.korean_name AS seller_name, 
+            seller_attributes.name AS attribute,
+            (SELECT MIN(ops.id) FROM options ops WHERE ps.id=ops.product_id GROUP BY product_id) as product_code 
+        ''' 
+
+        join_query = '''
+        FROM products ps 
+        JOIN sellers ON ps.seller_id=sellers.account_id
+        JOIN seller_attributes ON sellers.attribute_id=seller_attributes.id
+        WHERE
+            ps.is_deleted=0
+        '''
+        
+        # 판매여부
+        if filter_dict.get('sale', None) in ('0', '1'):
+            join_query += ' AND ps.is_on_sale=%(sale)s'
+
+        # 진열여부
+        if filter_dict.get('displayed', None) in ('0', '1'):
+            join_query += ' AND ps.is_on_sale=%(displayed)s'
+
+        # 상품명
+        if filter_dict.get('product_name', None):
+            join_query += " AND ps.name=%(product_name)s"
+
+        # 상품번호 (product_id)
+        if filter_dict.get('product_number', None):
+            join_query += ' AND ps.id=%(product_number)s'
+
+        # 상품코드 (옵션번호)
+        if filter_dict.get('product_code', None):  
+            join_query += ' AND ops.id=%(product_code)s' 
+
+        # 할인여부 
+        # 할인
+        if filter_dict.get('discount', None) == '1':
+            join_query += ' AND ps.discount_rate > 0'
+            
+        # 미할인
+        if filter_dict.get('discount', None) == '0':
+            join_query += " AND ps.discount_rate IS NULL"
+        
+        # 날짜
+        product_from  =  filter_dict.get('from', None)
+        product_until =  filter_dict.get('until', None)
+
+        # 시작일 정한경우
+        if product_from:
+            from_datetime = datetime.datetime(int(product_from[:4]), int(product_from[5:7].zfill(2)), int(product_from[8:10].zfill(2)))
+            join_query += f" AND ps.created_at >= '{from_datetime}'"
+
+        # 종료일 정한경우
+        if product_until:
+            until_datetime = datetime.datetime(int(product_until[:4]), int(product_until[5:7].zfill(2)), int(product_until[8:10].zfill(2)))
+            join_query += f" AND ps.created_at <= '{until_datetime}'"
+
+        # 셀러가 로그인 했을 때 : seller_id 직접 검색
+        if filter_dict.get('seller_id', None):
+            join_query += ' AND sellers.account_id = %(seller_id)s'
+        
+        # 마스터가 로그인 했을 때
+        else:
+            # 셀러 속성 
+            if filter_dict.get('attribute', None):
+                join_query += ' AND sellers.attribute_id=%(attribute)s'
+
+            # 셀러 이름 
+            if filter_dict.get('seller_name', None):
+                join_query += " AND sellers.korean_name=%(seller_name)s"
+
+        return list_column_query, join_query
+
     def get_product_list(self, db_connection, filter_dict):
         """
         조건에 맞는 상품의 목록을 반환합니다.
@@ -26,101 +120,24 @@ class ProductDao:
             seller_id      : 셀러의 account_id
         History: 
             2020-10-29: 초기생성
+            2026-10-19: 조건절 생성을 get_product_list_query 로 분리 (홍성은)
+            2026-10-19: 상품 번호 순 정렬 (홍성은)
         """
-        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            list_column_query = '''
-            SELECT
-                ps.id AS product_number,
-                ps.created_at, 
-                ps.name AS product_name, 
-                ps.price,
-                ps.discount_rate, 
-                ps.is_displayed, 
-                ps.is_on_sale, 
-                (SELECT image_url FROM product_images pi WHERE ps.id = pi.product_id order by ordering asc limit 1) as image_url,
-                sellers.korean_name AS seller_name, 
-                seller_attributes.name AS attribute,
-                (SELECT MIN(ops.id) FROM options ops WHERE ps.id=ops.product_id GROUP BY product_id) as product_code 
-            ''' 
+        list_column_query, join_query = self.get_product_list_query(filter_dict)
 
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
             count_column_query = '''
             SELECT
                 count(0) as total_count
             '''
 
-            join_query = '''
-            FROM products ps 
-            JOIN sellers ON ps.seller_id=sellers.account_id
-            JOIN seller_attributes ON sellers.attribute_id=seller_attributes.id
-            WHERE
-                ps.is_deleted=0
-            '''
-            
-            # 판매여부
-            if filter_dict.get('sale', None) in ('0', '1'):
-                join_query += ' AND ps.is_on_sale=%(sale)s'
-
-            # 진열여부
-            if filter_dict.get('displayed', None) in ('0', '1'):
-                join_query += ' AND ps.is_on_sale=%(displayed)s'
-
-            # 상품명
-            if filter_dict.get('product_name', None):
-                join_query += " AND ps.name=%(product_name)s"
-
-            # 상품번호 (product_id)
-            if filter_dict.get('product_number', None):
-                join_query += ' AND ps.id=%(product_number)s'
-
-            # 상품코드 (옵션번호)
-            if filter_dict.get('product_code', None):  
-                join_query += ' AND ops.id=%(product_code)s' 
-
-            # 할인여부 
-            # 할인
-            if filter_dict.get('discount', None) == '1':
-                join_query += ' AND ps.discount_rate > 0'
-                
-            # 미할인
-            if filter_dict.get('discount', None) == '0':
-                join_query += " AND ps.discount_rate IS NULL"
-            
-            # 날짜
-            product_from  =  filter_dict.get('from', None)
-            product_until =  filter_dict.get('until', None)
-
-            # 시작일 정한경우
-            if product_from:
-                from_datetime = datetime.datetime(int(product_from[:4]), int(product_from[5:7].zfill(2)), int(product_from[8:10].zfill(2)))
-                join_query += f" AND ps.created_at >= '{from_datetime}'"
-
-            # 종료일 정한경우
-            if product_until:
-                until_datetime = datetime.datetime(int(product_until[:4]), int(product_until[5:7].zfill(2)), int(product_until[8:10].zfill(2)))
-                join_query += f" AND ps.created_at <= '{until_datetime}'"
-
-            # 셀러가 로그인 했을 때 : seller_id 직접 검색
-            if filter_dict.get('seller_id', None):
-                join_query += ' AND sellers.account_id = %(seller_id)s'
-            
-            # 마스터가 로그인 했을 때
-            else:
-                # 셀러 속성 
-                if filter_dict.get('attribute', None):
-                    join_query += ' AND sellers.attribute_id=%(attribute)s'
-
-                # 셀러 이름 
-                if filter_dict.get('seller_name', None):
-                    print('이름 옴!')
-                    join_query += " AND sellers.korean_name=%(seller_name)s"
-            
             # Offset
             offset = int(filter_dict.get('offset', '0'))
             pagination = f" AND ps.id > {offset}"
 
-            # limit
+            # limit (샤드별 목록을 합칠 수 있도록 상품 번호 순으로)
             limit = int(filter_dict.get('limit', '10'))
-            pagination += f" limit {limit}"
+            pagination += f" ORDER BY ps.id limit {limit}"
 
             cursor.execute(list_column_query+join_query+pagination, filter_dict)
             list_row = cursor.fetchall()
@@ -130,6 +147,64 @@ class ProductDao:
 
             return list_row, count_row.get('total_count') if count_row else None
     
+    def stream_product_list(self, db_connection, filter_dict, batch_size=1000):
+        """
+        조건에 맞는 상품 전체를 서버 사이드 커서(SSDictCursor)로 batch_size 행씩 읽어 반환합니다. (내보내기용)
+        결과 전체를 메모리에 올리지 않으며, 제너레이터를 끝까지 읽기 전에는 같은 커넥션으로 다른 쿼리를 실행할 수 없습니다.
+        Args:
+            db_connection : db_connection
+            filter_dict   : get_product_list 의 필터 (offset, limit 는 사용하지 않음)
+            batch_size    : 한 번에 읽을 행 수
+        Returns:
+            딕셔너리 리스트를 batch 단위로 반환하는 제너레이터
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        list_column_query, join_query = self.get_product_list_query(filter_dict)
+
+        with db_connection.cursor(pymysql.cursors.SSDictCursor) as cursor:
+            cursor.execute(list_column_query + join_query + " ORDER BY ps.id", filter_dict)
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield rows
+
+    def get_products_by_ids(self, db_connection, body):
+        """
+        상품 목록과 같은 컬럼으로 상품들을 반환합니다. 삭제된 상품도 포함합니다. (변경분 동기화용)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {product_ids : 상품 id 들}
+        Returns:
+            상품 목록의 컬럼 + seller_id, is_deleted, stock_quantity(재고관리하는 옵션의 재고 합, 없으면 None)
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        list_column_query, _ = self.get_product_list_query({})
+
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = list_column_query + ''',
+            ps.seller_id,
+            ps.is_deleted,
+            (
+                SELECT CAST(SUM(ops.stock_quantity) AS SIGNED) FROM options ops
+                WHERE ps.id=ops.product_id AND ops.is_deleted=0 AND ops.is_stock_controlled=1
+            ) AS stock_quantity
+            FROM products ps 
+            JOIN sellers ON ps.seller_id=sellers.account_id
+            JOIN seller_attributes ON sellers.attribute_id=seller_attributes.id
+            WHERE
+                ps.id IN %(product_ids)s
+            '''
+            cursor.execute(query, body)
+
+            return cursor.fetchall()
+
     def check_availability(self, db_connection, product_ids):
         """
         상품의 판매여부, 삭제여부를 반환합니다.
@@ -229,6 +304,75 @@ class ProductDao:
             row = cursor.fetchall()
             return row if row else None
     
+    def get_product_snapshot(self, db_connection, body):
+        """
+        주문 페이지 스냅샷 캐시에 담을 상품의 판매 정보를 반환합니다.
+        Args:
+            db_connection : db_connection
+            product_id    : 상품 번호
+        Returns:
+            product_id, product_name, seller_id, is_on_sale, is_displayed, is_deleted,
+            price, discount_rate, min_quantity, max_quantity
+        Author : 홍성은
+        History: 
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            SELECT
+                id AS product_id,
+                name AS product_name,
+                seller_id,
+                is_on_sale,
+                is_displayed,
+                is_deleted,
+                price,
+                discount_rate,
+                min_quantity,
+                max_quantity
+            FROM products
+            WHERE id=%(product_id)s
+            '''
+            cursor.execute(query, body)
+            row = cursor.fetchone()
+
+            return row if row else None
+
+    def get_option_matrix(self, db_connection, body):
+        """
+        선택한 상품의 삭제되지 않은 모든 옵션(색상 x 사이즈)과 재고 정보를 불러옵니다.
+        Args:
+            db_connection : db_connection
+            product_id    : 상품 번호
+        Returns:
+            option_id, color_id, color, size_id, size, is_stock_controlled, stock_quantity
+        Author : 홍성은
+        History: 
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            SELECT
+                options.id AS option_id,
+                colors.id AS color_id,
+                colors.name AS color,
+                sizes.id AS size_id,
+                sizes.name AS size,
+                options.is_stock_controlled,
+                options.stock_quantity
+            FROM options
+            JOIN colors ON options.color_id=colors.id
+            JOIN sizes ON options.size_id=sizes.id
+            WHERE
+                options.is_deleted=0
+                AND options.product_id=%(product_id)s
+            ORDER BY options.id
+            '''
+            cursor.execute(query, body)
+            row = cursor.fetchall()
+
+            return row
+
     def check_option(self, db_connection, body):
         """
         선택한 옵션과 수량을 확인하여 구매 가능여부를 반환합니다. 
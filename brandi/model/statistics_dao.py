@@ -0,0 +1,929 @@
+import pymysql
+
+# 주문 상태 id 별로 seller_daily_sales 에서 건수를 세는 컬럼
+STATUS_COUNT_COLUMNS = {
+    1 : 'paid_count',               # 결제완료
+    2 : 'preparing_count',          # 상품준비
+    3 : 'delivery_preparing_count', # 배송준비
+    4 : 'shipping_count',           # 배송중
+    5 : 'delivered_count',          # 배송완료
+    6 : 'confirmed_count',          # 구매확정
+}
+
+# detail_orders 를 셀러/주문일자 별로 집계하는 SELECT (DAILY_SALES_COLUMNS 순서, 주문 생성시의 INSERT ... SELECT 와 야간 대사에서 사용)
+DAILY_SALES_SELECT = '''
+            SELECT
+                seller_id,
+                DATE(ordered_at),
+                COUNT(*),
+                SUM(quantity),
+                SUM(price*discount_rate*quantity),
+                {status_sums}
+            FROM detail_orders
+'''.format(status_sums=',\n                '.join(
+    f'SUM(status_id={status_id})' for status_id in STATUS_COUNT_COLUMNS
+))
+
+# 셀러별 상품 판매 순위를 유지하는 기간(일)
+TOP_PRODUCT_WINDOWS = (7, 30)
+
+# 상품 판매 순위 정렬 기준과 컬럼
+TOP_PRODUCT_ORDERS = {
+    'units'   : 'units',
+    'revenue' : 'revenue',
+}
+
+DAILY_SALES_COLUMN_NAMES = (
+    ['seller_id', 'sales_date', 'order_count', 'unit_count', 'revenue']
+    + list(STATUS_COUNT_COLUMNS.values())
+)
+DAILY_SALES_COLUMNS = ',\n                '.join(DAILY_SALES_COLUMN_NAMES)
+
+
+class StatisticsDao:
+    """매출 통계 모델
+    주문 생성, 주문 상태 변경시 함께 갱신되는 셀러별 일 매출(seller_daily_sales)과
+    상품 수(seller_product_counts) 집계 테이블을 다룹니다.
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def add_orders_to_daily_sales(self, db_connection, body):
+        """
+        새로 생성된 상세주문들을 셀러별 일 매출에 더합니다. 주문 생성과 같은 트랜잭션에서 호출합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids : 더할 detail_order 들의 id}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = f'''
+            INSERT INTO seller_daily_sales(
+                {DAILY_SALES_COLUMNS}
+            )
+            {DAILY_SALES_SELECT}
+            WHERE id IN %(order_ids)s
+            GROUP BY seller_id, DATE(ordered_at)
+            ON DUPLICATE KEY UPDATE
+                order_count = order_count + VALUES(order_count),
+                unit_count  = unit_count + VALUES(unit_count),
+                revenue     = revenue + VALUES(revenue),
+                {', '.join(f'{column} = {column} + VALUES({column})' for column in STATUS_COUNT_COLUMNS.values())}
+            '''
+            cursor.execute(query, body)
+
+    def move_daily_sales_status(self, db_connection, body):
+        """
+        상세주문들의 상태 변경을 셀러별 일 매출의 상태별 건수에 반영합니다.
+        상세주문의 status_id 를 바꾸는 것과 같은 트랜잭션에서 호출합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids        : 상태가 바뀐 detail_order 들의 id,
+                before_status_id  : 변경 전 상태 id,
+                status_id         : 변경 후 상태 id}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        before_column = STATUS_COUNT_COLUMNS[body['before_status_id']]
+        after_column  = STATUS_COUNT_COLUMNS[body['status_id']]
+
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = f'''
+            UPDATE seller_daily_sales AS s
+            JOIN (
+                SELECT
+                    seller_id,
+                    DATE(ordered_at) AS sales_date,
+                    COUNT(*) AS moved
+                FROM detail_orders
+                WHERE id IN %(order_ids)s
+                GROUP BY seller_id, DATE(ordered_at)
+            ) AS d ON s.seller_id = d.seller_id AND s.sales_date = d.sales_date
+            SET
+                s.{before_column} = s.{before_column} - d.moved,
+                s.{after_column} = s.{after_column} + d.moved
+            '''
+            cursor.execute(query, body)
+
+    def get_seller_daily_sales(self, db_connection, body):
+        """
+        셀러의 기간내 일 매출을 반환합니다. 주문이 없는 날은 행이 없습니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {account_id : seller 의 account_id,
+                start_date  : 시작일(포함),
+                end_date    : 종료일(포함)}
+        Returns:
+            [{sales_date, order_count, unit_count, revenue, paid_count, ... confirmed_count}]
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = f'''
+            SELECT
+                sales_date,
+                order_count,
+                unit_count,
+                revenue,
+                {', '.join(STATUS_COUNT_COLUMNS.values())}
+            FROM seller_daily_sales
+            WHERE seller_id=%(account_id)s
+                AND sales_date BETWEEN %(start_date)s AND %(end_date)s
+            ORDER BY sales_date
+            '''
+            cursor.execute(query, body)
+
+            return cursor.fetchall()
+
+    def rebuild_daily_sales(self, db_connection, body):
+        """
+        하루치 셀러별 일 매출을 detail_orders 로부터 다시 계산합니다. (야간 대사용)
+        detail_orders 는 잠그지 않는 일관된 읽기로 집계하므로 주문 생성, 상태 변경을 막지 않습니다.
+        그날의 집계 행(과 그 사이 간격)을 트랜잭션의 첫 문장에서 잠근 뒤 detail_orders 를 처음 읽으므로,
+        REPEATABLE READ 의 스냅샷이 잠금 이후에 만들어집니다. (rebuild_order_status_counts 와 같은 방식)
+        - 먼저 집계를 바꾼 주문 트랜잭션은 잠금을 기다리는 동안 커밋되어 스냅샷에 보입니다.
+        - 스냅샷 이후의 주문 트랜잭션은 집계 행(그날 첫 주문이면 간격) 잠금에서 기다렸다가 다시 계산한 값에 더합니다.
+        다시 계산한 셀러의 행은 덮어쓰고, 그날 주문이 더 이상 없는 셀러의 행만 지웁니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {sales_date : 다시 계산할 날짜}
+        Returns:
+            다시 계산된 셀러 수
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+            2026-10-19: 지우고 INSERT ... SELECT 하던 것을 잠그지 않는 읽기 후 덮어쓰기로 변경
+        """
+        with db_connection.cursor(pymysql.cursors.Cursor) as cursor:
+            cursor.execute('''
+            SELECT
+                seller_id
+            FROM seller_daily_sales
+            WHERE sales_date=%(sales_date)s
+            FOR UPDATE
+            ''', body)
+
+            cursor.execute(f'''
+            {DAILY_SALES_SELECT}
+            WHERE ordered_at >= %(sales_date)s
+                AND ordered_at < DATE_ADD(%(sales_date)s, INTERVAL 1 DAY)
+            GROUP BY seller_id, DATE(ordered_at)
+            ''', body)
+            rows = cursor.fetchall()
+
+            if rows:
+                cursor.executemany(f'''
+                INSERT INTO seller_daily_sales(
+                    {DAILY_SALES_COLUMNS}
+                ) VALUES (
+                    {', '.join(['%s'] * len(DAILY_SALES_COLUMN_NAMES))}
+                )
+                ON DUPLICATE KEY UPDATE
+                    {', '.join(f'{column} = VALUES({column})' for column in DAILY_SALES_COLUMN_NAMES[2:])}
+                ''', rows)
+
+                cursor.execute('''
+                DELETE FROM seller_daily_sales
+                WHERE sales_date=%(sales_date)s
+                    AND seller_id NOT IN %(seller_ids)s
+                ''', dict(body, seller_ids=[row[0] for row in rows]))
+            else:
+                cursor.execute('''
+                DELETE FROM seller_daily_sales
+                WHERE sales_date=%(sales_date)s
+                ''', body)
+
+            return len(rows)
+
+    def stream_sales(self, db_connection, body, batch_size=10000):
+        """
+        기간내 매출을 서버 사이드 커서(SSCursor)로 batch_size 행씩 읽어 반환합니다.
+        결과 전체를 메모리에 올리지 않으며, 각 행은 튜플 (start_date 로부터의 일수, 주문 건수, 판매 수량, 매출액) 입니다.
+        제너레이터를 끝까지 읽기 전에는 같은 커넥션으로 다른 쿼리를 실행할 수 없습니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {source       : 'rollup'(seller_daily_sales) 또는 'raw'(detail_orders),
+                start_date    : 시작일(포함),
+                end_date      : 종료일(포함),
+                seller_id     : 셀러의 account_id (없으면 None),
+                attribute_id  : 셀러 속성 id (없으면 None)}
+            batch_size    : 한 번에 읽을 행 수
+        Returns:
+            튜플 리스트를 batch 단위로 반환하는 제너레이터
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        if body['source'] == 'raw':
+            query = """
+            SELECT
+                TO_DAYS(sales.ordered_at) - TO_DAYS(%(start_date)s),
+                1,
+                sales.quantity,
+                sales.price*sales.discount_rate*sales.quantity
+            FROM detail_orders AS sales
+            """
+            date_condition = """
+                sales.ordered_at >= %(start_date)s
+                AND sales.ordered_at < DATE_ADD(%(end_date)s, INTERVAL 1 DAY)
+            """
+        else:
+            query = """
+            SELECT
+                TO_DAYS(sales.sales_date) - TO_DAYS(%(start_date)s),
+                sales.order_count,
+                sales.unit_count,
+                sales.revenue
+            FROM seller_daily_sales AS sales
+            """
+            date_condition = """
+                sales.sales_date BETWEEN %(start_date)s AND %(end_date)s
+            """
+
+        if body.get('attribute_id'):
+            query += """
+            JOIN sellers ON sellers.account_id = sales.seller_id
+                AND sellers.attribute_id = %(attribute_id)s
+            """
+
+        query += "WHERE" + date_condition
+
+        if body.get('seller_id'):
+            query += """
+                AND sales.seller_id = %(seller_id)s
+            """
+
+        with db_connection.cursor(pymysql.cursors.SSCursor) as cursor:
+            cursor.execute(query, body)
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield rows
+
+    def get_order_sketches(self, db_connection, body):
+        """
+        상세주문이 속한 셀러/주문일자의 스케치를 잠그고 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {detail_order_id : 상세주문 id}
+        Returns:
+            {seller_id, sales_date, receiver_id, product_id,
+             buyers_sketch, products_sketch (스케치가 없으면 None)}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            SELECT
+                d.seller_id,
+                DATE(d.ordered_at) AS sales_date,
+                d.receiver_id,
+                d.product_id,
+                s.buyers_sketch,
+                s.products_sketch
+            FROM detail_orders AS d
+            LEFT JOIN seller_daily_sketches AS s
+                ON s.seller_id = d.seller_id
+                AND s.sales_date = DATE(d.ordered_at)
+            WHERE d.id=%(detail_order_id)s
+            FOR UPDATE
+            """
+            cursor.execute(query, body)
+
+            return cursor.fetchone()
+
+    def save_daily_sketches(self, db_connection, body):
+        """
+        셀러/일자의 스케치들을 저장합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리 또는 딕셔너리 리스트
+                {seller_id, sales_date, buyers_sketch, products_sketch}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            INSERT INTO seller_daily_sketches(
+                seller_id,
+                sales_date,
+                buyers_sketch,
+                products_sketch
+            ) VALUES(
+                %(seller_id)s,
+                %(sales_date)s,
+                %(buyers_sketch)s,
+                %(products_sketch)s
+            )
+            ON DUPLICATE KEY UPDATE
+                buyers_sketch   = VALUES(buyers_sketch),
+                products_sketch = VALUES(products_sketch)
+            """
+            if isinstance(body, list):
+                cursor.executemany(query, body)
+            else:
+                cursor.execute(query, body)
+
+    def get_daily_sketches(self, db_connection, body):
+        """
+        기간내 셀러별 일 스케치를 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {start_date : 시작일(포함),
+                end_date    : 종료일(포함),
+                account_id  : seller 의 account_id (None 이면 전체 셀러)}
+        Returns:
+            [{seller_id, sales_date, buyers_sketch, products_sketch}]
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            SELECT
+                seller_id,
+                sales_date,
+                buyers_sketch,
+                products_sketch
+            FROM seller_daily_sketches
+            WHERE sales_date BETWEEN %(start_date)s AND %(end_date)s
+            """
+            if body.get('account_id'):
+                query += """
+                AND seller_id=%(account_id)s
+                """
+            cursor.execute(query, body)
+
+            return cursor.fetchall()
+
+    def stream_daily_sketch_members(self, db_connection, body, batch_size=10000):
+        """
+        하루치 상세주문의 (seller_id, receiver_id, product_id) 를 서버 사이드 커서로 batch_size 행씩 반환합니다. (스케치 재계산용)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {sales_date : 날짜}
+        Returns:
+            튜플 리스트를 batch 단위로 반환하는 제너레이터
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.SSCursor) as cursor:
+            query = """
+            SELECT
+                seller_id,
+                receiver_id,
+                product_id
+            FROM detail_orders
+            WHERE ordered_at >= %(sales_date)s
+                AND ordered_at < DATE_ADD(%(sales_date)s, INTERVAL 1 DAY)
+            """
+            cursor.execute(query, body)
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield rows
+
+    def delete_daily_sketches(self, db_connection, body):
+        """
+        하루치 스케치를 삭제합니다. (스케치 재계산용)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {sales_date : 날짜}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            DELETE FROM seller_daily_sketches
+            WHERE sales_date=%(sales_date)s
+            """
+            cursor.execute(query, body)
+
+    def add_orders_to_top_products(self, db_connection, body):
+        """
+        새로 생성된 상세주문들을 셀러별 상품 일 판매 집계와 최근 7/30일 판매 순위에 더합니다.
+        주문 생성과 같은 트랜잭션에서 호출합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids : 더할 detail_order 들의 id}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            daily_query = '''
+            INSERT INTO seller_product_daily_sales(
+                seller_id,
+                sales_date,
+                product_id,
+                units,
+                revenue
+            )
+            SELECT
+                seller_id,
+                DATE(ordered_at),
+                product_id,
+                SUM(quantity),
+                SUM(price*discount_rate*quantity)
+            FROM detail_orders
+            WHERE id IN %(order_ids)s
+            GROUP BY seller_id, DATE(ordered_at), product_id
+            ON DUPLICATE KEY UPDATE
+                units   = units + VALUES(units),
+                revenue = revenue + VALUES(revenue)
+            '''
+            cursor.execute(daily_query, body)
+
+            window_query = f'''
+            INSERT INTO seller_product_window_sales(
+                seller_id,
+                window_days,
+                product_id,
+                units,
+                revenue
+            )
+            SELECT
+                d.seller_id,
+                w.window_days,
+                d.product_id,
+                SUM(d.quantity),
+                SUM(d.price*d.discount_rate*d.quantity)
+            FROM detail_orders AS d
+            CROSS JOIN (
+                {' UNION ALL '.join(f'SELECT {window_days} AS window_days' for window_days in TOP_PRODUCT_WINDOWS)}
+            ) AS w
+            WHERE d.id IN %(order_ids)s
+            GROUP BY d.seller_id, w.window_days, d.product_id
+            ON DUPLICATE KEY UPDATE
+                units   = units + VALUES(units),
+                revenue = revenue + VALUES(revenue)
+            '''
+            cursor.execute(window_query, body)
+
+    def expire_top_product_window(self, db_connection, body):
+        """
+        기간에서 빠지는 하루치 판매량을 판매 순위에서 뺍니다. (하루에 한 번, 날짜가 바뀐 뒤 실행)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {window_days : 집계 기간(일),
+                expired_date : 기간에서 빠지는 날짜}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            update_query = '''
+            UPDATE seller_product_window_sales AS w
+            JOIN seller_product_daily_sales AS d
+                ON d.seller_id = w.seller_id
+                AND d.product_id = w.product_id
+                AND d.sales_date = %(expired_date)s
+            SET
+                w.units   = w.units - d.units,
+                w.revenue = w.revenue - d.revenue
+            WHERE w.window_days=%(window_days)s
+            '''
+            cursor.execute(update_query, body)
+
+            delete_query = '''
+            DELETE FROM seller_product_window_sales
+            WHERE window_days=%(window_days)s
+                AND units <= 0
+                AND revenue <= 0
+            '''
+            cursor.execute(delete_query, body)
+
+    def rebuild_top_product_window(self, db_connection, body):
+        """
+        판매 순위를 셀러별 상품 일 판매 집계로부터 다시 계산합니다. (처음 시작할 때 사용)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {window_days : 집계 기간(일),
+                end_date     : 기간의 마지막 날(포함)}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            delete_query = '''
+            DELETE FROM seller_product_window_sales
+            WHERE window_days=%(window_days)s
+            '''
+            cursor.execute(delete_query, body)
+
+            insert_query = '''
+            INSERT INTO seller_product_window_sales(
+                seller_id,
+                window_days,
+                product_id,
+                units,
+                revenue
+            )
+            SELECT
+                seller_id,
+                %(window_days)s,
+                product_id,
+                SUM(units),
+                SUM(revenue)
+            FROM seller_product_daily_sales
+            WHERE sales_date > DATE_SUB(%(end_date)s, INTERVAL %(window_days)s DAY)
+                AND sales_date <= %(end_date)s
+            GROUP BY seller_id, product_id
+            '''
+            cursor.execute(insert_query, body)
+
+    def delete_expired_product_daily_sales(self, db_connection, body):
+        """
+        어느 판매 순위 기간에도 들어가지 않는 오래된 상품 일 판매 집계를 삭제합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {before_date : 이 날짜 이전의 집계를 삭제}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            DELETE FROM seller_product_daily_sales
+            WHERE sales_date < %(before_date)s
+            '''
+            cursor.execute(query, body)
+
+    def get_top_products(self, db_connection, body):
+        """
+        셀러의 최근 기간 판매 순위 상위 상품들을 반환합니다.
+        (seller_id, window_days, units/revenue) 인덱스를 역순으로 limit 개만 읽습니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {account_id  : seller 의 account_id,
+                window_days  : 집계 기간(일),
+                order_by     : 'units' 또는 'revenue',
+                limit        : 상품 수}
+        Returns:
+            [{product_id, product_name, units, revenue}]
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        order_column = TOP_PRODUCT_ORDERS[body['order_by']]
+
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = f'''
+            SELECT
+                w.product_id,
+                p.name AS product_name,
+                w.units,
+                w.revenue
+            FROM seller_product_window_sales AS w
+            JOIN products AS p ON p.id = w.product_id
+            WHERE w.seller_id=%(account_id)s
+                AND w.window_days=%(window_days)s
+            ORDER BY w.{order_column} DESC
+            LIMIT %(limit)s
+            '''
+            cursor.execute(query, body)
+
+            return cursor.fetchall()
+
+    def get_available_product_counts(self, db_connection, body):
+        """
+        선택한 상품들 중 판매중(진열, 판매, 미삭제)인 상품 수를 셀러별로 반환합니다.
+        상태 변경 전후의 차이를 정확히 구하기 위해 트랜잭션이 끝날 때까지 상품들을 잠급니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {product_ids : 상품 번호들}
+        Returns:
+            {seller_id : 판매중인 상품 수}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            SELECT
+                seller_id,
+                SUM(is_displayed AND is_on_sale AND NOT is_deleted) AS products_on_sale
+            FROM products
+            WHERE id IN %(product_ids)s
+            GROUP BY seller_id
+            FOR UPDATE
+            '''
+            cursor.execute(query, body)
+
+            return {row['seller_id']: int(row['products_on_sale']) for row in cursor.fetchall()}
+
+    def add_products_on_sale(self, db_connection, body):
+        """
+        셀러의 판매중인 상품 수를 변경량만큼 더합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {account_id : seller 의 account_id,
+                delta       : 판매중인 상품 수 변경량}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            UPDATE seller_product_counts
+            SET products_on_sale = products_on_sale + %(delta)s
+            WHERE seller_id=%(account_id)s
+            '''
+            cursor.execute(query, body)
+
+    def get_seller_product_counts(self, db_connection, body):
+        """
+        셀러의 전체 상품 수와 판매중인 상품 수를 반환합니다.
+        Args:
+            db_connection : db_connection
+            account_id    : seller 의 account_id
+        Returns:
+            {total_products, products_on_sale}
+            None : 집계된 상품이 없는 경우
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            SELECT
+                total_products,
+                products_on_sale
+            FROM seller_product_counts
+            WHERE seller_id=%(account_id)s
+            '''
+            cursor.execute(query, body)
+
+            return cursor.fetchone()
+
+    def rebuild_seller_product_counts(self, db_connection):
+        """
+        셀러별 상품 수를 products 로부터 다시 계산합니다. (야간 대사용)
+        Args:
+            db_connection : db_connection
+        Returns:
+            다시 계산된 행 수
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            INSERT INTO seller_product_counts(
+                seller_id,
+                total_products,
+                products_on_sale
+            )
+            SELECT
+                seller_id,
+                COUNT(*),
+                SUM(is_displayed AND is_on_sale AND NOT is_deleted)
+            FROM products
+            GROUP BY seller_id
+            ON DUPLICATE KEY UPDATE
+                total_products   = VALUES(total_products),
+                products_on_sale = VALUES(products_on_sale)
+            '''
+            cursor.execute(query)
+
+            return cursor.rowcount
+
+    def add_orders_to_status_counts(self, db_connection, body):
+        """
+        새로 생성된 상세주문들을 셀러별 주문 상태별 건수에 더합니다. 주문 생성과 같은 트랜잭션에서 호출합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids : 더할 detail_order 들의 id}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            INSERT INTO seller_order_status_counts(
+                seller_id,
+                status_id,
+                order_count
+            )
+            SELECT
+                seller_id,
+                status_id,
+                COUNT(*)
+            FROM detail_orders
+            WHERE id IN %(order_ids)s
+            GROUP BY seller_id, status_id
+            ON DUPLICATE KEY UPDATE
+                order_count = order_count + VALUES(order_count)
+            '''
+            cursor.execute(query, body)
+
+    def move_order_status_counts(self, db_connection, body):
+        """
+        상세주문들의 상태 변경을 셀러별 주문 상태별 건수에 반영합니다.
+        상세주문의 status_id 를 바꾸는 것과 같은 트랜잭션에서 호출합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids        : 상태가 바뀐 detail_order 들의 id,
+                before_status_id  : 변경 전 상태 id,
+                status_id         : 변경 후 상태 id}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            # 변경 후 상태의 행이 아직 없을 수 있으므로 두 상태 모두 INSERT ... ON DUPLICATE KEY UPDATE 로 반영
+            query = '''
+            INSERT INTO seller_order_status_counts(
+                seller_id,
+                status_id,
+                order_count
+            )
+            SELECT
+                d.seller_id,
+                s.status_id,
+                s.sign * d.moved
+            FROM (
+                SELECT
+                    seller_id,
+                    COUNT(*) AS moved
+                FROM detail_orders
+                WHERE id IN %(order_ids)s
+                GROUP BY seller_id
+            ) AS d
+            JOIN (
+                SELECT %(before_status_id)s AS status_id, -1 AS sign
+                UNION ALL
+                SELECT %(status_id)s, 1
+            ) AS s
+            ON DUPLICATE KEY UPDATE
+                order_count = order_count + VALUES(order_count)
+            '''
+            cursor.execute(query, body)
+
+    def get_order_status_counts(self, db_connection, body):
+        """
+        주문 상태별 상세주문 수를 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {account_id : seller 의 account_id (None 이면 전체 셀러 합계)}
+        Returns:
+            [{status_id, order_count}]
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = '''
+            SELECT
+                status_id,
+                SUM(order_count) AS order_count
+            FROM seller_order_status_counts
+            '''
+            if body['account_id']:
+                query += '''
+            WHERE seller_id=%(account_id)s
+            '''
+            query += '''
+            GROUP BY status_id
+            '''
+            cursor.execute(query, body)
+
+            return cursor.fetchall()
+
+    def get_seller_chunk(self, db_connection, body):
+        """
+        셀러 번호 순서로 last_id 다음 limit 명 중 마지막 셀러 번호를 반환합니다. (야간 대사의 청크 경계)
+        일관된 읽기이므로 다시 계산하는 트랜잭션과 따로 커밋합니다. (rebuild_order_status_counts 참고)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {last_id : 직전 청크의 마지막 셀러 번호 (처음은 0),
+                limit    : 청크 크기}
+        Returns:
+            이번 청크의 마지막 셀러 번호, 남은 셀러가 없으면 None
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute('''
+            SELECT
+                MAX(account_id) AS last_id
+            FROM (
+                SELECT account_id
+                FROM sellers
+                WHERE account_id > %(last_id)s
+                ORDER BY account_id
+                LIMIT %(limit)s
+            ) AS chunk
+            ''', body)
+
+            return cursor.fetchone()['last_id']
+
+    def rebuild_order_status_counts(self, db_connection, body):
+        """
+        셀러 번호 범위의 셀러별 주문 상태별 건수를 detail_orders 로부터 다시 계산합니다. (야간 대사용)
+        detail_orders 는 잠그지 않는 일관된 읽기로 세므로 주문 생성, 상태 변경을 막지 않습니다.
+        범위의 건수 행(과 그 사이 간격)을 트랜잭션의 첫 문장에서 잠근 뒤 detail_orders 를 처음 읽으므로,
+        REPEATABLE READ 의 스냅샷이 잠금 이후에 만들어집니다.
+        - 먼저 건수를 바꾼 주문 트랜잭션은 잠금을 기다리는 동안 커밋되어 스냅샷에 보입니다.
+        - 스냅샷 이후의 주문 트랜잭션은 건수 행(새 상태면 간격) 잠금에서 기다렸다가 다시 계산한 값에 더합니다.
+        그래서 트랜잭션 안에서 이보다 먼저 일관된 읽기를 하면 안 됩니다. (청크 경계는 get_seller_chunk 로 따로 구함)
+        다시 계산한 (셀러, 상태)는 덮어쓰고, 더 이상 주문이 없는 (셀러, 상태)만 지웁니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {last_id      : 직전 청크의 마지막 셀러 번호 (처음은 0),
+                chunk_last_id : 이번 청크의 마지막 셀러 번호 (None 이면 끝까지)}
+        Returns:
+            다시 계산된 (셀러, 상태) 수
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+            2026-10-19: 전체를 지우고 다시 넣던 것을 셀러 청크별 덮어쓰기로 변경
+            2026-10-19: 청크 경계를 따로 구해 건수 행 잠금 전에 스냅샷이 만들어지지 않게 함
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            # 마지막 청크는 셀러가 아닌 번호로 남은 건수 행까지 정리하도록 위쪽 경계를 두지 않음
+            condition = 'seller_id > %(last_id)s'
+            if body['chunk_last_id'] is not None:
+                condition += ' AND seller_id <= %(chunk_last_id)s'
+
+            cursor.execute(f'''
+            SELECT
+                seller_id,
+                status_id
+            FROM seller_order_status_counts
+            WHERE {condition}
+            FOR UPDATE
+            ''', body)
+
+            cursor.execute(f'''
+            SELECT
+                seller_id,
+                status_id,
+                COUNT(*) AS order_count
+            FROM detail_orders
+            WHERE {condition}
+            GROUP BY seller_id, status_id
+            ''', body)
+            counts = cursor.fetchall()
+
+            if counts:
+                cursor.executemany('''
+                INSERT INTO seller_order_status_counts(
+                    seller_id,
+                    status_id,
+                    order_count
+                ) VALUES (
+                    %(seller_id)s,
+                    %(status_id)s,
+                    %(order_count)s
+                )
+                ON DUPLICATE KEY UPDATE
+                    order_count = VALUES(order_count)
+                ''', counts)
+
+                cursor.execute(f'''
+                DELETE FROM seller_order_status_counts
+                WHERE {condition}
+                    AND (seller_id, status_id) NOT IN %(pairs)s
+                ''', dict(body, pairs=[(row['seller_id'], row['status_id']) for row in counts]))
+            else:
+                cursor.execute(f'''
+                DELETE FROM seller_order_status_counts
+                WHERE {condition}
+                ''', body)
+
+            return len(counts)
@@ -0,0 +1,99 @@
+import pymysql
+
+
+class SyncDao:
+    """변경분 동기화 모델
+    상품/주문 목록의 변경 기록(sync_changes)을 읽고 오래된 기록을 정리합니다. 기록은 트리거가 남깁니다.
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def get_changes(self, db_connection, body):
+        """
+        토큰 이후의 변경 기록을 id 순서로 limit 개까지 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {entity   : product / order,
+                seller_id : 셀러 범위 (None 이면 전체),
+                token     : 이 id 이후의 기록을 봄,
+                limit     : 최대 개수,
+                settle    : 이 시간(초)보다 오래된 기록만 확정된 것으로 봄}
+        Returns:
+            [{id, entity_id, is_settled}]
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            SELECT
+                id,
+                entity_id,
+                changed_at <= NOW(3) - INTERVAL %(settle)s SECOND AS is_settled
+            FROM
+                sync_changes
+            WHERE
+                entity = %(entity)s
+            """
+            # 셀러 범위 - (entity, seller_id, id) 인덱스, 전체 - (entity, id) 인덱스
+            if body['seller_id']:
+                query += " AND seller_id = %(seller_id)s"
+
+            query += """
+                AND id > %(token)s
+            ORDER BY id
+            LIMIT %(limit)s
+            """
+            cursor.execute(query, body)
+
+            return cursor.fetchall()
+
+    def get_change_bounds(self, db_connection):
+        """
+        남아 있는 변경 기록의 처음과 마지막 id 를 반환합니다. 기록이 없으면 둘 다 None 입니다.
+        Returns:
+            {min_id, max_id}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute("""
+            SELECT
+                MIN(id) AS min_id,
+                MAX(id) AS max_id
+            FROM sync_changes
+            """)
+
+            return cursor.fetchone()
+
+    def prune_changes(self, db_connection, body):
+        """
+        days 일보다 오래된 변경 기록을 limit 개까지 지웁니다. 토큰이 오래되었는지 알 수 있도록 마지막 기록은 남깁니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {days  : 보관 일 수,
+                limit  : 한 번에 지울 최대 개수}
+        Returns:
+            지운 행 수
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute("SELECT MAX(id) AS max_id FROM sync_changes")
+            max_id = cursor.fetchone()['max_id']
+
+            if max_id is None:
+                return 0
+
+            query = """
+            DELETE FROM sync_changes
+            WHERE changed_at < NOW(3) - INTERVAL %(days)s DAY
+                AND id < %(max_id)s
+            ORDER BY id
+            LIMIT %(limit)s
+            """
+            return cursor.execute(query, dict(body, max_id=max_id))
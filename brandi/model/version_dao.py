@@ -0,0 +1,85 @@
+import pymysql
+
+
+class VersionDao:
+    """데이터 버전 모델
+    셀러별 상품/주문/셀러 정보의 버전(data_versions)을 읽습니다. 버전은 트리거가 올립니다.
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def get_versions(self, db_connection, body):
+        """
+        범위별 버전과 마지막 변경일시를 반환합니다. 전체 셀러 범위는 셀러별 버전의 합입니다.
+        (버전은 늘어나기만 하므로 어느 셀러의 버전이 올라도 합이 달라짐)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {scopes   : 범위들 (products, orders, sellers),
+                seller_id : 셀러 범위 (None 이면 전체)}
+        Returns:
+            [{scope, version, updated_at}] : 바뀐 적 없는 범위는 없음
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            SELECT
+                scope,
+                CAST(SUM(version) AS SIGNED) AS version,
+                MAX(updated_at) AS updated_at
+            FROM
+                data_versions
+            WHERE
+                scope IN %(scopes)s
+            """
+            if body['seller_id']:
+                query += " AND seller_id = %(seller_id)s"
+
+            query += " GROUP BY scope"
+
+            cursor.execute(query, body)
+            return cursor.fetchall()
+
+    def get_product_versions(self, db_connection, body):
+        """
+        상품을 등록한 셀러의 상품 버전을 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {product_id : 상품 번호}
+        Returns:
+            [{scope, version, updated_at}] : 없는 상품이면 빈 리스트
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            query = """
+            SELECT
+                v.scope,
+                v.version,
+                v.updated_at
+            FROM
+                products AS p
+            JOIN
+                data_versions AS v ON v.scope = 'products' AND v.seller_id = p.seller_id
+            WHERE
+                p.id = %(product_id)s
+            """
+            cursor.execute(query, body)
+            return cursor.fetchall()
+
+    def get_clock(self, db_connection):
+        """
+        DB 의 현재 시각과 UTC 현재 시각을 반환합니다. (DATETIME 컬럼을 UTC 로 바꾸기 위함)
+        Returns:
+            {now, utc_now}
+        Author : 홍성은
+        History:
+            2026-10-19: 초기생성
+        """
+        with db_connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute("SELECT NOW(3) AS now, UTC_TIMESTAMP(3) AS utc_now")
+            return cursor.fetchone()
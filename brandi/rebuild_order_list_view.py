@@ -0,0 +1,145 @@
+import time
+import argparse
+
+from sharding               import get_shard_indexes, get_job_connection
+from transaction            import run_in_transaction
+from id_generator           import TIMESTAMP_SHIFT
+from model.order_dao        import OrderDao
+
+""" 주문관리 목록 다시 만들기
+order_list_view 를 detail_orders, orders, products, receivers, detail_order_statuses 로부터 처음부터 다시 만듭니다.
+- order_list_view_new 에 detail_orders 를 id 순서로 청크 단위로 복사합니다. 청크마다 커밋하므로 서비스는 계속 동작합니다.
+- 복사하는 동안 생성되거나 상태가 바뀐 주문은 detail_order_status_log 와 detail_orders 의 id 로 찾아 다시 반영합니다.
+- RENAME TABLE 로 한 번에 바꾸고, 바꾸기 직전에 기존 테이블에 반영된 변경분을 새 테이블에 한 번 더 반영한 뒤 기존 테이블을 지웁니다.
+- 복사하는 동안 바뀐 상품명은 반영되지 않을 수 있으므로 상품 수정이 적은 시간에 실행합니다.
+- 샤딩중이면 샤드마다 차례로 다시 만듭니다. (--shard 로 한 샤드만 실행)
+
+    python rebuild_order_list_view.py --chunk-size 5000 --sleep 0.05
+    python rebuild_order_list_view.py --chunk-size 5000 --sleep 0.05 --shard 0
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 샤드별 실행 (--shard)
+"""
+
+order_dao = OrderDao()
+
+NEW_TABLE = 'order_list_view_new'
+OLD_TABLE = 'order_list_view_old'
+
+# 커밋이 늦은 주문을 놓치지 않도록 생성된 주문은 이 시간(ms)만큼 앞에서부터 다시 봄
+ORDER_LOOKBACK_MS = 60 * 1000
+
+
+def catch_up(db_connection, since, table):
+    """
+    since 이후에 생성되거나 상태가 바뀐 주문을 table 에 다시 반영하고, 다음에 사용할 기준을 반환합니다.
+    """
+    marks = {
+        'log_id'   : order_dao.get_last_status_log_id(db_connection),
+        'order_id' : since['order_id']
+    }
+    order_ids = order_dao.get_changed_order_ids(db_connection, {
+        'log_id'   : since['log_id'],
+        'order_id' : max(0, since['order_id'] - (ORDER_LOOKBACK_MS << TIMESTAMP_SHIFT))
+    })
+
+    if order_ids:
+        order_dao.add_orders_to_list_view(db_connection, {'order_ids': order_ids}, table)
+        marks['order_id'] = max(marks['order_id'], max(order_ids))
+
+    return marks, len(order_ids)
+
+
+def rebuild_order_list_view(chunk_size, sleep, shard=None):
+    """
+    샤드마다 주문관리 목록을 다시 만듭니다.
+    Args:
+        chunk_size : 한 트랜잭션에서 복사할 상세주문 수
+        sleep      : 청크 사이에 쉬는 시간(초)
+        shard      : 실행할 샤드 번호 (None 이면 모든 샤드)
+    Returns:
+        {'copied' : 복사한 청크 수, 'caught_up' : 다시 반영한 주문 수}
+    """
+    total = {'copied': 0, 'caught_up': 0}
+
+    for index in get_shard_indexes(shard):
+        result = rebuild_shard(chunk_size, sleep, index)
+        total['copied'] += result['copied']
+        total['caught_up'] += result['caught_up']
+        print(f"shard={index} copied={result['copied']} caught_up={result['caught_up']}")
+
+    return total
+
+
+def rebuild_shard(chunk_size, sleep, shard=None):
+    """
+    한 샤드의 주문관리 목록을 다시 만듭니다.
+    Args:
+        chunk_size : 한 트랜잭션에서 복사할 상세주문 수
+        sleep      : 청크 사이에 쉬는 시간(초)
+        shard      : 샤드 번호 (None 이면 기본 커넥션)
+    Returns:
+        {'copied' : 복사한 청크 수, 'caught_up' : 다시 반영한 주문 수}
+    """
+    db_connection = get_job_connection(shard)
+    total = {'copied': 0, 'caught_up': 0}
+
+    try:
+        with db_connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {NEW_TABLE}')
+            cursor.execute(f'CREATE TABLE {NEW_TABLE} LIKE order_list_view')
+
+        since = {'log_id': order_dao.get_last_status_log_id(db_connection), 'order_id': 0}
+        db_connection.commit()
+
+        # 전체 복사
+        last_id = 0
+        while True:
+            chunk_last_id = run_in_transaction(
+                'rebuild_order_list_view',
+                db_connection,
+                lambda: order_dao.copy_orders_to_list_view(
+                    db_connection, {'last_id': last_id, 'limit': chunk_size}, NEW_TABLE)
+            )
+            if chunk_last_id is None:
+                break
+
+            last_id = chunk_last_id
+            total['copied'] += 1
+            time.sleep(sleep)
+
+        # 복사하는 동안 상태가 바뀌었거나 복사가 끝난 뒤 생성된 주문 반영
+        since['order_id'] = last_id
+        since, caught_up = run_in_transaction(
+            'rebuild_order_list_view', db_connection, lambda: catch_up(db_connection, since, NEW_TABLE))
+        total['caught_up'] += caught_up
+
+        # 교체
+        with db_connection.cursor() as cursor:
+            cursor.execute(f'RENAME TABLE order_list_view TO {OLD_TABLE}, {NEW_TABLE} TO order_list_view')
+
+        # 교체 직전까지 기존 테이블에 반영된 변경분을 한 번 더 반영
+        since, caught_up = run_in_transaction(
+            'rebuild_order_list_view', db_connection, lambda: catch_up(db_connection, since, 'order_list_view'))
+        total['caught_up'] += caught_up
+
+        with db_connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE {OLD_TABLE}')
+
+        return total
+
+    finally:
+        db_connection.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='주문관리 목록 다시 만들기')
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    parser.add_argument('--sleep', type=float, default=0.05)
+    parser.add_argument('--shard', type=int, default=None, help='샤드 번호 (없으면 모든 샤드)')
+    args = parser.parse_args()
+
+    print(rebuild_order_list_view(args.chunk_size, args.sleep, args.shard))
@@ -0,0 +1,199 @@
+import os
+import socket
+import datetime
+import argparse
+
+from connection             import get_connection
+from sharding               import get_shard_indexes, get_job_connection, get_lease_name
+from transaction            import run_in_transaction
+from model.statistics_dao   import StatisticsDao
+from model.job_dao          import JobDao
+from service.statistics_service import StatisticsService
+from service.sync_service import SyncService
+from cache import invalidate_tags
+
+""" 매출 집계 야간 대사
+주문 생성/상태 변경시 갱신되는 seller_daily_sales, seller_daily_sketches, seller_order_status_counts,
+seller_product_counts 를 detail_orders, products 로부터 다시 계산하여 어긋난 값을 바로잡습니다.
+보관 기간이 지난 변경분 동기화 기록(sync_changes)도 정리합니다.
+셀러별 최근 7/30일 상품 판매 순위는 날짜가 바뀐 만큼 기간을 앞으로 옮깁니다.
+하루치씩(주문 상태별 건수는 셀러 청크씩) 트랜잭션을 나누어 잠금 시간을 짧게 유지합니다. 자정 직후에 실행합니다.
+여러 서버의 cron 에 등록되어 있어도 job_leases 의 리스를 얻은 하나만 실행합니다.
+샤딩중이면 샤드마다 차례로 실행하며, 리스도 샤드마다(reconcile_rollups:<샤드 번호>) 얻으므로
+여러 서버가 동시에 실행하면 리스를 얻은 샤드를 나누어 처리합니다.
+
+    python reconcile_rollups.py --days 2
+    python reconcile_rollups.py --days 2 --shard 0
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 리스를 얻은 경우에만 실행
+    2026-10-19 : 주문 상태별 건수 대사 추가
+    2026-10-19 : 변경분 동기화 기록 정리 추가
+    2026-10-19 : 주문 상태별 건수를 셀러 청크별로 다시 계산
+    2026-10-19 : 샤드별 실행 (--shard, 샤드별 리스)
+"""
+
+statistics_dao = StatisticsDao()
+statistics_service = StatisticsService()
+sync_service = SyncService()
+job_dao = JobDao()
+
+LEASE_NAME = 'reconcile_rollups'
+LEASE_TTL  = 60 * 60 # 초, 한 번 실행하는 데 걸리는 시간보다 길게
+
+STATUS_COUNT_CHUNK_SIZE = 500 # 주문 상태별 건수를 한 트랜잭션에서 다시 계산할 셀러 수
+
+
+def reconcile_rollups(days, shard=None):
+    """
+    샤드마다 reconcile_shard 를 실행하고 결과를 합칩니다.
+    Args:
+        days  : 다시 계산할 일 수
+        shard : 실행할 샤드 번호 (None 이면 모든 샤드)
+    Returns:
+        reconcile_shard 의 결과를 합친 딕셔너리, 다른 서버에서 실행중인 샤드는 'skipped' 에 담음
+        None : 모든 샤드가 다른 서버에서 실행중
+    """
+    total = {'daily_sales': 0, 'daily_sketches': 0, 'status_counts': 0, 'product_counts': 0, 'sync_changes': 0, 'skipped': []}
+    shards = get_shard_indexes(shard)
+
+    for index in shards:
+        result = reconcile_shard(days, index)
+
+        if result is None:
+            total['skipped'].append(index)
+            continue
+
+        for key, value in result.items():
+            total[key] += value
+
+    if len(total['skipped']) == len(shards):
+        return None
+
+    return total
+
+
+def reconcile_shard(days, shard=None):
+    """
+    오늘을 포함한 최근 days 일의 일 매출, 구매자/상품 스케치와 주문 상태별 건수, 셀러별 상품 수를 다시 계산하고,
+    상품 판매 순위 기간을 오늘까지 옮깁니다.
+    Args:
+        days  : 다시 계산할 일 수
+        shard : 샤드 번호 (None 이면 기본 커넥션)
+    Returns:
+        {'daily_sales'    : 다시 계산된 (셀러, 날짜) 수,
+         'daily_sketches' : 다시 계산된 (셀러, 날짜) 스케치 수,
+         'status_counts'  : 다시 계산된 (셀러, 상태) 수,
+         'product_counts' : 갱신된 행 수,
+         'sync_changes'   : 지운 변경 기록 수}
+        None : 다른 서버에서 실행중
+    """
+    lease = {'name': get_lease_name(LEASE_NAME, shard), 'owner': f'{socket.gethostname()}:{os.getpid()}', 'ttl': LEASE_TTL}
+
+    # 리스는 샤드와 관계없이 프라이머리의 job_leases 에 둠
+    lease_connection = get_connection()
+
+    try:
+        if not run_in_transaction('reconcile_rollups', lease_connection, lambda: job_dao.acquire_lease(lease_connection, lease)):
+            return None
+
+        db_connection = get_job_connection(shard)
+
+        try:
+            return rebuild_rollups(db_connection, days)
+        finally:
+            db_connection.close()
+
+    finally:
+        try:
+            # 리스를 얻지 못했으면 owner 가 달라 지워지지 않음
+            run_in_transaction('reconcile_rollups', lease_connection, lambda: job_dao.release_lease(lease_connection, lease))
+        finally:
+            lease_connection.close()
+
+
+def rebuild_rollups(db_connection, days):
+    """
+    리스를 얻은 뒤 db_connection 의 집계들을 다시 계산합니다. (reconcile_shard 의 Returns 참고)
+    """
+    total = {'daily_sales': 0, 'daily_sketches': 0, 'status_counts': 0, 'product_counts': 0, 'sync_changes': 0}
+    today = datetime.date.today()
+
+    for i in range(days):
+        sales_date = today - datetime.timedelta(i)
+        rows = run_in_transaction(
+            'reconcile_rollups',
+            db_connection,
+            lambda: statistics_dao.rebuild_daily_sales(db_connection, {'sales_date': sales_date})
+        )
+        total['daily_sales'] += rows
+
+        sketches = run_in_transaction(
+            'reconcile_rollups',
+            db_connection,
+            lambda: statistics_service.rebuild_daily_sketches(db_connection, sales_date)
+        )
+        total['daily_sketches'] += sketches
+        print(f"sales_date={sales_date} sellers={rows} sketches={sketches}")
+
+    # 판매 순위 기간을 오늘까지 하루씩 옮김
+    while True:
+        window_date = run_in_transaction(
+            'reconcile_rollups',
+            db_connection,
+            lambda: statistics_service.roll_top_product_windows(db_connection, today)
+        )
+        if not window_date:
+            break
+        print(f"top_product_windows={window_date}")
+
+    # 주문 상태별 건수는 셀러 청크마다 커밋
+    # 청크 경계는 따로 커밋하여, 다시 계산하는 트랜잭션의 스냅샷이 건수 행 잠금 뒤에 만들어지게 함
+    last_id = 0
+    while last_id is not None:
+        chunk_last_id = run_in_transaction(
+            'reconcile_rollups',
+            db_connection,
+            lambda: statistics_dao.get_seller_chunk(db_connection, {'last_id': last_id, 'limit': STATUS_COUNT_CHUNK_SIZE})
+        )
+        total['status_counts'] += run_in_transaction(
+            'reconcile_rollups',
+            db_connection,
+            lambda: statistics_dao.rebuild_order_status_counts(db_connection, {'last_id': last_id, 'chunk_last_id': chunk_last_id})
+        )
+        last_id = chunk_last_id
+
+    # 전체 셀러 범위 건수 캐시를 바로 맞춤 (셀러 범위는 캐시 TTL 안에 맞춰짐)
+    invalidate_tags(['order-status'])
+
+    total['product_counts'] = run_in_transaction(
+        'reconcile_rollups',
+        db_connection,
+        lambda: statistics_dao.rebuild_seller_product_counts(db_connection)
+    )
+
+    # 보관 기간이 지난 변경 기록을 청크 단위로 지움
+    while True:
+        pruned = run_in_transaction(
+            'reconcile_rollups',
+            db_connection,
+            lambda: sync_service.prune_changes(db_connection)
+        )['success']
+        total['sync_changes'] += pruned
+
+        if not pruned:
+            break
+
+    return total
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='매출 집계 야간 대사')
+    parser.add_argument('--days', type=int, default=2)
+    parser.add_argument('--shard', type=int, default=None, help='샤드 번호 (없으면 모든 샤드)')
+    args = parser.parse_args()
+
+    print(reconcile_rollups(args.days, args.shard))
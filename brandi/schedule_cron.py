@@ -1,73 +1,421 @@
+import os
+import time
+import signal
+import socket
+import logging
+import argparse
 import datetime
-import pymysql
-
-from flask  import Flask
-from app    import create_app
-
-from connection         import get_connection
-from utils              import send_slack, error_code
-from model.order_dao    import OrderDao
-    
-app = Flask(__name__)
-order_dao = OrderDao()
-
-@app.route("/")   
-def confirm_order(m): 
-    """   
-    10분 이상 된 detail_order 의 status 를 "구매확정" 으로 변경합니다. 
-    Args: 
-        db_connection : db_connection 
-        m             : n분 (우선 10분)   
-    Author : 김수정   
-    History:  
-        2020-11-02: 초기생성  
-    """   
-    # DB Connection   
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from connection             import get_connection
+from sharding               import SHARDS, get_job_connection, get_lease_name
+from transaction            import run_in_transaction
+from timer_wheel            import TimerWheel
+from id_generator           import TIMESTAMP_SHIFT
+from model.order_dao        import OrderDao
+from model.job_dao          import JobDao
+from service.order_service  import OrderService, DELIVERED_STATUS_ID, DB_UTC_OFFSET
+
+""" 자동 구매확정 워커
+배송완료 주문을 구매확정으로 변경하는 상주 프로세스입니다. 두 가지 방식이 있습니다.
+
+wheel (기본)
+- 주문이 배송완료가 될 때 order_confirm_schedules 에 예정일시가 저장됩니다.
+- 워커는 새 예약만 id 순서로 읽어 메모리의 계층형 타이머 휠에 넣고, tick 마다 만기가 된 주문만 구매확정합니다.
+  detail_orders 를 다시 훑지 않으며, 구매확정은 예정일시로부터 tick 이내에 이루어집니다.
+- 시작할 때 예약 테이블 전체를 읽어 휠을 복구합니다.
+- 예정일시(DATETIME)는 DB 시간대(KST, DB_UTC_OFFSET)로 저장되므로 서버 시간대와 관계없이 그 시간대로 읽어 휠에 넣습니다.
+- 커밋이 늦은 예약을 놓치지 않도록 SCHEDULE_LOOKBACK_MS 만큼 겹쳐서 다시 읽습니다.
+- 여러 서버에서 실행하면 job_leases 의 리스를 가진 하나만 휠을 돌리고, 나머지는 대기합니다.
+  리더는 LEASE_RENEW 초마다 리스를 연장(하트비트)하며, 리더가 죽으면 LEASE_TTL 초 뒤에 다른 서버가 이어받아
+  예약 테이블로부터 휠을 복구합니다. 리스를 잃은 직후 잠시 두 서버가 겹치더라도,
+  구매확정은 주문을 잠그고 아직 배송완료인 주문만 변경하므로 같은 주문이 두 번 확정되거나 알림이 두 번 가지 않습니다.
+
+scan
+- 주문한 지 n분 이상 된 배송완료 주문을 훑어서 처리합니다. 예약이 도입되기 전에 배송완료된 주문을 정리할 때 사용합니다.
+- 대상 주문을 id 순서로 청크 단위로 잠그고(FOR UPDATE SKIP LOCKED) 청크마다 짧은 트랜잭션으로 처리합니다.
+  다른 워커가 잠근 주문은 건너뛰므로, --concurrency 개의 스레드와 여러 서버의 워커가 겹치지 않게 대상을 나누어 가집니다.
+  워커를 늘리면 처리량도 늘어납니다.
+- 구매확정된 주문은 대상에서 빠지므로 중간에 멈춰도 다시 시작하면 남은 주문부터 처리합니다.
+- 실행마다 구매확정 건수, 청크 처리 시간, 가장 오래된 대상 주문의 지연 시간을 로그로 남깁니다.
+- 슬랙 알림은 청크가 커밋된 뒤에 보냅니다.
+
+샤딩중이면 --shard 로 샤드마다 워커를 실행합니다. (예약과 주문이 샤드에 있으므로)
+wheel 모드의 리더 리스는 프라이머리의 job_leases 에 샤드별 이름(auto_confirm_wheel:<샤드 번호>)으로 두어,
+샤드마다 한 서버가 리더가 됩니다.
+
+    python schedule_cron.py --tick 1 --chunk-size 500
+    python schedule_cron.py --mode scan --minutes 10 --chunk-size 500 --interval 60 --concurrency 2
+    python schedule_cron.py --tick 1 --chunk-size 500 --shard 0
+
+Authors: 김수정 / 홍성은
+
+History:
+    2020-11-02 : 초기 생성
+    2026-10-19 : 한 번 실행되는 스크립트에서 청크 단위 상주 워커로 변경 (홍성은)
+    2026-10-19 : 예약 테이블 + 타이머 휠 방식 추가 (홍성은)
+    2026-10-19 : 여러 서버 실행 지원 (wheel: 리스로 리더 선출, scan: SKIP LOCKED) (홍성은)
+    2026-10-19 : 샤드별 실행 (--shard, 샤드별 리더 리스) (홍성은)
+    2026-10-19 : 예정일시를 서버 시간대가 아닌 DB 시간대로 읽음 (홍성은)
+"""
+
+order_dao     = OrderDao()
+job_dao       = JobDao()
+order_service = OrderService()
+
+SYSTEM_ACCOUNT_ID = 1 # 자동 구매확정 변경자(마스터)
+
+CONFIRM_AFTER_MINUTES = 10
+CHUNK_SIZE            = 500
+INTERVAL              = 60 # 초
+CONCURRENCY           = 1
+TICK                  = 1.0 # 초
+
+# DB 의 DATETIME 이 저장되는 시간대
+DB_TIMEZONE = datetime.timezone(datetime.timedelta(minutes=DB_UTC_OFFSET))
+
+# 새 예약을 읽을 때 이미 읽은 id 보다 이 시간(ms)만큼 앞에서부터 다시 읽음
+SCHEDULE_LOOKBACK_MS  = 60 * 1000
+
+# wheel 모드 리더 리스 (샤딩중이면 get_lease_name 으로 샤드 번호를 붙임)
+LEASE_NAME  = 'auto_confirm_wheel'
+LEASE_TTL   = 15 # 초
+LEASE_RENEW = 5  # 초
+LEASE_OWNER = f'{socket.gethostname()}:{os.getpid()}'
+
+
+def confirm_worker(minutes, chunk_size, stop_event, shard=None):
+    """
+    다른 워커가 잠그지 않은 구매확정 대상을 더 없을 때까지 청크 단위로 처리합니다.
+    Args:
+        minutes     : 주문 후 구매확정까지의 시간(분)
+        chunk_size  : 청크 크기
+        stop_event  : 종료 요청 이벤트
+        shard       : 샤드 번호 (None 이면 기본 커넥션)
+    Returns:
+        {'confirmed' : 구매확정한 주문 수, 'chunks' : 청크별 처리 시간(초) 리스트}
+    """
+    db_connection = get_job_connection(shard)
+    metrics = {'confirmed': 0, 'chunks': []}
+    body = {
+        'minutes'    : minutes,
+        'limit'      : chunk_size,
+        'account_id' : SYSTEM_ACCOUNT_ID
+    }
+
     try:
-        db_connection = get_connection()
-
-        # detail order statuses
-            status_id_list = {
-                1: '결제완료',
-                6: '구매확정',
-                5: '배송완료',
-                3: '배송준비',
-                4: '배송중',
-                2: '상품준비',
-            }
-
-        orders_to_confirm = order_dao.get_orders_to_confirm(
-            db_connection,    
-            {'minutes':m, # 함수의 변수로 주어진 시간(분 단위)
-            'status_id':status_id_list['배송완료']}
-            ) 
-        
-        # 주문이 있는 경우, 해당 주문들의 배송상태를 구매확정(6)으로 변경
-        if orders_to_confirm: 
-            order_ids = [order['id'] for order in orders_to_confirm]
-            order_body =  {'order_ids':order_ids, 'status_id':status_id_list['구매확정'], 'account_id':1}
-            order_dao.confirm_order_delivery(db_connection, order_body)
-
-            # 변경 내역을 저장    
-            order_dao.log_order_confirm_history(db_connection, order_body)
-            db_connection.commit()
-
-            # 슬랙 보냄   
-            for order in orders_to_confirm:   
-                buyer_name = order['receiver_name']
-                product_name = order['product_name']
-                send_slack(buyer_name, product_name, "구매확정")
-
-    # DB 연결 실패
-    except Exception as exception:
-        return error_code({"error":"C0002", 'programming_error':exception})
-
-    # DB Close
+        while not stop_event.is_set():
+            started_at = time.monotonic()
+            chunk = run_in_transaction(
+                'auto_confirm',
+                db_connection,
+                lambda: order_service.confirm_delivered_orders(db_connection, dict(body))
+            )['success']
+
+            if not chunk:
+                break
+
+            metrics['confirmed'] += chunk['confirmed']
+            metrics['chunks'].append(time.monotonic() - started_at)
+
+        return metrics
+
     finally:
+        db_connection.close()
+
+
+def get_confirm_lag(minutes, shard=None):
+    """
+    샤드의 구매확정 대상 중 가장 오래된 주문이 대상이 된 뒤 지난 시간(초)을 반환합니다. 대상이 없으면 0 입니다.
+    """
+    db_connection = get_job_connection(shard)
+
+    try:
+        oldest = order_dao.get_oldest_order_to_confirm(
+            db_connection, {'minutes': minutes, 'status_id': DELIVERED_STATUS_ID})
+
+        if not oldest:
+            return 0
+
+        eligible_at = oldest + datetime.timedelta(minutes=minutes)
+        now = datetime.datetime.now(DB_TIMEZONE).replace(tzinfo=None)
+        return max(0, (now - eligible_at).total_seconds())
+
+    finally:
+        db_connection.close()
+
+
+def confirm_orders(minutes, chunk_size, concurrency, stop_event, shard=None):
+    """
+    concurrency 개의 워커로 샤드의 구매확정 대상을 모두 처리하고 실행 지표를 로그로 남깁니다.
+    Returns:
+        {'confirmed', 'chunks', 'chunk_avg', 'chunk_max', 'lag', 'elapsed'}
+    """
+    started_at = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(confirm_worker, minutes, chunk_size, stop_event, shard)
+            for _ in range(concurrency)
+        ]
+        results = [future.result() for future in futures]
+
+    chunks = [latency for result in results for latency in result['chunks']]
+    metrics = {
+        'confirmed' : sum(result['confirmed'] for result in results),
+        'chunks'    : len(chunks),
+        'chunk_avg' : round(sum(chunks) / len(chunks), 3) if chunks else 0,
+        'chunk_max' : round(max(chunks), 3) if chunks else 0,
+        'lag'       : round(get_confirm_lag(minutes, shard), 1),
+        'elapsed'   : round(time.monotonic() - started_at, 3)
+    }
+
+    logging.info(
+        'auto_confirm shard=%(shard)s confirmed=%(confirmed)s chunks=%(chunks)s chunk_avg=%(chunk_avg)ss '
+        'chunk_max=%(chunk_max)ss lag=%(lag)ss elapsed=%(elapsed)ss', dict(metrics, shard=shard)
+    )
+    return metrics
+
+
+class ConfirmScheduler:
+    """자동 구매확정 예약을 타이머 휠로 관리합니다.
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def __init__(self, db_connection, chunk_size, tick):
+        self.db_connection = db_connection
+        self.chunk_size    = chunk_size
+        self.wheel         = TimerWheel(time.time(), tick=tick)
+        self.seen          = set()
+        self.last_id       = 0
+
+    def load_new_schedules(self):
+        """
+        새로 생긴 예약을 읽어 휠에 넣습니다. 처음 호출하면 예약 전체를 읽습니다.
+        Returns:
+            새로 넣은 예약 수
+        """
+        cursor_id = max(0, self.last_id - (SCHEDULE_LOOKBACK_MS << TIMESTAMP_SHIFT))
+
+        # 다시 읽지 않을 예약은 잊음
+        self.seen = {schedule_id for schedule_id in self.seen if schedule_id > cursor_id}
+        loaded = 0
+
+        while True:
+            schedules = order_dao.get_new_order_confirm_schedules(
+                self.db_connection, {'last_id': cursor_id, 'limit': self.chunk_size})
+
+            for schedule in schedules:
+                if schedule['id'] not in self.seen:
+                    self.seen.add(schedule['id'])
+                    due = schedule['due_at'].replace(tzinfo=DB_TIMEZONE).timestamp()
+                    self.wheel.add((schedule['detail_order_id'], due), due)
+                    loaded += 1
+
+                cursor_id = schedule['id']
+
+            if len(schedules) < self.chunk_size:
+                break
+
+        self.last_id = max(self.last_id, cursor_id)
+
+        # 다음에 읽을 때 새로 커밋된 예약이 보이도록 트랜잭션을 끝냄
+        self.db_connection.commit()
+        return loaded
+
+    def run_once(self, stop_event):
+        """
+        새 예약을 읽고, 만기가 된 주문들을 청크 단위로 구매확정합니다.
+        Returns:
+            {'loaded', 'due', 'confirmed', 'chunks' : 청크별 처리 시간(초) 리스트, 'lag' : 가장 늦게 처리된 예약의 지연(초)}
+        """
+        loaded = self.load_new_schedules()
+
+        now = time.time()
+        due_schedules = self.wheel.advance(now)
+        metrics = {
+            'loaded'    : loaded,
+            'due'       : len(due_schedules),
+            'confirmed' : 0,
+            'chunks'    : [],
+            'lag'       : max((now - due for _, due in due_schedules), default=0)
+        }
+
+        for i in range(0, len(due_schedules), self.chunk_size):
+            if stop_event.is_set():
+                # 남은 예약은 테이블에 그대로 있으므로 다시 시작할 때 복구됨
+                break
+
+            started_at = time.monotonic()
+            chunk = due_schedules[i:i + self.chunk_size]
+            order_ids = [detail_order_id for detail_order_id, _ in chunk]
+
+            try:
+                result = run_in_transaction(
+                    'auto_confirm',
+                    self.db_connection,
+                    lambda: order_service.confirm_scheduled_orders(
+                        self.db_connection, {'order_ids': order_ids, 'account_id': SYSTEM_ACCOUNT_ID})
+                )
+            except Exception:
+                # 실패한 청크는 다음 tick 에 다시 시도
+                logging.exception('auto_confirm chunk failed')
+                for schedule in chunk:
+                    self.wheel.add(schedule, now)
+                continue
+
+            metrics['confirmed'] += result['success']['confirmed']
+            metrics['chunks'].append(time.monotonic() - started_at)
+
+        return metrics
+
+
+def acquire_lease(db_connection, lease_name):
+    """
+    리더 리스를 얻거나 연장합니다. DB 오류가 나면 리스를 잃은 것으로 봅니다.
+    """
+    try:
+        return run_in_transaction(
+            'auto_confirm_lease',
+            db_connection,
+            lambda: job_dao.acquire_lease(
+                db_connection, {'name': lease_name, 'owner': LEASE_OWNER, 'ttl': LEASE_TTL})
+        )
+    except Exception:
+        logging.exception('auto_confirm lease failed')
+        return False
+
+
+def run_wheel(chunk_size, tick, interval, shard=None):
+    """
+    샤드의 리더 리스를 가진 동안 tick 초마다 만기가 된 예약을 처리하고, interval 초마다 지표를 로그로 남깁니다.
+    SIGTERM/SIGINT 를 받으면 처리 중인 청크까지만 마치고 리스를 반납한 뒤 종료합니다.
+    Args:
+        shard : 샤드 번호 (None 이면 기본 커넥션)
+    """
+    stop_event = get_stop_event()
+    lease_name = get_lease_name(LEASE_NAME, shard)
+    db_connection = get_job_connection(shard)
+
+    # 리스는 샤드와 관계없이 프라이머리의 job_leases 에 둠
+    lease_connection = get_connection() if shard is not None else db_connection
+
+    try:
+        scheduler = None
+        renewed_at = None
+        totals = {'loaded': 0, 'due': 0, 'confirmed': 0, 'chunks': [], 'lag': 0}
+        logged_at = time.monotonic()
+
+        while not stop_event.is_set():
+            # 하트비트: 리더면 연장, 아니면 만료된 리스를 가져오려고 시도
+            if scheduler is None or time.monotonic() - renewed_at >= LEASE_RENEW:
+                is_leader = acquire_lease(lease_connection, lease_name)
+                renewed_at = time.monotonic()
+
+                if is_leader and scheduler is None:
+                    logging.info('auto_confirm leader acquired (%s, %s)', lease_name, LEASE_OWNER)
+                    scheduler = ConfirmScheduler(db_connection, chunk_size, tick)
+
+                elif not is_leader and scheduler is not None:
+                    # 새 리더가 예약 테이블로부터 휠을 복구하므로 메모리의 휠은 버림
+                    logging.warning('auto_confirm leader lost (%s, %s)', lease_name, LEASE_OWNER)
+                    scheduler = None
+
+            if scheduler is None:
+                stop_event.wait(LEASE_RENEW)
+                continue
+
+            try:
+                metrics = scheduler.run_once(stop_event)
+            except Exception:
+                logging.exception('auto_confirm tick failed')
+                metrics = {}
+
+            for key in ('loaded', 'due', 'confirmed', 'chunks'):
+                totals[key] += metrics.get(key, 0 if key != 'chunks' else [])
+            totals['lag'] = max(totals['lag'], metrics.get('lag', 0))
+
+            if time.monotonic() - logged_at >= interval:
+                chunks = totals['chunks']
+                logging.info(
+                    'auto_confirm shard=%s loaded=%s due=%s confirmed=%s pending=%s chunks=%s chunk_max=%ss lag_max=%ss',
+                    shard, totals['loaded'], totals['due'], totals['confirmed'], len(scheduler.wheel),
+                    len(chunks), round(max(chunks, default=0), 3), round(totals['lag'], 1)
+                )
+                totals = {'loaded': 0, 'due': 0, 'confirmed': 0, 'chunks': [], 'lag': 0}
+                logged_at = time.monotonic()
+
+            stop_event.wait(tick)
+
+        if scheduler is not None:
+            run_in_transaction(
+                'auto_confirm_lease',
+                lease_connection,
+                lambda: job_dao.release_lease(lease_connection, {'name': lease_name, 'owner': LEASE_OWNER})
+            )
+
+    finally:
+        if lease_connection is not db_connection:
+            lease_connection.close()
+        db_connection.close()
+
+
+def get_stop_event():
+    """
+    SIGTERM/SIGINT 를 받으면 설정되는 이벤트를 반환합니다.
+    """
+    stop_event = threading.Event()
+
+    def stop(signum, frame):
+        logging.info('auto_confirm stopping (signal %s)', signum)
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    return stop_event
+
+
+def run_forever(minutes, chunk_size, interval, concurrency, shard=None):
+    """
+    interval 초마다 샤드의 confirm_orders 를 실행합니다. SIGTERM/SIGINT 를 받으면 처리 중인 청크까지만 마치고 종료합니다.
+    """
+    stop_event = get_stop_event()
+
+    while not stop_event.is_set():
+        started_at = time.monotonic()
+
         try:
-            if db_connection:
-                db_connection.close()
-        except Exception as exception:
-            return error_code({"error":"C0003", 'programming_error':exception})  
+            confirm_orders(minutes, chunk_size, concurrency, stop_event, shard)
+        except Exception:
+            logging.exception('auto_confirm run failed')
+
+        stop_event.wait(max(0, interval - (time.monotonic() - started_at)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='자동 구매확정 워커')
+    parser.add_argument('--mode', choices=('wheel', 'scan'), default='wheel')
+    parser.add_argument('--tick', type=float, default=TICK)
+    parser.add_argument('--minutes', type=int, default=CONFIRM_AFTER_MINUTES)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--interval', type=float, default=INTERVAL)
+    parser.add_argument('--concurrency', type=int, default=CONCURRENCY)
+    parser.add_argument('--once', action='store_true', help='한 번만 실행하고 종료')
+    parser.add_argument('--shard', type=int, default=None, help='샤드 번호 (샤딩중이면 필수)')
+    args = parser.parse_args()
+
+    if SHARDS and args.shard is None:
+        parser.error('--shard is required when SHARDS is configured')
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 
-confirm_order(1)
\ No newline at end of file
+    if args.mode == 'wheel':
+        run_wheel(args.chunk_size, args.tick, args.interval, args.shard)
+    elif args.once:
+        confirm_orders(args.minutes, args.chunk_size, args.concurrency, threading.Event(), args.shard)
+    else:
+        run_forever(args.minutes, args.chunk_size, args.interval, args.concurrency, args.shard)
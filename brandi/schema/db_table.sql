@@ -13,7 +13,7 @@ CREATE TABLE account_types
 -- account_types Table Create SQL
 CREATE TABLE accounts
 (
-    id               INT            NOT NULL    AUTO_INCREMENT, 
+    id               BIGINT         NOT NULL    COMMENT '계정 id(id_generator 로 생성)', 
     identification   VARCHAR(45)    NOT NULL     UNIQUE COMMENT '계정 아이디',
     password         VARCHAR(500)   NOT NULL            COMMENT '비밀번호', 
     account_type_id  INT            NOT NULL  DEFAULT 2 COMMENT '(master,seller)',  
@@ -44,7 +44,7 @@ CREATE TABLE seller_attributes
 CREATE TABLE sellers
 (
     id                             INT            NOT NULL    AUTO_INCREMENT, 
-    account_id                     INT            NOT NULL    COMMENT '셀러의 account_id',
+    account_id                     BIGINT         NOT NULL    COMMENT '셀러의 account_id',
     contact                        VARCHAR(45)    NOT NULL    COMMENT '전화번호',  
     attribute_id                   INT            NOT NULL    COMMENT '셀러속성',
     korean_name                    VARCHAR(45)    NOT NULL    UNIQUE COMMENT '한국명',   
@@ -66,7 +66,7 @@ CREATE TABLE sellers
     cs_weekend_from                TIME           NULL        COMMENT '고객센터시작시간(주말)', 
     cs_weekend_until               TIME           NULL        COMMENT '고객센터마감시간(주말)', 
     updated_at                     DATETIME       NOT NULL    DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,  
-    updater_id                     INT            NULL        COMMENT '수정한 사람', 
+    updater_id                     BIGINT         NULL        COMMENT '수정한 사람', 
     refund_info                    VARCHAR(1000)   NULL        COMMENT '교환/환불정보',
     shipment_info                  VARCHAR(1000)   NULL        COMMENT '배송정보',
     PRIMARY KEY (id)
@@ -141,7 +141,7 @@ CREATE TABLE products
 (
     id                         INT             NOT NULL    AUTO_INCREMENT, 
     name                       VARCHAR(100)    NOT NULL COMMENT '상품명', 
-    seller_id                  INT             NOT NULL COMMENT '셀러번호', 
+    seller_id                  BIGINT          NOT NULL COMMENT '셀러번호(셀러의 account_id)', 
     cate_set_id     INT        NOT NULL        COMMENT '상품의 카테고리/섭카테고리', 
     introduction               VARCHAR(150)    NULL     COMMENT '한줄소개', 
     description                LONGTEXT        NOT NULL COMMENT '상품소개', 
@@ -158,7 +158,7 @@ CREATE TABLE products
     is_on_sale                 TINYINT(1)      DEFAULT 1   NOT NULL COMMENT '판매여부', 
     created_at                 DATETIME        NOT NULL    DEFAULT CURRENT_TIMESTAMP COMMENT '등록일', 
     updated_at                 DATETIME        NULL        DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '최종 수정일', 
-    updater_id                 INT             NOT NULL    COMMENT '최종수정인',    
+    updater_id                 BIGINT          NOT NULL    COMMENT '최종수정인',    
     is_deleted                 TINYINT(1)      DEFAULT 0   NOT NULL COMMENT '삭제여부(soft_delete)', 
     PRIMARY KEY (id)
 )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '상품정보';
@@ -180,13 +180,15 @@ ALTER TABLE products MODIFY description longtext NULL;
 -- account_types Table Create SQL
 CREATE TABLE receivers
 (
-    id              INT            NOT NULL    AUTO_INCREMENT, 
+    id              BIGINT         NOT NULL    COMMENT '수령인 id(id_generator 로 생성)', 
+    receiver_hash   CHAR(64)       NULL        COMMENT '정규화한 수령인 정보의 해시(sha256), 중복 수령인 제거용', 
     name            VARCHAR(45)    NOT NULL    COMMENT '주문자명', 
     contact         VARCHAR(45)    NOT NULL    COMMENT '전화번호', 
     zip_code        VARCHAR(45)    NOT NULL    COMMENT '우편번호', 
     street_address  VARCHAR(100)   NOT NULL    COMMENT '도로명주소', 
     detail_address  VARCHAR(100)   NOT NULL    COMMENT '상세주소', 
-    PRIMARY KEY (id)
+    PRIMARY KEY (id),
+    UNIQUE KEY UK_receivers_receiver_hash (receiver_hash)
 )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '수령보정보';
 
 
@@ -240,10 +242,10 @@ CREATE TABLE colors
 -- account_types Table Create SQL
 CREATE TABLE orders
 (
-    id                 INT               NOT NULL    AUTO_INCREMENT, 
+    id                 BIGINT            NOT NULL    COMMENT '주문 id(id_generator 로 생성)', 
     paied_at           DATETIME          NOT NULL    DEFAULT CURRENT_TIMESTAMP  COMMENT '결제일자', 
     total_paied_price  DECIMAL(18, 4)    NOT NULL    COMMENT '결제금액', 
-    receiver_id        INT               NOT NULL    COMMENT '수령인/배송지 정보', 
+    receiver_id        BIGINT            NOT NULL    COMMENT '수령인/배송지 정보', 
     PRIMARY KEY (id)
 )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '결제정보';
 
@@ -312,18 +314,20 @@ CREATE TABLE actions
 -- account_types Table Create SQL
 CREATE TABLE detail_orders
 (
-    id             INT         NOT NULL    AUTO_INCREMENT, 
-    order_id       INT         NOT NULL    COMMENT '큰 주문', 
+    id             BIGINT      NOT NULL    COMMENT '상세주문 id(id_generator 로 생성)', 
+    order_id       BIGINT      NOT NULL    COMMENT '큰 주문', 
     product_id     INT         NOT NULL    COMMENT '상품명', 
-    seller_id      INT         NOT NULL    COMMENT '셀러정보', 
-    receiver_id    INT         NOT NULL    COMMENT '수령인/배송지 정보', 
+    seller_id      BIGINT      NOT NULL    COMMENT '셀러정보(셀러의 account_id)', 
+    receiver_id    BIGINT      NOT NULL    COMMENT '수령인/배송지 정보', 
     option_id      INT         NOT NULL    COMMENT '옵션정보', 
     status_id      INT         NOT NULL    COMMENT '주문상태', 
     price          INT         NOT NULL    COMMENT '가격', 
     discount_rate  INT         NOT NULL    COMMENT '할인율', 
     quantity       INT         NOT NULL    COMMENT '수량', 
     ordered_at     DATETIME    NOT NULL    DEFAULT CURRENT_TIMESTAMP COMMENT '주문시점', 
-    PRIMARY KEY (id)
+    PRIMARY KEY (id),
+    KEY IX_detail_orders_ordered_at (ordered_at),
+    KEY IX_detail_orders_status_id_ordered_at (status_id, ordered_at)
 )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '세부주문내역';
 
 ALTER TABLE detail_orders
@@ -347,8 +351,8 @@ ALTER TABLE detail_orders
         REFERENCES products (id) ON DELETE CASCADE;
 
 ALTER TABLE detail_orders
-    ADD CONSTRAINT FK_detail_orders_seller_id_sellers_id FOREIGN KEY (seller_id)
-        REFERENCES sellers (id) ON DELETE CASCADE;
+    ADD CONSTRAINT FK_detail_orders_seller_id_accounts_id FOREIGN KEY (seller_id)
+        REFERENCES accounts (id) ON DELETE CASCADE;
 
 
 -- account_types Table Create SQL
@@ -401,9 +405,9 @@ CREATE TABLE managers
     email       VARCHAR(45)    NOT NULL    COMMENT '담당자 이메일', 
     ordering    INT            NOT NULL    COMMENT '담당자 순서(1,2,3)', 
     updated_at  DATETIME       NOT NULL    DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일', 
-    updater_id  INT            NOT NULL    COMMENT '최종 수정자', 
+    updater_id  BIGINT         NOT NULL    COMMENT '최종 수정자', 
     is_deleted  TINYINT(1)     NOT NULL    DEFAULT 0 COMMENT '삭제여부', 
-    deleter_id  INT            NULL     COMMENT '삭제자', 
+    deleter_id  BIGINT         NULL     COMMENT '삭제자', 
     PRIMARY KEY (id)
 )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '담당자정보';
 
@@ -425,9 +429,9 @@ CREATE TABLE seller_status_log
 (
     id                 INT         NOT NULL    AUTO_INCREMENT, 
     changed_at         DATETIME    NOT NULL    DEFAULT CURRENT_TIMESTAMP COMMENT '셀러상태 변경 기록', 
-    seller_id          INT         NOT NULL    COMMENT '셀러', 
+    seller_id          BIGINT      NOT NULL    COMMENT '셀러(셀러의 account_id)', 
     changed_status_id  INT         NOT NULL    COMMENT '변경된 상태', 
-    updater_id         INT         NOT NULL    COMMENT '수정자',
+    updater_id         BIGINT      NOT NULL    COMMENT '수정자',
     PRIMARY KEY (id)
 )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '셀러상태기록';
 
@@ -436,12 +440,12 @@ ALTER TABLE seller_status_log
         REFERENCES seller_statuses (id) ON DELETE CASCADE;
 
 ALTER TABLE seller_status_log
-    ADD CONSTRAINT FK_seller_status_log_seller_id_sellers_id FOREIGN KEY (seller_id)
-        REFERENCES sellers (id) ON DELETE CASCADE;
+    ADD CONSTRAINT FK_seller_status_log_seller_id_accounts_id FOREIGN KEY (seller_id)
+        REFERENCES accounts (id) ON DELETE CASCADE;
 
 ALTER TABLE seller_status_log
-    ADD CONSTRAINT FK_seller_status_log_updater_id_sellers_id FOREIGN KEY (updater_id)
-        REFERENCES sellers (id) ON DELETE CASCADE;
+    ADD CONSTRAINT FK_seller_status_log_updater_id_accounts_id FOREIGN KEY (updater_id)
+        REFERENCES accounts (id) ON DELETE CASCADE;
 
 
 -- account_types Table Create SQL
@@ -470,7 +474,7 @@ CREATE TABLE product_log
     discount_rate   INT         NOT NULL    COMMENT '할인율', 
     discount_from   DATETIME    NOT NULL    COMMENT '할인시작일', 
     discount_until  DATETIME    NOT NULL    COMMENT '할인종료일', 
-    updater_id      INT         NOT NULL    COMMENT '수정자', 
+    updater_id      BIGINT      NOT NULL    COMMENT '수정자', 
     PRIMARY KEY (id)
 )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '가격기록';
 
@@ -488,9 +492,9 @@ CREATE TABLE detail_order_status_log
 (
     id               INT         NOT NULL    AUTO_INCREMENT, 
     status_id        INT         NOT NULL    COMMENT '주문상태', 
-    detail_order_id  INT         NOT NULL    COMMENT '상세주문', 
+    detail_order_id  BIGINT      NOT NULL    COMMENT '상세주문', 
     changed_at       DATETIME    NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '날짜', 
-    updater_id       INT         NOT NULL    COMMENT '수정자', 
+    updater_id       BIGINT      NOT NULL    COMMENT '수정자', 
     PRIMARY KEY (id)
 )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '세부주문 상태 ';
 
@@ -513,7 +517,7 @@ ALTER TABLE detail_order_status_log
 CREATE TABLE masters
 (
     id           INT            NOT NULL    AUTO_INCREMENT, 
-    account_id  INT            NOT NULL     COMMENT '계정', 
+    account_id  BIGINT         NOT NULL     COMMENT '계정', 
     name        VARCHAR(45)    NOT NULL     COMMENT '이름', 
     PRIMARY KEY (id)
 )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '마스터 계정';
@@ -538,4 +542,366 @@ ALTER TABLE menu_sets_account_types
 
 ALTER TABLE menu_sets_account_types
     ADD CONSTRAINT FK_menu_sets_account_types_account_type_id_account_types_id FOREIGN KEY (account_type_id)
-        REFERENCES account_types (id) ON DELETE CASCADE;
\ No newline at end of file
+        REFERENCES account_types (id) ON DELETE CASCADE;
+
+-- idempotency_keys Table Create SQL
+CREATE TABLE idempotency_keys
+(
+    id               INT            NOT NULL    AUTO_INCREMENT, 
+    idempotency_key  VARCHAR(100)   NOT NULL    COMMENT '클라이언트 멱등키(Idempotency-Key 헤더)', 
+    endpoint         VARCHAR(45)    NOT NULL    COMMENT '요청 종류(make_order, change_order_status)', 
+    fingerprint      CHAR(64)       NOT NULL    COMMENT '요청 내용 해시(sha256)', 
+    response         TEXT           NULL        COMMENT '저장된 응답(JSON)', 
+    created_at       DATETIME       NOT NULL    DEFAULT CURRENT_TIMESTAMP COMMENT '생성일', 
+    expires_at       DATETIME       NOT NULL    COMMENT '만료일', 
+    PRIMARY KEY (id),
+    UNIQUE KEY UK_idempotency_keys_idempotency_key_endpoint (idempotency_key, endpoint),
+    KEY IX_idempotency_keys_expires_at (expires_at)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '멱등키';
+
+-- seller_daily_sales Table Create SQL
+CREATE TABLE seller_daily_sales
+(
+    seller_id                 BIGINT            NOT NULL    COMMENT '셀러(셀러의 account_id)', 
+    sales_date                DATE              NOT NULL    COMMENT '주문일자', 
+    order_count               INT               NOT NULL    DEFAULT 0 COMMENT '주문(상세주문) 건수', 
+    unit_count                INT               NOT NULL    DEFAULT 0 COMMENT '판매 수량', 
+    revenue                   DECIMAL(18, 4)    NOT NULL    DEFAULT 0 COMMENT '매출액', 
+    paid_count                INT               NOT NULL    DEFAULT 0 COMMENT '결제완료 건수', 
+    preparing_count           INT               NOT NULL    DEFAULT 0 COMMENT '상품준비 건수', 
+    delivery_preparing_count  INT               NOT NULL    DEFAULT 0 COMMENT '배송준비 건수', 
+    shipping_count            INT               NOT NULL    DEFAULT 0 COMMENT '배송중 건수', 
+    delivered_count           INT               NOT NULL    DEFAULT 0 COMMENT '배송완료 건수', 
+    confirmed_count           INT               NOT NULL    DEFAULT 0 COMMENT '구매확정 건수', 
+    PRIMARY KEY (seller_id, sales_date),
+    KEY IX_seller_daily_sales_sales_date (sales_date)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '셀러별 일 매출 집계';
+
+-- seller_product_counts Table Create SQL
+CREATE TABLE seller_product_counts
+(
+    seller_id         BIGINT    NOT NULL    COMMENT '셀러(셀러의 account_id)', 
+    total_products    INT       NOT NULL    DEFAULT 0 COMMENT '전체 상품 수', 
+    products_on_sale  INT       NOT NULL    DEFAULT 0 COMMENT '판매중(진열, 판매, 미삭제) 상품 수', 
+    PRIMARY KEY (seller_id)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '셀러별 상품 수 집계';
+
+-- seller_daily_sketches Table Create SQL
+CREATE TABLE seller_daily_sketches
+(
+    seller_id        BIGINT       NOT NULL    COMMENT '셀러(셀러의 account_id)', 
+    sales_date       DATE         NOT NULL    COMMENT '주문일자', 
+    buyers_sketch    BLOB         NOT NULL    COMMENT '구매자(receiver_id) HyperLogLog 스케치(zlib)', 
+    products_sketch  BLOB         NOT NULL    COMMENT '판매 상품(product_id) HyperLogLog 스케치(zlib)', 
+    PRIMARY KEY (seller_id, sales_date),
+    KEY IX_seller_daily_sketches_sales_date (sales_date)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '셀러별 일 구매자/상품 수 근사 집계';
+
+-- seller_product_daily_sales Table Create SQL
+CREATE TABLE seller_product_daily_sales
+(
+    seller_id   BIGINT            NOT NULL    COMMENT '셀러(셀러의 account_id)', 
+    sales_date  DATE              NOT NULL    COMMENT '주문일자', 
+    product_id  INT               NOT NULL    COMMENT '상품', 
+    units       INT               NOT NULL    DEFAULT 0 COMMENT '판매 수량', 
+    revenue     DECIMAL(18, 4)    NOT NULL    DEFAULT 0 COMMENT '매출액', 
+    PRIMARY KEY (seller_id, sales_date, product_id),
+    KEY IX_seller_product_daily_sales_sales_date (sales_date)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '셀러별 상품 일 판매 집계';
+
+-- seller_product_window_sales Table Create SQL
+CREATE TABLE seller_product_window_sales
+(
+    seller_id    BIGINT            NOT NULL    COMMENT '셀러(셀러의 account_id)', 
+    window_days  INT               NOT NULL    COMMENT '집계 기간(7, 30일)', 
+    product_id   INT               NOT NULL    COMMENT '상품', 
+    units        INT               NOT NULL    DEFAULT 0 COMMENT '기간내 판매 수량', 
+    revenue      DECIMAL(18, 4)    NOT NULL    DEFAULT 0 COMMENT '기간내 매출액', 
+    PRIMARY KEY (seller_id, window_days, product_id),
+    KEY IX_seller_product_window_sales_units (seller_id, window_days, units),
+    KEY IX_seller_product_window_sales_revenue (seller_id, window_days, revenue)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '셀러별 최근 7/30일 상품 판매 순위';
+
+-- job_watermarks Table Create SQL
+CREATE TABLE job_watermarks
+(
+    job_name    VARCHAR(45)     NOT NULL    COMMENT '배치 작업 이름', 
+    watermark   VARCHAR(100)    NOT NULL    COMMENT '마지막으로 처리한 위치(날짜, id 등)', 
+    updated_at  DATETIME        NOT NULL    DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '최종 수정일', 
+    PRIMARY KEY (job_name)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '배치 작업 진행 위치';
+
+-- order_confirm_schedules Table Create SQL
+CREATE TABLE order_confirm_schedules
+(
+    id               BIGINT      NOT NULL    COMMENT '예약 id(id_generator 로 생성, 워커가 새 예약을 읽는 순서)', 
+    detail_order_id  BIGINT      NOT NULL    COMMENT '배송완료된 상세주문', 
+    due_at           DATETIME    NOT NULL    COMMENT '자동 구매확정 예정일시', 
+    PRIMARY KEY (id),
+    UNIQUE KEY UK_order_confirm_schedules_detail_order_id (detail_order_id),
+    KEY IX_order_confirm_schedules_due_at (due_at)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '자동 구매확정 예약';
+
+-- job_leases Table Create SQL
+CREATE TABLE job_leases
+(
+    name         VARCHAR(45)     NOT NULL    COMMENT '배치 작업 이름', 
+    owner        VARCHAR(100)    NOT NULL    COMMENT '리스를 가진 프로세스(호스트명:pid)', 
+    expires_at   DATETIME(3)     NOT NULL    COMMENT '리스 만료일시(하트비트로 연장)', 
+    PRIMARY KEY (name)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '배치 작업 리더 리스';
+
+-- seller_order_status_counts Table Create SQL
+CREATE TABLE seller_order_status_counts
+(
+    seller_id      BIGINT    NOT NULL    COMMENT '셀러(셀러의 account_id)', 
+    status_id      INT       NOT NULL    COMMENT '주문 상태 id', 
+    order_count    INT       NOT NULL    DEFAULT 0    COMMENT '해당 상태의 상세주문 수', 
+    PRIMARY KEY (seller_id, status_id),
+    KEY IX_seller_order_status_counts_status_id (status_id)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '셀러별 주문 상태별 상세주문 수 집계';
+
+-- order_list_view Table Create SQL
+CREATE TABLE order_list_view
+(
+    detail_order_id    BIGINT         NOT NULL    COMMENT '상세주문 id', 
+    order_id           BIGINT         NOT NULL    COMMENT '주문번호', 
+    seller_id          BIGINT         NOT NULL    COMMENT '셀러의 account_id', 
+    status_id          INT            NOT NULL    COMMENT '주문상태 id', 
+    status_name        VARCHAR(45)    NOT NULL    COMMENT '주문상태명', 
+    paied_at           DATETIME       NOT NULL    COMMENT '결제일자', 
+    ordered_at         DATETIME       NOT NULL    COMMENT '주문시점', 
+    product_id         INT            NOT NULL    COMMENT '상품 id', 
+    product_name       VARCHAR(100)   NOT NULL    COMMENT '상품명', 
+    option_id          INT            NOT NULL    COMMENT '옵션정보', 
+    quantity           INT            NOT NULL    COMMENT '수량', 
+    receiver_name      VARCHAR(45)    NOT NULL    COMMENT '주문자명', 
+    receiver_contact   VARCHAR(45)    NOT NULL    COMMENT '핸드폰번호', 
+    PRIMARY KEY (detail_order_id),
+    KEY IX_order_list_view_order_id (order_id),
+    KEY IX_order_list_view_status_id_order_id (status_id, order_id),
+    KEY IX_order_list_view_receiver_name_order_id (receiver_name, order_id),
+    KEY IX_order_list_view_receiver_contact_order_id (receiver_contact, order_id),
+    KEY IX_order_list_view_product_name_order_id (product_name, order_id),
+    KEY IX_order_list_view_product_id (product_id)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '주문관리 목록 (상세주문당 한 행, 주문 생성/상태 변경/상품명 변경시 갱신)';
+
+-- 상품명이 바뀌면 주문관리 목록에도 반영 (상품 수정 경로와 관계없이 유지되도록 트리거 사용)
+DELIMITER $$
+CREATE TRIGGER TR_products_name_order_list_view AFTER UPDATE ON products
+FOR EACH ROW
+BEGIN
+    IF NEW.name <> OLD.name THEN
+        UPDATE order_list_view SET product_name = NEW.name WHERE product_id = NEW.id;
+    END IF;
+END$$
+DELIMITER ;
+
+-- 주문관리 목록 결제일 기간 조회 (상태 탭 / 전체 탭), 최신순 정렬까지 인덱스로 처리
+ALTER TABLE order_list_view
+    ADD KEY IX_order_list_view_status_id_paied_at_order_id (status_id, paied_at, order_id),
+    ADD KEY IX_order_list_view_paied_at_order_id (paied_at, order_id);
+
+-- 셀러 범위 주문관리 목록 (셀러 로그인시 항상 seller_id 조건이 붙음)
+ALTER TABLE order_list_view
+    ADD KEY IX_order_list_view_seller_id_status_id_order_id (seller_id, status_id, order_id),
+    ADD KEY IX_order_list_view_seller_id_order_id (seller_id, order_id),
+    ADD KEY IX_order_list_view_seller_id_status_id_paied_at_order_id (seller_id, status_id, paied_at, order_id),
+    ADD KEY IX_order_list_view_seller_id_paied_at_order_id (seller_id, paied_at, order_id);
+
+-- 셀러별 상세주문 조회 (주문관리 목록 대사, 셀러 범위 집계)
+ALTER TABLE detail_orders
+    ADD KEY IX_detail_orders_seller_id_status_id_id (seller_id, status_id, id);
+
+-- jobs Table Create SQL
+CREATE TABLE jobs
+(
+    id                BIGINT           NOT NULL    COMMENT '작업 id(id_generator 로 생성)', 
+    job_type          VARCHAR(45)      NOT NULL    COMMENT '작업 종류 (job_worker.JOB_HANDLERS)', 
+    status            VARCHAR(20)      NOT NULL    DEFAULT 'queued'    COMMENT 'queued / running / succeeded / failed / cancelled', 
+    priority          INT              NOT NULL    DEFAULT 0    COMMENT '클수록 먼저 실행', 
+    payload           JSON             NOT NULL    COMMENT '작업 입력', 
+    result            JSON             NULL        COMMENT '작업 결과', 
+    error             VARCHAR(1000)    NULL        COMMENT '마지막 실패 내용', 
+    progress          INT              NOT NULL    DEFAULT 0    COMMENT '처리한 양', 
+    total             INT              NULL        COMMENT '전체 양 (모르면 NULL)', 
+    attempts          INT              NOT NULL    DEFAULT 0    COMMENT '실행 시도 횟수', 
+    max_attempts      INT              NOT NULL    DEFAULT 5    COMMENT '최대 실행 시도 횟수', 
+    cancel_requested  TINYINT          NOT NULL    DEFAULT 0    COMMENT '취소 요청 여부', 
+    run_after         DATETIME(3)      NOT NULL    DEFAULT CURRENT_TIMESTAMP(3)    COMMENT '이 시각 이후에 실행 (재시도 대기)', 
+    locked_by         VARCHAR(100)     NULL        COMMENT '실행중인 워커(호스트명:pid)', 
+    locked_until      DATETIME(3)      NULL        COMMENT '실행 리스 만료일시 (진행 보고마다 연장)', 
+    created_by        BIGINT           NOT NULL    COMMENT '요청자 account_id', 
+    created_at        DATETIME         NOT NULL    DEFAULT CURRENT_TIMESTAMP    COMMENT '생성일시', 
+    finished_at       DATETIME         NULL        COMMENT '종료일시', 
+    PRIMARY KEY (id),
+    KEY IX_jobs_status_priority_run_after (status, priority, run_after),
+    KEY IX_jobs_status_locked_until (status, locked_until),
+    KEY IX_jobs_created_by (created_by)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '백오피스 작업 큐';
+
+-- sync_changes Table Create SQL
+CREATE TABLE sync_changes
+(
+    id            BIGINT         NOT NULL    AUTO_INCREMENT    COMMENT '변경 id (동기화 토큰)', 
+    entity        VARCHAR(20)    NOT NULL    COMMENT 'product / order', 
+    entity_id     BIGINT         NOT NULL    COMMENT '상품 id / 상세주문 id', 
+    seller_id     BIGINT         NOT NULL    COMMENT '셀러번호(셀러의 account_id)', 
+    changed_at    DATETIME(3)    NOT NULL    DEFAULT CURRENT_TIMESTAMP(3)    COMMENT '변경일시', 
+    PRIMARY KEY (id),
+    KEY IX_sync_changes_entity_id (entity, id),
+    KEY IX_sync_changes_entity_seller_id_id (entity, seller_id, id),
+    KEY IX_sync_changes_changed_at (changed_at)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '상품/주문 목록 변경 기록 (변경분 동기화용, 트리거로 기록)';
+
+-- 상품의 등록/수정(판매, 진열, 가격, 삭제 등)과 옵션 재고 변경, 상세주문의 생성/상태 변경을 기록
+-- (변경 경로와 관계없이 빠짐없이 기록되도록 트리거 사용)
+DELIMITER $$
+CREATE TRIGGER TR_products_insert_sync_changes AFTER INSERT ON products
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_changes(entity, entity_id, seller_id) VALUES ('product', NEW.id, NEW.seller_id);
+END$$
+
+CREATE TRIGGER TR_products_update_sync_changes AFTER UPDATE ON products
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_changes(entity, entity_id, seller_id) VALUES ('product', NEW.id, NEW.seller_id);
+END$$
+
+CREATE TRIGGER TR_options_stock_sync_changes AFTER UPDATE ON options
+FOR EACH ROW
+BEGIN
+    IF NOT (NEW.stock_quantity <=> OLD.stock_quantity) OR NEW.is_deleted <> OLD.is_deleted THEN
+        INSERT INTO sync_changes(entity, entity_id, seller_id)
+        SELECT 'product', id, seller_id FROM products WHERE id = NEW.product_id;
+    END IF;
+END$$
+
+CREATE TRIGGER TR_detail_orders_insert_sync_changes AFTER INSERT ON detail_orders
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_changes(entity, entity_id, seller_id) VALUES ('order', NEW.id, NEW.seller_id);
+END$$
+
+CREATE TRIGGER TR_detail_orders_status_sync_changes AFTER UPDATE ON detail_orders
+FOR EACH ROW
+BEGIN
+    IF NEW.status_id <> OLD.status_id THEN
+        INSERT INTO sync_changes(entity, entity_id, seller_id) VALUES ('order', NEW.id, NEW.seller_id);
+    END IF;
+END$$
+DELIMITER ;
+
+-- data_versions Table Create SQL
+CREATE TABLE data_versions
+(
+    scope         VARCHAR(20)    NOT NULL    COMMENT 'products / orders / sellers', 
+    seller_id     BIGINT         NOT NULL    COMMENT '셀러번호(셀러의 account_id)', 
+    version       BIGINT         NOT NULL    DEFAULT 0    COMMENT '변경될 때마다 1씩 증가', 
+    updated_at    DATETIME(3)    NOT NULL    DEFAULT CURRENT_TIMESTAMP(3)    COMMENT '마지막 변경일시', 
+    PRIMARY KEY (scope, seller_id)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '셀러별 데이터 버전 (조건부 GET 의 ETag/Last-Modified 용, 트리거로 갱신)';
+
+-- 셀러의 상품(옵션, 재고 포함), 주문, 셀러 정보(담당자, 상태 기록 포함)가 바뀌면 버전을 올림
+-- 행 잠금으로 같은 셀러의 버전 증가가 커밋 순서대로 보이므로, 같은 버전이면 같은 데이터임
+DELIMITER $$
+CREATE PROCEDURE bump_data_version(IN p_scope VARCHAR(20), IN p_seller_id BIGINT)
+BEGIN
+    INSERT INTO data_versions(scope, seller_id, version, updated_at)
+    VALUES (p_scope, p_seller_id, 1, NOW(3))
+    ON DUPLICATE KEY UPDATE
+        version    = version + 1,
+        updated_at = NOW(3);
+END$$
+
+CREATE TRIGGER TR_products_insert_data_versions AFTER INSERT ON products
+FOR EACH ROW
+BEGIN
+    CALL bump_data_version('products', NEW.seller_id);
+END$$
+
+CREATE TRIGGER TR_products_update_data_versions AFTER UPDATE ON products
+FOR EACH ROW
+BEGIN
+    CALL bump_data_version('products', NEW.seller_id);
+END$$
+
+CREATE TRIGGER TR_options_insert_data_versions AFTER INSERT ON options
+FOR EACH ROW
+BEGIN
+    CALL bump_data_version('products', (SELECT seller_id FROM products WHERE id = NEW.product_id));
+END$$
+
+CREATE TRIGGER TR_options_update_data_versions AFTER UPDATE ON options
+FOR EACH ROW
+BEGIN
+    CALL bump_data_version('products', (SELECT seller_id FROM products WHERE id = NEW.product_id));
+END$$
+
+CREATE TRIGGER TR_detail_orders_insert_data_versions AFTER INSERT ON detail_orders
+FOR EACH ROW
+BEGIN
+    CALL bump_data_version('orders', NEW.seller_id);
+END$$
+
+CREATE TRIGGER TR_detail_orders_update_data_versions AFTER UPDATE ON detail_orders
+FOR EACH ROW
+BEGIN
+    CALL bump_data_version('orders', NEW.seller_id);
+END$$
+
+CREATE TRIGGER TR_sellers_insert_data_versions AFTER INSERT ON sellers
+FOR EACH ROW
+BEGIN
+    CALL bump_data_version('sellers', NEW.account_id);
+END$$
+
+CREATE TRIGGER TR_sellers_update_data_versions AFTER UPDATE ON sellers
+FOR EACH ROW
+BEGIN
+    CALL bump_data_version('sellers', NEW.account_id);
+END$$
+
+-- managers.seller_id 는 sellers.id 이므로, sellers 에서 버전 키인 account_id 를 찾아 올림
+CREATE PROCEDURE bump_manager_data_version(IN p_seller_row_id INT)
+BEGIN
+    DECLARE v_account_id BIGINT;
+
+    SELECT account_id INTO v_account_id
+    FROM sellers
+    WHERE id = p_seller_row_id;
+
+    IF v_account_id IS NOT NULL THEN
+        CALL bump_data_version('sellers', v_account_id);
+    END IF;
+END$$
+
+CREATE TRIGGER TR_managers_insert_data_versions AFTER INSERT ON managers
+FOR EACH ROW
+BEGIN
+    CALL bump_manager_data_version(NEW.seller_id);
+END$$
+
+CREATE TRIGGER TR_managers_update_data_versions AFTER UPDATE ON managers
+FOR EACH ROW
+BEGIN
+    CALL bump_manager_data_version(NEW.seller_id);
+
+    IF NEW.seller_id <> OLD.seller_id THEN
+        CALL bump_manager_data_version(OLD.seller_id);
+    END IF;
+END$$
+
+CREATE TRIGGER TR_managers_delete_data_versions AFTER DELETE ON managers
+FOR EACH ROW
+BEGIN
+    CALL bump_manager_data_version(OLD.seller_id);
+END$$
+
+CREATE TRIGGER TR_seller_status_log_insert_data_versions AFTER INSERT ON seller_status_log
+FOR EACH ROW
+BEGIN
+    CALL bump_data_version('sellers', NEW.seller_id);
+END$$
+DELIMITER ;
@@ -0,0 +1,236 @@
+import os
+import re
+import time
+import argparse
+import statistics
+
+from connection import DATABASES, connect
+
+""" 벤치마크용 데이터 만들기
+서비스 DB 와 별도의 벤치마크 DB(--database)에 주문관리 목록(order_list_view)을 rows 행만큼 만듭니다.
+- 테이블과 인덱스는 schema/db_table.sql 의 정의를 그대로 사용합니다. (외래키가 없는 테이블만 만듦)
+- 행은 번호 n 의 CRC32 로 정하므로 같은 인자로 실행하면 언제나 같은 데이터가 만들어집니다.
+- 결제일시는 until 이전 days 일 동안 고르게 나누고, 주문의 절반은 대형 셀러(big_sellers 명)에, 나머지는 sellers 명에게 나눕니다.
+- 셀러 범위 조회를 재기 위해 마지막 셀러(account_id 가 가장 큰 셀러)는 전체 기간에 small_seller_rows 건만 갖는 소형 셀러로 만듭니다.
+- --daily-sales 를 주면 만든 주문으로 셀러별 일 매출 집계(seller_daily_sales)도 만듭니다. (판매가는 상품 id 로 정함)
+- 인덱스를 유지하면서 넣으면 느리므로, 나중에 추가한 인덱스(ALTER TABLE ... ADD KEY)는 데이터를 넣은 뒤 만듭니다.
+
+    python seed_benchmark.py --database brandi_bench --rows 10000000
+    python seed_benchmark.py --database brandi_bench_50m --rows 50000000
+    python benchmark_order_list.py --database brandi_bench
+    python seed_benchmark.py --database brandi_bench --rows 10000000 --daily-sales
+    python benchmark_sales.py --database brandi_bench
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 소형 셀러 추가 (셀러 범위 조회)
+    2026-10-19 : 셀러별 일 매출 집계 추가 (--daily-sales)
+"""
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schema', 'db_table.sql')
+
+# 한 트랜잭션에 넣을 행 수 (10^CHUNK_DIGITS)
+CHUNK_DIGITS = 6
+
+STATUS_NAMES = ('결제완료', '상품준비', '배송준비', '배송중', '배송완료', '구매확정')
+
+
+def connect_benchmark(database):
+    """
+    벤치마크 DB 에 연결합니다. DB 가 없으면 만듭니다.
+    """
+    db_connection = connect(dict(DATABASES, database=None))
+
+    with db_connection.cursor() as cursor:
+        cursor.execute(f'CREATE DATABASE IF NOT EXISTS `{database}` DEFAULT CHARSET utf8mb4 COLLATE utf8mb4_general_ci')
+
+    db_connection.select_db(database)
+    return db_connection
+
+
+def get_table_ddl(table):
+    """
+    schema/db_table.sql 에서 테이블의 CREATE TABLE 문과 인덱스를 추가하는 ALTER TABLE 문들을 찾아 반환합니다.
+    Returns:
+        (CREATE TABLE 문, ALTER TABLE 문 리스트)
+    """
+    with open(SCHEMA_PATH, encoding='utf-8') as schema:
+        sql = schema.read()
+
+    create = re.search(rf'CREATE TABLE {table}\s*\(.*?\)ENGINE=[^;]*;', sql, re.S).group(0)
+    alters = [
+        alter for alter in re.findall(rf'ALTER TABLE {table}\s[^;]*;', sql)
+        if all(line.strip().startswith('ADD KEY') for line in alter.splitlines()[1:])
+    ]
+    return create, alters
+
+
+def measure(run, repeat):
+    """
+    run 을 한 번 실행하여 캐시를 채운 뒤 repeat 번 실행한 시간(ms)의 통계를 반환합니다.
+    Returns:
+        {'median' : 중앙값, 'p95' : 95 백분위수, 'max' : 최대값, 'rows' : 마지막 실행 결과의 행 수}
+    """
+    run()
+
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        result = run()
+        timings.append((time.perf_counter() - started_at) * 1000)
+
+    timings.sort()
+    return {
+        'median' : statistics.median(timings),
+        'p95'    : timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        'max'    : timings[-1],
+        'rows'   : len(result) if hasattr(result, '__len__') else None
+    }
+
+
+def create_digits(db_connection):
+    """
+    0~9 숫자 테이블을 만듭니다. 자기 자신과 교차 조인하여 번호를 만듭니다.
+    """
+    with db_connection.cursor() as cursor:
+        cursor.execute('DROP TABLE IF EXISTS bench_digits')
+        cursor.execute('CREATE TABLE bench_digits (d TINYINT NOT NULL PRIMARY KEY)')
+        cursor.execute('INSERT INTO bench_digits VALUES ' + ','.join(f'({d})' for d in range(10)))
+
+
+def seed_order_list_view(db_connection, body):
+    """
+    order_list_view 를 다시 만들고 rows 행을 넣습니다.
+    Args:
+        db_connection : 벤치마크 DB 커넥션
+        body          : 딕셔너리
+            {rows             : 행 수,
+            days              : 결제일시를 나눌 일수,
+            until             : 마지막 결제일시(YYYY-MM-DD),
+            sellers           : 셀러 수,
+            big_sellers       : 주문의 절반을 받는 대형 셀러 수,
+            small_seller_rows : 소형 셀러의 주문 수}
+    """
+    create, alters = get_table_ddl('order_list_view')
+
+    with db_connection.cursor() as cursor:
+        cursor.execute('DROP TABLE IF EXISTS order_list_view')
+        cursor.execute(create)
+
+    create_digits(db_connection)
+
+    numbers = ' + '.join(f'd{i}.d * {10 ** i}' for i in range(CHUNK_DIGITS))
+    digits  = ', '.join(f'bench_digits AS d{i}' for i in range(CHUNK_DIGITS))
+    statuses = ', '.join(f"'{name}'" for name in STATUS_NAMES)
+
+    # 구매확정이 절반, 나머지 상태가 1/10 씩
+    query = f"""
+    INSERT INTO order_list_view
+    SELECT
+        n + 1,
+        n DIV 2 + 1,
+        CASE
+            WHEN n %% (%(rows)s DIV %(small_seller_rows)s) = 0 AND n DIV (%(rows)s DIV %(small_seller_rows)s) < %(small_seller_rows)s
+                THEN 1 + %(big_sellers)s + %(sellers)s
+            WHEN CRC32(n) %% 2 = 0
+                THEN 1 + CRC32(n) DIV 2 %% %(big_sellers)s
+            ELSE 1 + %(big_sellers)s + CRC32(n) DIV 2 %% %(sellers)s
+        END,
+        status_id,
+        ELT(status_id, {statuses}),
+        paied_at,
+        paied_at,
+        product_id,
+        CONCAT('상품 ', product_id),
+        product_id * 3 + n %% 3,
+        1 + n %% 3,
+        CONCAT('구매자', CRC32(n * 7 + 3) %% 1000000),
+        CONCAT('010', LPAD(CRC32(n * 11 + 4) %% 100000000, 8, '0'))
+    FROM (
+        SELECT
+            n,
+            ELT(1 + CRC32(n * 3 + 1) %% 10, 1, 2, 3, 4, 5, 6, 6, 6, 6, 6) AS status_id,
+            TIMESTAMP(%(until)s) - INTERVAL %(days)s DAY
+                + INTERVAL n * (%(days)s * 86400) DIV %(rows)s SECOND AS paied_at,
+            1 + CRC32(n * 5 + 2) %% 100000 AS product_id
+        FROM (
+            SELECT %(start)s + {numbers} AS n
+            FROM {digits}
+        ) AS numbers
+        WHERE n < %(rows)s
+    ) AS seeds
+    """
+
+    for start in range(0, body['rows'], 10 ** CHUNK_DIGITS):
+        with db_connection.cursor() as cursor:
+            cursor.execute(query, dict(body, start=start))
+        db_connection.commit()
+        print(f"order_list_view {min(start + 10 ** CHUNK_DIGITS, body['rows'])}/{body['rows']}")
+
+    with db_connection.cursor() as cursor:
+        for alter in alters:
+            cursor.execute(alter)
+        cursor.execute('ANALYZE TABLE order_list_view')
+
+
+def seed_daily_sales(db_connection):
+    """
+    seller_daily_sales 를 다시 만들고 order_list_view 의 주문을 셀러/주문일자별로 집계하여 넣습니다.
+    """
+    create, alters = get_table_ddl('seller_daily_sales')
+    status_counts = ',\n'.join(f'            SUM(status_id = {status_id})' for status_id in range(1, len(STATUS_NAMES) + 1))
+
+    with db_connection.cursor() as cursor:
+        cursor.execute('DROP TABLE IF EXISTS seller_daily_sales')
+        cursor.execute(create)
+        cursor.execute(f"""
+        INSERT INTO seller_daily_sales
+        SELECT
+            seller_id,
+            DATE(ordered_at),
+            COUNT(*),
+            SUM(quantity),
+            SUM(quantity * (1 + product_id % 50) * 1000),
+{status_counts}
+        FROM order_list_view
+        GROUP BY seller_id, DATE(ordered_at)
+        """)
+        for alter in alters:
+            cursor.execute(alter)
+        cursor.execute('ANALYZE TABLE seller_daily_sales')
+
+    db_connection.commit()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='벤치마크용 데이터 만들기')
+    parser.add_argument('--database', default='brandi_bench', help='벤치마크 DB 이름 (서비스 DB 를 쓰지 않음)')
+    parser.add_argument('--rows', type=int, default=10000000)
+    parser.add_argument('--days', type=int, default=730)
+    parser.add_argument('--until', default='2026-10-19')
+    parser.add_argument('--sellers', type=int, default=2000)
+    parser.add_argument('--big-sellers', type=int, default=20)
+    parser.add_argument('--small-seller-rows', type=int, default=1000)
+    parser.add_argument('--daily-sales', action='store_true', help='셀러별 일 매출 집계도 만듦')
+    args = parser.parse_args()
+
+    if args.database == DATABASES.get('database'):
+        parser.error('서비스 DB 에는 실행할 수 없습니다.')
+
+    db_connection = connect_benchmark(args.database)
+    try:
+        seed_order_list_view(db_connection, {
+            'rows'              : args.rows,
+            'days'              : args.days,
+            'until'             : args.until,
+            'sellers'           : args.sellers,
+            'big_sellers'       : args.big_sellers,
+            'small_seller_rows' : args.small_seller_rows
+        })
+
+        if args.daily_sales:
+            seed_daily_sales(db_connection)
+    finally:
+        db_connection.close()
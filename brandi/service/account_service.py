@@ -6,12 +6,16 @@ from config import SECRET, ALGORITHM
 from model.account_dao import AccountDao
 from model.product_dao import ProductDao
 from model.order_dao import OrderDao
+from model.statistics_dao import StatisticsDao
+from service.statistics_service import StatisticsService
 
 product_dao = ProductDao()
 order_dao   = OrderDao()
 
 
 from utils import error_code, get_filter, nav_to_dict
+from transaction import is_retryable
+from singleflight import single_flight
 
 class AccountService():
     def signup(self, seller_info, db_connection):
@@ -66,7 +70,10 @@ class AccountService():
             result = account_dao.signup_account(seller_info, db_connection=db_connection)
             return result
                 
-        except Exception:
+        except Exception as exception:
+            # 데드락 등 재시도 가능한 에러는 run_in_transaction 에서 재시도
+            if is_retryable(exception):
+                raise
             return jsonify({'error':'C0002'})
 
     def get_seller_list(self, seller_list, db_connection):
@@ -283,8 +290,18 @@ class AccountService():
         
         # 기타 에러
         except Exception as error:
+            # 데드락 등 재시도 가능한 에러는 run_in_transaction 에서 재시도
+            if is_retryable(error):
+                raise
             return {'error':"C0001", 'programming_error':error} 
 
+    # 셀러마다 날짜별로 합치며, 주문 생성/상태 변경, 상품 상태 변경시 태그(seller:<셀러 번호>)로 무효화
+    @single_flight(
+        key=lambda self, db_connection: (request.account_id, datetime.date.today()),
+        ttl=30,
+        stale_ttl=60,
+        tags=lambda self, db_connection: [f'seller:{request.account_id}']
+    )
     def get_home_info(self, db_connection):
         """
         셀러 로그인시 매출 통계자료를 불러오는 함수입니다. 
@@ -294,82 +311,80 @@ class AccountService():
             Success     : {'success': 
                 { 'products_on_sale' : 판매중인 상품 수,
                   'total_product'    : 전체 상품 수,
-                  'statistics'       : {'datetime':날짜, 'sales':일 매출액, 'count':일 판매건수} * 30개
+                  'statistics'       : {'datetime':날짜, 'sales':일 매출액, 'count':일 판매건수,
+                                        'buyers':일 구매자 수, 'products':일 판매 상품 수} * 30개,
+                  'unique_buyers'    : 30일간 서로 다른 구매자 수 (근사치),
+                  'unique_products'  : 30일간 판매된 서로 다른 상품 수 (근사치),
+                  'unique_error'     : 근사치의 상대 표준오차 (약 0.016)
+                  'top_products'     : {7 또는 30 : {'units' : 판매 수량 상위 상품들, 'revenue' : 매출액 상위 상품들}}
                 }
             }, 200
         Authors: 김수정
         History:
         2020-11-01 : 초기 생성
+        2026-10-19 : 매 요청마다 상품/주문을 모두 가져와 집계하던 것을 집계 테이블 조회로 변경 (홍성은)
+        2026-10-19 : 구매자/상품 수 근사치 추가 (홍성은)
+        2026-10-19 : 최근 7/30일 판매 순위 상품 추가 (홍성은)
+        2026-10-19 : 같은 셀러의 동시 조회를 합침 (single_flight) (홍성은)
         """
-        account_dao = AccountDao()
-        product_dao = ProductDao()
-        order_dao   = OrderDao()
+        statistics_dao = StatisticsDao()
+        statistics_service = StatisticsService()
 
         account_id = request.account_id
 
         try:
-            # 전체 상품을 가져옴
-            product_result = product_dao.get_all_product_for_seller(db_connection, {'account_id':account_id})
+            # 셀러별 상품 수 집계 (상품 상태 변경시 갱신, 야간 대사로 보정)
+            product_counts = statistics_dao.get_seller_product_counts(db_connection, {'account_id':account_id})
+
             # 전체 상품 갯수
-            number_of_all_products = len(product_result)
+            number_of_all_products = product_counts['total_products'] if product_counts else 0
             
             # 판매중, 진열중, 미삭제된 상품의 갯수
-            number_of_available_products = 0
-            for product in product_result:      
-                if (
-                    product['is_displayed'] and
-                    product['is_on_sale'] and
-                    not product['is_deleted']
-                ):
-                    number_of_available_products += 1
+            number_of_available_products = product_counts['products_on_sale'] if product_counts else 0
             
-            # 지난 한달간의 주문을 다 가져옴
-            now = datetime.datetime.now()
-            today = datetime.datetime(now.year, now.month, now.day)
+            # 지난 한달간의 일 매출 집계를 가져옴 (주문이 없는 날은 행이 없음)
+            today = datetime.date.today()
             last_month = today - datetime.timedelta(29, 0)
 
-            order_result = order_dao.get_one_month_orders(
+            daily_sales = statistics_dao.get_seller_daily_sales(
                     db_connection, {
                         'account_id' : account_id,
-                        'last_month' : last_month,
+                        'start_date' : last_month,
+                        'end_date'   : today
                     }
             )
+            sales_by_date = {sales['sales_date']: sales for sales in daily_sales}
 
-            # 일자별로 분류해서 매출 건수와 매출액을 0으로 우선 입력해둠
-            order_dict_list = [
-            { 
-                'datetime' : str(
-                    (last_month + datetime.timedelta(i, 0)).month)\
-                    +\
-                    '/'\
-                    +str((last_month+datetime.timedelta(i, 0)).day),
-                'count' : 0,
-                'sales' : 0
-            } for i in range(30)]
+            # 지난 한달간 서로 다른 구매자/상품 수 (HyperLogLog 근사치)
+            unique_counts = statistics_service.get_unique_counts(
+                    db_connection, {
+                        'account_id' : account_id,
+                        'start_date' : last_month,
+                        'end_date'   : today
+                    }
+            )
 
+            # 일자별로 매출 건수와 매출액을 채움 (주문이 없는 날은 0)
+            order_dict_list = []
             order_preparing = 0
             order_delivered = 0
 
-            # 결제 한 건당 
-            for order in order_result:
-                order_date = order['ordered_at']    
-                order_midnight = datetime.datetime(order_date.year, order_date.month, order_date.day)
-
-                # 주문 날짜로 order_dict_list 의 index 를 구함
-                index = (now-order_midnight).days
-
-                # 매출 건수를 1 더해줌
-                order_dict_list[29-index]['count'] += 1
-                
-                # 매출액을 더해줌
-                price = order['price']*order['discount_rate']*order['quantity']
-                order_dict_list[29-index]['sales'] += price
+            for i in range(30):
+                sales_date = last_month + datetime.timedelta(i, 0)
+                sales = sales_by_date.get(sales_date)
+                uniques = unique_counts['daily'].get(sales_date)
 
-                if order['status_name'] == "상품준비":
-                    order_preparing += 1
+                order_dict_list.append({
+                    'datetime' : str(sales_date.month) + '/' + str(sales_date.day),
+                    'count'    : sales['order_count'] if sales else 0,
+                    'sales'    : float(sales['revenue']) if sales else 0,
+                    'buyers'   : uniques['buyers'] if uniques else 0,
+                    'products' : uniques['products'] if uniques else 0
+                })
 
-                if order['status_name'] == "배송완료":
-                    order_delivered += 1
+                if sales:
+                    order_preparing += sales['preparing_count']
+                    order_delivered += sales['delivered_count']
 
             return {'success':
                 {
@@ -377,7 +392,11 @@ class AccountService():
                 'products_on_sale' : number_of_available_products,
                 'statistics'       : order_dict_list,
                 'order_preparing'  : order_preparing,
-                'order_delivered'  : order_delivered 
+                'order_delivered'  : order_delivered,
+                'unique_buyers'    : unique_counts['buyers'],
+                'unique_products'  : unique_counts['products'],
+                'unique_error'     : unique_counts['standard_error'],
+                'top_products'     : statistics_service.get_top_products(db_connection, account_id)
                 }
             }   
 
@@ -0,0 +1,201 @@
+import json
+
+from model.job_dao import JobDao
+
+from id_generator import id_generator
+
+job_dao = JobDao()
+
+# 이 개수보다 많은 주문/상품의 상태를 바꾸는 요청은 작업 큐로 넘기고 job id 를 바로 반환
+BULK_JOB_THRESHOLD = 200
+
+# 우선순위 (클수록 먼저 실행)
+BULK_JOB_PRIORITY        = 10 # 백오피스 화면에서 요청한 일괄 변경
+MAINTENANCE_JOB_PRIORITY = 0  # 백필, 대사
+
+DEFAULT_MAX_ATTEMPTS = 5
+
+# 마스터가 POST /job 으로 직접 등록할 수 있는 작업
+MAINTENANCE_JOB_TYPES = ('backfill_receivers', 'reconcile_rollups')
+
+class JobService():
+    def enqueue_job(self, db_connection, body):
+        """
+        작업을 큐에 넣고 job id 를 반환합니다. 요청 트랜잭션이 커밋되어야 워커가 실행합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_type    : 작업 종류 (job_worker.JOB_HANDLERS),
+                payload      : 작업 입력 (딕셔너리),
+                priority     : 우선순위,
+                total        : 전체 양 (모르면 None),
+                account_id   : 요청자 account_id}
+        Returns:
+            {'success': {'job_id': 작업 id}}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        job_id = id_generator.get_id()
+
+        job_dao.enqueue_job(db_connection, {
+            'job_id'       : job_id,
+            'job_type'     : body['job_type'],
+            'payload'      : json.dumps(body['payload']),
+            'priority'     : body['priority'],
+            'total'        : body.get('total'),
+            'max_attempts' : body.get('max_attempts', DEFAULT_MAX_ATTEMPTS),
+            'account_id'   : body['account_id']
+        })
+
+        return {'success': {'job_id': job_id}}
+
+    def enqueue_maintenance_job(self, db_connection, body):
+        """
+        마스터가 요청한 백필/대사 작업을 큐에 넣습니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_type  : MAINTENANCE_JOB_TYPES 중 하나,
+                payload    : 작업 입력 (딕셔너리),
+                account_id : 요청자 account_id}
+        Returns:
+            {'success': {'job_id': 작업 id}}
+            {'error': 'J5013'} : 등록할 수 없는 작업 종류
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        if body['job_type'] not in MAINTENANCE_JOB_TYPES or not isinstance(body['payload'], dict):
+            return {'error': 'J5013'}
+
+        body['priority'] = MAINTENANCE_JOB_PRIORITY
+        return self.enqueue_job(db_connection, body)
+
+    def get_job(self, db_connection, body):
+        """
+        작업의 상태, 진행 상황, 결과를 반환합니다. 셀러는 자신이 요청한 작업만 볼 수 있습니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_id    : 작업 id,
+                account_id : 로그인한 유저의 id,
+                is_master  : 마스터 여부}
+        Returns:
+            {'success': {id, job_type, status, priority, result, error, progress, total, attempts, ...}}
+            {'error': 'J5011'} : 없거나 볼 수 없는 작업
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        job = job_dao.get_job(db_connection, body)
+
+        if not job or (not body['is_master'] and job['created_by'] != body['account_id']):
+            return {'error': 'J5011'}
+
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        job['cancel_requested'] = bool(job['cancel_requested'])
+
+        return {'success': job}
+
+    def cancel_job(self, db_connection, body):
+        """
+        작업을 취소합니다. 실행중인 작업은 지금 처리중인 청크까지 마치고 멈춥니다.
+        이미 커밋된 청크는 되돌리지 않습니다.
+        Args:
+            db_connection : db_connection
+            body          : get_job 과 같음
+        Returns:
+            {'success': {'job_id': 작업 id, 'status': 취소 후 상태}}
+            {'error': 'J5011'} : 없거나 볼 수 없는 작업
+            {'error': 'J5012'} : 이미 끝난 작업
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        job = self.get_job(db_connection, body)
+        if 'error' in job:
+            return job
+
+        if not job_dao.cancel_job(db_connection, body):
+            return {'error': 'J5012'}
+
+        status = 'running' if job['success']['status'] == 'running' else 'cancelled'
+        return {'success': {'job_id': body['job_id'], 'status': status}}
+
+    def claim_job(self, db_connection, body):
+        """
+        리스가 만료된 작업을 대기 상태로 돌리고, 실행할 작업을 하나 가져갑니다. (job_worker 용)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {worker : 워커(호스트명:pid),
+                lease   : 실행 리스 시간(초)}
+        Returns:
+            {'success': {id, job_type, payload(딕셔너리), attempts, max_attempts, created_by}}
+            {'success': None} : 실행할 작업이 없음
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        job_dao.requeue_expired_jobs(db_connection)
+
+        job = job_dao.claim_job(db_connection, body)
+        if job:
+            job['payload'] = json.loads(job['payload'])
+
+        return {'success': job}
+
+    def report_job_progress(self, db_connection, body):
+        """
+        진행 상황을 저장하고 실행 리스를 연장합니다. (job_worker 용)
+        Args:
+            db_connection : db_connection
+            body          : JobDao.report_job_progress 와 같음
+        Returns:
+            {'success': {'cancel_requested': 취소 요청 여부}}
+            {'success': None} : 다른 워커가 작업을 가져감
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        row = job_dao.report_job_progress(db_connection, body)
+
+        return {'success': {'cancel_requested': bool(row['cancel_requested'])} if row else None}
+
+    def finish_job(self, db_connection, body):
+        """
+        작업을 끝난 상태로 바꿉니다. (job_worker 용)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {job_id : 작업 id,
+                worker  : 워커(호스트명:pid),
+                status  : succeeded / failed / cancelled,
+                result  : 작업 결과 (딕셔너리, 없으면 None),
+                error   : 실패 내용 (없으면 None)}
+        Returns:
+            {'success': 바뀐 행 수}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        body['result'] = json.dumps(body['result'], default=str) if body['result'] is not None else None
+
+        return {'success': job_dao.finish_job(db_connection, body)}
+
+    def retry_job(self, db_connection, body):
+        """
+        실패한 작업을 delay 초 뒤에 다시 실행하도록 합니다. (job_worker 용)
+        Args:
+            db_connection : db_connection
+            body          : JobDao.retry_job 과 같음
+        Returns:
+            {'success': None}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        job_dao.retry_job(db_connection, body)
+
+        return {'success': None}
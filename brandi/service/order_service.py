@@ -1,51 +1,191 @@
+import json
+import datetime
+
 from flask import request, jsonify
 
-from model.product_dao import ProductDao
-from model.account_dao import AccountDao
-from model.order_dao   import OrderDao
+from model.product_dao      import ProductDao
+from model.account_dao      import AccountDao
+from model.order_dao        import OrderDao
+from model.idempotency_dao  import IdempotencyDao
+from model.statistics_dao   import StatisticsDao
+
+from service.product_service import ProductService
+from service.statistics_service import StatisticsService
+from service.job_service import JobService, BULK_JOB_PRIORITY
+
+from utils import error_code, send_slack, get_fingerprint, get_receiver_hash
+from id_generator import id_generator
+from transaction import on_commit
+from event_bus import event_bus
+from cache import order_status_counts_cache, invalidate_tags
+from sharding import fan_out, fan_out_page
+
+product_dao     = ProductDao()
+account_dao     = AccountDao()
+order_dao       = OrderDao()
+idempotency_dao = IdempotencyDao()
+statistics_dao  = StatisticsDao()
+product_service = ProductService()
+statistics_service = StatisticsService()
+job_service = JobService()
+
+# 멱등키 보관 시간(초)
+IDEMPOTENCY_KEY_TTL = 24 * 60 * 60
+
+# 주문 상태 id
+PREPARE_STATUS_ID   = 2 # 상품준비
+DELIVERED_STATUS_ID = 5 # 배송완료
+CONFIRMED_STATUS_ID = 6 # 구매확정
+
+# 배송완료 후 자동 구매확정까지의 시간(분)
+AUTO_CONFIRM_MINUTES = 10
+
+# DB 의 DATETIME 컬럼(NOW(), CURRENT_TIMESTAMP)이 저장되는 시간대 (KST, 분)
+DB_UTC_OFFSET = 9 * 60
+
+# 주문관리 화면의 탭 이름과 주문 상태 id (allOrderList 는 전체)
+ORDER_STATUS_TABS = {
+    'allOrderList': None,
+    'prepareList': 2,
+    'deliveryPrepareList': 3,
+    'deliveryList': 4,
+    'deliveryCompleteList': 5,
+    'orderConfirmList': 6,
+}
 
-from utils import error_code, send_slack
+def get_paied_at_range(order_info):
+    """
+    요청자 시간대의 조회 시작일/종료일(YYYY-MM-DD)을 DB 시간대의 결제일시 범위로 바꿉니다.
+    종료일은 그 다음날 0시 미만으로 바꾸므로 paied_at 컬럼을 그대로 비교하여 인덱스를 사용할 수 있습니다.
+    Args:
+        order_info : 딕셔너리
+            {start_date : 시작일 (선택),
+            end_date    : 종료일 (선택),
+            utc_offset  : 요청자 시간대의 UTC 와의 차이(분, 예: KST 540)}
+    Returns:
+        (paied_from, paied_until) : 각각 datetime 또는 None (조건 없음)
+    Raises:
+        ValueError : 날짜 형식이 틀리거나 시작일이 종료일보다 늦은 경우
+    """
+    shift = datetime.timedelta(minutes=order_info['utc_offset'] - DB_UTC_OFFSET)
+    paied_from = paied_until = None
+
+    if order_info['start_date']:
+        start_date = datetime.date.fromisoformat(order_info['start_date'])
+        paied_from = datetime.datetime.combine(start_date, datetime.time()) - shift
+
+    if order_info['end_date']:
+        end_date = datetime.date.fromisoformat(order_info['end_date'])
+        paied_until = datetime.datetime.combine(end_date + datetime.timedelta(1), datetime.time()) - shift
+
+    if paied_from and paied_until and paied_from >= paied_until:
+        raise ValueError('start_date is after end_date')
+
+    return paied_from, paied_until
 
-product_dao = ProductDao()
-account_dao = AccountDao()
-order_dao   = OrderDao()
 
 class OrderService():
-    def make_order_service(self, db_connection, product_id, body):
+    def check_idempotency_key(self, db_connection, idempotency_body):
+        """
+        멱등키를 선점하거나, 이미 처리된 요청이면 저장된 응답을 반환합니다.
+        선점은 요청을 처리하는 트랜잭션 안에서 이루어지므로, 요청이 실패하여 롤백되면 키도 함께 사라집니다.
+        같은 키로 동시에 들어온 요청은 먼저 들어온 트랜잭션이 끝날 때까지 대기한 뒤 저장된 응답을 받습니다.
+        Args:
+            db_connection    : db_connection
+            idempotency_body : 딕셔너리
+                {idempotency_key : 멱등키,
+                endpoint         : 요청 종류,
+                fingerprint      : 요청 내용의 해시값}
+        Returns:
+            None                : 새 요청 - 처리를 계속 진행
+            저장된 응답          : 같은 요청이 이미 처리된 경우
+            {'error':'O3021'}   : 같은 키가 다른 내용의 요청에 사용된 경우
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        idempotency_body['ttl'] = IDEMPOTENCY_KEY_TTL
+
+        # 새로 선점한 경우
+        if idempotency_dao.reserve_key(db_connection, idempotency_body):
+            return None
+
+        stored = idempotency_dao.get_key(db_connection, idempotency_body)
+
+        # 키는 같으나 요청 내용이 다른 경우
+        if stored['fingerprint'] != idempotency_body['fingerprint']:
+            return {'error':'O3021'}
+
+        return json.loads(stored['response'])
+
+    def save_idempotency_result(self, db_connection, idempotency_body, result):
+        """
+        처리 완료된 요청의 응답을 멱등키에 저장합니다.
+        Args:
+            db_connection    : db_connection
+            idempotency_body : check_idempotency_key 에 전달했던 딕셔너리
+            result           : 저장할 응답
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        idempotency_body['response'] = json.dumps(result, ensure_ascii=False)
+        idempotency_dao.save_response(db_connection, idempotency_body)
+
+    def make_order_service(self, db_connection, product_id, body, idempotency_key=None):
         """
         주문을 생성하기 위해 상품정보, 옵션정보, 수령인 정보를 확인하고 저장합니다.
         Args:
-            db_connection : db_connection
-            product_id    : 선택한 상품 번호
-            body          : 색상, 사이즈, 수량, 수령인 정보, 수령지 정보
+            db_connection   : db_connection
+            product_id      : 선택한 상품 번호
+            body            : 색상, 사이즈, 수량, 수령인 정보, 수령지 정보
+            idempotency_key : Idempotency-Key 헤더 값 (없으면 None)
         Returns:
             {'success' : None } : 해당되는 상품 없음 ###
         Authors: 김수정
         History:
         2020-10-31 : 초기 생성
+        2026-10-19 : 멱등키 처리 추가 (홍성은)
+        2026-10-19 : 상품/옵션 확인에 주문 페이지 스냅샷 캐시 사용, 재고 차감을 주문 생성 전으로 이동 (홍성은)
+        2026-10-19 : 셀러별 일 매출 집계 갱신 (홍성은)
+        2026-10-19 : 셀러별 일 구매자/상품 스케치 갱신 (홍성은)
+        2026-10-19 : 셀러별 상품 판매 순위 갱신 (홍성은)
+        2026-10-19 : 커밋 후 주문 생성 이벤트 발행 (홍성은)
+        2026-10-19 : 커밋 후 주문 상태별 건수 캐시 무효화 (홍성은)
         """
         try:
-            # 있는 상품인지 확인
-            is_product_available = product_dao.check_availability(db_connection, {'product_ids':product_id})
+            # 재시도된 요청이면 상품, 옵션, 주문을 건드리지 않고 저장된 응답을 반환
+            if idempotency_key:
+                idempotency_body = {
+                    'idempotency_key' : idempotency_key,
+                    'endpoint'        : 'make_order',
+                    'fingerprint'     : get_fingerprint(product_id, body)
+                }
+                stored_result = self.check_idempotency_key(db_connection, idempotency_body)
+                if stored_result:
+                    return stored_result
+
+            # 있는 상품인지 확인 (주문 페이지 스냅샷 캐시 사용)
+            product_snapshot = product_service.get_product_snapshot(db_connection, product_id)
 
             # 존재하지 않는 상품인 경우
-            if not is_product_available:
+            if not product_snapshot:
                 return {'error':'P2011'}
             # 존재하는 상품의 경우
             else:
                 # 삭제된 상품
-                if is_product_available['is_deleted'] == 1:
+                if product_snapshot['is_deleted'] == 1:
                     return {'error':'P2012'}
                 # 미판매 상품
-                elif is_product_available['is_on_sale'] == 0:
+                elif product_snapshot['is_on_sale'] == 0:
                     return {'error':'P2013'}
                 else:
                     # 옵션 & 수량 정보 확인하기 
                     # - 사이즈와 컬러를 넣어서 옵션이 있나 확인)
                     # - 구매 수량이 상품의 최대/최소 구매 수량에 맞는지)
                     body['product_id'] = product_id
-                    option_info = product_dao.check_option(
-                        db_connection, 
+                    option_info = product_service.find_option(
+                        product_snapshot, 
                         body
                         )
 
@@ -53,37 +193,56 @@ class OrderService():
                     if not option_info:
                         return {'error':'P2014'}
 
-                    # 옵션과 최소/최대 수량정보는 알맞으나 재고가 없는 경우
+                    quantity = body['quantity']
+
+                    # 재고 수량 관리하는 경우 재고량 수정해줌 (재고는 캐시가 아닌 DB 에서 확인)
                     if option_info['is_stock_controlled']:
-                        if option_info['stock_quantity'] < body['quantity']:
+                        remaining_stock = order_dao.make_change_to_stock(
+                            db_connection,
+                            {'option_id':option_info['option_id'], 'quantity':quantity}
+                        )
+
+                        # 옵션과 최소/최대 수량정보는 알맞으나 재고가 없는 경우
+                        if remaining_stock is None:
                             return {'error':'P2015'}
 
+                        # 품절된 경우 커밋 후 스냅샷의 재고 상태를 갱신
+                        if remaining_stock <= 0:
+                            on_commit(
+                                db_connection,
+                                lambda: product_service.invalidate_product_snapshot(product_id)
+                            )
+
                     # 주문을 생성함
                     # 가격을 확인함 
-                    price = is_product_available['price']
-                    if is_product_available['discount_rate']:
-                        discount_rate = (1-is_product_available['discount_rate']*0.01)
+                    price = product_snapshot['price']
+                    if product_snapshot['discount_rate']:
+                        discount_rate = (1-product_snapshot['discount_rate']*0.01)
                     else:
                         discount_rate = 1
-                    quantity = body['quantity']
 
                     total_price = price*discount_rate*quantity
                     
-                    # 우선 주문자 정보를 저장하고 id를 받음
-                    # print(body)
+                    # 수령인, 주문, 상세주문의 id 를 미리 생성하여 INSERT 마다 lastrowid 를 기다리지 않음
+                    receiver_id, order_id, detail_order_id = id_generator.get_ids(3)
+
+                    # 우선 주문자 정보를 저장하고 id를 받음 (같은 수령인이 있으면 기존 id)
+                    body['receiver_id'] = receiver_id
+                    body['receiver_hash'] = get_receiver_hash(body)
                     receiver_id = order_dao.save_receiver_info(
                         db_connection, 
                         body
                     )
 
                     # order 만들기
-                    order_id = order_dao.make_order_info(db_connection, {'receiver_id':receiver_id, 'total_price':total_price})
+                    order_dao.make_order_info(db_connection, {'order_id':order_id, 'receiver_id':receiver_id, 'total_price':total_price})
 
                     # detail order 에 전달할 딕셔너리 생성
                     detail_body = {}
+                    detail_body['detail_order_id'] = detail_order_id
                     detail_body['order_id'] = order_id
                     detail_body['product_id'] = product_id
-                    detail_body['seller_id'] = is_product_available['seller_id']
+                    detail_body['seller_id'] = product_snapshot['seller_id']
                     detail_body['receiver_id'] = receiver_id
                     detail_body['price'] = price
                     detail_body['discount_rate'] = discount_rate
@@ -94,33 +253,77 @@ class OrderService():
                     detail_body['option_id'] = option_id
                     order_make = order_dao.make_detail_order_info(db_connection, detail_body)
 
-                    # 재고 수량 관리하는 경우 재고량 수정해줌
-                    if option_info['is_stock_controlled']:
-                        stock_control_result = order_dao.make_change_to_stock(db_connection, detail_body)
+                    # 주문관리 목록에 추가
+                    order_dao.add_orders_to_list_view(db_connection, {'order_ids':[detail_order_id]})
+
+                    # 셀러별 일 매출 집계, 주문 상태별 건수, 상품 판매 순위, 구매자/상품 스케치에 더함
+                    statistics_dao.add_orders_to_daily_sales(db_connection, {'order_ids':[detail_order_id]})
+                    statistics_dao.add_orders_to_status_counts(db_connection, {'order_ids':[detail_order_id]})
+                    statistics_dao.add_orders_to_top_products(db_connection, {'order_ids':[detail_order_id]})
+                    statistics_service.add_order_to_sketches(db_connection, detail_order_id)
+
+                    # 커밋 후 주문 상태별 건수 캐시 무효화
+                    seller_id = product_snapshot['seller_id']
+                    on_commit(
+                        db_connection,
+                        lambda seller_id=seller_id: invalidate_tags([f'seller:{seller_id}', 'order-status'])
+                    )
+
+                    # 커밋 후 셀러의 주문관리 화면에 알림
+                    on_commit(
+                        db_connection,
+                        lambda event=dict(detail_body): event_bus.publish(
+                            'order_created',
+                            event['seller_id'],
+                            {
+                                'detail_order_id' : event['detail_order_id'],
+                                'order_id'        : event['order_id'],
+                                'status_id'       : PREPARE_STATUS_ID
+                            }
+                        )
+                    )
             
-            send_slack(body['buyer_name'], option_info['product_name'], '상품준비')
-            return {'success': '구매가 완료 되었습니다.'}
+            result = {'success': '구매가 완료 되었습니다.'}
+            if idempotency_key:
+                self.save_idempotency_result(db_connection, idempotency_body, result)
+
+            send_slack(body['buyer_name'], product_snapshot['product_name'], '상품준비')
+            return result
 
         except (KeyError, TypeError) as error:
             return {'error':"C0001", 'programming_error':error} 
 
-    def make_order_progress(self, db_connection, account_id, body):
+    def make_order_progress(self, db_connection, account_id, body, idempotency_key=None):
         """
         선택한 주문의 배송상태를 확인하고 요청받은 대로 변경합니다. 
         Args:
-            db_connection : db_connection
-            account_id    : 로그인한 유저의 id
-            body          : 
+            db_connection   : db_connection
+            account_id      : 로그인한 유저의 id
+            body            : 
                 {id         : detail_order 의 id 들 (list), 
                 status_id   : 현재 status 의 id}
+            idempotency_key : Idempotency-Key 헤더 값 (없으면 None)
         Returns:
             {'success':"변경 완료"}
             {'error':'O3011'} - 주문이 존재하지 않거나, 주문상태와 요청이 맞지 않는 경우 (ex. 배송중인데 구매확정으로 변경하는 경우 등)
         Authors: 김수정
         History:
         2020-11-04 : 초기 생성
+        2026-10-19 : 멱등키 처리 추가 (홍성은)
+        2026-10-19 : 상태 변경을 change_detail_order_status 로 분리 (홍성은)
         """
         try:
+            # 재시도된 요청이면 주문을 건드리지 않고 저장된 응답을 반환
+            if idempotency_key:
+                idempotency_body = {
+                    'idempotency_key' : idempotency_key,
+                    'endpoint'        : 'change_order_status',
+                    'fingerprint'     : get_fingerprint(account_id, body)
+                }
+                stored_result = self.check_idempotency_key(db_connection, idempotency_body)
+                if stored_result:
+                    return stored_result
+
             # 주문들의 현재 상태를 확인합니다. 
             orders_status = order_dao.check_order_status(db_connection, body)
             
@@ -134,15 +337,13 @@ class OrderService():
                 after_status_info = order_dao.check_order_flow(db_connection, body)
 
                 # 변경하기 위해 body 에 담아줌
-                body['status_id']  = after_status_info['id']
-                body['order_ids']  = body['id']
-                body['account_id'] = account_id
-
-                # 상태 변경
-                changed_orders = order_dao.confirm_order_delivery(db_connection, body)
-                # 상태 변경한 시간을 담아와서 기록 남길떄 시간을 넣어주는 게 좋을지???
-                # 기록 남김
-                history = order_dao.log_order_confirm_history(db_connection, body)
+                body['before_status_id'] = body['status_id']
+                body['status_id']        = after_status_info['id']
+                body['order_ids']        = body['id']
+                body['account_id']       = account_id
+
+                # 상태 변경, 기록, 집계 반영
+                self.change_detail_order_status(db_connection, body)
                 
                 #슬랙 보내기 위해 받는이와 상품정보 가져옴
                 order_info = order_dao.get_order_info(db_connection, body)
@@ -155,11 +356,308 @@ class OrderService():
             
                     send_slack(buyer_name, product_name, status_name) 
                 
-                return {'success':"변경 완료"}
+                result = {'success':"변경 완료"}
+                if idempotency_key:
+                    self.save_idempotency_result(db_connection, idempotency_body, result)
+
+                return result
 
         except (KeyError, TypeError) as error:
             return {'error':"C0001", 'programming_error':error} 
     
+    def enqueue_order_progress(self, db_connection, account_id, body, idempotency_key=None):
+        """
+        대량의 배송상태 변경 요청을 작업 큐에 넣고 job id 를 바로 반환합니다.
+        job_worker 가 make_order_progress 를 청크 단위로 실행합니다.
+        Args:
+            make_order_progress 와 같음
+        Returns:
+            {'success': {'job_id': 작업 id}}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        # 재시도된 요청이면 작업을 다시 만들지 않고 처음 만든 작업의 id 를 반환
+        if idempotency_key:
+            idempotency_body = {
+                'idempotency_key' : idempotency_key,
+                'endpoint'        : 'change_order_status',
+                'fingerprint'     : get_fingerprint(account_id, body)
+            }
+            stored_result = self.check_idempotency_key(db_connection, idempotency_body)
+            if stored_result:
+                return stored_result
+
+        result = job_service.enqueue_job(db_connection, {
+            'job_type'   : 'change_order_status',
+            'payload'    : {'id': body['id'], 'status_id': body['status_id'], 'account_id': account_id},
+            'priority'   : BULK_JOB_PRIORITY,
+            'total'      : len(body['id']),
+            'account_id' : account_id
+        })
+
+        if idempotency_key:
+            self.save_idempotency_result(db_connection, idempotency_body, result)
+
+        return result
+
+    def change_detail_order_status(self, db_connection, body):
+        """
+        상세주문들의 상태를 변경하고, 변경 내역과 주문관리 목록, 셀러별 일 매출의 상태별 건수, 주문 상태별 건수에 반영합니다.
+        배송완료로 바뀌는 주문은 AUTO_CONFIRM_MINUTES 분 뒤 자동 구매확정을 예약합니다.
+        커밋 후 셀러별로 상태 변경 이벤트를 발행하고 주문 상태별 건수 캐시를 무효화합니다.
+        주문 상태를 바꾸는 모든 곳에서 이 함수를 사용해야 집계와 예약이 맞게 유지됩니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids        : 변경할 detail_order 들의 id (모두 before_status_id 상태여야 함),
+                before_status_id  : 변경 전 상태 id,
+                status_id         : 변경 후 상태 id,
+                account_id        : 변경자의 account_id}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        2026-10-19 : 자동 구매확정 예약 추가
+        2026-10-19 : 주문 상태별 건수 반영 추가
+        2026-10-19 : 주문관리 목록 반영 추가
+        2026-10-19 : 상태 변경 이벤트 발행 추가
+        2026-10-19 : 주문 상태별 건수 캐시 무효화 추가
+        """
+        # 상태 변경
+        order_dao.confirm_order_delivery(db_connection, body)
+
+        # 기록 남김
+        order_dao.log_order_confirm_history(db_connection, body)
+
+        # 주문관리 목록 반영
+        order_dao.move_order_list_status(db_connection, body)
+
+        # 셀러별 일 매출의 상태별 건수 반영
+        statistics_dao.move_daily_sales_status(db_connection, body)
+
+        # 주문관리 탭별 건수 반영
+        statistics_dao.move_order_status_counts(db_connection, body)
+
+        # 배송완료가 되면 자동 구매확정을 예약하고, 배송완료에서 벗어나면 예약을 지움
+        if body['status_id'] == DELIVERED_STATUS_ID:
+            order_dao.schedule_order_confirm(db_connection, {
+                'schedules' : [
+                    {'schedule_id': schedule_id, 'detail_order_id': order_id}
+                    for schedule_id, order_id in zip(id_generator.get_ids(len(body['order_ids'])), body['order_ids'])
+                ],
+                'minutes'   : AUTO_CONFIRM_MINUTES
+            })
+
+        elif body['before_status_id'] == DELIVERED_STATUS_ID:
+            order_dao.delete_order_confirm_schedules(db_connection, body)
+
+        # 커밋 후 셀러별로 주문관리 화면에 알림
+        seller_order_ids = {}
+        for order in order_dao.get_order_sellers(db_connection, body):
+            seller_order_ids.setdefault(order['seller_id'], []).append(order['id'])
+
+        on_commit(
+            db_connection,
+            lambda: invalidate_tags([f'seller:{seller_id}' for seller_id in seller_order_ids] + ['order-status'])
+        )
+
+        for seller_id, order_ids in seller_order_ids.items():
+            event = {
+                'detail_order_ids' : order_ids,
+                'before_status_id' : body['before_status_id'],
+                'status_id'        : body['status_id']
+            }
+            on_commit(
+                db_connection,
+                lambda seller_id=seller_id, event=event: event_bus.publish('order_status_changed', seller_id, event)
+            )
+
+    def get_order_status_counts(self, db_connection, body):
+        """
+        주문관리 화면의 탭별 상세주문 수를 반환합니다. 주문 생성/상태 변경시 갱신되는 집계를 읽습니다.
+        워커 간 공유 캐시에 저장하며, 주문 생성/상태 변경이 커밋되면 태그(seller:<셀러 번호>, order-status)로 무효화됩니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {account_id : seller 의 account_id (None 이면 전체 셀러)}
+        Returns:
+            {'success': {allOrderList : 전체 상세주문 수, prepareList : 상품준비 수, ... orderConfirmList : 구매확정 수}}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        2026-10-19 : 워커 간 공유 캐시 사용
+        2026-10-19 : 전체 셀러는 모든 샤드의 집계를 더함
+        """
+        def load():
+            if body['account_id']:
+                pages = [statistics_dao.get_order_status_counts(db_connection, body)]
+            else:
+                pages = fan_out(
+                    lambda shard_connection: statistics_dao.get_order_status_counts(shard_connection, body),
+                    db_connection
+                )
+
+            counts = {}
+            for rows in pages:
+                for row in rows:
+                    counts[row['status_id']] = counts.get(row['status_id'], 0) + int(row['order_count'])
+
+            return {
+                tab: sum(counts.values()) if status_id is None else counts.get(status_id, 0)
+                for tab, status_id in ORDER_STATUS_TABS.items()
+            }
+
+        account_id = body['account_id']
+        tab_counts = order_status_counts_cache.get_or_load(
+            ('order_status_counts', account_id or 'all'),
+            load,
+            tags=[f'seller:{account_id}'] if account_id else ['order-status']
+        )
+
+        return {'success': dict(tab_counts)}
+
+    def confirm_delivered_orders(self, db_connection, body):
+        """
+        주문한 지 n분 이상 된 배송완료 주문을 한 청크 구매확정으로 변경합니다.
+        다른 워커가 처리중인 주문은 건너뛰므로 여러 워커가 동시에 호출해도 겹치지 않습니다.
+        슬랙 알림은 트랜잭션이 커밋된 뒤에 보냅니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {minutes    : n분,
+                limit       : 청크 크기,
+                account_id  : 변경자(시스템)의 account_id}
+        Returns:
+            {'success': {'last_id' : 이번 청크의 마지막 id, 'confirmed' : 구매확정한 주문 수}}
+            {'success': None} : 더 처리할 주문이 없음
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성 (schedule_cron.confirm_order 에서 분리)
+        2026-10-19 : 워커별 분할 대신 SKIP LOCKED 로 주문을 나누어 가짐
+        """
+        body['status_id'] = DELIVERED_STATUS_ID
+        orders_to_confirm = order_dao.get_orders_to_confirm(db_connection, body)
+
+        if not orders_to_confirm:
+            return {'success': None}
+
+        order_ids = [order['id'] for order in orders_to_confirm]
+
+        # 상태 변경, 기록, 집계 반영
+        self.change_detail_order_status(db_connection, {
+            'order_ids'        : order_ids,
+            'before_status_id' : DELIVERED_STATUS_ID,
+            'status_id'        : CONFIRMED_STATUS_ID,
+            'account_id'       : body['account_id']
+        })
+
+        # 커밋 후 슬랙 보냄
+        for order in orders_to_confirm:
+            on_commit(
+                db_connection,
+                lambda order=order: send_slack(order['receiver_name'], order['product_name'], "구매확정")
+            )
+
+        return {'success': {'last_id': order_ids[-1], 'confirmed': len(order_ids)}}
+
+    def confirm_scheduled_orders(self, db_connection, body):
+        """
+        예약 시각이 된 주문들 중 아직 배송완료인 주문을 구매확정으로 변경하고 예약을 지웁니다.
+        이미 다른 경로로 상태가 바뀐 주문은 예약만 지웁니다. 슬랙 알림은 트랜잭션이 커밋된 뒤에 보냅니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {order_ids  : 만기가 된 detail_order 의 id 들,
+                account_id  : 변경자(시스템)의 account_id}
+        Returns:
+            {'success': {'confirmed' : 구매확정한 주문 수}}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        orders_to_confirm = order_dao.get_scheduled_orders_to_confirm(db_connection, {
+            'order_ids' : body['order_ids'],
+            'status_id' : DELIVERED_STATUS_ID
+        })
+
+        if orders_to_confirm:
+            # 상태 변경, 기록, 집계 반영 (배송완료에서 벗어나므로 예약도 지워짐)
+            self.change_detail_order_status(db_connection, {
+                'order_ids'        : [order['id'] for order in orders_to_confirm],
+                'before_status_id' : DELIVERED_STATUS_ID,
+                'status_id'        : CONFIRMED_STATUS_ID,
+                'account_id'       : body['account_id']
+            })
+
+            # 커밋 후 슬랙 보냄
+            for order in orders_to_confirm:
+                on_commit(
+                    db_connection,
+                    lambda order=order: send_slack(order['receiver_name'], order['product_name'], "구매확정")
+                )
+
+        # 이미 상태가 바뀐 주문의 예약 정리
+        order_dao.delete_order_confirm_schedules(db_connection, {'order_ids': body['order_ids']})
+
+        return {'success': {'confirmed': len(orders_to_confirm)}}
+
+    def dedupe_receivers(self, db_connection, last_id, chunk_size):
+        """
+        receiver_hash 가 없는(중복 제거 이전에 저장된) 수령인을 한 청크 처리합니다.
+        같은 해시의 수령인이 이미 있으면 주문과 상세주문을 그 수령인으로 옮기고 중복 행을 삭제하며,
+        없으면 해시를 저장하여 이후 주문에서 재사용되도록 합니다.
+        Args:
+            db_connection : db_connection
+            last_id       : 직전 청크의 마지막 수령인 id
+            chunk_size    : 한 청크에서 처리할 수령인 수
+        Returns:
+            {'success': {'last_id' : 이번 청크의 마지막 id,
+                         'hashed'  : 해시를 저장한 수령인 수,
+                         'merged'  : 삭제(병합)된 중복 수령인 수}}
+            {'success': None} : 더 처리할 수령인이 없음
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        receivers = order_dao.get_receivers_to_hash(db_connection, {'last_id':last_id, 'limit':chunk_size})
+
+        if not receivers:
+            return {'success': None}
+
+        receiver_hashes = {receiver['id'] : get_receiver_hash(receiver) for receiver in receivers}
+
+        # 이미 해시가 저장된 수령인이 있으면 그 수령인을 남김
+        survivors = {
+            row['receiver_hash'] : row['id']
+            for row in order_dao.get_receivers_by_hash(
+                db_connection, {'receiver_hashes':list(set(receiver_hashes.values()))}
+            )
+        }
+
+        # 없으면 청크 안에서 id 가 가장 작은 수령인을 남김
+        hash_list  = []
+        merge_list = []
+        for receiver in receivers:
+            receiver_hash = receiver_hashes[receiver['id']]
+
+            if receiver_hash in survivors:
+                merge_list.append((survivors[receiver_hash], receiver['id']))
+            else:
+                survivors[receiver_hash] = receiver['id']
+                hash_list.append((receiver_hash, receiver['id']))
+
+        if hash_list:
+            order_dao.set_receiver_hashes(db_connection, hash_list)
+
+        if merge_list:
+            order_dao.merge_receivers(db_connection, merge_list)
+
+        return {'success': {
+            'last_id' : receivers[-1]['id'],
+            'hashed'  : len(hash_list),
+            'merged'  : len(merge_list)
+        }}
+
     def get_complete_order(self,order_info, db_connection):
         """
         결제완료된 리스트 가져오기 
@@ -167,13 +665,63 @@ class OrderService():
             order_info: 결제 리스트
             db_connection: 연결된 db
         Returns: 
-            주문 리스트
+            {'success': 주문 리스트}
+            {'error': 'O3031'} : 조회 기간이 잘못된 경우
+            {'error': 'O3032'} : 시간대가 잘못된 경우
         Authors: 
             홍성은 
         History:
             2020-11-03: 초기 생성 
+            2026-10-19: 요청자 시간대 기준 결제일 기간 조회 추가
+            2026-10-19: 전체 셀러는 모든 샤드의 목록을 합침
         """
         if order_info is None:
-            return error_code({'error':'C0006'})
-        result = order_dao.get_complete_order_list(order_info,db_connection=db_connection)
-        return result 
\ No newline at end of file
+            return {'error':'C0006'}
+
+        error = self.check_order_list_filter(order_info)
+        if error:
+            return error
+
+        if order_info.get('seller_id'):
+            result = order_dao.get_complete_order_list(order_info,db_connection=db_connection)
+            return {'success': result}
+
+        # 전체 셀러는 모든 샤드에서 읽어 목록과 같은 순서(결제일시, 주문번호 역순)로 합침
+        if order_info.get('paied_from') or order_info.get('paied_until'):
+            sort_key = lambda order: (order['a_paied_at'] or '', order['b_oreder_id'])
+        else:
+            sort_key = lambda order: order['b_oreder_id']
+
+        result = fan_out_page(
+            lambda shard_connection, body: order_dao.get_complete_order_list(body, db_connection=shard_connection),
+            order_info,
+            sort_key,
+            reverse=True,
+            db_connection=db_connection
+        )
+        return {'success': result}
+
+    def check_order_list_filter(self, order_info):
+        """
+        주문 관리 목록 필터의 시간대와 조회 기간을 확인하고, 결제일시 범위(paied_from, paied_until)를 채웁니다.
+        목록 조회와 내보내기가 함께 사용합니다.
+        Args:
+            order_info : 주문 관리 목록 필터
+        Returns:
+            None               : 정상
+            {'error': 'O3031'} : 조회 기간이 잘못된 경우
+            {'error': 'O3032'} : 시간대가 잘못된 경우
+        Authors: 홍성은
+        History:
+        2026-10-19 : get_complete_order 에서 분리
+        """
+        # UTC-12:00 ~ UTC+14:00
+        if not -12 * 60 <= order_info['utc_offset'] <= 14 * 60:
+            return {'error':'O3032'}
+
+        try:
+            order_info['paied_from'], order_info['paied_until'] = get_paied_at_range(order_info)
+        except ValueError:
+            return {'error':'O3031'}
+
+        return None 
\ No newline at end of file
@@ -2,13 +2,40 @@ from flask import request, jsonify
 
 from model.product_dao import ProductDao
 from model.account_dao import AccountDao
+from model.statistics_dao import StatisticsDao
+from service.job_service import JobService, BULK_JOB_PRIORITY
 
 from utils import error_code
+from cache import product_snapshot_cache, invalidate_tags
+from singleflight import single_flight
+from sharding import fan_out, merge_sorted
+from transaction import on_commit
 
 product_dao = ProductDao()
 account_dao = AccountDao()
+statistics_dao = StatisticsDao()
+job_service = JobService()
+
+# 스냅샷 구조가 바뀌면 올려서 이전 형식의 캐시를 쓰지 않도록 함
+PRODUCT_SNAPSHOT_VERSION = 1
+
+
+def get_product_list_key(self, db_connection, filter_dict):
+    """
+    상품 목록 조회를 구분하는 키. 셀러는 자신의 상품만 보므로 계정별로, 마스터는 필터로만 구분합니다.
+    같은 필터가 다른 순서로 와도 같은 키가 되도록 정렬합니다.
+    """
+    scope = 'master' if request.is_master else request.account_id
+
+    return (scope, tuple(sorted((name, tuple(filter_dict.getlist(name))) for name in filter_dict)))
+
+
+def get_product_list_tags(self, db_connection, filter_dict):
+    return ['products'] if request.is_master else [f'seller:{request.account_id}']
+
 
 class ProductService():
+    @single_flight(key=get_product_list_key, ttl=10, stale_ttl=30, tags=get_product_list_tags)
     def get_product_list(self, db_connection, filter_dict):
         """
         상품 목록 보기
@@ -21,6 +48,8 @@ class ProductService():
         Authors: 김수정
         History:
         2020-10-29 : 초기 생성
+        2026-10-19 : 같은 조회를 합침 (single_flight, 상품 상태 변경시 태그로 무효화) (홍성은)
+        2026-10-19 : 마스터는 모든 샤드의 목록을 상품 번호 순으로 합침 (홍성은)
         """
         try:
             # 마스터인지 셀러인지 파악하기
@@ -35,7 +64,21 @@ class ProductService():
                 filter_dict['seller_id'] = account_id
 
             # 해당되는 모든 상품을 가져옴
-            filtering_result, total_count = product_dao.get_product_list(db_connection, filter_dict)
+            # 마스터는 모든 샤드에서 같은 페이지(상품 번호 > offset)를 읽어 상품 번호 순으로 합침
+            if is_master:
+                pages = fan_out(
+                    lambda shard_connection: product_dao.get_product_list(shard_connection, filter_dict),
+                    db_connection
+                )
+                filtering_result = merge_sorted(
+                    [rows for rows, _ in pages],
+                    key=lambda product: product['product_number'],
+                    limit=int(filter_dict.get('limit', '10'))
+                )
+                total_count = sum(count or 0 for _, count in pages)
+
+            else:
+                filtering_result, total_count = product_dao.get_product_list(db_connection, filter_dict)
             for product in filtering_result:
                 created_at_datetime = product['created_at'] 
                 year, month, day = created_at_datetime.year, str(created_at_datetime.month).zfill(2), str(created_at_datetime.day).zfill(2)
@@ -60,47 +103,148 @@ class ProductService():
         except (KeyError, TypeError) as error:
             return {'error':"C0001", 'programming_error':error}
 
+    def get_product_snapshot(self, db_connection, product_id):
+        """주문 페이지에 필요한 상품 정보를 캐시에서 가져오고, 없으면 DB 에서 불러와 캐시에 저장합니다.
+        상품 상태 변경, 옵션 품절 등 스냅샷이 바뀌는 쓰기가 커밋되면 invalidate_product_snapshot 으로
+        모든 워커에서 무효화됩니다. (태그 product:<상품 번호>)
+        반환된 스냅샷은 캐시와 공유되므로 수정하면 안 됩니다.
+        Args:
+            db_connection : db_connection
+            product_id    : 상품 번호
+        Returns:
+            {product_id, product_name, seller_id, is_on_sale, is_displayed, is_deleted,
+             price, discount_rate, min_quantity, max_quantity,
+             colors  : [{color, color_id}],
+             sizes   : [{size, size_id}],
+             options : [{option_id, color_id, size_id, is_stock_controlled, in_stock}]}
+            None : 존재하지 않는 상품
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        2026-10-19 : 워커 간 공유 캐시(TwoLevelCache)로 변경
+        """
+        return product_snapshot_cache.get_or_load(
+            ('product_snapshot', PRODUCT_SNAPSHOT_VERSION, product_id),
+            lambda: self.load_product_snapshot(db_connection, product_id),
+            tags=[f'product:{product_id}']
+        )
+
+    def load_product_snapshot(self, db_connection, product_id):
+        """주문 페이지에 필요한 상품 정보를 DB 에서 불러옵니다. (get_product_snapshot 의 캐시 미스)
+        Args:
+            db_connection : db_connection
+            product_id    : 상품 번호
+        Returns:
+            get_product_snapshot 과 같음
+        Authors: 홍성은
+        History:
+        2026-10-19 : get_product_snapshot 에서 분리
+        """
+        product = product_dao.get_product_snapshot(db_connection, {'product_id':product_id})
+        if not product:
+            return None
+
+        option_rows = product_dao.get_option_matrix(db_connection, {'product_id':product_id})
+
+        colors  = {}
+        sizes   = {}
+        options = []
+        for option in option_rows:
+            colors.setdefault(option['color_id'], {'color':option['color'], 'color_id':option['color_id']})
+            sizes.setdefault(option['size_id'], {'size':option['size'], 'size_id':option['size_id']})
+            options.append({
+                'option_id'           : option['option_id'],
+                'color_id'            : option['color_id'],
+                'size_id'             : option['size_id'],
+                'is_stock_controlled' : option['is_stock_controlled'],
+                'in_stock'            : not option['is_stock_controlled'] or (option['stock_quantity'] or 0) > 0
+            })
+
+        snapshot = dict(product)
+        snapshot['colors']  = list(colors.values())
+        snapshot['sizes']   = list(sizes.values())
+        snapshot['options'] = options
+
+        return snapshot
+
+    def invalidate_product_snapshot(self, product_id):
+        """주문 페이지 스냅샷 캐시를 모든 워커에서 무효화합니다. 쓰기가 커밋된 뒤(transaction.on_commit) 호출합니다.
+        Args:
+            product_id : 상품 번호
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        2026-10-19 : 태그 무효화로 변경
+        """
+        invalidate_tags([f'product:{product_id}'])
+
+    def find_option(self, snapshot, body):
+        """스냅샷에서 선택한 색상/사이즈의 옵션을 찾고, 구매 수량이 최소/최대 구매 수량에 맞는지 확인합니다.
+        Args:
+            snapshot : get_product_snapshot 의 결과
+            body     : {color_id, size_id, quantity}
+        Returns:
+            {option_id, color_id, size_id, is_stock_controlled, in_stock}
+            None : 옵션이 없거나 수량이 맞지 않는 경우
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        if not snapshot['min_quantity'] <= body['quantity'] <= snapshot['max_quantity']:
+            return None
+
+        for option in snapshot['options']:
+            if option['color_id'] == body['color_id'] and option['size_id'] == body['size_id']:
+                return option
+
+        return None
+
     def get_options_service(self, db_connection, product_id):
         """주문을 위해 선택한 상품의 옵션정보를 불러옵니다.
         Args:
             db_connection : db_connection
             product_id    : 선택한 상품 번호
         Returns:
-            {'success' : None } : 해당되는 상품 없음 ###
+            {'success' : {colors, sizes, options(색상 x 사이즈 재고상태), price, discount_rate, min_quantity, max_quantity}}
+            {'error' : 'P2011'} : 해당되는 상품 없음
         Authors: 김수정
         History:
         2020-10-31 : 초기 생성
+        2026-10-19 : 주문 페이지 스냅샷 캐시 사용 (홍성은)
         """
         try:
             # 있는 상품인지 확인
-
-            is_product_available = product_dao.check_availability(db_connection, {'product_ids':product_id})
+            snapshot = self.get_product_snapshot(db_connection, product_id)
 
             # 존재하지 않는 상품인 경우
-            if not is_product_available:
+            if not snapshot:
                 return {'error':'P2011'}
             
             # 존재하는 상품의 경우
             else:
                 # 삭제된 상품
-                if is_product_available['is_deleted']:
+                if snapshot['is_deleted']:
                     return {'error':'P2012'}
 
                 # 미판매 상품
-                elif is_product_available['is_on_sale'] == False:
+                elif snapshot['is_on_sale'] == False:
                     return {'error':'P2013'}
                 
                 else:
-
-                    color_list = product_dao.get_colors(db_connection, {'product_id':product_id})
-                    size_list = product_dao.get_sizes(db_connection, {'product_id':product_id})
-
                     # 옵션이 없는 경우 - 구매 불가
-                    if not color_list or not size_list:
+                    if not snapshot['colors'] or not snapshot['sizes']:
 
                         return {'error':'P2014'}
 
-            return {'success': {'colors':color_list, 'sizes':size_list}}
+            return {'success': {
+                'colors'        : snapshot['colors'],
+                'sizes'         : snapshot['sizes'],
+                'options'       : snapshot['options'],
+                'price'         : snapshot['price'],
+                'discount_rate' : snapshot['discount_rate'],
+                'min_quantity'  : snapshot['min_quantity'],
+                'max_quantity'  : snapshot['max_quantity']
+            }}
 
         except (KeyError, TypeError) as error:
             return {'error':"C0001", 'programming_error':error}
@@ -120,6 +264,10 @@ class ProductService():
         Authors: 김수정
         History:
         2020-10-31 : 초기 생성
+        2026-10-19 : 셀러별 판매중인 상품 수 집계 갱신 (홍성은)
+        2026-10-19 : body 에 updater_id 가 있으면 사용 (작업 큐에서 실행) (홍성은)
+        2026-10-19 : 스냅샷 캐시를 태그로 한 번에 무효화 (홍성은)
+        2026-10-19 : 셀러/전체 상품 목록과 홈 통계도 무효화 (홍성은)
         """
         product_ids = body['product_ids']
 
@@ -130,14 +278,59 @@ class ProductService():
         if len(products_to_change) != len(product_ids):
             return {'error':'P2011'}
 
-        updater_id  = request.account_id
+        # 작업 큐에서 실행되면 요청 컨텍스트가 없으므로 등록할 때 저장한 요청자를 사용
+        updater_id  = body['updater_id'] if 'updater_id' in body else request.account_id
         body['updater_id'] = updater_id
         body['product_ids'] = product_ids
 
+        # 셀러별 판매중인 상품 수 (변경 전)
+        before_counts = statistics_dao.get_available_product_counts(db_connection, body)
+
         # 상품이 잘 있는 경우, 상품 상태 바꿔줌
         change_result = product_dao.change_product_status(
                 db_connection, 
                 body
             )
 
-        return {'success': "변경 완료"}
\ No newline at end of file
+        # 변경 전후의 차이만큼 셀러별 판매중인 상품 수를 갱신
+        after_counts = statistics_dao.get_available_product_counts(db_connection, body)
+        for seller_id, products_on_sale in after_counts.items():
+            delta = products_on_sale - before_counts.get(seller_id, 0)
+            if delta:
+                statistics_dao.add_products_on_sale(db_connection, {'account_id':seller_id, 'delta':delta})
+
+        # 커밋 후 주문 페이지 스냅샷, 셀러/전체 상품 목록, 홈 통계를 한 번에 무효화
+        seller_ids = set(before_counts) | set(after_counts)
+        on_commit(
+            db_connection,
+            lambda: invalidate_tags(
+                [f'product:{product_id}' for product_id in product_ids]
+                + [f'seller:{seller_id}' for seller_id in seller_ids]
+                + ['products']
+            )
+        )
+
+        return {'success': "변경 완료"}
+
+    def enqueue_change_status(self, db_connection, body):
+        """대량의 판매여부, 진열여부 변경 요청을 작업 큐에 넣고 job id 를 바로 반환합니다.
+        job_worker 가 change_status 를 청크 단위로 실행합니다.
+        Args:
+            db_connection : db_connection
+            body          : change_status 와 같음
+        Returns:
+            {'success': {'job_id': 작업 id}}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        payload = {key: body[key] for key in ('product_ids', 'sales', 'displayed') if key in body}
+        payload['updater_id'] = request.account_id
+
+        return job_service.enqueue_job(db_connection, {
+            'job_type'   : 'change_product_status',
+            'payload'    : payload,
+            'priority'   : BULK_JOB_PRIORITY,
+            'total'      : len(body['product_ids']),
+            'account_id' : request.account_id
+        })
\ No newline at end of file
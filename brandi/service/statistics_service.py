@@ -0,0 +1,385 @@
+import datetime
+
+import numpy as np
+
+from model.statistics_dao import StatisticsDao, TOP_PRODUCT_WINDOWS, TOP_PRODUCT_ORDERS
+from model.job_dao import JobDao
+from hyperloglog import HyperLogLog, get_standard_error
+from sharding import fan_out
+
+statistics_dao = StatisticsDao()
+job_dao = JobDao()
+
+# 조회 가능한 집계 단위와 대상
+SALES_INTERVALS = ('day', 'week', 'month')
+SALES_SOURCES   = ('rollup', 'raw')
+
+# 한 번에 조회할 수 있는 최대 기간(일)
+MAX_SALES_RANGE_DAYS = 366 * 5
+
+# 홈 화면에 보여줄 판매 순위 상품 수
+TOP_PRODUCT_LIMIT = 5
+
+# 판매 순위 기간을 마지막으로 옮긴 날짜를 저장하는 작업 이름
+TOP_PRODUCT_JOB = 'top_product_windows'
+
+
+def get_sales_buckets(start_date, end_date, interval):
+    """
+    기간의 각 날짜가 몇 번째 구간에 속하는지 계산합니다.
+    Args:
+        start_date : 시작일(포함)
+        end_date   : 종료일(포함)
+        interval   : 'day', 'week'(월요일 시작), 'month'
+    Returns:
+        (labels      : 구간 시작일 문자열 리스트,
+         day_buckets : start_date 로부터의 일수를 구간 번호로 바꾸는 numpy 배열)
+    """
+    labels      = []
+    day_buckets = np.empty((end_date - start_date).days + 1, dtype=np.int64)
+
+    for day in range(len(day_buckets)):
+        date = start_date + datetime.timedelta(day)
+
+        if interval == 'week':
+            bucket_start = date - datetime.timedelta(date.weekday())
+        elif interval == 'month':
+            bucket_start = date.replace(day=1)
+        else:
+            bucket_start = date
+
+        label = bucket_start.isoformat()
+        if not labels or labels[-1] != label:
+            labels.append(label)
+
+        day_buckets[day] = len(labels) - 1
+
+    return labels, day_buckets
+
+
+def parse_date_range(body):
+    """
+    body 의 start_date, end_date 문자열(YYYY-MM-DD)을 date 로 바꿉니다.
+    Returns:
+        (start_date, end_date)
+        None : 날짜 형식이 틀리거나, 시작일이 종료일보다 늦거나, 기간이 너무 긴 경우
+    """
+    try:
+        start_date = datetime.date.fromisoformat(body['start_date'])
+        end_date   = datetime.date.fromisoformat(body['end_date'])
+    except (TypeError, ValueError):
+        return None
+
+    if start_date > end_date or (end_date - start_date).days >= MAX_SALES_RANGE_DAYS:
+        return None
+
+    return start_date, end_date
+
+
+class StatisticsService():
+    def get_sales_series(self, db_connection, body):
+        """
+        기간내 매출액, 판매 수량, 주문 건수를 일/주/월 단위로 집계합니다.
+        행을 서버 사이드 커서로 나누어 읽고, 딕셔너리 대신 numpy 배열(np.bincount)로 구간별 합계를 구합니다.
+        'rollup' 은 셀러별 일 매출 집계(셀러 수 x 일수 행)를 읽으므로 전체 셀러 1년 조회도 빠르게 끝나며,
+        'raw' 는 detail_orders 를 직접 읽으므로 집계가 대사되기 전의 값을 확인할 때 짧은 기간에만 사용합니다.
+        셀러를 지정하지 않으면 모든 샤드에서 동시에 구간별 합계를 구해 더합니다. (구간별 합계는 그대로 더할 수 있음)
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {start_date   : 시작일 문자열(YYYY-MM-DD),
+                end_date      : 종료일 문자열(YYYY-MM-DD),
+                interval      : 'day', 'week', 'month',
+                source        : 'rollup', 'raw',
+                seller_id     : 셀러의 account_id (선택),
+                attribute_id  : 셀러 속성 id (선택)}
+        Returns:
+            {'success': {'interval' : 집계 단위,
+                         'labels'   : 구간 시작일들,
+                         'revenue'  : 구간별 매출액,
+                         'units'    : 구간별 판매 수량,
+                         'orders'   : 구간별 주문 건수}}
+            {'error':'S4011'} : 날짜 형식이 틀리거나 기간이 잘못된 경우
+            {'error':'S4012'} : 지원하지 않는 집계 단위
+            {'error':'S4013'} : 지원하지 않는 조회 대상
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        2026-10-19 : 전체 셀러는 모든 샤드의 합계를 더함
+        """
+        if body['interval'] not in SALES_INTERVALS:
+            return {'error':'S4012'}
+
+        if body['source'] not in SALES_SOURCES:
+            return {'error':'S4013'}
+
+        date_range = parse_date_range(body)
+        if not date_range:
+            return {'error':'S4011'}
+
+        start_date, end_date = date_range
+        body['start_date'] = start_date
+        body['end_date']   = end_date
+
+        labels, day_buckets = get_sales_buckets(start_date, end_date, body['interval'])
+
+        def sum_sales(connection):
+            # 행: 구간, 열: (주문 건수, 판매 수량, 매출액)
+            totals = np.zeros((3, len(labels)))
+
+            for rows in statistics_dao.stream_sales(connection, body):
+                columns = np.array(rows, dtype=np.float64)
+                buckets = day_buckets[columns[:, 0].astype(np.int64)]
+
+                for i in range(3):
+                    totals[i] += np.bincount(buckets, weights=columns[:, i + 1], minlength=len(labels))
+
+            return totals
+
+        if body['seller_id']:
+            totals = sum_sales(db_connection)
+        else:
+            totals = sum(fan_out(sum_sales, db_connection))
+
+        return {'success': {
+            'interval' : body['interval'],
+            'labels'   : labels,
+            'revenue'  : totals[2].tolist(),
+            'units'    : totals[1].astype(np.int64).tolist(),
+            'orders'   : totals[0].astype(np.int64).tolist()
+        }}
+
+    def add_order_to_sketches(self, db_connection, detail_order_id):
+        """
+        새 상세주문의 구매자와 상품을 셀러별 일 스케치에 더합니다. 주문 생성과 같은 트랜잭션에서 호출합니다.
+        스케치가 바뀌지 않은 경우(이미 센 구매자/상품일 가능성이 높은 경우)에는 저장하지 않습니다.
+        Args:
+            db_connection   : db_connection
+            detail_order_id : 상세주문 id
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        order = statistics_dao.get_order_sketches(db_connection, {'detail_order_id':detail_order_id})
+
+        buyers   = HyperLogLog.from_bytes(order['buyers_sketch'])
+        products = HyperLogLog.from_bytes(order['products_sketch'])
+
+        buyers_changed   = buyers.add(order['receiver_id'])
+        products_changed = products.add(order['product_id'])
+
+        if buyers_changed or products_changed:
+            statistics_dao.save_daily_sketches(db_connection, {
+                'seller_id'       : order['seller_id'],
+                'sales_date'      : order['sales_date'],
+                'buyers_sketch'   : buyers.to_bytes(),
+                'products_sketch' : products.to_bytes()
+            })
+
+    def get_unique_counts(self, db_connection, body):
+        """
+        기간내 서로 다른 구매자 수와 판매된 상품 수의 근사치를 일별, 기간 전체로 반환합니다.
+        일별 스케치를 합쳐서 구하므로 여러 날 또는 여러 셀러에 걸친 구매자도 한 번만 셉니다.
+        셀러를 지정하지 않으면 모든 샤드의 스케치를 읽어 레지스터별 최댓값으로 합친 뒤 추정합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {start_date : 시작일(포함),
+                end_date    : 종료일(포함),
+                account_id  : seller 의 account_id (None 이면 전체 셀러)}
+        Returns:
+            {'daily'          : {날짜 : {'buyers', 'products'}},
+             'buyers'         : 기간 전체 구매자 수,
+             'products'       : 기간 전체 상품 수,
+             'standard_error' : 상대 표준오차}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        2026-10-19 : 전체 셀러는 모든 샤드의 스케치를 합침
+        """
+        def load_sketches(connection):
+            return [
+                (row['sales_date'], HyperLogLog.from_bytes(row['buyers_sketch']), HyperLogLog.from_bytes(row['products_sketch']))
+                for row in statistics_dao.get_daily_sketches(connection, body)
+            ]
+
+        if body['account_id']:
+            pages = [load_sketches(db_connection)]
+        else:
+            pages = fan_out(load_sketches, db_connection)
+
+        daily_sketches = {}
+        total_buyers   = HyperLogLog()
+        total_products = HyperLogLog()
+
+        for sales_date, buyers, products in (sketch for page in pages for sketch in page):
+            if sales_date in daily_sketches:
+                daily_sketches[sales_date][0].merge(buyers)
+                daily_sketches[sales_date][1].merge(products)
+            else:
+                daily_sketches[sales_date] = (buyers, products)
+
+            total_buyers.merge(buyers)
+            total_products.merge(products)
+
+        return {
+            'daily' : {
+                sales_date : {'buyers': buyers.count(), 'products': products.count()}
+                for sales_date, (buyers, products) in daily_sketches.items()
+            },
+            'buyers'         : total_buyers.count(),
+            'products'       : total_products.count(),
+            'standard_error' : round(get_standard_error(), 4)
+        }
+
+    def get_unique_series(self, db_connection, body):
+        """
+        마스터용으로 기간내 일별/기간 전체의 서로 다른 구매자 수와 판매 상품 수 근사치를 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {start_date : 시작일 문자열(YYYY-MM-DD),
+                end_date    : 종료일 문자열(YYYY-MM-DD),
+                account_id  : 셀러의 account_id (None 이면 전체 셀러)}
+        Returns:
+            {'success': {'daily'          : [{'date', 'buyers', 'products'}],
+                         'buyers'         : 기간 전체 구매자 수,
+                         'products'       : 기간 전체 상품 수,
+                         'standard_error' : 상대 표준오차}}
+            {'error':'S4011'} : 날짜 형식이 틀리거나 기간이 잘못된 경우
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        date_range = parse_date_range(body)
+        if not date_range:
+            return {'error':'S4011'}
+
+        body['start_date'], body['end_date'] = date_range
+
+        unique_counts = self.get_unique_counts(db_connection, body)
+        unique_counts['daily'] = [
+            {'date': sales_date.isoformat(), **counts}
+            for sales_date, counts in sorted(unique_counts['daily'].items())
+        ]
+
+        return {'success': unique_counts}
+
+    def rebuild_daily_sketches(self, db_connection, sales_date):
+        """
+        하루치 셀러별 스케치를 detail_orders 로부터 다시 계산합니다. (야간 대사용)
+        수령인 병합 등으로 receiver_id 가 바뀐 경우에도 다시 맞춰집니다.
+        Args:
+            db_connection : db_connection
+            sales_date    : 다시 계산할 날짜
+        Returns:
+            다시 계산된 셀러 수
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        # 먼저 지워서 그날의 스케치를 잠가 두면, 재계산 도중 들어온 주문은 커밋 후 새 스케치에 더해집니다.
+        statistics_dao.delete_daily_sketches(db_connection, {'sales_date':sales_date})
+
+        sketches = {}
+
+        for rows in statistics_dao.stream_daily_sketch_members(db_connection, {'sales_date':sales_date}):
+            for seller_id, receiver_id, product_id in rows:
+                if seller_id not in sketches:
+                    sketches[seller_id] = (HyperLogLog(), HyperLogLog())
+
+                sketches[seller_id][0].add(receiver_id)
+                sketches[seller_id][1].add(product_id)
+
+        if sketches:
+            statistics_dao.save_daily_sketches(db_connection, [
+                {
+                    'seller_id'       : seller_id,
+                    'sales_date'      : sales_date,
+                    'buyers_sketch'   : buyers.to_bytes(),
+                    'products_sketch' : products.to_bytes()
+                } for seller_id, (buyers, products) in sketches.items()
+            ])
+
+        return len(sketches)
+
+    def get_top_products(self, db_connection, account_id):
+        """
+        셀러의 최근 7/30일 판매 순위 상위 상품들을 판매 수량, 매출액 기준으로 반환합니다.
+        주문 생성시 갱신되는 판매 순위 테이블의 인덱스에서 상위 몇 건만 읽으므로 주문 수와 상관없이 일정한 시간이 걸립니다.
+        Args:
+            db_connection : db_connection
+            account_id    : seller 의 account_id
+        Returns:
+            {기간(일) : {'units'   : [{product_id, product_name, units, revenue}],
+                        'revenue' : [{product_id, product_name, units, revenue}]}}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        top_products = {}
+
+        for window_days in TOP_PRODUCT_WINDOWS:
+            top_products[window_days] = {}
+
+            for order_by in TOP_PRODUCT_ORDERS:
+                products = statistics_dao.get_top_products(db_connection, {
+                    'account_id'  : account_id,
+                    'window_days' : window_days,
+                    'order_by'    : order_by,
+                    'limit'       : TOP_PRODUCT_LIMIT
+                })
+
+                for product in products:
+                    product['revenue'] = float(product['revenue'])
+
+                top_products[window_days][order_by] = products
+
+        return top_products
+
+    def roll_top_product_windows(self, db_connection, current_date):
+        """
+        판매 순위 기간을 하루 앞으로 옮깁니다. 기간에서 빠지는 날의 판매량을 빼고, 필요 없어진 일 판매 집계를 지웁니다.
+        처음 실행하는 경우에는 일 판매 집계로부터 current_date 기준으로 다시 계산합니다.
+        옮긴 날짜(watermark)를 같은 트랜잭션에 저장하므로 중간에 멈추거나 다시 실행해도 두 번 빼지 않습니다.
+        Args:
+            db_connection : db_connection
+            current_date  : 오늘 날짜
+        Returns:
+            판매 순위 기간의 새 마지막 날
+            None : 이미 current_date 까지 옮긴 경우
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        watermark = job_dao.get_watermark(db_connection, {'job_name':TOP_PRODUCT_JOB})
+
+        # 처음 실행하는 경우
+        if watermark is None:
+            window_date = current_date
+
+            for window_days in TOP_PRODUCT_WINDOWS:
+                statistics_dao.rebuild_top_product_window(
+                    db_connection, {'window_days':window_days, 'end_date':window_date})
+
+        else:
+            last_date = datetime.date.fromisoformat(watermark)
+            if last_date >= current_date:
+                return None
+
+            window_date = last_date + datetime.timedelta(1)
+
+            for window_days in TOP_PRODUCT_WINDOWS:
+                statistics_dao.expire_top_product_window(db_connection, {
+                    'window_days'  : window_days,
+                    'expired_date' : window_date - datetime.timedelta(window_days)
+                })
+
+        # 가장 긴 기간에 들어가는 날짜의 집계만 남김
+        statistics_dao.delete_expired_product_daily_sales(db_connection, {
+            'before_date' : window_date - datetime.timedelta(max(TOP_PRODUCT_WINDOWS) - 1)
+        })
+
+        job_dao.set_watermark(db_connection, {'job_name':TOP_PRODUCT_JOB, 'watermark':window_date.isoformat()})
+
+        return window_date
@@ -0,0 +1,141 @@
+from model.sync_dao import SyncDao
+from model.product_dao import ProductDao
+from model.order_dao import OrderDao
+
+sync_dao    = SyncDao()
+product_dao = ProductDao()
+order_dao   = OrderDao()
+
+# 한 번에 보내는 최대 변경 수
+SYNC_LIMIT_DEFAULT = 500
+SYNC_LIMIT_MAX     = 2000
+
+# 변경 기록은 커밋 순서가 아닌 id 순서로 보이므로, 이 시간(초)보다 최근의 기록은 다음 요청에서 다시 보냄
+# (id 가 더 작은 기록을 가진 트랜잭션이 아직 커밋되지 않았을 수 있음)
+SYNC_SETTLE_SECONDS = 30
+
+# 변경 기록 보관 일 수. 이보다 오래된 토큰은 전체를 다시 받아야 함
+SYNC_RETENTION_DAYS = 7
+SYNC_PRUNE_LIMIT    = 10000
+
+
+class SyncService():
+    def get_changes(self, db_connection, body, load_rows, key):
+        """
+        토큰 이후에 바뀐 행과 삭제된 id, 다음 토큰을 반환합니다.
+        - 같은 행이 여러 번 바뀌었어도 현재 값을 한 번만 보냅니다.
+        - 토큰이 없거나, 변경 기록이 정리되어 이어 받을 수 없으면 resync 를 True 로 보냅니다.
+          클라이언트는 받은 토큰을 저장한 뒤 목록 전체를 다시 불러오고, 이후 그 토큰으로 변경분을 받습니다.
+        - 최근 SYNC_SETTLE_SECONDS 초 안의 변경은 토큰을 넘기지 않으므로 다음 요청에서 다시 올 수 있습니다.
+        Args:
+            db_connection : db_connection
+            body          : 딕셔너리
+                {entity   : product / order,
+                seller_id : 셀러 범위 (None 이면 전체),
+                token     : 마지막으로 받은 토큰 (없으면 None),
+                limit     : 최대 변경 수}
+            load_rows     : (db_connection, ids) 를 받아 현재 행들을 반환하는 함수
+            key           : 행에서 id 를 가리키는 키
+        Returns:
+            {'success': {'resync'   : 전체를 다시 받아야 하는지,
+                         'changes'  : 바뀐 행들,
+                         'deleted'  : 삭제된 id 들,
+                         'token'    : 다음 토큰,
+                         'has_more' : 바로 이어서 더 받을 변경이 있는지}}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        bounds = sync_dao.get_change_bounds(db_connection)
+        last_id = bounds['max_id'] or 0
+        token = body['token']
+
+        # 처음 받거나, 토큰 이후의 기록이 정리되었거나, 토큰이 이 DB 의 것이 아닌 경우
+        if token is None or token < 0 or token > last_id or (bounds['min_id'] and token < bounds['min_id'] - 1):
+            return {'success': {'resync': True, 'changes': [], 'deleted': [], 'token': last_id, 'has_more': False}}
+
+        limit = min(max(body['limit'] or SYNC_LIMIT_DEFAULT, 1), SYNC_LIMIT_MAX)
+        changes = sync_dao.get_changes(db_connection, {
+            'entity'    : body['entity'],
+            'seller_id' : body['seller_id'],
+            'token'     : token,
+            'limit'     : limit,
+            'settle'    : SYNC_SETTLE_SECONDS
+        })
+
+        # 확정된 기록까지만 토큰을 넘김
+        next_token = token
+        for change in changes:
+            if not change['is_settled']:
+                break
+            next_token = change['id']
+
+        ids = list(dict.fromkeys(change['entity_id'] for change in changes))
+        rows = load_rows(db_connection, ids) if ids else []
+        found = {row[key] for row in rows}
+
+        return {'success': {
+            'resync'   : False,
+            'changes'  : [row for row in rows if not row.get('is_deleted')],
+            'deleted'  : [entity_id for entity_id in ids if entity_id not in found]
+                         + [row[key] for row in rows if row.get('is_deleted')],
+            'token'    : next_token,
+            # 확정되지 않은 기록에서 멈췄으면 바로 다시 요청하지 않고 다음 주기에 받음
+            'has_more' : len(changes) == limit and next_token == changes[-1]['id']
+        }}
+
+    def get_product_changes(self, db_connection, body):
+        """
+        상품의 등록, 수정(판매, 진열, 가격 등), 재고 변경, 삭제를 변경분으로 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : get_changes 와 같음 (entity 제외)
+        Returns:
+            get_changes 와 같음, changes 는 상품 목록의 컬럼 + seller_id, stock_quantity
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        body['entity'] = 'product'
+
+        return self.get_changes(
+            db_connection,
+            body,
+            lambda db_connection, ids: product_dao.get_products_by_ids(db_connection, {'product_ids': ids}),
+            'product_number'
+        )
+
+    def get_order_changes(self, db_connection, body):
+        """
+        상세주문의 생성과 상태 변경을 변경분으로 반환합니다.
+        Args:
+            db_connection : db_connection
+            body          : get_changes 와 같음 (entity 제외)
+        Returns:
+            get_changes 와 같음, changes 는 주문 관리 목록의 컬럼 + status_id
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        body['entity'] = 'order'
+
+        return self.get_changes(
+            db_connection,
+            body,
+            lambda db_connection, ids: order_dao.get_order_list_rows(db_connection, {'order_ids': ids}),
+            'c_detail_order_id'
+        )
+
+    def prune_changes(self, db_connection):
+        """
+        보관 기간이 지난 변경 기록을 SYNC_PRUNE_LIMIT 개까지 지웁니다.
+        Returns:
+            {'success': 지운 행 수}
+        Authors: 홍성은
+        History:
+        2026-10-19 : 초기 생성
+        """
+        return {'success': sync_dao.prune_changes(db_connection, {
+            'days'  : SYNC_RETENTION_DAYS,
+            'limit' : SYNC_PRUNE_LIMIT
+        })}
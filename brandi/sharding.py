@@ -0,0 +1,238 @@
+import zlib
+import heapq
+import itertools
+
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+
+from cache import LocalCache
+from connection import DATABASES, connect, get_connection, get_read_connection
+
+""" 셀러 기준 샤딩
+상품(products, options, product_images), 주문(orders, receivers, detail_orders, order_list_view)과
+셀러별 집계(daily_sales, order_status_counts 등), 버전/변경 기록 테이블을 셀러 번호로 N 개의 MySQL 샤드에 나눕니다.
+- 샤드 맵 : config.SHARDS 의 순서가 샤드 번호이며, 셀러는 crc32(seller_id) % N 번 샤드에 둡니다.
+  큰 셀러를 따로 두거나 샤드를 늘린 뒤 기존 셀러를 옮기지 않으려면 config.SHARD_MAP 에 셀러 번호 : 샤드 번호로 고정합니다.
+  (셀러 번호는 id_generator 의 id 라 아래 자리가 대부분 0 이므로 나머지 연산 대신 해시를 사용)
+- 한 주문은 한 상품(한 셀러)의 것이므로 주문의 모든 행이 같은 샤드에 있고, 트랜잭션은 한 샤드 안에서 끝납니다.
+- 계정, 셀러, 매니저, 코드 테이블 같은 기준 테이블은 프라이머리(DATABASES)에 쓰고 모든 샤드로 복제합니다.
+  (샤드에서 상품/주문과 조인하기 위함, 복제 필터 replicate-do-table)
+- DAO 는 그대로이고, 어느 커넥션을 넘기는지만 바뀝니다.
+    get_shard_connection   : 셀러 범위 요청. 셀러의 샤드, 셀러가 없으면(마스터 전체 조회) 기본 커넥션
+    is_cross_shard         : 샤드별 결과를 합칠 수 없는 조회(변경분 동기화)를 전체 셀러 범위로 요청했는지
+    get_located_connection : 상품/주문 번호로 요청. 그 행이 있는 샤드
+    fan_out                : 마스터 전체 조회. 모든 샤드에서 동시에 실행한 결과들 (매출 통계는 구간별 합계를 더하고 HyperLogLog 는 합침)
+    merge_sorted           : 샤드별로 정렬된 결과를 합쳐 offset, limit 만큼 자름
+- 배치 작업(야간 대사, 자동 구매확정, 목록 다시 만들기, 백필)은 샤드마다 실행합니다.
+    get_shard_indexes      : 실행할 샤드 번호들 (--shard 로 지정하지 않으면 모든 샤드)
+    get_job_connection     : 샤드 번호의 커넥션 (None 이면 기본 커넥션)
+    get_lease_name         : job_leases 리스 이름을 샤드별로 나눔 (리스는 프라이머리의 job_leases 에 둠)
+- fan_out 으로 넘기는 함수는 다른 스레드에서 실행되므로 flask request 를 읽으면 안 됩니다.
+- 샤드는 레플리카 없이 연결하며, SHARDS 가 없으면 모든 함수가 샤딩 전과 같은 커넥션을 사용합니다.
+
+로컬에서 여러 MySQL 인스턴스로 확인하기
+    3307, 3308 포트에 MySQL 을 띄우고 각각 schema/db_table.sql 을 적용한 뒤 기준 테이블을 채우고
+    config.py 에 SHARDS = [{'host': '127.0.0.1', 'port': 3307}, {'host': '127.0.0.1', 'port': 3308}]
+    (user, password, database 는 DATABASES 와 같으면 생략)
+    상품 번호(AUTO_INCREMENT)가 샤드끼리 겹치지 않도록 샤드마다 auto_increment_increment=샤드 수,
+    auto_increment_offset=샤드 번호 + 1 로 설정합니다.
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 배치 작업용 샤드 번호, 커넥션, 리스 이름 추가
+"""
+
+SHARDS    = getattr(config, 'SHARDS', [])
+SHARD_MAP = getattr(config, 'SHARD_MAP', {})
+
+FAN_OUT_WORKERS = 8
+
+# 상품 번호 등으로 찾은 샤드 번호 (셀러를 옮기면 LOCATION_TTL 초 안에 다시 찾음)
+LOCATION_TTL = 600
+
+_locations = LocalCache(maxsize=100000, ttl=LOCATION_TTL)
+_executor  = ThreadPoolExecutor(max_workers=FAN_OUT_WORKERS)
+
+
+class CrossShardError(Exception):
+    """한 요청이 여러 샤드의 데이터를 바꾸려 하는 경우"""
+    pass
+
+
+def get_shard_index(seller_id):
+    """
+    셀러의 샤드 번호를 반환합니다.
+    """
+    if seller_id in SHARD_MAP:
+        return SHARD_MAP[seller_id]
+
+    return zlib.crc32(str(seller_id).encode()) % len(SHARDS)
+
+
+def connect_shard(index):
+    return connect(dict(DATABASES, **SHARDS[index]))
+
+
+def get_shard_indexes(shard=None):
+    """
+    배치 작업을 실행할 샤드 번호들을 반환합니다.
+    Args:
+        shard : 지정한 샤드 번호 (None 이면 모든 샤드)
+    Returns:
+        샤드 번호 리스트, 샤딩하지 않으면 [None]
+    """
+    if shard is not None:
+        return [shard]
+
+    return list(range(len(SHARDS))) or [None]
+
+
+def get_job_connection(shard=None):
+    """
+    배치 작업이 사용할 커넥션을 반환합니다. (shard 가 None 이면 기본 커넥션)
+    """
+    return get_connection() if shard is None else connect_shard(shard)
+
+
+def get_lease_name(name, shard=None):
+    """
+    샤드마다 한 서버만 실행하도록 리스 이름에 샤드 번호를 붙입니다. (예: auto_confirm_wheel:0)
+    """
+    return name if shard is None else f'{name}:{shard}'
+
+
+def is_cross_shard(seller_id):
+    """
+    샤딩중 전체 셀러 범위로 요청했는지 확인합니다.
+    변경분 동기화처럼 샤드별 결과를 합칠 수 없는 조회는 셀러를 지정해야 합니다.
+    """
+    return bool(SHARDS) and not seller_id
+
+
+def get_shard_connection(seller_id=None, read=False):
+    """
+    셀러 범위 요청에 사용할 커넥션을 반환합니다.
+    Args:
+        seller_id : 셀러 번호 (None 이면 전체 셀러 범위)
+        read      : 읽기 전용 조회 (샤딩하지 않을 때 레플리카를 사용)
+    Returns:
+        셀러의 샤드 커넥션, 셀러가 없으면 기본 커넥션
+    """
+    if SHARDS and seller_id:
+        return connect_shard(get_shard_index(seller_id))
+
+    return get_read_connection() if read else get_connection()
+
+
+def fan_out(read, db_connection=None):
+    """
+    모든 샤드에서 read 를 동시에 실행합니다.
+    Args:
+        read          : 샤드 커넥션을 받아 결과를 반환하는 함수
+        db_connection : 샤딩하지 않을 때 사용할 커넥션
+    Returns:
+        샤드 순서대로 결과 리스트 (샤딩하지 않으면 [read(db_connection)])
+    """
+    if not SHARDS:
+        return [read(db_connection)]
+
+    def run(index):
+        shard_connection = connect_shard(index)
+        try:
+            return read(shard_connection)
+        finally:
+            shard_connection.close()
+
+    return list(_executor.map(run, range(len(SHARDS))))
+
+
+def merge_sorted(pages, key, reverse=False, offset=0, limit=None):
+    """
+    샤드별로 key 순서로 정렬된 행들을 합쳐 offset 부터 limit 개를 반환합니다.
+    """
+    merged = heapq.merge(*pages, key=key, reverse=reverse)
+
+    return list(itertools.islice(merged, offset, None if limit is None else offset + limit))
+
+
+def fan_out_page(read_page, body, key, reverse=False, db_connection=None):
+    """
+    LIMIT/OFFSET 으로 페이지를 읽는 조회를 모든 샤드에서 실행하여 한 페이지로 합칩니다.
+    각 샤드에서 처음부터 offset + limit 개를 읽으므로, 뒤쪽 페이지일수록 샤드마다 많이 읽습니다.
+    Args:
+        read_page     : (db_connection, body) 를 받아 key 순서로 정렬된 행들을 반환하는 함수
+        body          : offset, limit 을 포함한 조건
+        key           : 정렬 키 함수
+        reverse       : 내림차순 여부
+        db_connection : 샤딩하지 않을 때 사용할 커넥션
+    Returns:
+        행 리스트
+    """
+    if not SHARDS:
+        return read_page(db_connection, body)
+
+    shard_body = dict(body, offset=0, limit=body['offset'] + body['limit'])
+    pages = fan_out(lambda shard_connection: read_page(shard_connection, shard_body))
+
+    return merge_sorted(pages, key, reverse, body['offset'], body['limit'])
+
+
+def get_located_connection(find, key=None):
+    """
+    상품/주문 번호로 요청할 때, 그 행들이 있는 샤드의 커넥션을 반환합니다.
+    Args:
+        find : 샤드 커넥션을 받아 그 샤드에서 찾은 행들을 반환하는 함수
+        key  : 찾은 샤드 번호를 기억할 키 (예: ('product', 상품 번호), None 이면 매번 찾음)
+    Returns:
+        행들이 있는 샤드 커넥션, 어디에도 없으면 기본 커넥션 (서비스에서 없는 번호로 처리)
+    Raises:
+        CrossShardError : 행들이 여러 샤드에 있는 경우
+    """
+    if not SHARDS:
+        return get_connection()
+
+    index = _locations.get(key) if key else None
+
+    if index is None:
+        indexes = [index for index, rows in enumerate(fan_out(find)) if rows]
+
+        if len(indexes) > 1:
+            raise CrossShardError(key)
+
+        if not indexes:
+            return get_connection()
+
+        index = indexes[0]
+        if key:
+            _locations.set(key, index)
+
+    return connect_shard(index)
+
+
+def stream_shards(read_batches, seller_id=None, sharded=True):
+    """
+    내보내기용으로 셀러의 샤드, 셀러가 없으면 모든 샤드에서 차례로 batch 를 읽습니다. (샤드 사이의 순서는 섞이지 않음)
+    Args:
+        read_batches : db_connection 을 받아 batch 제너레이터를 반환하는 함수
+        seller_id    : 셀러 번호 (None 이면 전체 셀러)
+        sharded      : 셀러별로 나뉜 테이블을 읽는지 (False 면 기준 테이블이므로 기본 커넥션에서 읽음)
+    Returns:
+        batch 제너레이터
+    """
+    if not SHARDS or not sharded:
+        open_connections = [get_read_connection]
+    elif seller_id:
+        open_connections = [lambda: connect_shard(get_shard_index(seller_id))]
+    else:
+        open_connections = [lambda index=index: connect_shard(index) for index in range(len(SHARDS))]
+
+    for open_connection in open_connections:
+        db_connection = open_connection()
+
+        try:
+            yield from read_batches(db_connection)
+        finally:
+            db_connection.close()
@@ -0,0 +1,164 @@
+import time
+import threading
+
+from functools import wraps
+from collections import OrderedDict
+
+from cache import tag_versions
+
+""" 같은 조회 합치기 (single-flight)
+캐시가 만료된 순간 같은 조회가 동시에 여러 번 들어오면, 하나(leader)만 실행하고 나머지는 그 결과를 받습니다.
+- 결과는 ttl 초 동안 그대로 돌려주며(fresh), 결과가 의존하는 태그(cache.invalidate_tags)가 무효화되면 바로 fresh 가 아니게 됩니다.
+- fresh 가 지난 뒤 stale_ttl 초 동안은, leader 가 다시 조회하는 동안 다른 요청에 이전 결과를 바로 돌려줍니다.
+  (stale-while-revalidate, leader 자신은 새 결과를 받음)
+  태그가 무효화된 결과는 시간과 관계없이 돌려주지 않고, 무효화 이후에 시작한 leader 를 기다립니다.
+  (셀러가 저장한 직후 목록을 다시 불러왔을 때 저장 전의 목록을 받지 않도록)
+- 이전 결과가 없으면 leader 를 최대 timeout 초 기다리고, 시간이 지나거나 leader 가 실패하면 직접 조회합니다.
+- 에러 결과({'error': ...})는 저장하지 않습니다.
+- 프로세스(gunicorn 워커)마다 동작하므로, 같은 조회는 워커 수 이상 동시에 실행되지 않습니다.
+- 반환된 결과는 여러 요청이 공유하므로 수정하면 안 됩니다.
+
+    @single_flight(key=lambda self, db_connection: request.account_id, ttl=5, stale_ttl=60,
+                   tags=lambda self, db_connection: [f'seller:{request.account_id}'])
+    def get_home_info(self, db_connection):
+        ...
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 태그가 무효화된 결과는 stale 로도 돌려주지 않음
+"""
+
+
+class Flight:
+    """실행중인 조회 하나"""
+    def __init__(self, versions):
+        self.versions  = versions # 조회를 시작할 때의 태그 버전
+        self.event     = threading.Event()
+        self.succeeded = False
+        self.result    = None
+
+
+class SingleFlight:
+    """키별 실행중인 조회와 최근 결과
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+
+        self._lock    = threading.Lock()
+        self._results = OrderedDict() # key : (저장 시각, 태그 버전, 결과)
+        self._flights = {}            # key : Flight
+
+    def do(self, key, compute, ttl, stale_ttl=0, timeout=5, tags=(), should_store=None):
+        """
+        Args:
+            key          : 조회를 구분하는 키 (hashable)
+            compute      : 인자 없이 조회를 실행하는 함수
+            ttl          : 결과를 그대로 돌려주는 시간(초)
+            stale_ttl    : ttl 이 지난 뒤 다시 조회하는 동안 이전 결과를 돌려주는 시간(초)
+            timeout      : 이전 결과가 없을 때 leader 를 기다리는 최대 시간(초)
+            tags         : 결과가 의존하는 태그들
+            should_store : 결과를 받아 저장할지 반환하는 함수
+        Returns:
+            조회 결과
+        """
+        started_at = time.monotonic()
+        versions = tag_versions.get_versions(tags)
+
+        with self._lock:
+            stored = self._results.get(key)
+
+            if stored:
+                stored_at, stored_versions, result = stored
+                age = started_at - stored_at
+
+                if age < ttl and stored_versions == versions:
+                    self._results.move_to_end(key)
+                    return result
+
+                # 무효화된 결과는 stale 로도 쓰지 않음
+                if age >= ttl + stale_ttl or stored_versions != versions:
+                    del self._results[key]
+                    stored = None
+
+            # 무효화 전에 시작한 leader 의 결과는 기다리지 않고 새 leader 가 됨
+            flight = self._flights.get(key)
+            is_leader = flight is None or flight.versions != versions
+            if is_leader:
+                flight = self._flights[key] = Flight(versions)
+
+        if not is_leader:
+            # 다시 조회하는 동안 이전 결과를 돌려줌
+            if stored:
+                return stored[2]
+
+            if flight.event.wait(timeout) and flight.succeeded:
+                return flight.result
+
+            # leader 가 늦거나 실패하면 직접 조회
+            return compute()
+
+        try:
+            result = compute()
+
+            if should_store is None or should_store(result):
+                with self._lock:
+                    # 조회 전의 시각과 태그 버전으로 저장하므로, 조회 도중 무효화되면 fresh 가 아님
+                    # 나중에 시작한 leader 가 먼저 저장했으면 덮어쓰지 않음
+                    stored = self._results.get(key)
+                    if not stored or stored[0] <= started_at:
+                        self._results[key] = (started_at, versions, result)
+                        self._results.move_to_end(key)
+
+                    while len(self._results) > self.maxsize:
+                        self._results.popitem(last=False)
+
+            flight.result    = result
+            flight.succeeded = True
+            return result
+
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.event.set()
+
+
+flights = SingleFlight()
+
+
+def is_not_error(result):
+    return not (isinstance(result, dict) and 'error' in result)
+
+
+def single_flight(key, ttl, stale_ttl=0, timeout=5, tags=None, should_store=is_not_error):
+    """
+    함수(서비스 메소드)의 같은 조회를 합치는 데코레이터입니다.
+    Args:
+        key          : 함수와 같은 인자를 받아 조회를 구분하는 키를 반환하는 함수 (필터는 정렬하여 같은 조회가 같은 키가 되게 함)
+        ttl          : 결과를 그대로 돌려주는 시간(초)
+        stale_ttl    : ttl 이 지난 뒤 다시 조회하는 동안 이전 결과를 돌려주는 시간(초)
+        timeout      : 이전 결과가 없을 때 leader 를 기다리는 최대 시간(초)
+        tags         : 함수와 같은 인자를 받아 결과가 의존하는 태그들을 반환하는 함수
+        should_store : 결과를 받아 저장할지 반환하는 함수 (기본: 에러가 아니면 저장)
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return flights.do(
+                (func.__qualname__, key(*args, **kwargs)),
+                lambda: func(*args, **kwargs),
+                ttl,
+                stale_ttl,
+                timeout,
+                tuple(tags(*args, **kwargs)) if tags else (),
+                should_store
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,59 @@
+import pytest
+
+from hyperloglog import HyperLogLog, get_standard_error
+
+# 같은 값은 언제나 같은 해시가 되므로 결과가 실행마다 같음
+ERROR_BOUND = 3 * get_standard_error()
+
+
+def make_sketch(values):
+    sketch = HyperLogLog()
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+
+@pytest.mark.parametrize('count', [10000, 100000])
+def test_count_is_within_error_bound(count):
+    sketch = make_sketch(range(count))
+
+    assert abs(sketch.count() - count) / count <= ERROR_BOUND
+
+
+def test_small_counts_are_nearly_exact():
+    for count in (1, 10, 50, 200):
+        assert abs(make_sketch(f'buyer-{i}' for i in range(count)).count() - count) <= max(1, count * 0.02)
+
+    assert HyperLogLog().count() == 0
+
+
+def test_duplicates_do_not_change_sketch():
+    sketch = make_sketch(range(1000))
+
+    assert not any(sketch.add(value) for value in range(1000))
+    assert sketch.count() == make_sketch(range(1000)).count()
+
+
+def test_merge_equals_union():
+    first  = make_sketch(range(0, 60000))
+    second = make_sketch(range(40000, 100000))
+
+    first.merge(second)
+
+    assert first.registers == make_sketch(range(100000)).registers
+    assert abs(first.count() - 100000) / 100000 <= ERROR_BOUND
+
+
+def test_bytes_round_trip():
+    sketch = make_sketch(range(5000))
+
+    assert HyperLogLog.from_bytes(sketch.to_bytes()).registers == sketch.registers
+    assert HyperLogLog.from_bytes(None).count() == 0
+
+
+def test_precision_mismatch_is_rejected():
+    with pytest.raises(ValueError):
+        HyperLogLog(12).merge(HyperLogLog(10))
+
+    with pytest.raises(ValueError):
+        HyperLogLog(12, bytearray(10))
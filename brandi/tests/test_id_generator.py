@@ -0,0 +1,115 @@
+import threading
+import multiprocessing
+
+import pytest
+
+from id_generator import IdGenerator, get_time_id, TIMESTAMP_SHIFT, WORKER_ID_SHIFT, MAX_WORKER_ID
+
+THREADS     = 8
+PROCESSES   = 4
+ID_COUNT    = 5000
+
+
+class FakeLease:
+    """DB 없이 정해진 순서로 워커 id 를 빌려주는 리스 (연장은 항상 실패)"""
+    def __init__(self, worker_ids):
+        self.worker_ids = list(worker_ids)
+
+    def acquire(self, owner, worker_id=None):
+        if worker_id is not None:
+            return None
+        return self.worker_ids.pop(0) if self.worker_ids else None
+
+    def release(self, owner, worker_id):
+        pass
+
+
+def get_worker_id(generated_id):
+    return (generated_id >> WORKER_ID_SHIFT) & MAX_WORKER_ID
+
+
+def test_ids_are_unique_and_increasing_across_threads():
+    generator = IdGenerator(worker_id=1)
+    results = [None] * THREADS
+
+    def generate(index):
+        results[index] = generator.get_ids(ID_COUNT)
+
+    threads = [threading.Thread(target=generate, args=(index,)) for index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for ids in results:
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    all_ids = [generated_id for ids in results for generated_id in ids]
+    assert len(set(all_ids)) == THREADS * ID_COUNT
+
+
+def generate_in_process(worker_id, queue):
+    queue.put((worker_id, IdGenerator(worker_id=worker_id).get_ids(ID_COUNT)))
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='fork 를 지원하지 않는 플랫폼')
+def test_ids_are_unique_across_forked_processes():
+    context = multiprocessing.get_context('fork')
+    queue = context.Queue()
+    processes = [context.Process(target=generate_in_process, args=(worker_id, queue)) for worker_id in range(PROCESSES)]
+
+    for process in processes:
+        process.start()
+    results = [queue.get(timeout=30) for _ in processes]
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    all_ids = []
+    for worker_id, ids in results:
+        assert ids == sorted(ids)
+        assert {get_worker_id(generated_id) for generated_id in ids} == {worker_id}
+        all_ids.extend(ids)
+
+    assert len(set(all_ids)) == PROCESSES * ID_COUNT
+
+
+def test_ids_keep_increasing_when_worker_id_changes():
+    generator = IdGenerator(lease=FakeLease([700, 3]))
+
+    before = generator.get_ids(100)
+    assert generator.worker_id == 700
+
+    # 리스를 잃으면 다른(더 작은) 워커 id 를 얻어도 이전 id 보다 커야 함
+    generator._valid_until = 0
+    after = generator.get_ids(100)
+    assert generator.worker_id == 3
+
+    ids = before + after
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_forked_child_does_not_reuse_fixed_worker_id():
+    generator = IdGenerator(worker_id=5, lease=FakeLease([9]))
+    generator._reset(forked=True)
+
+    assert generator.worker_id is None
+    generator.get_id()
+    assert generator.worker_id == 9
+
+
+def test_no_free_worker_id_raises():
+    generator = IdGenerator(lease=FakeLease([]))
+
+    with pytest.raises(RuntimeError):
+        generator.get_id()
+
+
+def test_time_id_is_not_greater_than_later_ids():
+    lower_bound = get_time_id()
+    generated_id = IdGenerator(worker_id=0).get_id()
+
+    assert lower_bound <= generated_id
+    assert lower_bound >> TIMESTAMP_SHIFT <= generated_id >> TIMESTAMP_SHIFT
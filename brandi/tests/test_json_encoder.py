@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+pytest.importorskip('flask')
+
+from json_encoder import BigIntJSONEncoder, MAX_SAFE_INTEGER, parse_id, stringify_big_ints
+
+
+def test_big_ints_are_sent_as_strings():
+    order_id = 903921634508816385
+    body = {'success': {'order_id': order_id, 'ids': [order_id, 7], 'count': 3, 'flag': True}}
+
+    decoded = json.loads(json.dumps(body, cls=BigIntJSONEncoder))
+
+    assert decoded == {'success': {'order_id': str(order_id), 'ids': [str(order_id), 7], 'count': 3, 'flag': True}}
+
+
+def test_safe_ints_stay_numbers():
+    assert stringify_big_ints(MAX_SAFE_INTEGER) == MAX_SAFE_INTEGER
+    assert stringify_big_ints(MAX_SAFE_INTEGER + 1) == str(MAX_SAFE_INTEGER + 1)
+    assert stringify_big_ints(-MAX_SAFE_INTEGER - 1) == str(-MAX_SAFE_INTEGER - 1)
+
+
+def test_indented_output_is_converted():
+    assert json.loads(json.dumps([1 << 60], cls=BigIntJSONEncoder, indent=2)) == [str(1 << 60)]
+
+
+def test_parse_id_round_trips_strings():
+    order_id = 903921634508816385
+
+    assert parse_id(str(order_id)) == order_id
+    assert parse_id(order_id) == order_id
+
+    with pytest.raises(ValueError):
+        parse_id('12a')
+
+    with pytest.raises(TypeError):
+        parse_id(1.5)
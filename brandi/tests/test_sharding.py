@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+pytest.importorskip('pymysql')
+pytest.importorskip('flask')
+
+import sharding
+from sharding import fan_out, fan_out_page, merge_sorted
+
+
+class FakeShard:
+    """샤드 커넥션 대신 사용하는 행 목록"""
+    def __init__(self, rows):
+        self.rows = rows
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def read_page(shard, body):
+    # 목록 조회처럼 (결제일시, 주문번호) 역순으로 offset, limit 만큼 읽음
+    rows = sorted(shard.rows, key=order_key, reverse=True)
+    return rows[body['offset']:body['offset'] + body['limit']]
+
+
+def order_key(order):
+    return order['paied_at'], order['order_id']
+
+
+@pytest.fixture
+def shards(monkeypatch):
+    rng = random.Random(3)
+    rows = [{'order_id': order_id, 'paied_at': rng.randint(0, 50)} for order_id in range(1, 301)]
+    connections = [FakeShard(rows[index::3]) for index in range(3)]
+
+    monkeypatch.setattr(sharding, 'SHARDS', [{}, {}, {}])
+    monkeypatch.setattr(sharding, 'connect_shard', lambda index: connections[index])
+
+    return rows, connections
+
+
+def test_merge_sorted_applies_offset_and_limit():
+    pages = [[9, 6, 3], [8, 5, 2], [7, 4, 1]]
+
+    assert merge_sorted(pages, key=lambda value: value, reverse=True) == [9, 8, 7, 6, 5, 4, 3, 2, 1]
+    assert merge_sorted(pages, key=lambda value: value, reverse=True, offset=2, limit=3) == [7, 6, 5]
+    assert merge_sorted([[1, 4], [2, 3]], key=lambda value: value, offset=3, limit=10) == [4]
+
+
+def test_fan_out_page_matches_single_database(shards):
+    rows, connections = shards
+    everything = FakeShard(rows)
+
+    for offset in (0, 20, 95, 290):
+        body = {'offset': offset, 'limit': 20}
+
+        assert fan_out_page(read_page, body, order_key, reverse=True) == read_page(everything, body)
+
+    assert all(connection.closed for connection in connections)
+
+
+def test_fan_out_sums_shard_results(shards):
+    rows, _ = shards
+
+    assert sum(fan_out(lambda connection: len(connection.rows))) == len(rows)
+
+
+def test_without_shards_uses_given_connection(monkeypatch):
+    monkeypatch.setattr(sharding, 'SHARDS', [])
+    connection = FakeShard([{'order_id': 1, 'paied_at': 0}])
+
+    assert fan_out(lambda db_connection: db_connection, connection) == [connection]
+    assert fan_out_page(read_page, {'offset': 0, 'limit': 10}, order_key, True, connection) == connection.rows
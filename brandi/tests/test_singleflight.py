@@ -0,0 +1,166 @@
+import time
+import threading
+
+from cache import invalidate_tags
+from singleflight import SingleFlight
+
+THREADS = 8
+
+
+def test_concurrent_calls_run_once():
+    flights = SingleFlight()
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+    results = [None] * THREADS
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {'success': len(calls)}
+
+    def call(index):
+        results[index] = flights.do('key', compute, ttl=10)
+
+    leader = threading.Thread(target=call, args=(0,))
+    leader.start()
+    started.wait(5)
+
+    followers = [threading.Thread(target=call, args=(index,)) for index in range(1, THREADS)]
+    for thread in followers:
+        thread.start()
+
+    # 뒤따른 요청들이 leader 를 기다리게 한 뒤 끝냄
+    time.sleep(0.05)
+    release.set()
+
+    for thread in [leader] + followers:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{'success': 1}] * THREADS
+
+
+def test_fresh_result_is_reused_until_ttl():
+    flights = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert flights.do('key', compute, ttl=10) == 1
+    assert flights.do('key', compute, ttl=10) == 1
+    assert flights.do('key', compute, ttl=0) == 2
+
+
+def test_invalidated_result_is_not_served():
+    flights = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert flights.do('key', compute, ttl=10, stale_ttl=30, tags=('seller:test-fresh',)) == 1
+
+    invalidate_tags(['seller:test-fresh'])
+
+    assert flights.do('key', compute, ttl=10, stale_ttl=30, tags=('seller:test-fresh',)) == 2
+
+
+def test_invalidated_result_is_not_served_as_stale_while_leader_runs():
+    flights = SingleFlight()
+    tags = ('seller:test-stale',)
+    started = threading.Event()
+    release = threading.Event()
+
+    flights.do('key', lambda: 'before', ttl=0, stale_ttl=30, tags=tags)
+    invalidate_tags(list(tags))
+
+    def slow_compute():
+        started.set()
+        release.wait(5)
+        return 'after'
+
+    leader = threading.Thread(target=flights.do, args=('key', slow_compute, 0, 30, 5, tags))
+    leader.start()
+    started.wait(5)
+
+    results = []
+    follower = threading.Thread(target=lambda: results.append(flights.do('key', lambda: 'direct', 0, 30, 5, tags)))
+    follower.start()
+
+    time.sleep(0.05)
+    assert not results
+
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert results == ['after']
+
+
+def test_stale_result_is_served_while_leader_runs_when_not_invalidated():
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    flights.do('key', lambda: 'before', ttl=0, stale_ttl=30)
+
+    def slow_compute():
+        started.set()
+        release.wait(5)
+        return 'after'
+
+    leader = threading.Thread(target=flights.do, args=('key', slow_compute, 0, 30))
+    leader.start()
+    started.wait(5)
+
+    assert flights.do('key', lambda: 'direct', ttl=0, stale_ttl=30) == 'before'
+
+    release.set()
+    leader.join()
+
+
+def test_flight_started_before_invalidation_is_not_joined():
+    flights = SingleFlight()
+    tags = ('seller:test-flight',)
+    started = threading.Event()
+    release = threading.Event()
+
+    def old_compute():
+        started.set()
+        release.wait(5)
+        return 'old'
+
+    old_leader = threading.Thread(target=flights.do, args=('key', old_compute, 10, 0, 5, tags))
+    old_leader.start()
+    started.wait(5)
+
+    invalidate_tags(list(tags))
+
+    assert flights.do('key', lambda: 'new', ttl=10, tags=tags) == 'new'
+
+    release.set()
+    old_leader.join()
+
+    # 먼저 시작한 leader 가 늦게 끝나도 새 결과를 덮어쓰지 않음
+    assert flights.do('key', lambda: 'again', ttl=10, tags=tags) == 'new'
+
+
+def test_errors_are_not_stored():
+    flights = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'error': 'C0001'}
+
+    should_store = lambda result: 'error' not in result
+
+    flights.do('key', compute, ttl=10, should_store=should_store)
+    flights.do('key', compute, ttl=10, should_store=should_store)
+
+    assert len(calls) == 2
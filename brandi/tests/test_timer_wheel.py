@@ -0,0 +1,73 @@
+import random
+
+from timer_wheel import TimerWheel
+
+
+def run_until(wheel, start, end):
+    """
+    start 부터 end 까지 한 tick(1초)씩 돌리고 {key: 꺼낸 시각} 을 반환합니다.
+    """
+    popped = {}
+    for now in range(start, end + 1):
+        for key in wheel.advance(now):
+            popped[key] = now
+    return popped
+
+
+def test_keys_are_popped_at_their_due_tick():
+    wheel = TimerWheel(0, slots=4, levels=3)
+    dues = {f'job-{due}': due for due in [1, 2, 3, 4, 5, 15, 16, 17, 63, 64, 65, 100]}
+
+    for key, due in dues.items():
+        wheel.add(key, due)
+
+    assert len(wheel) == len(dues)
+    assert run_until(wheel, 0, 200) == dues
+    assert len(wheel) == 0
+
+
+def test_cascade_keeps_order_for_random_dues():
+    rng = random.Random(7)
+    wheel = TimerWheel(1000, slots=8, levels=3)
+    dues = {key: 1000 + rng.randint(1, 600) for key in range(500)}
+
+    for key, due in dues.items():
+        wheel.add(key, due)
+
+    popped = []
+    for now in range(1000, 1700):
+        expired = wheel.advance(now)
+        assert all(dues[key] == now for key in expired)
+        popped.extend(expired)
+
+    assert sorted(popped) == sorted(dues)
+
+
+def test_due_beyond_top_wheel_is_rescheduled():
+    # slots=4, levels=2 이면 16 tick 까지 표현하므로 그 뒤는 위 휠에서 여러 번 다시 배치됨
+    wheel = TimerWheel(0, slots=4, levels=2)
+    wheel.add('far', 50)
+
+    assert run_until(wheel, 0, 100) == {'far': 50}
+
+
+def test_keys_added_while_running_and_past_dues():
+    wheel = TimerWheel(0, slots=4, levels=3)
+    wheel.advance(10)
+
+    wheel.add('past', 3)
+    wheel.add('later', 30)
+
+    assert wheel.advance(10) == ['past']
+
+    # 여러 tick 을 한 번에 건너뛰어도 꺼냄
+    assert wheel.advance(40) == ['later']
+    assert len(wheel) == 0
+
+
+def test_fractional_ticks_round_up():
+    wheel = TimerWheel(0, tick=0.5, slots=4, levels=3)
+    wheel.add('job', 1.2)
+
+    assert wheel.advance(1.4) == []
+    assert wheel.advance(1.5) == ['job']
@@ -0,0 +1,96 @@
+import math
+
+""" 계층형 타이머 휠
+많은 수의 예약 작업을 만기 시각에 맞추어 꺼내기 위한 자료구조입니다.
+- 가장 아래 휠은 slots 개의 칸이 각각 tick 초를 나타내고, 위의 휠은 아래 휠 한 바퀴를 한 칸으로 나타냅니다.
+  (tick=1, slots=64, levels=4 이면 약 194일까지 표현하며, 그보다 먼 예약은 위 휠에서 다시 배치됩니다.)
+- 추가는 O(1), 한 tick 전진은 해당 칸의 예약 수에 비례하므로 만기가 된 예약만 다룹니다.
+- 위 휠의 칸이 돌아오면 그 칸의 예약들을 아래 휠로 내려 보냅니다.(cascade)
+- 취소는 지원하지 않습니다. 꺼낸 쪽에서 아직 처리할 대상인지 확인해야 합니다.
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+"""
+
+
+class TimerWheel:
+    """계층형 타이머 휠
+    Author : 홍성은
+    History:
+        2026-10-19: 초기생성
+    """
+    def __init__(self, now, tick=1.0, slots=64, levels=4):
+        """
+        Args:
+            now    : 현재 시각(초, time.time())
+            tick   : 가장 아래 휠 한 칸의 길이(초)
+            slots  : 휠 하나의 칸 수
+            levels : 휠의 수
+        """
+        self.tick         = tick
+        self.slots        = slots
+        self.levels       = levels
+        self.current_tick = int(now // tick)
+        self.wheels       = [[[] for _ in range(slots)] for _ in range(levels)]
+        self.ready        = []
+        self.size         = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, key, due):
+        """
+        due 시각(초)에 꺼낼 key 를 추가합니다. 이미 지난 시각이면 다음 advance 에서 바로 꺼냅니다.
+        """
+        self.size += 1
+        self._place(key, math.ceil(due / self.tick))
+
+    def _place(self, key, due_tick):
+        delta = due_tick - self.current_tick
+
+        if delta <= 0:
+            self.ready.append(key)
+            return
+
+        for level in range(self.levels):
+            if delta < self.slots ** (level + 1) or level == self.levels - 1:
+                slot = (due_tick // self.slots ** level) % self.slots
+                self.wheels[level][slot].append((due_tick, key))
+                return
+
+    def advance(self, now):
+        """
+        now 시각(초)까지 휠을 돌리고, 그 사이에 만기가 된 key 들을 반환합니다.
+        """
+        expired = self.ready
+        self.ready = []
+
+        target_tick = int(now // self.tick)
+
+        while self.current_tick < target_tick:
+            self.current_tick += 1
+
+            # 위 휠의 칸이 돌아왔으면 아래 휠로 내려 보냄 (위에서부터)
+            for level in range(self.levels - 1, 0, -1):
+                if self.current_tick % self.slots ** level == 0:
+                    slot = (self.current_tick // self.slots ** level) % self.slots
+                    entries = self.wheels[level][slot]
+                    self.wheels[level][slot] = []
+
+                    for due_tick, key in entries:
+                        self._place(key, due_tick)
+
+            slot = self.current_tick % self.slots
+            entries = self.wheels[0][slot]
+            self.wheels[0][slot] = []
+
+            for due_tick, key in entries:
+                self._place(key, due_tick)
+
+            expired.extend(self.ready)
+            self.ready = []
+
+        self.size -= len(expired)
+        return expired
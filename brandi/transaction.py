@@ -0,0 +1,213 @@
+import time
+import random
+import logging
+import weakref
+import threading
+
+import pymysql
+
+from connection import save_consistency_token
+
+""" 트랜잭션 재시도
+데드락(1213), 락 대기 시간 초과(1205)처럼 다시 실행하면 성공할 수 있는 에러가 나면
+롤백 후 지터가 적용된 백오프를 두고 서비스 함수를 다시 실행합니다.
+재시도가 몰려 DB 부하가 커지지 않도록 엔드포인트별 재시도 예산(토큰 버킷)을 둡니다.
+
+Authors: 홍성은
+
+History:
+    2026-10-19 : 초기 생성
+    2026-10-19 : 재시도와 재시도 포기를 엔드포인트, 에러 번호와 함께 로그로 남김
+"""
+
+# 재시도 가능한 MySQL 에러 번호
+RETRYABLE_ERRORS = {
+    1205, # ER_LOCK_WAIT_TIMEOUT
+    1213, # ER_LOCK_DEADLOCK
+}
+
+MAX_RETRIES      = 3     # 요청 한 건당 최대 재시도 횟수
+BACKOFF_BASE     = 0.05  # 첫 재시도 대기 시간(초)
+BACKOFF_MAX      = 1.0   # 최대 대기 시간(초)
+
+# 재시도 예산: 요청 한 건마다 RETRY_BUDGET_RATIO 만큼 토큰이 쌓이고 재시도 한 번에 토큰 1개를 씁니다.
+RETRY_BUDGET_RATIO = 0.1
+RETRY_BUDGET_MAX   = 10.0
+
+_lock          = threading.Lock()
+_retry_budgets = {}
+_retry_counts  = {}
+
+# 커넥션별로 커밋 이후 실행할 함수들
+_commit_callbacks = weakref.WeakKeyDictionary()
+
+
+def on_commit(db_connection, callback):
+    """
+    현재 트랜잭션이 커밋된 뒤 실행할 함수를 등록합니다.
+    캐시 무효화처럼 커밋된 데이터를 기준으로 해야 하는 작업에 사용하며, 롤백되면 실행되지 않습니다.
+    Args:
+        db_connection : db_connection
+        callback      : 인자 없이 호출되는 함수
+    """
+    with _lock:
+        _commit_callbacks.setdefault(db_connection, []).append(callback)
+
+
+def commit(db_connection):
+    """
+    트랜잭션을 커밋하고 on_commit 으로 등록된 함수들을 실행합니다.
+    요청 중이면 커밋된 GTID 를 세션 일관성 토큰으로 저장합니다. (connection.save_consistency_token)
+    이미 커밋된 뒤이므로 등록된 함수에서 난 에러는 기록만 하고 전파하지 않습니다.
+    """
+    db_connection.commit()
+
+    try:
+        save_consistency_token(db_connection)
+    except Exception:
+        logging.exception('saving consistency token failed')
+
+    with _lock:
+        callbacks = _commit_callbacks.pop(db_connection, [])
+
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception:
+            logging.exception('on_commit callback failed')
+
+
+def rollback(db_connection):
+    """
+    트랜잭션을 롤백하고 on_commit 으로 등록된 함수들을 버립니다.
+    """
+    with _lock:
+        _commit_callbacks.pop(db_connection, None)
+
+    db_connection.rollback()
+
+
+def is_retryable(exception):
+    """
+    재시도 가능한 DB 에러인지 확인합니다.
+    Args:
+        exception : 발생한 에러
+    Returns:
+        True / False
+    """
+    return (
+        isinstance(exception, pymysql.err.MySQLError)
+        and bool(exception.args)
+        and exception.args[0] in RETRYABLE_ERRORS
+    )
+
+
+def _deposit_budget(endpoint):
+    with _lock:
+        budget = _retry_budgets.get(endpoint, RETRY_BUDGET_MAX)
+        _retry_budgets[endpoint] = min(RETRY_BUDGET_MAX, budget + RETRY_BUDGET_RATIO)
+
+
+def _withdraw_budget(endpoint):
+    with _lock:
+        budget = _retry_budgets.get(endpoint, RETRY_BUDGET_MAX)
+        if budget < 1:
+            return False
+
+        _retry_budgets[endpoint] = budget - 1
+        return True
+
+
+def _count_retry(endpoint, exception, attempt):
+    """
+    재시도를 집계하고, 엔드포인트와 MySQL 에러 번호, 프로세스 누적 횟수를 로그로 남깁니다.
+    """
+    with _lock:
+        counts = _retry_counts.setdefault(endpoint, {'retries': 0, 'exhausted': 0})
+        counts['retries'] += 1
+        retries, exhausted = counts['retries'], counts['exhausted']
+
+    logging.warning(
+        'transaction retry endpoint=%s errno=%s attempt=%s total_retries=%s total_exhausted=%s',
+        endpoint, exception.args[0], attempt, retries, exhausted
+    )
+
+
+def _count_exhausted(endpoint, exception, attempt):
+    """
+    재시도 횟수나 예산을 모두 써서 에러를 낸 경우를 집계하고 로그로 남깁니다.
+    """
+    with _lock:
+        counts = _retry_counts.setdefault(endpoint, {'retries': 0, 'exhausted': 0})
+        counts['exhausted'] += 1
+        retries, exhausted = counts['retries'], counts['exhausted']
+
+    logging.error(
+        'transaction retry exhausted endpoint=%s errno=%s attempts=%s total_retries=%s total_exhausted=%s',
+        endpoint, exception.args[0], attempt, retries, exhausted
+    )
+
+
+def get_backoff(attempt):
+    """
+    attempt 번째 재시도 전에 기다릴 시간을 반환합니다. (full jitter)
+    Args:
+        attempt : 1부터 시작하는 재시도 횟수
+    Returns:
+        대기 시간(초)
+    """
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** (attempt - 1))))
+
+
+def is_success(result):
+    """
+    서비스 함수의 결과가 커밋해야 하는 결과인지 확인합니다.
+    {'error': ...} 딕셔너리만 실패로 보고, 그 외(플라스크 응답 등)는 성공으로 봅니다.
+    """
+    return not isinstance(result, dict) or 'success' in result
+
+
+def run_in_transaction(endpoint, db_connection, service_call):
+    """
+    서비스 함수를 하나의 트랜잭션으로 실행하고, 성공하면 커밋(on_commit 함수 실행), 실패하면 롤백합니다.
+    재시도 가능한 에러가 나면 롤백 후 백오프를 두고 service_call 을 처음부터 다시 실행합니다.
+    service_call 은 여러 번 호출될 수 있으므로 요청 body 를 변경한다면 호출할 때마다 복사본을 넘겨야 합니다.
+    Args:
+        endpoint      : 재시도 횟수를 집계하고 로그에 남길 엔드포인트 이름
+        db_connection : db_connection
+        service_call  : 인자 없이 호출되는 서비스 함수
+    Returns:
+        service_call 의 결과
+    Raises:
+        재시도 불가능한 에러, 또는 재시도 횟수/예산을 모두 쓴 뒤의 에러
+    Authors: 홍성은
+    History:
+        2026-10-19 : 초기 생성
+    """
+    _deposit_budget(endpoint)
+    attempt = 0
+
+    while True:
+        try:
+            result = service_call()
+
+            if is_success(result):
+                commit(db_connection)
+            else:
+                rollback(db_connection)
+
+            return result
+
+        except Exception as exception:
+            rollback(db_connection)
+
+            if not is_retryable(exception):
+                raise
+
+            if attempt >= MAX_RETRIES or not _withdraw_budget(endpoint):
+                _count_exhausted(endpoint, exception, attempt)
+                raise
+
+            attempt += 1
+            _count_retry(endpoint, exception, attempt)
+            time.sleep(get_backoff(attempt))
@@ -1,6 +1,8 @@
 from slacker import Slacker
 import os
 import jwt
+import json
+import hashlib
 from flask import jsonify, Response, request
 from config import SECRET,ALGORITHM, BRANDI_TOKEN, CHANNEL_ID
 from functools  import wraps 
@@ -132,6 +134,27 @@ def error_code(error_dict):
         # 주문 상태 변경 3010
         'O3011' : {'message': 'REQUEST DOES NOT MATCH', 'client_message': '주문의 상태를 다시 확인하세요', 'code': 400}, 
 
+        # 멱등키 3020
+        'O3021' : {'message': 'IDEMPOTENCY_KEY_REUSED', 'client_message': '이미 다른 요청에 사용된 멱등키입니다', 'code': 422}, 
+        'O3022' : {'message': 'INVALID_IDEMPOTENCY_KEY', 'client_message': '멱등키는 100자 이하로 입력하세요', 'code': 400}, 
+
+        # 주문 목록 조회 3030
+        'O3031' : {'message': 'INVALID_DATE_RANGE', 'client_message': '조회 기간을 확인하세요', 'code': 400}, 
+        'O3032' : {'message': 'INVALID_UTC_OFFSET', 'client_message': '시간대를 확인하세요', 'code': 400}, 
+
+    # S (Statistics)
+        # 매출 통계 4010
+        'S4011' : {'message': 'INVALID_DATE_RANGE', 'client_message': '조회 기간을 확인하세요', 'code': 400}, 
+        'S4012' : {'message': 'INVALID_INTERVAL', 'client_message': '조회 단위는 day, week, month 중 하나입니다', 'code': 400}, 
+        'S4013' : {'message': 'INVALID_SOURCE', 'client_message': '조회 대상은 rollup, raw 중 하나입니다', 'code': 400}, 
+
+
+    # J (Job)
+        # 작업 큐 5010
+        'J5011' : {'message': 'JOB_NOT_FOUND', 'client_message': '작업을 찾을 수 없습니다', 'code': 404}, 
+        'J5012' : {'message': 'JOB_ALREADY_FINISHED', 'client_message': '이미 끝난 작업입니다', 'code': 400}, 
+        'J5013' : {'message': 'INVALID_JOB_TYPE', 'client_message': '등록할 수 없는 작업입니다', 'code': 400}, 
+
 
     # C (공통)
         'C0001' : {'message': 'KEY_ERROR', 'client_message': '필수정보를 입력하세요', 'code': 401}, 
@@ -141,6 +164,8 @@ def error_code(error_dict):
         'C0005' : {'message': 'KEY_TYPE ERROR', 'client_message': '데이터 타입 확인하세요', 'code': 400}, 
         'C0006' : {'message': 'NO DATA', 'client_message': '데이터를 전송하세요', 'code': 400}, 
         'C0007' : {'message': 'NO_AUTHORIZATION', 'client_message': '셀러 이외 접근 불가', 'code': 400}, 
+        'C0008' : {'message': 'INVALID_EXPORT_FORMAT', 'client_message': '파일 형식은 csv, xlsx 중 하나입니다', 'code': 400}, 
+        'C0009' : {'message': 'CROSS_SHARD_REQUEST', 'client_message': '여러 셀러의 데이터는 셀러별로 나누어 요청하세요', 'code': 400}, 
 
     }
 
@@ -149,6 +174,49 @@ def error_code(error_dict):
     
     return jsonify( codes[error_dict['error']]   ), codes[error_dict['error']]['code']
     
+def get_fingerprint(*args):
+    """
+    요청 내용을 정렬된 JSON 으로 직렬화하여 sha256 해시값을 반환합니다.
+    같은 내용의 요청은 딕셔너리 키 순서와 상관없이 같은 값을 가집니다.
+    Args:
+        args : 해시할 요청 내용들
+    Returns:
+        64자리 16진수 문자열
+    Authors: 홍성은
+    History:
+        2026-10-19 : 초기 생성
+    """
+    canonical = json.dumps(args, sort_keys=True, ensure_ascii=False, default=str)
+
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def get_receiver_hash(receiver_info):
+    """
+    수령인 정보를 정규화하여 해시값을 반환합니다.
+    공백, 대소문자, 전화번호의 하이픈 차이만 있는 수령인은 같은 값을 가집니다.
+    Args:
+        receiver_info : 딕셔너리
+            {name 또는 buyer_name, contact, zip_code, street_address, detail_address}
+    Returns:
+        64자리 16진수 문자열
+    Authors: 홍성은
+    History:
+        2026-10-19 : 초기 생성
+    """
+    def normalize(value):
+        return ' '.join(str(value).split()).casefold()
+
+    name = receiver_info['buyer_name'] if 'buyer_name' in receiver_info else receiver_info['name']
+    normalized = [
+        normalize(name),
+        ''.join(char for char in str(receiver_info['contact']) if char.isdigit()),
+        normalize(receiver_info['zip_code']).replace(' ', '').replace('-', ''),
+        normalize(receiver_info['street_address']),
+        normalize(receiver_info['detail_address']),
+    ]
+
+    return hashlib.sha256('\x1f'.join(normalized).encode('utf-8')).hexdigest()
+
 def check_param(essens_params):
     for key, value in essens_params:
         if key != type(value):